@@ -0,0 +1,29 @@
+-- Migration: Expression indexes for numeric and date CRM attributes
+-- Serves range filters and sorting in CRM record list views. New attributes
+-- get their index from ensure_crm_attribute_index_task; this backfills
+-- indexes for attributes that already exist.
+
+DO $$
+DECLARE
+    attr_slug TEXT;
+    index_name TEXT;
+BEGIN
+    FOR attr_slug IN
+        SELECT DISTINCT slug
+        FROM crm_attributes
+        WHERE attribute_type IN ('number', 'currency', 'rating', 'date', 'timestamp')
+          AND (is_filterable OR is_sortable)
+          AND slug ~ '^[a-z0-9_]+$'
+    LOOP
+        index_name := 'ix_crm_records_attr_' || attr_slug;
+        IF length(index_name) > 63 THEN
+            index_name := 'ix_crm_records_attr_' || left(encode(sha256(attr_slug::bytea), 'hex'), 16);
+        END IF;
+
+        EXECUTE format(
+            'CREATE INDEX IF NOT EXISTS %I ON crm_records (object_id, (NULLIF("values" -> %L, ''null''::jsonb)))',
+            index_name,
+            attr_slug
+        );
+    END LOOP;
+END $$;
@@ -0,0 +1,14 @@
+-- Migration: Delta-compressed document versions
+-- New versions store zlib-compressed snapshots or patches against the latest
+-- snapshot in content_blob; existing rows keep their JSONB content and are
+-- read as snapshots
+
+ALTER TABLE document_versions
+ADD COLUMN IF NOT EXISTS content_blob BYTEA,
+ADD COLUMN IF NOT EXISTS base_version_number INTEGER;
+
+ALTER TABLE document_versions
+ALTER COLUMN content DROP NOT NULL;
+
+COMMENT ON COLUMN document_versions.content_blob IS 'zlib-compressed JSON: full content for snapshots, a patch otherwise';
+COMMENT ON COLUMN document_versions.base_version_number IS 'Snapshot version the patch in content_blob applies to; NULL for snapshots';
@@ -0,0 +1,44 @@
+-- Migration: Full-text search for documents and knowledge entities
+-- Replaces ILIKE scans with weighted tsvector columns (GIN) and trigram indexes
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Documents created before content_text was populated on insert
+UPDATE documents
+SET content_text = (
+    SELECT string_agg(t #>> '{}', ' ')
+    FROM jsonb_path_query(content, 'strict $.**.text') AS t
+    WHERE jsonb_typeof(t) = 'string'
+)
+WHERE content_text IS NULL;
+
+ALTER TABLE documents
+ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(content_text, '')), 'B')
+) STORED;
+
+CREATE INDEX IF NOT EXISTS ix_documents_search_vector
+ON documents USING gin (search_vector);
+
+CREATE INDEX IF NOT EXISTS ix_documents_title_trgm
+ON documents USING gin (title gin_trgm_ops);
+
+-- Partial-word fallback search also matches body text
+CREATE INDEX IF NOT EXISTS ix_documents_content_text_trgm
+ON documents USING gin (content_text gin_trgm_ops);
+
+ALTER TABLE knowledge_entities
+ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(description, '')), 'B')
+) STORED;
+
+CREATE INDEX IF NOT EXISTS ix_knowledge_entities_search_vector
+ON knowledge_entities USING gin (search_vector);
+
+CREATE INDEX IF NOT EXISTS ix_knowledge_entities_name_trgm
+ON knowledge_entities USING gin (normalized_name gin_trgm_ops);
+
+COMMENT ON COLUMN documents.search_vector IS 'Weighted full-text search document: title (A), content_text (B)';
+COMMENT ON COLUMN knowledge_entities.search_vector IS 'Weighted full-text search document: name (A), description (B)';
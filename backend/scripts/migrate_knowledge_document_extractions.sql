@@ -0,0 +1,15 @@
+-- Migration: Knowledge document extraction hashes
+-- Stores a content hash per document so unchanged documents are not re-extracted
+
+CREATE TABLE IF NOT EXISTS knowledge_document_extractions (
+    document_id UUID PRIMARY KEY REFERENCES documents(id) ON DELETE CASCADE,
+    workspace_id UUID NOT NULL REFERENCES workspaces(id) ON DELETE CASCADE,
+    content_hash VARCHAR(64) NOT NULL,
+    entities_found INTEGER NOT NULL DEFAULT 0,
+    extracted_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS ix_knowledge_document_extractions_workspace_id
+ON knowledge_document_extractions(workspace_id);
+
+COMMENT ON TABLE knowledge_document_extractions IS 'Content hash of each document at its last knowledge extraction';
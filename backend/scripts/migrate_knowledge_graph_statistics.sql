@@ -0,0 +1,8 @@
+-- Migration: Precomputed knowledge graph statistics
+-- Statistics are refreshed at extraction time instead of on every graph view
+
+ALTER TABLE knowledge_graph_summaries
+ADD COLUMN IF NOT EXISTS statistics JSONB,
+ADD COLUMN IF NOT EXISTS statistics_version INTEGER;
+
+COMMENT ON COLUMN knowledge_graph_summaries.statistics IS 'Graph statistics payload as of statistics_version';
@@ -0,0 +1,11 @@
+-- Migration: Knowledge graph summary table
+-- Per-workspace graph version used to invalidate in-memory adjacency snapshots
+
+CREATE TABLE IF NOT EXISTS knowledge_graph_summaries (
+    workspace_id UUID PRIMARY KEY REFERENCES workspaces(id) ON DELETE CASCADE,
+    graph_version INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+COMMENT ON TABLE knowledge_graph_summaries IS 'Per-workspace knowledge graph version and summary data';
+COMMENT ON COLUMN knowledge_graph_summaries.graph_version IS 'Bumped whenever extraction changes entities or relationships';
@@ -0,0 +1,58 @@
+-- Migration: Normalized event filter keys for workflow event subscriptions
+-- Lets incoming events be matched to waiting executions with an indexed lookup
+
+ALTER TABLE crm_workflow_event_subscriptions
+ADD COLUMN IF NOT EXISTS filter_key_count INTEGER NOT NULL DEFAULT 0;
+
+CREATE TABLE IF NOT EXISTS crm_workflow_event_filter_keys (
+    subscription_id UUID NOT NULL REFERENCES crm_workflow_event_subscriptions(id) ON DELETE CASCADE,
+    filter_key VARCHAR(255) NOT NULL,
+    filter_value TEXT NOT NULL,
+    workspace_id UUID NOT NULL,
+    event_type VARCHAR(100) NOT NULL,
+    PRIMARY KEY (subscription_id, filter_key)
+);
+
+CREATE INDEX IF NOT EXISTS idx_workflow_event_filter_keys_lookup
+ON crm_workflow_event_filter_keys(workspace_id, event_type, filter_key, filter_value);
+
+-- Partial index for the active-subscription scan
+CREATE INDEX IF NOT EXISTS idx_workflow_event_subscriptions_active
+ON crm_workflow_event_subscriptions(workspace_id, event_type, filter_key_count)
+WHERE is_active = true;
+
+-- Backfill filter keys for subscriptions that are still waiting, using the
+-- same canonical form as _canonical_filter_value in workflow_event_service:
+-- booleans and integral numbers are stored as ints (true -> 1, 5.0 -> 5).
+-- Object, array and null values are not indexed; they are verified in
+-- application code. Existing rows are rebuilt so re-running fixes them.
+DELETE FROM crm_workflow_event_filter_keys k
+USING crm_workflow_event_subscriptions s
+WHERE k.subscription_id = s.id
+  AND s.is_active = true;
+
+INSERT INTO crm_workflow_event_filter_keys (subscription_id, filter_key, filter_value, workspace_id, event_type)
+SELECT
+    s.id,
+    f.key,
+    CASE
+        WHEN jsonb_typeof(f.value) = 'boolean' THEN
+            CASE WHEN f.value = 'true'::jsonb THEN '1' ELSE '0' END
+        WHEN jsonb_typeof(f.value) = 'number'
+             AND (f.value::text)::numeric = trunc((f.value::text)::numeric) THEN
+            trunc((f.value::text)::numeric)::text
+        ELSE f.value::text
+    END,
+    s.workspace_id,
+    s.event_type
+FROM crm_workflow_event_subscriptions s
+CROSS JOIN LATERAL jsonb_each(s.event_filter) AS f(key, value)
+WHERE s.is_active = true
+  AND jsonb_typeof(f.value) NOT IN ('object', 'array', 'null')
+ON CONFLICT DO NOTHING;
+
+UPDATE crm_workflow_event_subscriptions s
+SET filter_key_count = (
+    SELECT COUNT(*) FROM crm_workflow_event_filter_keys k WHERE k.subscription_id = s.id
+)
+WHERE s.is_active = true;
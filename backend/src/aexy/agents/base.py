@@ -3,13 +3,15 @@
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from typing import Any, Annotated, TypedDict, Sequence
+import asyncio
 import operator
+import time
 
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, ToolMessage
+from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import BaseTool
 from langchain_anthropic import ChatAnthropic
 from langgraph.graph import StateGraph, END
-from langgraph.prebuilt import ToolNode
 
 from aexy.core.config import settings
 
@@ -20,11 +22,36 @@ class AgentState(TypedDict):
     record_id: str | None
     record_data: dict
     context: dict
-    steps: list[dict]
+    steps: Annotated[list[dict], operator.add]
     final_output: dict | None
     error: str | None
 
 
+# Compiled graphs per agent class. Graph nodes look the running agent up in
+# the run config, so one compiled graph serves every instance of a class.
+_compiled_graphs: dict[type, Any] = {}
+
+
+def _agent_of(config: RunnableConfig) -> "BaseAgent":
+    return config["configurable"]["agent"]
+
+
+async def _agent_node(state: AgentState, config: RunnableConfig) -> dict:
+    return await _agent_of(config)._call_model(state)
+
+
+async def _tools_node(state: AgentState, config: RunnableConfig) -> dict:
+    return await _agent_of(config)._process_tools(state)
+
+
+def _route(state: AgentState, config: RunnableConfig) -> str:
+    return _agent_of(config)._should_continue(state)
+
+
+def _elapsed_ms(started: float) -> int:
+    return int((time.monotonic() - started) * 1000)
+
+
 class BaseAgent(ABC):
     """Base class for LangGraph-based agents."""
 
@@ -42,7 +69,8 @@ class BaseAgent(ABC):
         self.max_iterations = max_iterations
         self.timeout_seconds = timeout_seconds
         self._llm: ChatAnthropic | None = None
-        self._tools: list[BaseTool] = []
+        self._llm_with_tools: Any = None
+        self._tools: list[BaseTool] | None = None
         self._graph: StateGraph | None = None
 
     @property
@@ -73,18 +101,26 @@ class BaseAgent(ABC):
         """Define the agent's goal."""
         return self.description
 
+    def _get_tools(self) -> list[BaseTool]:
+        """Get the agent's tool instances, created once per agent."""
+        if self._tools is None:
+            self._tools = self.tools
+        return self._tools
+
     def _get_llm_with_tools(self) -> ChatAnthropic:
         """Get LLM bound with tools."""
-        if self.tools:
-            return self.llm.bind_tools(self.tools)
-        return self.llm
+        if self._llm_with_tools is None:
+            tools = self._get_tools()
+            self._llm_with_tools = self.llm.bind_tools(tools) if tools else self.llm
+        return self._llm_with_tools
 
     def _should_continue(self, state: AgentState) -> str:
         """Determine if agent should continue or end."""
         messages = state["messages"]
 
         # Check iteration limit
-        if len(state.get("steps", [])) >= self.max_iterations:
+        model_calls = sum(1 for step in state.get("steps", []) if step["type"] == "llm_call")
+        if model_calls >= self.max_iterations:
             return "end"
 
         # Check for error
@@ -99,20 +135,25 @@ class BaseAgent(ABC):
 
         return "end"
 
-    def _call_model(self, state: AgentState) -> dict:
+    async def _call_model(self, state: AgentState) -> dict:
         """Call the LLM with current state."""
         messages = state["messages"]
         llm = self._get_llm_with_tools()
+        started = time.monotonic()
 
         try:
-            response = llm.invoke(messages)
+            response = await llm.ainvoke(messages)
 
             # Record step
+            usage = getattr(response, "usage_metadata", None) or {}
             step = {
                 "type": "llm_call",
                 "timestamp": datetime.now(timezone.utc).isoformat(),
                 "input_messages": len(messages),
                 "has_tool_calls": bool(getattr(response, "tool_calls", None)),
+                "duration_ms": _elapsed_ms(started),
+                "input_tokens": usage.get("input_tokens"),
+                "output_tokens": usage.get("output_tokens"),
             }
 
             return {
@@ -129,58 +170,80 @@ class BaseAgent(ABC):
                 }],
             }
 
-    def _process_tools(self, state: AgentState) -> dict:
-        """Process tool calls."""
+    async def _process_tools(self, state: AgentState) -> dict:
+        """Process tool calls.
+
+        The tool calls of one model turn run concurrently, except that tools
+        holding a database session take turns on it, since a session cannot
+        be used by several coroutines at once.
+        """
         messages = state["messages"]
         last_message = messages[-1]
 
         if not hasattr(last_message, "tool_calls") or not last_message.tool_calls:
             return {"messages": []}
 
-        tool_node = ToolNode(self.tools)
-        try:
-            result = tool_node.invoke({"messages": [last_message]})
-
-            # Record tool steps
-            steps = []
-            for tool_call in last_message.tool_calls:
-                steps.append({
-                    "type": "tool_call",
-                    "tool": tool_call.get("name", "unknown"),
-                    "input": tool_call.get("args", {}),
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                })
-
-            return {
-                "messages": result.get("messages", []),
-                "steps": steps,
-            }
-        except Exception as e:
-            return {
-                "messages": [ToolMessage(
-                    content=f"Error executing tools: {str(e)}",
-                    tool_call_id=last_message.tool_calls[0].get("id", ""),
-                )],
-                "steps": [{
-                    "type": "error",
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "error": str(e),
-                }],
+        tools_by_name = {tool.name: tool for tool in self._get_tools()}
+        session_lock = asyncio.Lock()
+
+        async def run_tool_call(tool_call: dict) -> tuple[ToolMessage, dict]:
+            name = tool_call.get("name", "unknown")
+            args = tool_call.get("args", {})
+            started = time.monotonic()
+            status = "success"
+
+            try:
+                tool = tools_by_name.get(name)
+                if tool is None:
+                    raise ValueError(f"Unknown tool: {name}")
+                if getattr(tool, "db", None) is not None:
+                    async with session_lock:
+                        output = await tool.ainvoke(args)
+                else:
+                    output = await tool.ainvoke(args)
+                content = output if isinstance(output, str) else str(output)
+            except Exception as e:
+                status = "error"
+                content = f"Error executing tool {name}: {str(e)}"
+
+            message = ToolMessage(
+                content=content,
+                name=name,
+                tool_call_id=tool_call.get("id", ""),
+                status=status,
+            )
+            step = {
+                "type": "tool_call",
+                "tool": name,
+                "input": args,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "status": status,
+                "duration_ms": _elapsed_ms(started),
             }
+            return message, step
+
+        results = await asyncio.gather(
+            *(run_tool_call(tool_call) for tool_call in last_message.tool_calls)
+        )
+
+        return {
+            "messages": [message for message, _ in results],
+            "steps": [step for _, step in results],
+        }
 
     def _build_graph(self) -> StateGraph:
         """Build the LangGraph state graph."""
         graph = StateGraph(AgentState)
 
         # Add nodes
-        graph.add_node("agent", self._call_model)
-        graph.add_node("tools", self._process_tools)
+        graph.add_node("agent", _agent_node)
+        graph.add_node("tools", _tools_node)
 
         # Add edges
         graph.set_entry_point("agent")
         graph.add_conditional_edges(
             "agent",
-            self._should_continue,
+            _route,
             {
                 "tools": "tools",
                 "end": END,
@@ -192,11 +255,20 @@ class BaseAgent(ABC):
 
     @property
     def graph(self) -> StateGraph:
-        """Get the compiled graph."""
+        """Get the graph definition."""
         if self._graph is None:
             self._graph = self._build_graph()
         return self._graph
 
+    @property
+    def compiled_graph(self) -> Any:
+        """Get the compiled graph, shared by every agent of this class."""
+        compiled = _compiled_graphs.get(type(self))
+        if compiled is None:
+            compiled = self.graph.compile()
+            _compiled_graphs[type(self)] = compiled
+        return compiled
+
     def build_initial_message(
         self,
         record_data: dict,
@@ -253,11 +325,10 @@ Please analyze the information and take appropriate actions to achieve the goal.
             "error": None,
         }
 
-        # Compile and run graph
-        compiled = self.graph.compile()
-
         try:
-            final_state = await compiled.ainvoke(state)
+            final_state = await self.compiled_graph.ainvoke(
+                state, config={"configurable": {"agent": self}}
+            )
 
             # Extract final output
             if final_state["messages"]:
@@ -86,6 +86,7 @@ class WhatIfResponse(BaseModel):
     workload_impacts: list[dict[str, Any]]
     team_impact: dict[str, Any]
     recommendations: list[str]
+    comparison_to_baseline: dict[str, Any] | None = None
 
 
 class OptimizeAssignmentsRequest(BaseModel):
@@ -94,6 +95,12 @@ class OptimizeAssignmentsRequest(BaseModel):
     tasks: list[dict[str, Any]] = Field(description="Tasks to assign")
     max_per_developer: int | None = Field(default=None, description="Max tasks per dev")
     current_workloads: dict[str, int] | None = Field(default=None)
+    required_assignments: list[dict[str, str]] | None = Field(
+        default=None, description="[{task_id, developer_id}] pairs that must be assigned"
+    )
+    forbidden_assignments: list[dict[str, str]] | None = Field(
+        default=None, description="[{task_id, developer_id}] pairs that must not be assigned"
+    )
 
 
 class ScenarioComparisonRequest(BaseModel):
@@ -657,8 +664,9 @@ async def optimize_assignments(
 ) -> WhatIfResponse:
     """Generate an optimized assignment scenario.
 
-    Uses a greedy algorithm to assign tasks to developers
-    based on skill match, experience, and workload balance.
+    Finds the assignment with the highest total skill match that keeps
+    each developer within the workload limit, and reports the gain over
+    greedy assignment.
     """
     result = await db.execute(select(Developer))
     developers = list(result.scalars().all())
@@ -674,6 +682,10 @@ async def optimize_assignments(
         constraints["max_per_dev"] = request.max_per_developer
     if request.current_workloads:
         constraints["current_workloads"] = request.current_workloads
+    if request.required_assignments:
+        constraints["required_assignments"] = request.required_assignments
+    if request.forbidden_assignments:
+        constraints["forbidden_assignments"] = request.forbidden_assignments
 
     analyzer = WhatIfAnalyzer()
     scenario = analyzer.optimize_assignments(
@@ -719,6 +731,7 @@ async def optimize_assignments(
             "warnings": scenario.team_impact.warnings,
         },
         recommendations=scenario.recommendations,
+        comparison_to_baseline=scenario.comparison_to_baseline,
     )
 
 
@@ -43,6 +43,7 @@ from aexy.schemas.crm import (
     FilterCondition,
     SortCondition,
 )
+from aexy.services.crm_query import InvalidCursorError
 from aexy.services.crm_service import (
     CRMObjectService,
     CRMAttributeService,
@@ -1218,6 +1219,7 @@ async def list_records(
     include_archived: bool = False,
     limit: int = Query(default=50, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, description="Keyset cursor from a previous page"),
     current_user: Developer = Depends(get_current_developer),
     db: AsyncSession = Depends(get_db),
 ):
@@ -1225,13 +1227,17 @@ async def list_records(
     await check_workspace_permission(workspace_id, current_user, db)
 
     service = CRMRecordService(db)
-    records, total = await service.list_records(
-        workspace_id=workspace_id,
-        object_id=object_id,
-        include_archived=include_archived,
-        limit=limit,
-        offset=offset,
-    )
+    try:
+        records, total, next_cursor = await service.list_records(
+            workspace_id=workspace_id,
+            object_id=object_id,
+            include_archived=include_archived,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     return {
         "records": [
@@ -1250,6 +1256,7 @@ async def list_records(
         "total": total,
         "limit": limit,
         "offset": offset,
+        "next_cursor": next_cursor,
     }
 
 
@@ -83,7 +83,7 @@ def document_to_response(doc) -> DocumentResponse:
     )
 
 
-def document_to_list_response(doc) -> DocumentListResponse:
+def document_to_list_response(doc, snippet: str | None = None) -> DocumentListResponse:
     """Convert Document model to list response schema."""
     return DocumentListResponse(
         id=str(doc.id),
@@ -94,6 +94,7 @@ def document_to_list_response(doc) -> DocumentListResponse:
         generation_status=doc.generation_status,
         created_at=doc.created_at,
         updated_at=doc.updated_at,
+        snippet=snippet,
     )
 
 
@@ -143,12 +144,13 @@ async def list_documents(
     service = DocumentService(db)
 
     if search:
-        documents = await service.search_documents(
+        results = await service.search_documents(
             workspace_id=workspace_id,
             query=search,
             limit=limit,
             offset=offset,
         )
+        return [document_to_list_response(doc, snippet) for doc, snippet in results]
     else:
         # Get flat list at parent level
         tree = await service.get_document_tree(
@@ -171,8 +173,6 @@ async def list_documents(
             for item in tree
         ]
 
-    return [document_to_list_response(doc) for doc in documents]
-
 
 @router.get("/tree", response_model=list[DocumentTreeItem])
 async def get_document_tree(
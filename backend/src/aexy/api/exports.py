@@ -116,6 +116,7 @@ async def download_export(
     content_types = {
         ExportFormat.CSV: "text/csv",
         ExportFormat.JSON: "application/json",
+        ExportFormat.JSONL: "application/x-ndjson",
         ExportFormat.PDF: "application/pdf",
         ExportFormat.XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
     }
@@ -167,6 +168,13 @@ async def get_available_formats(
             "available": True,
             "requirements": None,
         },
+        {
+            "format": ExportFormat.JSONL.value,
+            "name": "JSON Lines",
+            "description": "One JSON object per line, suited to large exports and streaming",
+            "available": True,
+            "requirements": None,
+        },
         {
             "format": ExportFormat.PDF.value,
             "name": "PDF",
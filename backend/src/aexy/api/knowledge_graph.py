@@ -10,6 +10,7 @@ from aexy.api.developers import get_current_developer_id
 from aexy.core.database import get_db
 from aexy.models.plan import PlanTier
 from aexy.schemas.knowledge_graph import (
+    CompactGraphDataResponse,
     DocumentConnectionsResponse,
     EntitySearchResponse,
     EntitySearchResult,
@@ -97,7 +98,7 @@ async def require_enterprise_workspace(
 
 @router.get(
     "/graph",
-    response_model=GraphDataResponse,
+    response_model=GraphDataResponse | CompactGraphDataResponse,
     summary="Get knowledge graph data",
     description="Get the full knowledge graph data for a workspace with optional filters.",
 )
@@ -115,6 +116,7 @@ async def get_graph(
     include_documents: bool = Query(default=True, description="Include document nodes"),
     include_entities: bool = Query(default=True, description="Include entity nodes"),
     max_nodes: int = Query(default=200, ge=1, le=1000, description="Max nodes to return"),
+    compact: bool = Query(default=False, description="Return the compact columnar format"),
 ):
     """Get knowledge graph data with filters."""
     from datetime import datetime
@@ -154,6 +156,9 @@ async def get_graph(
     service = KnowledgeGraphService(db)
     graph_data = await service.get_graph_data(workspace_id, filters)
 
+    if compact:
+        return CompactGraphDataResponse(**graph_data.to_compact_dict())
+
     return GraphDataResponse(
         nodes=[
             GraphNodeResponse(
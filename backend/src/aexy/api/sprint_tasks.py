@@ -682,10 +682,88 @@ async def add_comment(
 # Export Endpoints
 # ============================================================================
 
-from fastapi.responses import StreamingResponse
+from functools import partial
+
+from fastapi.responses import FileResponse
 from aexy.schemas.analytics import ExportFormat
 from aexy.services.export_service import ExportService
-import io
+
+# (field, column header) pairs of each row-streamed sprint task export, matching
+# the columns the in-memory exporters write for the same format
+SPRINT_TASK_EXPORT_COLUMNS = {
+    ExportFormat.CSV: [
+        ("id", "ID"),
+        ("title", "Title"),
+        ("status", "Status"),
+        ("priority", "Priority"),
+        ("story_points", "Story Points"),
+        ("assignee_name", "Assignee"),
+        ("epic_title", "Epic"),
+        ("labels", "Labels"),
+        ("created_at", "Created At"),
+        ("updated_at", "Updated At"),
+    ],
+    ExportFormat.XLSX: [
+        ("title", "Title"),
+        ("status", "Status"),
+        ("priority", "Priority"),
+        ("story_points", "Story Points"),
+        ("assignee_name", "Assignee"),
+        ("epic_title", "Epic"),
+        ("labels", "Labels"),
+        ("created_at", "Created At"),
+    ],
+    ExportFormat.JSONL: [
+        (field, field)
+        for field in (
+            "id",
+            "title",
+            "description",
+            "status",
+            "priority",
+            "story_points",
+            "labels",
+            "assignee_id",
+            "assignee_name",
+            "epic_id",
+            "epic_title",
+            "created_at",
+            "updated_at",
+        )
+    ],
+}
+
+
+def _sprint_task_export_record(task) -> dict:
+    """Convert a sprint task into its export record."""
+    assignee = task.assignee
+    epic = task.epic if hasattr(task, "epic") else None
+    return {
+        "id": str(task.id),
+        "title": task.title,
+        "description": task.description or "",
+        "status": task.status,
+        "priority": task.priority,
+        "story_points": task.story_points,
+        "labels": task.labels or [],
+        "assignee_id": str(task.assignee_id) if task.assignee_id else None,
+        "assignee_name": assignee.name if assignee else None,
+        "epic_id": str(task.epic_id) if task.epic_id else None,
+        "epic_title": epic.title if epic else None,
+        "created_at": task.created_at.isoformat() if task.created_at else None,
+        "updated_at": task.updated_at.isoformat() if task.updated_at else None,
+    }
+
+
+def _sprint_task_export_row(format: ExportFormat, task) -> list:
+    """Convert a sprint task into a row of SPRINT_TASK_EXPORT_COLUMNS[format]."""
+    record = _sprint_task_export_record(task)
+    if format != ExportFormat.JSONL:
+        record["labels"] = ", ".join(record["labels"])
+    if format == ExportFormat.XLSX:
+        record["status"] = (record["status"] or "").replace("_", " ").title()
+        record["priority"] = (record["priority"] or "").title()
+    return [record[field] for field, _ in SPRINT_TASK_EXPORT_COLUMNS[format]]
 
 
 @router.get("/export/{format}")
@@ -695,7 +773,7 @@ async def export_sprint_tasks(
     db: AsyncSession = Depends(get_db),
     current_user: Developer = Depends(get_current_developer),
 ):
-    """Export sprint tasks in specified format (csv, xlsx, pdf, json)."""
+    """Export sprint tasks in specified format (csv, jsonl, xlsx, pdf, json)."""
     task_service = SprintTaskService(db)
     sprint_service = SprintService(db)
 
@@ -715,49 +793,6 @@ async def export_sprint_tasks(
             detail="You don't have permission to access this sprint",
         )
 
-    # Get all tasks for the sprint
-    tasks = await task_service.get_sprint_tasks(sprint_id)
-
-    # Calculate stats
-    stats = {
-        "total": len(tasks),
-        "completed": len([t for t in tasks if t.status == "done"]),
-        "in_progress": len([t for t in tasks if t.status == "in_progress"]),
-        "todo": len([t for t in tasks if t.status in ["todo", "backlog"]]),
-        "review": len([t for t in tasks if t.status == "review"]),
-        "total_points": sum(t.story_points or 0 for t in tasks),
-        "completed_points": sum(t.story_points or 0 for t in tasks if t.status == "done"),
-    }
-
-    # Convert tasks to export format
-    export_tasks = []
-    for task in tasks:
-        assignee = task.assignee
-        epic = task.epic if hasattr(task, "epic") else None
-        export_tasks.append({
-            "id": str(task.id),
-            "title": task.title,
-            "description": task.description or "",
-            "status": task.status,
-            "priority": task.priority,
-            "story_points": task.story_points,
-            "labels": task.labels or [],
-            "assignee_id": str(task.assignee_id) if task.assignee_id else None,
-            "assignee_name": assignee.name if assignee else None,
-            "epic_id": str(task.epic_id) if task.epic_id else None,
-            "epic_title": epic.title if epic else None,
-            "created_at": task.created_at.isoformat() if task.created_at else None,
-            "updated_at": task.updated_at.isoformat() if task.updated_at else None,
-        })
-
-    data = {
-        "title": f"Sprint: {sprint.name}",
-        "sprint_name": sprint.name,
-        "sprint_id": str(sprint.id),
-        "stats": stats,
-        "tasks": export_tasks,
-    }
-
     # Use export service
     from aexy.schemas.analytics import ExportRequest, ExportType
     export_service = ExportService()
@@ -770,7 +805,44 @@ async def export_sprint_tasks(
     job = await export_service.create_export_job(request, str(current_user.id), db)
     await db.commit()
 
-    completed_job = await export_service.process_export(job.id, db, data)
+    if format in SPRINT_TASK_EXPORT_COLUMNS:
+        # Stream tasks from a server-side cursor straight into the file
+        fields, labels = zip(*SPRINT_TASK_EXPORT_COLUMNS[format])
+        completed_job = await export_service.process_streaming_export(
+            job.id,
+            db,
+            headers=list(fields if format == ExportFormat.JSONL else labels),
+            rows=export_service.stream_query_rows(
+                db,
+                task_service.get_sprint_tasks_export_query(sprint_id),
+                partial(_sprint_task_export_row, format),
+            ),
+            title=f"Sprint: {sprint.name}",
+        )
+    else:
+        # Get all tasks for the sprint
+        tasks = await task_service.get_sprint_tasks(sprint_id)
+
+        # Calculate stats
+        stats = {
+            "total": len(tasks),
+            "completed": len([t for t in tasks if t.status == "done"]),
+            "in_progress": len([t for t in tasks if t.status == "in_progress"]),
+            "todo": len([t for t in tasks if t.status in ["todo", "backlog"]]),
+            "review": len([t for t in tasks if t.status == "review"]),
+            "total_points": sum(t.story_points or 0 for t in tasks),
+            "completed_points": sum(t.story_points or 0 for t in tasks if t.status == "done"),
+        }
+
+        data = {
+            "title": f"Sprint: {sprint.name}",
+            "sprint_name": sprint.name,
+            "sprint_id": str(sprint.id),
+            "stats": stats,
+            "tasks": [_sprint_task_export_record(task) for task in tasks],
+        }
+
+        completed_job = await export_service.process_export(job.id, db, data)
     await db.commit()
 
     if not completed_job or not completed_job.file_path:
@@ -779,30 +851,19 @@ async def export_sprint_tasks(
             detail="Failed to generate export",
         )
 
-    # Return the file
-    from pathlib import Path
-    file_path = Path(completed_job.file_path)
-
     content_types = {
         ExportFormat.CSV: "text/csv",
         ExportFormat.JSON: "application/json",
+        ExportFormat.JSONL: "application/x-ndjson",
         ExportFormat.PDF: "application/pdf",
         ExportFormat.XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
     }
-    extensions = {
-        ExportFormat.CSV: "csv",
-        ExportFormat.JSON: "json",
-        ExportFormat.PDF: "pdf",
-        ExportFormat.XLSX: "xlsx",
-    }
-
-    filename = f"{sprint.name.replace(' ', '_')}_tasks.{extensions[format]}"
 
-    with open(file_path, "rb") as f:
-        content = f.read()
+    filename = f"{sprint.name.replace(' ', '_')}_tasks.{format.value}"
 
-    return StreamingResponse(
-        io.BytesIO(content),
+    # Serve from disk in chunks instead of reading the export into memory
+    return FileResponse(
+        path=completed_job.file_path,
+        filename=filename,
         media_type=content_types[format],
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
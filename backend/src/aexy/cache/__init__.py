@@ -1,5 +1,30 @@
-"""Caching layer for LLM analysis results."""
+"""Caching layer for LLM analysis results, API responses and derived payloads."""
 
 from aexy.cache.analysis_cache import AnalysisCache, get_analysis_cache
+from aexy.cache.calendar_busy_cache import CalendarBusyCache, get_calendar_busy_cache
+from aexy.cache.crm_count_cache import CRMCountCache, get_crm_count_cache
+from aexy.cache.crm_trigger_cache import CRMTriggerVersionCache, get_crm_trigger_version_cache
+from aexy.cache.document_tree_cache import DocumentTreeCache, get_document_tree_cache
+from aexy.cache.github_response_cache import GitHubResponseCache, get_github_response_cache
+from aexy.cache.knowledge_graph_cache import KnowledgeGraphCache, get_knowledge_graph_cache
+from aexy.cache.workflow_cache import InMemoryWorkflowCache, WorkflowCache, get_workflow_cache
 
-__all__ = ["AnalysisCache", "get_analysis_cache"]
+__all__ = [
+    "AnalysisCache",
+    "get_analysis_cache",
+    "CalendarBusyCache",
+    "get_calendar_busy_cache",
+    "CRMCountCache",
+    "get_crm_count_cache",
+    "CRMTriggerVersionCache",
+    "get_crm_trigger_version_cache",
+    "DocumentTreeCache",
+    "get_document_tree_cache",
+    "GitHubResponseCache",
+    "get_github_response_cache",
+    "KnowledgeGraphCache",
+    "get_knowledge_graph_cache",
+    "InMemoryWorkflowCache",
+    "WorkflowCache",
+    "get_workflow_cache",
+]
@@ -0,0 +1,134 @@
+"""Redis-based cache for external calendar free/busy results."""
+
+import json
+import logging
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CALENDAR_BUSY_CACHE_TTL = 120
+
+
+class CalendarBusyCache:
+    """Redis-based cache of busy periods per calendar connection and UTC day.
+
+    Entries are short-lived; they are also dropped for the days of an event
+    whenever one is created, moved or deleted through the connection.
+    """
+
+    def __init__(self, redis_client: Any, ttl: int = CALENDAR_BUSY_CACHE_TTL) -> None:
+        """Initialize the cache.
+
+        Args:
+            redis_client: Redis client (async, binary responses).
+            ttl: Time to live for cached days in seconds.
+        """
+        self._redis = redis_client
+        self._ttl = ttl
+        self._prefix = "aexy:calendar:busy:"
+
+    def _make_key(self, connection_id: str, day: date) -> str:
+        return f"{self._prefix}{connection_id}:{day.isoformat()}"
+
+    async def get_days(self, connection_id: str, days: list[date]) -> dict[date, list[dict]]:
+        """Get the cached busy periods of a connection for some days.
+
+        Args:
+            connection_id: Calendar connection ID.
+            days: UTC days to look up.
+
+        Returns:
+            Busy periods per cached day; days that are not cached are absent.
+        """
+        try:
+            values = await self._redis.mget([self._make_key(connection_id, d) for d in days])
+        except Exception as e:
+            logger.warning(f"Calendar busy cache get failed for {connection_id}: {e}")
+            return {}
+
+        cached = {}
+        for day, value in zip(days, values):
+            if value is None:
+                continue
+            cached[day] = [
+                {
+                    **period,
+                    "start": datetime.fromisoformat(period["start"]),
+                    "end": datetime.fromisoformat(period["end"]),
+                }
+                for period in json.loads(value)
+            ]
+        return cached
+
+    async def set_days(self, connection_id: str, busy_by_day: dict[date, list[dict]]) -> bool:
+        """Cache the busy periods of a connection per day.
+
+        Args:
+            connection_id: Calendar connection ID.
+            busy_by_day: Busy periods overlapping each UTC day.
+
+        Returns:
+            True if cached successfully.
+        """
+        try:
+            pipe = self._redis.pipeline()
+            for day, periods in busy_by_day.items():
+                pipe.setex(
+                    self._make_key(connection_id, day),
+                    self._ttl,
+                    json.dumps(periods, default=lambda value: value.isoformat()),
+                )
+            await pipe.execute()
+            return True
+
+        except Exception as e:
+            logger.warning(f"Calendar busy cache set failed for {connection_id}: {e}")
+            return False
+
+    async def invalidate(self, connection_id: str, days: list[date]) -> bool:
+        """Drop cached days of a connection.
+
+        Args:
+            connection_id: Calendar connection ID.
+            days: UTC days to drop.
+
+        Returns:
+            True if invalidated successfully.
+        """
+        try:
+            await self._redis.delete(*[self._make_key(connection_id, d) for d in days])
+            return True
+
+        except Exception as e:
+            logger.warning(f"Calendar busy cache invalidate failed for {connection_id}: {e}")
+            return False
+
+
+@lru_cache
+def get_calendar_busy_cache() -> CalendarBusyCache | None:
+    """Get the shared calendar free/busy cache.
+
+    Returns:
+        Free/busy cache, or None when caching is disabled or Redis is unavailable.
+    """
+    from aexy.core.config import get_settings
+
+    settings = get_settings()
+    if not settings.calendar_busy_cache_enabled:
+        return None
+
+    try:
+        import redis.asyncio as redis
+
+        client = redis.from_url(settings.redis_url)
+        return CalendarBusyCache(client, ttl=settings.calendar_busy_cache_ttl)
+
+    except ImportError:
+        logger.warning("Redis not installed, calendar busy cache disabled")
+        return None
+
+    except Exception as e:
+        logger.warning(f"Failed to connect to Redis, calendar busy cache disabled: {e}")
+        return None
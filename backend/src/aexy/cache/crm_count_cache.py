@@ -0,0 +1,128 @@
+"""Redis-based cache for CRM record list totals."""
+
+import hashlib
+import json
+import logging
+from functools import lru_cache
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CRM_COUNT_CACHE_TTL = 60
+
+
+class CRMCountCache:
+    """Redis-based cache of filtered record counts per CRM object.
+
+    Counts are keyed by a per-object generation number, which is bumped when
+    records are created or deleted, so totals stay exact across inserts and
+    deletes and are at most ``ttl`` seconds stale for value edits that move
+    records in or out of a filter.
+    """
+
+    def __init__(self, redis_client: Any, ttl: int = CRM_COUNT_CACHE_TTL) -> None:
+        """Initialize the cache.
+
+        Args:
+            redis_client: Redis client (async, binary responses).
+            ttl: Time to live for cached counts in seconds.
+        """
+        self._redis = redis_client
+        self._ttl = ttl
+        self._prefix = "aexy:crm:count:"
+
+    def _generation_key(self, object_id: str) -> str:
+        return f"{self._prefix}{object_id}:gen"
+
+    def _make_key(self, object_id: str, generation: int, query: dict[str, Any]) -> str:
+        """Create a cache key for a query on an object generation."""
+        query_hash = hashlib.sha256(
+            json.dumps(query, sort_keys=True, default=str).encode()
+        ).hexdigest()[:32]
+        return f"{self._prefix}{object_id}:{generation}:{query_hash}"
+
+    async def get(self, object_id: str, query: dict[str, Any]) -> int | None:
+        """Get a cached count.
+
+        Args:
+            object_id: CRM object ID.
+            query: Filters and flags the count was computed for.
+
+        Returns:
+            Cached count if found, None otherwise.
+        """
+        try:
+            generation = int(await self._redis.get(self._generation_key(object_id)) or 0)
+            data = await self._redis.get(self._make_key(object_id, generation, query))
+            return int(data) if data is not None else None
+
+        except Exception as e:
+            logger.warning(f"CRM count cache get failed for object {object_id}: {e}")
+            return None
+
+    async def set(self, object_id: str, query: dict[str, Any], count: int) -> bool:
+        """Cache a count.
+
+        Args:
+            object_id: CRM object ID.
+            query: Filters and flags the count was computed for.
+            count: Number of matching records.
+
+        Returns:
+            True if cached successfully.
+        """
+        try:
+            generation = int(await self._redis.get(self._generation_key(object_id)) or 0)
+            await self._redis.setex(self._make_key(object_id, generation, query), self._ttl, count)
+            return True
+
+        except Exception as e:
+            logger.warning(f"CRM count cache set failed for object {object_id}: {e}")
+            return False
+
+    async def invalidate(self, object_id: str) -> bool:
+        """Invalidate all cached counts of an object.
+
+        Args:
+            object_id: CRM object ID.
+
+        Returns:
+            True if invalidated successfully.
+        """
+        try:
+            key = self._generation_key(object_id)
+            await self._redis.incr(key)
+            await self._redis.expire(key, self._ttl * 10)
+            return True
+
+        except Exception as e:
+            logger.warning(f"CRM count cache invalidate failed for object {object_id}: {e}")
+            return False
+
+
+@lru_cache
+def get_crm_count_cache() -> CRMCountCache | None:
+    """Get the shared CRM count cache.
+
+    Returns:
+        Count cache, or None when caching is disabled or Redis is unavailable.
+    """
+    from aexy.core.config import get_settings
+
+    settings = get_settings()
+    if not settings.crm_count_cache_enabled:
+        return None
+
+    try:
+        import redis.asyncio as redis
+
+        client = redis.from_url(settings.redis_url)
+        return CRMCountCache(client, ttl=settings.crm_count_cache_ttl)
+
+    except ImportError:
+        logger.warning("Redis not installed, CRM count cache disabled")
+        return None
+
+    except Exception as e:
+        logger.warning(f"Failed to connect to Redis, CRM count cache disabled: {e}")
+        return None
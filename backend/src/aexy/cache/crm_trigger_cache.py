@@ -0,0 +1,89 @@
+"""Redis-based version counters for in-process CRM trigger indexes."""
+
+import logging
+from functools import lru_cache
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class CRMTriggerVersionCache:
+    """Per-workspace version numbers of the CRM automation trigger set.
+
+    Every process keeps its own compiled trigger index; the shared version is
+    bumped whenever an automation changes so all processes notice and rebuild
+    on their next lookup. Versions are tiny integers and are kept without TTL.
+    """
+
+    def __init__(self, redis_client: Any) -> None:
+        """Initialize the cache.
+
+        Args:
+            redis_client: Redis client (async, binary responses).
+        """
+        self._redis = redis_client
+        self._prefix = "aexy:crm:triggers:"
+
+    def _version_key(self, workspace_id: str) -> str:
+        return f"{self._prefix}{workspace_id}:version"
+
+    async def get_version(self, workspace_id: str) -> int | None:
+        """Get the trigger set version of a workspace.
+
+        Args:
+            workspace_id: Workspace ID.
+
+        Returns:
+            Current version, or None if Redis is unavailable.
+        """
+        try:
+            return int(await self._redis.get(self._version_key(workspace_id)) or 0)
+
+        except Exception as e:
+            logger.warning(f"CRM trigger version get failed for workspace {workspace_id}: {e}")
+            return None
+
+    async def bump_version(self, workspace_id: str) -> bool:
+        """Increment the trigger set version of a workspace.
+
+        Args:
+            workspace_id: Workspace ID.
+
+        Returns:
+            True if bumped successfully.
+        """
+        try:
+            await self._redis.incr(self._version_key(workspace_id))
+            return True
+
+        except Exception as e:
+            logger.warning(f"CRM trigger version bump failed for workspace {workspace_id}: {e}")
+            return False
+
+
+@lru_cache
+def get_crm_trigger_version_cache() -> CRMTriggerVersionCache | None:
+    """Get the shared CRM trigger version cache.
+
+    Returns:
+        Version cache, or None when disabled or Redis is unavailable.
+    """
+    from aexy.core.config import get_settings
+
+    settings = get_settings()
+    if not settings.crm_trigger_index_enabled:
+        return None
+
+    try:
+        import redis.asyncio as redis
+
+        client = redis.from_url(settings.redis_url)
+        return CRMTriggerVersionCache(client)
+
+    except ImportError:
+        logger.warning("Redis not installed, CRM trigger index caching disabled")
+        return None
+
+    except Exception as e:
+        logger.warning(f"Failed to connect to Redis, CRM trigger index caching disabled: {e}")
+        return None
@@ -0,0 +1,118 @@
+"""Redis-based cache for workspace document trees."""
+
+import json
+import logging
+import zlib
+from functools import lru_cache
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DOCUMENT_TREE_CACHE_TTL = 300
+
+
+class DocumentTreeCache:
+    """Redis-based cache of the flat document tree nodes of a workspace.
+
+    Stores the per-document fields the sidebar tree is assembled from (no
+    per-user data), as zlib-compressed JSON. Entries are invalidated after
+    documents or spaces are created, updated, moved or deleted.
+    """
+
+    def __init__(self, redis_client: Any, ttl: int = DOCUMENT_TREE_CACHE_TTL) -> None:
+        """Initialize the cache.
+
+        Args:
+            redis_client: Redis client (async, binary responses).
+            ttl: Time to live for cached trees in seconds.
+        """
+        self._redis = redis_client
+        self._ttl = ttl
+        self._prefix = "aexy:document_tree:"
+
+    def _make_key(self, workspace_id: str) -> str:
+        """Create a cache key for a workspace."""
+        return f"{self._prefix}{workspace_id}"
+
+    async def get(self, workspace_id: str) -> list[dict[str, Any]] | None:
+        """Get the cached tree nodes of a workspace.
+
+        Args:
+            workspace_id: Workspace ID.
+
+        Returns:
+            Cached nodes if found, None otherwise.
+        """
+        try:
+            data = await self._redis.get(self._make_key(workspace_id))
+            if data is None:
+                return None
+            return json.loads(zlib.decompress(data))
+
+        except Exception as e:
+            logger.warning(f"Document tree cache get failed for workspace {workspace_id}: {e}")
+            return None
+
+    async def set(self, workspace_id: str, nodes: list[dict[str, Any]]) -> bool:
+        """Cache the tree nodes of a workspace.
+
+        Args:
+            workspace_id: Workspace ID.
+            nodes: JSON-serializable tree nodes.
+
+        Returns:
+            True if cached successfully.
+        """
+        try:
+            data = zlib.compress(json.dumps(nodes, separators=(",", ":")).encode(), 6)
+            await self._redis.setex(self._make_key(workspace_id), self._ttl, data)
+            return True
+
+        except Exception as e:
+            logger.warning(f"Document tree cache set failed for workspace {workspace_id}: {e}")
+            return False
+
+    async def invalidate(self, workspace_id: str) -> bool:
+        """Drop the cached tree of a workspace.
+
+        Args:
+            workspace_id: Workspace ID.
+
+        Returns:
+            True if invalidated successfully.
+        """
+        try:
+            await self._redis.delete(self._make_key(workspace_id))
+            return True
+
+        except Exception as e:
+            logger.warning(f"Document tree cache invalidate failed for workspace {workspace_id}: {e}")
+            return False
+
+
+@lru_cache
+def get_document_tree_cache() -> DocumentTreeCache | None:
+    """Get the shared document tree cache.
+
+    Returns:
+        Tree cache, or None when caching is disabled or Redis is unavailable.
+    """
+    from aexy.core.config import get_settings
+
+    settings = get_settings()
+    if not settings.document_tree_cache_enabled:
+        return None
+
+    try:
+        import redis.asyncio as redis
+
+        client = redis.from_url(settings.redis_url)
+        return DocumentTreeCache(client, ttl=settings.document_tree_cache_ttl)
+
+    except ImportError:
+        logger.warning("Redis not installed, document tree cache disabled")
+        return None
+
+    except Exception as e:
+        logger.warning(f"Failed to connect to Redis, document tree cache disabled: {e}")
+        return None
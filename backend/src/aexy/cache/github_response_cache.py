@@ -0,0 +1,167 @@
+"""Redis-based HTTP response cache for conditional GitHub API requests."""
+
+import hashlib
+import json
+import logging
+import zlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Cached responses are only a source of validators; GitHub decides freshness,
+# so a long TTL is safe and maximizes 304 hits on incremental syncs.
+GITHUB_RESPONSE_CACHE_TTL = 7 * 86400
+
+
+@dataclass
+class CachedResponse:
+    """A cached GitHub API response with its validators."""
+
+    body: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Build the conditional request headers for this entry."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class GitHubResponseCache:
+    """Redis-based cache of GitHub API responses keyed by (token scope, URL).
+
+    Stores ETag/Last-Modified validators with a zlib-compressed body so
+    requests can be sent conditionally. GitHub answers unchanged resources
+    with 304 Not Modified, which does not count against the rate limit.
+    """
+
+    def __init__(self, redis_client: Any, ttl: int = GITHUB_RESPONSE_CACHE_TTL) -> None:
+        """Initialize the cache.
+
+        Args:
+            redis_client: Redis client (async, binary responses).
+            ttl: Time to live for cached responses in seconds.
+        """
+        self._redis = redis_client
+        self._ttl = ttl
+        self._prefix = "aexy:github:http:"
+
+    def _make_key(self, access_token: str, url: str) -> str:
+        """Create a cache key scoped to the token (hashed) and URL."""
+        token_hash = hashlib.sha256(access_token.encode()).hexdigest()[:16]
+        url_hash = hashlib.sha256(url.encode()).hexdigest()[:32]
+        return f"{self._prefix}{token_hash}:{url_hash}"
+
+    async def get(self, access_token: str, url: str) -> CachedResponse | None:
+        """Get a cached response.
+
+        Args:
+            access_token: GitHub token the response was fetched with.
+            url: Request path including its query string.
+
+        Returns:
+            Cached response if found, None otherwise.
+        """
+        try:
+            data = await self._redis.get(self._make_key(access_token, url))
+            if data is None:
+                return None
+
+            header_len = int.from_bytes(data[:4], "big")
+            meta = json.loads(data[4 : 4 + header_len])
+            return CachedResponse(
+                body=zlib.decompress(data[4 + header_len :]),
+                etag=meta.get("etag"),
+                last_modified=meta.get("last_modified"),
+            )
+
+        except Exception as e:
+            logger.warning(f"GitHub response cache get failed for {url}: {e}")
+            return None
+
+    async def set(
+        self,
+        access_token: str,
+        url: str,
+        body: bytes,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> bool:
+        """Cache a response body with its validators.
+
+        Args:
+            access_token: GitHub token the response was fetched with.
+            url: Request path including its query string.
+            body: Raw response body.
+            etag: ETag response header.
+            last_modified: Last-Modified response header.
+
+        Returns:
+            True if cached successfully.
+        """
+        if not etag and not last_modified:
+            return False
+
+        try:
+            meta = json.dumps({"etag": etag, "last_modified": last_modified}).encode()
+            payload = len(meta).to_bytes(4, "big") + meta + zlib.compress(body, 6)
+            await self._redis.setex(self._make_key(access_token, url), self._ttl, payload)
+            return True
+
+        except Exception as e:
+            logger.warning(f"GitHub response cache set failed for {url}: {e}")
+            return False
+
+    async def clear_token(self, access_token: str) -> int:
+        """Delete all cached responses for a token.
+
+        Args:
+            access_token: GitHub token whose responses should be dropped.
+
+        Returns:
+            Number of keys deleted.
+        """
+        try:
+            token_hash = hashlib.sha256(access_token.encode()).hexdigest()[:16]
+            keys = [k async for k in self._redis.scan_iter(f"{self._prefix}{token_hash}:*")]
+            if keys:
+                await self._redis.delete(*keys)
+            return len(keys)
+
+        except Exception as e:
+            logger.warning(f"GitHub response cache clear failed: {e}")
+            return 0
+
+
+@lru_cache
+def get_github_response_cache() -> GitHubResponseCache | None:
+    """Get the shared GitHub response cache.
+
+    Returns:
+        Response cache, or None when caching is disabled or Redis is unavailable.
+    """
+    from aexy.core.config import get_settings
+
+    settings = get_settings()
+    if not settings.github_response_cache_enabled:
+        return None
+
+    try:
+        import redis.asyncio as redis
+
+        client = redis.from_url(settings.redis_url)
+        return GitHubResponseCache(client, ttl=settings.github_response_cache_ttl)
+
+    except ImportError:
+        logger.warning("Redis not installed, GitHub response cache disabled")
+        return None
+
+    except Exception as e:
+        logger.warning(f"Failed to connect to Redis, GitHub response cache disabled: {e}")
+        return None
@@ -0,0 +1,179 @@
+"""Redis-based cache for serialized knowledge graph payloads."""
+
+import hashlib
+import json
+import logging
+import zlib
+from functools import lru_cache
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+KNOWLEDGE_GRAPH_CACHE_TTL = 3600
+
+
+class KnowledgeGraphCache:
+    """Redis-based cache of graph payloads keyed by (workspace, graph version, filters).
+
+    Extraction bumps the workspace's graph version, so new requests miss and
+    stale entries expire via TTL. Payloads also embed document titles and
+    timestamps, which change without a new graph version; document edits
+    call ``invalidate`` to bump a per-workspace cache generation that is part
+    of the key. Payloads are stored as zlib-compressed JSON.
+    """
+
+    def __init__(self, redis_client: Any, ttl: int = KNOWLEDGE_GRAPH_CACHE_TTL) -> None:
+        """Initialize the cache.
+
+        Args:
+            redis_client: Redis client (async, binary responses).
+            ttl: Time to live for cached payloads in seconds.
+        """
+        self._redis = redis_client
+        self._ttl = ttl
+        self._prefix = "aexy:knowledge_graph:"
+
+    def _make_key(
+        self,
+        workspace_id: str,
+        version: int,
+        generation: int,
+        filters_key: str,
+    ) -> str:
+        """Create a cache key from the workspace, graph version, generation and filter set."""
+        filters_hash = hashlib.sha256(filters_key.encode()).hexdigest()[:32]
+        return f"{self._prefix}{workspace_id}:{version}.{generation}:{filters_hash}"
+
+    def _generation_key(self, workspace_id: str) -> str:
+        """Create the key of a workspace's cache generation counter."""
+        return f"{self._prefix}{workspace_id}:generation"
+
+    async def generation(self, workspace_id: str) -> int:
+        """Get the current cache generation of a workspace.
+
+        Read it before building a payload and pass it to ``set``, so a payload
+        built while a document changed is stored under the old generation.
+
+        Args:
+            workspace_id: Workspace ID.
+
+        Returns:
+            Cache generation, 0 if the workspace was never invalidated.
+        """
+        try:
+            data = await self._redis.get(self._generation_key(workspace_id))
+            return int(data) if data is not None else 0
+
+        except Exception as e:
+            logger.warning(
+                f"Knowledge graph cache generation failed for workspace {workspace_id}: {e}"
+            )
+            return 0
+
+    async def invalidate(self, workspace_id: str) -> bool:
+        """Make every cached payload of a workspace stale.
+
+        Args:
+            workspace_id: Workspace ID.
+
+        Returns:
+            True if invalidated successfully.
+        """
+        try:
+            await self._redis.incr(self._generation_key(workspace_id))
+            return True
+
+        except Exception as e:
+            logger.warning(
+                f"Knowledge graph cache invalidate failed for workspace {workspace_id}: {e}"
+            )
+            return False
+
+    async def get(
+        self,
+        workspace_id: str,
+        version: int,
+        generation: int,
+        filters_key: str,
+    ) -> dict | None:
+        """Get a cached graph payload.
+
+        Args:
+            workspace_id: Workspace ID.
+            version: Current graph version of the workspace.
+            generation: Current cache generation of the workspace.
+            filters_key: Canonical representation of the applied filters.
+
+        Returns:
+            Cached payload if found, None otherwise.
+        """
+        try:
+            data = await self._redis.get(
+                self._make_key(workspace_id, version, generation, filters_key)
+            )
+            if data is None:
+                return None
+            return json.loads(zlib.decompress(data))
+
+        except Exception as e:
+            logger.warning(f"Knowledge graph cache get failed for workspace {workspace_id}: {e}")
+            return None
+
+    async def set(
+        self,
+        workspace_id: str,
+        version: int,
+        generation: int,
+        filters_key: str,
+        payload: dict,
+    ) -> bool:
+        """Cache a graph payload.
+
+        Args:
+            workspace_id: Workspace ID.
+            version: Graph version the payload was built from.
+            generation: Cache generation read before building the payload.
+            filters_key: Canonical representation of the applied filters.
+            payload: JSON-serializable graph payload.
+
+        Returns:
+            True if cached successfully.
+        """
+        try:
+            data = zlib.compress(json.dumps(payload, separators=(",", ":")).encode(), 6)
+            await self._redis.setex(
+                self._make_key(workspace_id, version, generation, filters_key), self._ttl, data
+            )
+            return True
+
+        except Exception as e:
+            logger.warning(f"Knowledge graph cache set failed for workspace {workspace_id}: {e}")
+            return False
+
+
+@lru_cache
+def get_knowledge_graph_cache() -> KnowledgeGraphCache | None:
+    """Get the shared knowledge graph cache.
+
+    Returns:
+        Graph cache, or None when caching is disabled or Redis is unavailable.
+    """
+    from aexy.core.config import get_settings
+
+    settings = get_settings()
+    if not settings.knowledge_graph_cache_enabled:
+        return None
+
+    try:
+        import redis.asyncio as redis
+
+        client = redis.from_url(settings.redis_url)
+        return KnowledgeGraphCache(client, ttl=settings.knowledge_graph_cache_ttl)
+
+    except ImportError:
+        logger.warning("Redis not installed, knowledge graph cache disabled")
+        return None
+
+    except Exception as e:
+        logger.warning(f"Failed to connect to Redis, knowledge graph cache disabled: {e}")
+        return None
@@ -3,6 +3,7 @@
 import json
 import logging
 from collections import defaultdict
+from functools import lru_cache
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -91,7 +92,10 @@ class WorkflowCache:
             return False
 
     async def invalidate_workflow(self, workflow_id: str) -> bool:
-        """Invalidate a cached workflow and its topological sort.
+        """Invalidate a cached workflow, its topological sort and compiled plans.
+
+        Compiled plans are only dropped in this process; other processes key
+        them by workflow version and never reuse a stale one.
 
         Args:
             workflow_id: The workflow ID.
@@ -99,6 +103,10 @@ class WorkflowCache:
         Returns:
             True if invalidated.
         """
+        from aexy.services.workflow_plan import invalidate_workflow_plans
+
+        invalidate_workflow_plans(workflow_id)
+
         try:
             # Delete workflow cache
             workflow_key = self._workflow_key(workflow_id)
@@ -106,7 +114,7 @@ class WorkflowCache:
 
             # Delete all version-specific topo caches
             pattern = f"{self._topo_prefix}{workflow_id}:*"
-            keys = await self._redis.keys(pattern)
+            keys = [key async for key in self._redis.scan_iter(match=pattern)]
             if keys:
                 await self._redis.delete(*keys)
 
@@ -267,7 +275,10 @@ class InMemoryWorkflowCache:
         return True
 
     async def invalidate_workflow(self, workflow_id: str) -> bool:
-        """Invalidate cached workflow."""
+        """Invalidate cached workflow and compiled plans."""
+        from aexy.services.workflow_plan import invalidate_workflow_plans
+
+        invalidate_workflow_plans(workflow_id)
         keys_to_delete = [k for k in self._cache if workflow_id in k]
         for key in keys_to_delete:
             del self._cache[key]
@@ -293,3 +304,27 @@ class InMemoryWorkflowCache:
         self._evict_if_needed()
         self._cache[f"topo:{workflow_id}:v{version}"] = (execution_order, time.time())
         return True
+
+
+@lru_cache
+def get_workflow_cache() -> WorkflowCache | InMemoryWorkflowCache:
+    """Get the shared workflow cache.
+
+    Returns:
+        Redis-backed cache, or the in-memory fallback when Redis is unavailable.
+    """
+    from aexy.core.config import get_settings
+
+    try:
+        import redis.asyncio as redis
+
+        client = redis.from_url(get_settings().redis_url)
+        return WorkflowCache(client)
+
+    except ImportError:
+        logger.warning("Redis not installed, using in-memory workflow cache")
+        return InMemoryWorkflowCache()
+
+    except Exception as e:
+        logger.warning(f"Failed to connect to Redis, using in-memory workflow cache: {e}")
+        return InMemoryWorkflowCache()
@@ -0,0 +1,161 @@
+"""Long-lived event loop for running async I/O from synchronous code.
+
+Celery tasks and other sync code paths submit coroutines to a loop that
+runs in a daemon thread for the lifetime of the process, so pooled clients
+bound to that loop (the async database engine, Redis clients, HTTP
+connections) are reused across calls instead of being rebuilt per call.
+
+Celery workers start the runtime on ``worker_process_init`` and stop it on
+``worker_process_shutdown`` (see ``aexy.processing.celery_app``); anywhere
+else it is started lazily on first use.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import weakref
+from concurrent.futures import Future
+from typing import Any, Coroutine, TypeVar
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Connection pool limits of the shared HTTP client
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+HTTP_TIMEOUT_SECONDS = 30.0
+
+
+def _new_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=HTTP_TIMEOUT_SECONDS,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        ),
+    )
+
+
+class AsyncRuntime:
+    """An asyncio event loop running in a dedicated daemon thread."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop, name="aexy-async-runtime", daemon=True
+        )
+        self._http_client: httpx.AsyncClient | None = None
+        self._thread.start()
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread.is_alive() and not self.loop.is_closed()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "Future[T]":
+        """Schedule a coroutine on the runtime loop from any other thread."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """Run a coroutine on the runtime loop and wait for its result.
+
+        If the wait is interrupted (timeout, Celery time limit, ...) the
+        coroutine is cancelled rather than left running on the loop.
+
+        Raises:
+            RuntimeError: If called from the runtime loop itself, which would
+                deadlock.
+        """
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("AsyncRuntime.run() called from the runtime loop")
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client bound to the runtime loop.
+
+        Must only be used from coroutines running on the runtime loop.
+        """
+        if self._http_client is None:
+            self._http_client = _new_http_client()
+        return self._http_client
+
+    async def _aclose(self) -> None:
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Close pooled clients and stop the loop."""
+        if not self.is_running:
+            return
+        try:
+            self.run(self._aclose(), timeout)
+        except Exception as e:
+            logger.warning(f"Failed to close async runtime clients: {e}")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+
+
+_runtimes: dict[int, AsyncRuntime] = {}
+_runtimes_lock = threading.Lock()
+
+
+def get_async_runtime() -> AsyncRuntime:
+    """Get the async runtime of the current process, starting it if needed.
+
+    Runtimes are keyed by PID so forked workers never inherit the parent's
+    (threadless) loop.
+    """
+    pid = os.getpid()
+    runtime = _runtimes.get(pid)
+    if runtime is not None and runtime.is_running:
+        return runtime
+
+    with _runtimes_lock:
+        runtime = _runtimes.get(pid)
+        if runtime is None or not runtime.is_running:
+            runtime = AsyncRuntime()
+            _runtimes[pid] = runtime
+            logger.debug(f"Started async runtime for process {pid}")
+    return runtime
+
+
+def shutdown_async_runtime(timeout: float = 5.0) -> None:
+    """Stop the async runtime of the current process, if one was started."""
+    with _runtimes_lock:
+        runtime = _runtimes.pop(os.getpid(), None)
+    if runtime is not None:
+        runtime.stop(timeout)
+
+
+_loop_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get a pooled HTTP client for the running event loop.
+
+    Connections are bound to the loop they were opened on, so each loop
+    (the API server's, a worker's runtime loop) gets its own client.
+    """
+    loop = asyncio.get_running_loop()
+    client = _loop_http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = _new_http_client()
+        _loop_http_clients[loop] = client
+    return client
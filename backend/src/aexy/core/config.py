@@ -265,6 +265,18 @@ class Settings(BaseSettings):
     # GitHub API
     github_api_base_url: str = "https://api.github.com"
     github_oauth_url: str = "https://github.com/login/oauth"
+    github_response_cache_enabled: bool = Field(
+        default=True,
+        description="Cache GitHub API responses and send conditional (ETag) requests",
+    )
+    github_response_cache_ttl: int = Field(
+        default=7 * 86400,
+        description="TTL in seconds for cached GitHub API responses",
+    )
+    github_graphql_sync_enabled: bool = Field(
+        default=True,
+        description="Use bulk GraphQL queries for commit/PR/review sync (REST fallback)",
+    )
 
     # GitHub Webhook
     github_webhook_secret: str = ""
@@ -312,6 +324,56 @@ class Settings(BaseSettings):
         default="redis://localhost:6379/0",
         description="Redis connection URL",
     )
+    knowledge_graph_cache_enabled: bool = Field(
+        default=True,
+        description="Cache serialized knowledge graph payloads per graph version",
+    )
+    knowledge_graph_cache_ttl: int = Field(
+        default=3600,
+        description="TTL in seconds for cached knowledge graph payloads",
+    )
+    document_tree_cache_enabled: bool = Field(
+        default=True,
+        description="Cache workspace document trees for the docs sidebar",
+    )
+    document_tree_cache_ttl: int = Field(
+        default=300,
+        description="TTL in seconds for cached document trees",
+    )
+    crm_count_cache_enabled: bool = Field(
+        default=True,
+        description="Cache filtered CRM record list totals",
+    )
+    crm_count_cache_ttl: int = Field(
+        default=60,
+        description="TTL in seconds for cached CRM record counts",
+    )
+    crm_trigger_index_enabled: bool = Field(
+        default=True,
+        description="Reuse compiled CRM automation trigger indexes across requests",
+    )
+    calendar_busy_cache_enabled: bool = Field(
+        default=True,
+        description="Cache external calendar free/busy results per connection and day",
+    )
+    calendar_busy_cache_ttl: int = Field(
+        default=120,
+        description="TTL in seconds for cached calendar free/busy results",
+    )
+
+    # Workflow execution
+    workflow_journal_enabled: bool = Field(
+        default=True,
+        description="Buffer workflow step records and commit only at durability boundaries",
+    )
+    workflow_journal_flush_steps: int = Field(
+        default=20,
+        description="Maximum number of buffered workflow steps before a journal flush",
+    )
+    workflow_timers_enabled: bool = Field(
+        default=True,
+        description="Schedule workflow wait resumes and timeouts in a Redis timer queue",
+    )
 
     # Celery (for background processing)
     celery_broker_url: str = Field(
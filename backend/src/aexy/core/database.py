@@ -1,11 +1,12 @@
 """Database configuration and session management."""
 
+import asyncio
 import os
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager, contextmanager
-from typing import Generator
+from typing import Any, Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
@@ -91,6 +92,53 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+# Session.info key holding callbacks queued by run_after_commit
+_AFTER_COMMIT_CALLBACKS = "aexy_after_commit_callbacks"
+
+# Strong references to running after-commit tasks so they are not collected
+_after_commit_tasks: set[asyncio.Task] = set()
+
+
+def _run_after_commit_callbacks(session: Session) -> None:
+    """Schedule the callbacks queued on a session that just committed."""
+    callbacks = session.info.pop(_AFTER_COMMIT_CALLBACKS, [])
+    if not callbacks:
+        return
+    loop = asyncio.get_running_loop()
+    for callback in callbacks:
+        task = loop.create_task(callback())
+        _after_commit_tasks.add(task)
+        task.add_done_callback(_after_commit_tasks.discard)
+
+
+def _discard_after_commit_callbacks(session: Session, previous_transaction: Any) -> None:
+    """Drop queued callbacks when the outermost transaction rolls back."""
+    if previous_transaction.parent is None:
+        session.info.pop(_AFTER_COMMIT_CALLBACKS, None)
+
+
+def run_after_commit(session: AsyncSession, callback: Callable[[], Awaitable[Any]]) -> None:
+    """Run an async callback once the session's current transaction commits.
+
+    Use this for side effects such as cache invalidation that must not be
+    observed before the data they describe is visible to other sessions.
+    Callbacks are dropped if the transaction rolls back instead.
+
+    Args:
+        session: Session whose next commit triggers the callback.
+        callback: Coroutine function called without arguments.
+    """
+    sync_session = session.sync_session
+    if _AFTER_COMMIT_CALLBACKS not in sync_session.info:
+        sync_session.info[_AFTER_COMMIT_CALLBACKS] = []
+        if not event.contains(sync_session, "after_commit", _run_after_commit_callbacks):
+            event.listen(sync_session, "after_commit", _run_after_commit_callbacks)
+            event.listen(
+                sync_session, "after_soft_rollback", _discard_after_commit_callbacks
+            )
+    sync_session.info[_AFTER_COMMIT_CALLBACKS].append(callback)
+
+
 @asynccontextmanager
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     """Get an async database session as a context manager.
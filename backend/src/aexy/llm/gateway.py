@@ -1,6 +1,7 @@
 """Unified LLM gateway with provider selection and caching."""
 
 import hashlib
+import json
 import logging
 from functools import lru_cache
 from typing import TYPE_CHECKING, Any
@@ -16,6 +17,7 @@ from aexy.llm.base import (
     MatchScore,
     TaskSignals,
 )
+from aexy.llm.prompts import MATCH_RANKING_PROMPT, MATCH_RANKING_SYSTEM_PROMPT
 
 if TYPE_CHECKING:
     from aexy.services.llm_rate_limiter import LLMRateLimiter
@@ -411,25 +413,123 @@ class LLMGateway:
         self,
         task_signals: TaskSignals,
         developers: list[dict[str, Any]],
+        use_cache: bool = True,
+        cache_ttl: int = 3600,
+        skip_rate_limit: bool = False,
+        workspace_id: str | None = None,
     ) -> list[MatchScore]:
-        """Rank multiple developers for a task.
+        """Rank multiple developers for a task in a single LLM call.
+
+        Results are cached on the task signals and the developer profiles,
+        so re-ranking an unchanged shortlist costs nothing.
 
         Args:
             task_signals: Extracted task signals.
             developers: List of developer skill profiles.
+            use_cache: Whether to use caching.
+            cache_ttl: Cache TTL in seconds (default 1 hour).
+            skip_rate_limit: Skip rate limit check.
+            workspace_id: Optional workspace ID for workspace-level rate limiting.
 
         Returns:
-            Ranked list of match scores.
+            Ranked list of match scores, one per developer.
+
+        Raises:
+            LLMRateLimitError: If rate limit is exceeded.
         """
+        if not developers:
+            return []
+
+        cache_key = None
+        if use_cache and self.cache:
+            cache_key = self._hash_content(
+                "rank_developers:"
+                + json.dumps(
+                    {"task": task_signals.model_dump(), "developers": developers},
+                    sort_keys=True,
+                    default=str,
+                )
+            )
+            cached = await self.cache.get(cache_key)
+            if cached:
+                return [MatchScore.model_validate(score) for score in cached["rankings"]]
+
+        tokens_estimate = 300 + 150 * len(developers)
+        if not skip_rate_limit:
+            await self._check_rate_limit(
+                tokens_estimate=tokens_estimate,
+                workspace_id=workspace_id,
+            )
+
+        prompt = MATCH_RANKING_PROMPT.format(
+            required_skills=", ".join(task_signals.required_skills),
+            preferred_skills=", ".join(task_signals.preferred_skills),
+            domain=task_signals.domain or "unspecified",
+            complexity=task_signals.complexity,
+            candidates="\n".join(self._format_ranking_candidate(d) for d in developers),
+        )
+        response_text, total_tokens, *_ = await self.provider._call_api(
+            MATCH_RANKING_SYSTEM_PROMPT, prompt
+        )
+        await self._record_rate_limit_usage(total_tokens, workspace_id=workspace_id)
+
+        data = self.provider._parse_json_response(response_text)
+        ranked = {
+            str(entry.get("developer_id", "")): entry
+            for entry in data.get("rankings", [])
+            if isinstance(entry, dict)
+        }
+
+        def bounded(value: Any) -> float:
+            try:
+                return min(max(float(value), 0.0), 100.0)
+            except (TypeError, ValueError):
+                return 0.0
+
         scores = []
         for developer in developers:
-            score = await self.score_match(task_signals, developer)
-            scores.append(score)
+            developer_id = str(developer.get("developer_id", ""))
+            entry = ranked.get(developer_id, {})
+            scores.append(
+                MatchScore(
+                    developer_id=developer_id,
+                    overall_score=bounded(entry.get("overall_score")),
+                    skill_match=bounded(entry.get("skill_match")),
+                    experience_match=bounded(entry.get("experience_match")),
+                    growth_opportunity=bounded(entry.get("growth_opportunity")),
+                    reasoning=entry.get("reasoning", "") if entry else "Not ranked by the model",
+                    strengths=entry.get("strengths", []),
+                    gaps=entry.get("gaps", []),
+                )
+            )
 
         # Sort by overall score descending
         scores.sort(key=lambda s: s.overall_score, reverse=True)
+
+        if use_cache and self.cache and cache_key and ranked:
+            await self.cache.set(
+                cache_key,
+                {"rankings": [score.model_dump() for score in scores]},
+                ttl=cache_ttl,
+            )
+
         return scores
 
+    @staticmethod
+    def _format_ranking_candidate(developer: dict[str, Any]) -> str:
+        """Format a developer skill profile as one candidate line."""
+
+        def names(key: str) -> str:
+            return ", ".join(item.get("name", "") for item in developer.get(key, [])) or "none"
+
+        return (
+            f"- id: {developer.get('developer_id', '')}; "
+            f"languages: {names('languages')}; "
+            f"frameworks: {names('frameworks')}; "
+            f"domains: {names('domains')}; "
+            f"recent activity: {developer.get('recent_activity', 'unknown')}"
+        )
+
     async def health_check(self) -> dict[str, Any]:
         """Check health of the gateway and its components.
 
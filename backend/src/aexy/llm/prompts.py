@@ -208,6 +208,38 @@ Respond with JSON:
 }}"""
 
 
+MATCH_RANKING_SYSTEM_PROMPT = """You are an expert at matching developers to tasks based on skills.
+Evaluate and rank several candidate developers for one task.
+Consider skill overlap, growth opportunities, and potential gaps.
+Respond ONLY with valid JSON."""
+
+MATCH_RANKING_PROMPT = """Score how well each candidate developer matches the task.
+
+Task Requirements:
+- Required skills: {required_skills}
+- Preferred skills: {preferred_skills}
+- Domain: {domain}
+- Complexity: {complexity}
+
+Candidates:
+{candidates}
+
+Respond with JSON containing one entry per candidate:
+{{
+  "rankings": [
+    {{
+      "developer_id": "candidate id as given",
+      "overall_score": 0-100,
+      "skill_match": 0-100,
+      "experience_match": 0-100,
+      "growth_opportunity": 0-100,
+      "reasoning": "explanation of the score",
+      "strengths": ["what makes this developer a good fit"],
+      "gaps": ["skills or experience the developer lacks"]
+    }}
+  ]
+}}"""
+
 # ============================================================================
 # Phase 3: Career Intelligence Prompts
 # ============================================================================
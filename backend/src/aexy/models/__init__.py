@@ -349,6 +349,8 @@ from aexy.models.knowledge_graph import (
     KnowledgeRelationship,
     KnowledgeDocumentRelationship,
     KnowledgeExtractionJob,
+    KnowledgeDocumentExtraction,
+    KnowledgeGraphSummary,
     KnowledgeEntityType,
     KnowledgeRelationType,
     KnowledgeExtractionStatus,
@@ -723,6 +725,8 @@ __all__ = [
     "KnowledgeRelationship",
     "KnowledgeDocumentRelationship",
     "KnowledgeExtractionJob",
+    "KnowledgeDocumentExtraction",
+    "KnowledgeGraphSummary",
     "KnowledgeEntityType",
     "KnowledgeRelationType",
     "KnowledgeExtractionStatus",
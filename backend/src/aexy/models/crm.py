@@ -105,6 +105,7 @@ class CRMAutomationTriggerType(str, Enum):
     RECORD_UPDATED = "record.updated"
     RECORD_DELETED = "record.deleted"
     FIELD_CHANGED = "field.changed"
+    STAGE_CHANGED = "stage.changed"
     # List events
     LIST_ENTRY_ADDED = "list_entry.added"
     LIST_ENTRY_REMOVED = "list_entry.removed"
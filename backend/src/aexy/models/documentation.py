@@ -7,16 +7,18 @@ from uuid import uuid4
 
 from sqlalchemy import (
     Boolean,
+    Computed,
     DateTime,
     Float,
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
 )
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -274,6 +276,16 @@ class Document(Base):
     content_text: Mapped[str | None] = mapped_column(
         Text, nullable=True
     )  # Plain text for search
+    # Weighted search document (title > body), maintained by Postgres on save
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(content_text, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     # Visual customization
     icon: Mapped[str | None] = mapped_column(String(50), nullable=True)  # Emoji or icon
@@ -366,7 +378,7 @@ class Document(Base):
         "DocumentVersion",
         back_populates="document",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
         order_by="desc(DocumentVersion.version_number)",
     )
     code_links: Mapped[list["DocumentCodeLink"]] = relationship(
@@ -391,6 +403,19 @@ class Document(Base):
         Index("ix_documents_workspace_parent", "workspace_id", "parent_id"),
         Index("ix_documents_workspace_template", "workspace_id", "is_template"),
         Index("ix_documents_workspace_space", "workspace_id", "space_id"),
+        Index("ix_documents_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_documents_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_documents_content_text_trgm",
+            "content_text",
+            postgresql_using="gin",
+            postgresql_ops={"content_text": "gin_trgm_ops"},
+        ),
     )
 
 
@@ -413,7 +438,13 @@ class DocumentVersion(Base):
 
     # Version info
     version_number: Mapped[int] = mapped_column(Integer, nullable=False)
-    content: Mapped[dict] = mapped_column(JSONB, nullable=False)  # Full snapshot
+    content: Mapped[dict | None] = mapped_column(
+        JSONB, nullable=True
+    )  # Legacy uncompressed snapshot; reconstructed content for loaded versions
+    # zlib-compressed JSON: full content for snapshots, a patch otherwise
+    content_blob: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    # Snapshot version the patch applies to (None for snapshots)
+    base_version_number: Mapped[int | None] = mapped_column(Integer, nullable=True)
     content_diff: Mapped[dict | None] = mapped_column(
         JSONB, nullable=True
     )  # Diff from previous
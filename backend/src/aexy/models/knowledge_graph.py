@@ -7,6 +7,7 @@ from uuid import uuid4
 
 from sqlalchemy import (
     Boolean,
+    Computed,
     DateTime,
     Float,
     ForeignKey,
@@ -16,7 +17,7 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
 )
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -94,6 +95,16 @@ class KnowledgeEntity(Base):
         String(50), default=KnowledgeEntityType.CONCEPT.value, nullable=False
     )
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Weighted search document (name > description), maintained by Postgres
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     # Aliases for the same entity (e.g., "React", "ReactJS", "React.js")
     aliases: Mapped[list[str]] = mapped_column(
@@ -150,6 +161,13 @@ class KnowledgeEntity(Base):
         ),
         Index("ix_knowledge_entities_workspace_type", "workspace_id", "entity_type"),
         Index("ix_knowledge_entities_confidence", "workspace_id", "confidence_score"),
+        Index("ix_knowledge_entities_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_knowledge_entities_name_trgm",
+            "normalized_name",
+            postgresql_using="gin",
+            postgresql_ops={"normalized_name": "gin_trgm_ops"},
+        ),
     )
 
 
@@ -435,3 +453,65 @@ class KnowledgeExtractionJob(Base):
         Index("ix_extraction_jobs_workspace_status", "workspace_id", "status"),
         Index("ix_extraction_jobs_document", "document_id"),
     )
+
+
+class KnowledgeDocumentExtraction(Base):
+    """Content hash of a document as of its last entity extraction.
+
+    Lets full re-extraction skip documents whose title and text have not
+    changed since they were last sent to the LLM.
+    """
+
+    __tablename__ = "knowledge_document_extractions"
+
+    document_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        ForeignKey("documents.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    workspace_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        ForeignKey("workspaces.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    # SHA-256 of the extracted title and plain text
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    entities_found: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    extracted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+
+class KnowledgeGraphSummary(Base):
+    """Per-workspace knowledge graph summary.
+
+    ``graph_version`` is bumped whenever extraction changes entities or
+    relationships, so in-memory snapshots and cached payloads built from an
+    older version can be detected and rebuilt.
+    """
+
+    __tablename__ = "knowledge_graph_summaries"
+
+    workspace_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        ForeignKey("workspaces.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    graph_version: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    # Precomputed graph statistics and the graph version they were computed at
+    statistics: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    statistics_version: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    # Timestamps
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
@@ -5,7 +5,7 @@ from typing import Any
 from uuid import uuid4
 import enum
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, Boolean, Enum
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, Boolean, Enum
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -206,6 +206,9 @@ class WorkflowEventSubscription(Base):
     event_type: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
     # Filter criteria (e.g., {"record_id": "...", "email_id": "..."})
     event_filter: Mapped[dict] = mapped_column(JSONB, default=dict, nullable=False)
+    # Number of normalized filter rows; a subscription matches an event when
+    # all of them are found among the event's key/value pairs.
+    filter_key_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
     # Timeout
     timeout_at: Mapped[datetime | None] = mapped_column(
@@ -228,8 +231,48 @@ class WorkflowEventSubscription(Base):
         default=lambda: datetime.now(timezone.utc),
     )
 
-    # Relationship
+    # Relationships
     execution = relationship("WorkflowExecution", back_populates="event_subscriptions")
+    filter_keys = relationship(
+        "WorkflowEventFilterKey",
+        back_populates="subscription",
+        cascade="all, delete-orphan",
+    )
+
+
+class WorkflowEventFilterKey(Base):
+    """Normalized (key, value) row of an event subscription's filter.
+
+    Lets incoming events be matched against waiting subscriptions with an
+    indexed equality lookup instead of evaluating every filter in Python.
+    Values are stored as canonical JSON text.
+    """
+
+    __tablename__ = "crm_workflow_event_filter_keys"
+
+    subscription_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        ForeignKey("crm_workflow_event_subscriptions.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    filter_key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    filter_value: Mapped[str] = mapped_column(Text, nullable=False)
+
+    # Denormalized from the subscription so lookups stay on one index
+    workspace_id: Mapped[str] = mapped_column(UUID(as_uuid=False), nullable=False)
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False)
+
+    subscription = relationship("WorkflowEventSubscription", back_populates="filter_keys")
+
+    __table_args__ = (
+        Index(
+            "idx_workflow_event_filter_keys_lookup",
+            "workspace_id",
+            "event_type",
+            "filter_key",
+            "filter_value",
+        ),
+    )
 
 
 class WorkflowExecutionStep(Base):
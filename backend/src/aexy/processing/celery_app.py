@@ -1,9 +1,14 @@
 """Celery application configuration."""
 
+import logging
+
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 
 from aexy.core.config import get_settings
 
+logger = logging.getLogger(__name__)
+
 settings = get_settings()
 
 celery_app = Celery(
@@ -111,9 +116,14 @@ celery_app.conf.update(
             "schedule": 300,  # Every 5 minutes
         },
         # Workflow scheduling
+        "dispatch-workflow-timers": {
+            "task": "aexy.processing.workflow_tasks.dispatch_workflow_timers",
+            "schedule": 1,  # Every second
+            "options": {"expires": 5},  # Drop dispatches that queued up behind a backlog
+        },
         "check-paused-workflows": {
             "task": "aexy.processing.workflow_tasks.check_paused_workflows",
-            "schedule": 60,  # Every minute
+            "schedule": 60,  # Every minute (fallback sweep)
         },
         "check-event-subscription-timeouts": {
             "task": "aexy.processing.workflow_tasks.check_event_subscription_timeouts",
@@ -206,3 +216,24 @@ celery_app.conf.update(
         },
     },
 )
+
+
+@worker_process_init.connect
+def start_async_runtime(**kwargs) -> None:
+    """Start the worker process's event loop before it takes any task."""
+    from aexy.core.async_runtime import get_async_runtime
+
+    get_async_runtime()
+
+
+@worker_process_shutdown.connect
+def stop_async_runtime(**kwargs) -> None:
+    """Close the worker process's database pool and stop its event loop."""
+    from aexy.core.async_runtime import get_async_runtime, shutdown_async_runtime
+    from aexy.core.database import get_engine
+
+    try:
+        get_async_runtime().run(get_engine().dispose(), timeout=10)
+    except Exception as e:
+        logger.warning(f"Failed to dispose async engine on worker shutdown: {e}")
+    shutdown_async_runtime()
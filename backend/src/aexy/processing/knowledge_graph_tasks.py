@@ -1,6 +1,5 @@
 """Celery tasks for knowledge graph extraction and maintenance."""
 
-import asyncio
 import logging
 from typing import Any
 
@@ -8,32 +7,11 @@ from celery import shared_task
 
 from aexy.llm.base import LLMRateLimitError
 from aexy.processing.rate_limited_task import RateLimitedTask
+from aexy.processing.tasks import run_async
 
 logger = logging.getLogger(__name__)
 
 
-def run_async(coro):
-    """Run an async coroutine in a sync context.
-
-    Always creates a new event loop to avoid conflicts between
-    concurrent Celery tasks sharing the same worker process.
-    """
-    from aexy.core.database import get_engine
-
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        # Dispose all pooled connections before closing the loop.
-        try:
-            engine = get_engine()
-            loop.run_until_complete(engine.dispose())
-        except Exception:
-            pass
-        loop.close()
-
-
 @shared_task(bind=True, base=RateLimitedTask, max_retries=5)
 def extract_knowledge_from_document_task(
     self,
@@ -185,11 +163,13 @@ async def _update_document_relationships(workspace_id: str) -> dict[str, Any]:
     async with async_session_maker() as db:
         service = KnowledgeExtractionService(db)
 
-        relationships = await service.build_document_relationships(workspace_id)
+        counts = await service.build_document_relationships(workspace_id)
 
         return {
             "workspace_id": workspace_id,
-            "relationships_created": len(relationships),
+            "relationships_created": counts["created"],
+            "relationships_updated": counts["updated"],
+            "relationships_removed": counts["removed"],
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
 
@@ -227,6 +207,8 @@ async def _cleanup_orphaned_entities(workspace_id: str) -> dict[str, Any]:
         KnowledgeEntityMention,
         KnowledgeRelationship,
     )
+    from aexy.services.knowledge_graph_index import bump_graph_version
+    from aexy.services.knowledge_graph_service import KnowledgeGraphService
 
     async with async_session_maker() as db:
         # Find entities with no mentions
@@ -256,6 +238,8 @@ async def _cleanup_orphaned_entities(workspace_id: str) -> dict[str, Any]:
             )
             await db.execute(delete_entity_stmt)
 
+            await bump_graph_version(db, workspace_id)
+            await KnowledgeGraphService(db).refresh_graph_statistics(workspace_id)
             await db.commit()
 
         return {
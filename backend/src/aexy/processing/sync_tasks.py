@@ -70,6 +70,7 @@ async def _sync_repository(
     from sqlalchemy import select
     from sqlalchemy.orm import selectinload
 
+    from aexy.cache.github_response_cache import get_github_response_cache
     from aexy.core.database import async_session_maker
     from aexy.models.developer import GitHubConnection
     from aexy.models.repository import DeveloperRepository
@@ -141,7 +142,11 @@ async def _sync_repository(
             # Check rate limit before starting
             await rate_limiter.check_and_wait(access_token)
 
-            async with GitHubService(access_token=access_token) as gh:
+            async with GitHubService(
+                access_token=access_token,
+                response_cache=get_github_response_cache(),
+                rate_limiter=rate_limiter,
+            ) as gh:
                 # Sync commits
                 commits_synced, last_commit = await _sync_commits(
                     db=db,
@@ -575,6 +580,7 @@ async def _sync_commits_standalone(
     from sqlalchemy import select
     from sqlalchemy.orm import selectinload
 
+    from aexy.cache.github_response_cache import get_github_response_cache
     from aexy.core.database import async_session_maker
     from aexy.models.developer import GitHubConnection
     from aexy.models.repository import DeveloperRepository
@@ -612,7 +618,11 @@ async def _sync_commits_standalone(
         if not connection:
             return {"error": "GitHub connection not found"}
 
-        async with GitHubService(access_token=connection.access_token) as gh:
+        async with GitHubService(
+            access_token=connection.access_token,
+            response_cache=get_github_response_cache(),
+            rate_limiter=rate_limiter,
+        ) as gh:
             synced, last_commit = await _sync_commits(
                 db=db,
                 gh=gh,
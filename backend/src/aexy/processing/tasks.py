@@ -1,6 +1,5 @@
 """Celery tasks for LLM analysis."""
 
-import asyncio
 import logging
 from typing import Any
 
@@ -15,30 +14,15 @@ logger = logging.getLogger(__name__)
 def run_async(coro):
     """Run an async coroutine in a sync context.
 
-    Always creates a new event loop to avoid conflicts between
-    concurrent Celery tasks sharing the same worker process.
-
-    IMPORTANT: This disposes the database connection pool after each run
-    to prevent asyncpg connections created on one event loop from being
-    reused on a different loop (which causes "Future attached to a
-    different loop" errors).
+    The coroutine runs on the worker process's long-lived event loop (see
+    ``aexy.core.async_runtime``), so the async engine's connection pool and
+    the Redis clients bound to that loop are reused across tasks instead of
+    reconnecting for every task. Tasks running in worker threads share the
+    loop safely; the pool is disposed when the worker process shuts down.
     """
-    from aexy.core.database import get_engine
+    from aexy.core.async_runtime import get_async_runtime
 
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        # Dispose all pooled connections before closing the loop.
-        # This prevents asyncpg connections from being reused on a
-        # different event loop in the next task execution.
-        try:
-            engine = get_engine()
-            loop.run_until_complete(engine.dispose())
-        except Exception:
-            pass  # Best effort - don't fail the task if disposal fails
-        loop.close()
+    return get_async_runtime().run(coro)
 
 
 @shared_task(bind=True, base=RateLimitedTask, max_retries=5)
@@ -800,3 +784,73 @@ async def _regenerate_document(
                 "status": "failed",
                 "error": str(e),
             }
+
+
+# ============================================================================
+# CRM Tasks
+# ============================================================================
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def ensure_crm_attribute_index_task(self, slug: str) -> dict[str, Any]:
+    """Create the expression index for a numeric/date CRM attribute slug.
+
+    Args:
+        slug: Attribute slug.
+
+    Returns:
+        Index name and whether DDL was issued.
+    """
+    try:
+        return run_async(_ensure_crm_attribute_index(slug))
+    except Exception as exc:
+        logger.error(f"CRM attribute index creation failed for {slug}: {exc}")
+        raise self.retry(exc=exc)
+
+
+async def _ensure_crm_attribute_index(slug: str) -> dict[str, Any]:
+    """Async implementation of CRM attribute index creation."""
+    from sqlalchemy import text
+
+    from aexy.core.database import get_engine
+    from aexy.services.crm_query import attribute_index_ddl, attribute_index_name
+
+    ddl = attribute_index_ddl(slug)
+    if ddl is None:
+        return {"slug": slug, "created": False}
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    async with get_engine().connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text(ddl))
+
+    return {"slug": slug, "index": attribute_index_name(slug), "created": True}
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=30)
+def execute_crm_automation_runs_task(self, run_ids: list[str]) -> dict[str, Any]:
+    """Execute a batch of queued CRM automation runs.
+
+    Args:
+        run_ids: IDs of pending automation runs.
+
+    Returns:
+        Number of runs executed.
+    """
+    try:
+        return run_async(_execute_crm_automation_runs(run_ids))
+    except Exception as exc:
+        logger.error(f"CRM automation runs failed: {exc}")
+        raise self.retry(exc=exc)
+
+
+async def _execute_crm_automation_runs(run_ids: list[str]) -> dict[str, Any]:
+    """Async implementation of CRM automation run execution."""
+    from aexy.core.database import async_session_maker
+    from aexy.services.crm_automation_service import CRMAutomationService
+
+    async with async_session_maker() as db:
+        executed = await CRMAutomationService(db).execute_pending_runs(run_ids)
+        await db.commit()
+
+    return {"queued": len(run_ids), "executed": executed}
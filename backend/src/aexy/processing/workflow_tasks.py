@@ -4,7 +4,8 @@ import logging
 from datetime import datetime, timezone, timedelta
 
 from celery import shared_task
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, literal, update
+from sqlalchemy.orm import Session
 
 from aexy.core.database import get_sync_session
 from aexy.models.workflow import (
@@ -18,6 +19,16 @@ from aexy.models.crm import CRMAutomation, CRMRecord
 
 logger = logging.getLogger(__name__)
 
+# Number of due executions handed to one resume task
+RESUME_BATCH_SIZE = 20
+
+# How overdue a wait must be before the database sweep picks it up when the
+# timer queue is active
+SWEEP_GRACE_SECONDS = 30
+
+# Tolerance for clock differences between the dispatcher and the database
+CLOCK_SKEW_SECONDS = 1
+
 
 @shared_task(
     name="aexy.processing.workflow_tasks.execute_workflow_task",
@@ -140,92 +151,233 @@ def resume_workflow_task(
     logger.info(f"Resuming workflow execution: {execution_id}")
 
     with get_sync_session() as db:
-        execution = db.execute(
-            select(WorkflowExecution).where(WorkflowExecution.id == execution_id)
-        ).scalar_one_or_none()
+        # Only resume paused executions
+        if not _claim_paused_execution(db, execution_id):
+            execution = db.execute(
+                select(WorkflowExecution).where(WorkflowExecution.id == execution_id)
+            ).scalar_one_or_none()
 
-        if not execution:
-            logger.error(f"Execution not found: {execution_id}")
-            return {"status": "error", "message": "Execution not found"}
+            if not execution:
+                logger.error(f"Execution not found: {execution_id}")
+                return {"status": "error", "message": "Execution not found"}
 
-        # Only resume paused executions
-        if execution.status != WorkflowExecutionStatus.PAUSED.value:
             logger.info(f"Execution {execution_id} is not paused (status: {execution.status})")
             return {"status": "skipped", "message": f"Execution is {execution.status}"}
 
-        # Clear wait state
-        execution.resume_at = None
-        execution.wait_event_type = None
-        execution.wait_timeout_at = None
-        execution.paused_at = None
-        db.commit()
-
     # Delegate to execute task
     return execute_workflow_task(execution_id)
 
 
+def _claim_paused_execution(
+    db: Session,
+    execution_id: str,
+    due_before: datetime | None = None,
+) -> bool:
+    """Atomically take a paused execution out of its wait state.
+
+    Concurrent resumes of the same execution (timer dispatch, sweep, event)
+    race on this update, so exactly one of them proceeds.
+
+    Args:
+        db: Database session.
+        execution_id: Workflow execution ID.
+        due_before: Only claim if the execution's resume_at is not after this.
+
+    Returns:
+        True if this caller claimed the execution.
+    """
+    stmt = update(WorkflowExecution).where(
+        WorkflowExecution.id == execution_id,
+        WorkflowExecution.status == WorkflowExecutionStatus.PAUSED.value,
+    )
+    if due_before is not None:
+        stmt = stmt.where(WorkflowExecution.resume_at <= due_before)
+
+    result = db.execute(
+        stmt.values(
+            status=WorkflowExecutionStatus.RUNNING.value,
+            resume_at=None,
+            wait_event_type=None,
+            wait_timeout_at=None,
+            paused_at=None,
+        )
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+@shared_task(name="aexy.processing.workflow_tasks.resume_due_workflows_task")
+def resume_due_workflows_task(execution_ids: list[str]) -> dict:
+    """
+    Resume a batch of executions whose scheduled wait has elapsed.
+
+    Executions that were already resumed, cancelled or rescheduled to a later
+    time are skipped. Each execution is claimed right before it runs, so a
+    failure or crash part way through leaves the rest of the batch paused
+    for the next dispatch or sweep.
+
+    Args:
+        execution_ids: Workflow execution IDs
+
+    Returns:
+        Dict with counts of resumed, skipped and failed workflows
+    """
+    due_before = datetime.now(timezone.utc) + timedelta(seconds=CLOCK_SKEW_SECONDS)
+
+    resumed = skipped = failed = 0
+    for execution_id in execution_ids:
+        with get_sync_session() as db:
+            claimed = _claim_paused_execution(db, execution_id, due_before=due_before)
+        if not claimed:
+            skipped += 1
+            continue
+
+        try:
+            execute_workflow_task(execution_id)
+            resumed += 1
+        except Exception:
+            logger.exception(f"Failed to resume workflow execution: {execution_id}")
+            failed += 1
+
+    return {"resumed": resumed, "skipped": skipped, "failed": failed}
+
+
+def _expire_event_waits(db: Session, execution_ids: list[str] | None, now: datetime) -> int:
+    """Fail executions whose event wait has timed out."""
+    stmt = update(WorkflowExecution).where(
+        WorkflowExecution.status == WorkflowExecutionStatus.PAUSED.value,
+        WorkflowExecution.wait_event_type.isnot(None),
+        WorkflowExecution.wait_timeout_at <= now,
+    )
+    if execution_ids is not None:
+        stmt = stmt.where(WorkflowExecution.id.in_(execution_ids))
+
+    result = db.execute(
+        stmt.values(
+            status=WorkflowExecutionStatus.FAILED.value,
+            error=literal("Timeout waiting for event: ") + WorkflowExecution.wait_event_type,
+            completed_at=now,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
+
+
+@shared_task(name="aexy.processing.workflow_tasks.expire_workflow_waits_task")
+def expire_workflow_waits_task(execution_ids: list[str]) -> dict:
+    """
+    Fail a batch of executions whose event wait timed out.
+
+    Args:
+        execution_ids: Workflow execution IDs
+
+    Returns:
+        Dict with count of timed out workflows
+    """
+    now = datetime.now(timezone.utc) + timedelta(seconds=CLOCK_SKEW_SECONDS)
+    with get_sync_session() as db:
+        count = _expire_event_waits(db, execution_ids, now)
+
+    return {"timed_out": count}
+
+
+def _dispatch_resumes(execution_ids: list[str]) -> None:
+    """Hand due executions to workers in batches."""
+    for start in range(0, len(execution_ids), RESUME_BATCH_SIZE):
+        resume_due_workflows_task.delay(execution_ids[start:start + RESUME_BATCH_SIZE])
+
+
+@shared_task(name="aexy.processing.workflow_tasks.dispatch_workflow_timers")
+def dispatch_workflow_timers() -> dict:
+    """
+    Dispatch due workflow wake-ups from the Redis timer queue.
+
+    Runs every second, so scheduled waits resume within about a second of
+    their due time.
+
+    Returns:
+        Dict with counts of dispatched resumes and timeouts
+    """
+    from aexy.processing.workflow_timers import (
+        POP_BATCH_SIZE,
+        RESUME,
+        TIMEOUT,
+        get_workflow_timer_queue,
+    )
+
+    queue = get_workflow_timer_queue()
+    if not queue:
+        return {"resumed": 0, "timed_out": 0}
+
+    now = datetime.now(timezone.utc)
+    resumes: list[str] = []
+    timeouts: list[str] = []
+    while True:
+        due = queue.pop_due(now)
+        for kind, execution_id in due:
+            if kind == RESUME:
+                resumes.append(execution_id)
+            elif kind == TIMEOUT:
+                timeouts.append(execution_id)
+        if len(due) < POP_BATCH_SIZE:
+            break
+
+    if resumes:
+        _dispatch_resumes(resumes)
+    if timeouts:
+        expire_workflow_waits_task.delay(timeouts)
+
+    return {"resumed": len(resumes), "timed_out": len(timeouts)}
+
+
 @shared_task(name="aexy.processing.workflow_tasks.check_paused_workflows")
 def check_paused_workflows() -> dict:
     """
-    Periodic task to check for workflows that need to be resumed.
+    Periodic sweep for paused workflows that need to be resumed.
 
-    This task runs every minute and checks for:
+    Waits are normally resumed by ``dispatch_workflow_timers``; this sweep
+    runs every minute as a fallback and only picks up waits that are overdue
+    by more than a grace period while the timer queue is active:
     1. Workflows paused with a resume_at time that has passed
     2. Workflows waiting for events that have timed out
 
     Returns:
         Dict with count of resumed workflows
     """
+    from aexy.processing.workflow_timers import get_workflow_timer_queue
+
     logger.info("Checking for paused workflows to resume")
 
     now = datetime.now(timezone.utc)
-    resumed_count = 0
-    timed_out_count = 0
+    if get_workflow_timer_queue():
+        cutoff = now - timedelta(seconds=SWEEP_GRACE_SECONDS)
+    else:
+        cutoff = now
 
     with get_sync_session() as db:
         # Find workflows ready to resume (duration/datetime waits)
-        ready_to_resume = db.execute(
-            select(WorkflowExecution).where(
+        ready_to_resume = list(db.execute(
+            select(WorkflowExecution.id).where(
                 and_(
                     WorkflowExecution.status == WorkflowExecutionStatus.PAUSED.value,
-                    WorkflowExecution.resume_at <= now,
+                    WorkflowExecution.resume_at <= cutoff,
                     WorkflowExecution.resume_at.isnot(None),
                 )
             )
-        ).scalars().all()
+        ).scalars().all())
 
-        for execution in ready_to_resume:
-            logger.info(f"Resuming workflow {execution.id} (scheduled for {execution.resume_at})")
-            resume_workflow_task.delay(execution.id)
-            resumed_count += 1
+        # Fail workflows waiting for events that have timed out
+        timed_out_count = _expire_event_waits(db, None, cutoff)
 
-        # Find workflows waiting for events that have timed out
-        timed_out = db.execute(
-            select(WorkflowExecution).where(
-                and_(
-                    WorkflowExecution.status == WorkflowExecutionStatus.PAUSED.value,
-                    WorkflowExecution.wait_event_type.isnot(None),
-                    WorkflowExecution.wait_timeout_at <= now,
-                    WorkflowExecution.wait_timeout_at.isnot(None),
-                )
-            )
-        ).scalars().all()
-
-        for execution in timed_out:
-            logger.info(f"Workflow {execution.id} timed out waiting for {execution.wait_event_type}")
-            # Mark as failed due to timeout
-            execution.status = WorkflowExecutionStatus.FAILED.value
-            execution.error = f"Timeout waiting for event: {execution.wait_event_type}"
-            execution.completed_at = now
-            timed_out_count += 1
-
-        if timed_out:
-            db.commit()
+    if ready_to_resume:
+        logger.info(f"Sweep found {len(ready_to_resume)} overdue paused workflows")
+        _dispatch_resumes(ready_to_resume)
 
-    logger.info(f"Resumed {resumed_count} workflows, timed out {timed_out_count} workflows")
+    logger.info(f"Resumed {len(ready_to_resume)} workflows, timed out {timed_out_count} workflows")
 
     return {
-        "resumed": resumed_count,
+        "resumed": len(ready_to_resume),
         "timed_out": timed_out_count,
     }
 
@@ -0,0 +1,136 @@
+"""Redis timer queue for paused workflow executions.
+
+Executions that pause on a duration/datetime wait or an event wait with a
+timeout are registered in a Redis sorted set scored by their due time. The
+``dispatch_workflow_timers`` task pops due entries every second and hands
+them to workers in batches; ``check_paused_workflows`` remains as a
+database sweep for anything the queue missed (e.g. Redis was down when the
+execution paused).
+
+Entries are hints, not state: the tasks they trigger re-check the execution
+row, so stale or duplicate entries are harmless.
+"""
+
+import logging
+from datetime import datetime
+from functools import lru_cache
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Timer kinds, stored as "<kind>:<execution id>" members
+RESUME = "resume"
+TIMEOUT = "timeout"
+
+# Maximum entries popped per Redis round trip
+POP_BATCH_SIZE = 500
+
+# Atomically take due members so concurrent dispatchers never share one
+POP_DUE_SCRIPT = """
+local items = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+if #items > 0 then
+    redis.call('ZREM', KEYS[1], unpack(items))
+end
+return items
+"""
+
+
+class WorkflowTimerQueue:
+    """Sorted set of workflow wake-ups keyed by due time."""
+
+    def __init__(self, redis_client: Any) -> None:
+        """Initialize the queue.
+
+        Args:
+            redis_client: Redis client (sync).
+        """
+        self._redis = redis_client
+        self._key = "aexy:workflow:timers"
+        self._pop_due = redis_client.register_script(POP_DUE_SCRIPT)
+
+    def schedule(self, kind: str, execution_id: str, due_at: datetime) -> bool:
+        """Register a wake-up for an execution.
+
+        Args:
+            kind: RESUME or TIMEOUT.
+            execution_id: Workflow execution ID.
+            due_at: When the execution is due (timezone-aware).
+
+        Returns:
+            True if registered.
+        """
+        try:
+            self._redis.zadd(self._key, {f"{kind}:{execution_id}": due_at.timestamp()})
+            return True
+
+        except Exception as e:
+            logger.warning(f"Workflow timer schedule failed for {execution_id}: {e}")
+            return False
+
+    def pop_due(self, now: datetime, limit: int = POP_BATCH_SIZE) -> list[tuple[str, str]]:
+        """Remove and return due wake-ups.
+
+        Args:
+            now: Current time.
+            limit: Maximum number of entries to pop.
+
+        Returns:
+            (kind, execution_id) pairs.
+        """
+        try:
+            members = self._pop_due(keys=[self._key], args=[now.timestamp(), limit])
+        except Exception as e:
+            logger.warning(f"Workflow timer pop failed: {e}")
+            return []
+
+        due = []
+        for member in members:
+            if isinstance(member, bytes):
+                member = member.decode()
+            kind, _, execution_id = member.partition(":")
+            due.append((kind, execution_id))
+        return due
+
+
+@lru_cache
+def get_workflow_timer_queue() -> WorkflowTimerQueue | None:
+    """Get the shared workflow timer queue.
+
+    Returns:
+        Timer queue, or None when disabled or Redis is unavailable.
+    """
+    from aexy.core.config import get_settings
+
+    settings = get_settings()
+    if not settings.workflow_timers_enabled:
+        return None
+
+    try:
+        import redis
+
+        client = redis.from_url(settings.redis_url)
+        return WorkflowTimerQueue(client)
+
+    except ImportError:
+        logger.warning("Redis not installed, workflow timers disabled")
+        return None
+
+    except Exception as e:
+        logger.warning(f"Failed to connect to Redis, workflow timers disabled: {e}")
+        return None
+
+
+def schedule_wait_timers(
+    execution_id: str,
+    resume_at: datetime | None = None,
+    timeout_at: datetime | None = None,
+) -> None:
+    """Register the wake-ups of an execution that just paused."""
+    queue = get_workflow_timer_queue()
+    if not queue:
+        return
+
+    if resume_at:
+        queue.schedule(RESUME, execution_id, resume_at)
+    if timeout_at:
+        queue.schedule(TIMEOUT, execution_id, timeout_at)
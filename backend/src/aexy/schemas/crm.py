@@ -35,7 +35,7 @@ CRMActivityType = Literal[
 ]
 
 CRMAutomationTriggerType = Literal[
-    "record.created", "record.updated", "record.deleted", "field.changed",
+    "record.created", "record.updated", "record.deleted", "field.changed", "stage.changed",
     "list_entry.added", "list_entry.removed", "status.changed",
     "schedule.daily", "schedule.weekly", "date.approaching", "date.passed",
     "webhook.received", "form.submitted",
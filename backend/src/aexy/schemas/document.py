@@ -87,6 +87,7 @@ class DocumentListResponse(BaseModel):
     generation_status: DocumentStatus = "draft"
     created_at: datetime
     updated_at: datetime
+    snippet: str | None = None  # Highlighted search excerpt
 
 
 class DocumentTreeItem(BaseModel):
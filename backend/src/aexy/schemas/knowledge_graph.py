@@ -231,6 +231,36 @@ class GraphDataResponse(BaseModel):
     )
 
 
+class CompactGraphDataResponse(BaseModel):
+    """Columnar graph data response for large graphs.
+
+    Node fields are parallel arrays; edges reference nodes by index into
+    ``node_ids`` and relationship types by index into ``relationship_types``.
+    """
+
+    node_ids: list[str] = Field(default_factory=list, description="Node IDs")
+    node_labels: list[str] = Field(default_factory=list, description="Node display labels")
+    node_types: list[str] = Field(default_factory=list, description="Node types")
+    node_metadata: list[dict] = Field(default_factory=list, description="Node metadata")
+    edge_sources: list[int] = Field(default_factory=list, description="Edge source node indices")
+    edge_targets: list[int] = Field(default_factory=list, description="Edge target node indices")
+    edge_types: list[int] = Field(
+        default_factory=list, description="Edge relationship type indices"
+    )
+    edge_strengths: list[float] = Field(default_factory=list, description="Edge strengths")
+    relationship_types: list[str] = Field(
+        default_factory=list, description="Relationship types referenced by edge_types"
+    )
+    statistics: GraphStatisticsResponse = Field(
+        default_factory=GraphStatisticsResponse,
+        description="Graph statistics",
+    )
+    temporal: TemporalDataResponse | None = Field(
+        default=None,
+        description="Temporal data for timeline (included when date filters are applied)",
+    )
+
+
 class EntityResponse(BaseModel):
     """Entity details response."""
 
@@ -0,0 +1,198 @@
+"""Optimal task assignment under per-developer capacity limits.
+
+Assignment is solved as a min-cost flow: source -> task (capacity 1) ->
+developer (capacity 1, cost -score) -> sink (capacity = open slots).
+Successive shortest paths with Dijkstra over reduced costs give the
+assignment with the highest total score; zero-gain paths are still taken
+so ties favor assigning more tasks. Required pairs are fixed up front and
+forbidden pairs get no edge.
+
+Tasks and developers are referred to by their index in the score matrix.
+"""
+
+import heapq
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+# Tolerance for floating point path costs
+EPSILON = 1e-9
+
+
+@dataclass
+class AssignmentResult:
+    """Optimal assignment and the greedy assignment it was compared with."""
+
+    assignments: dict[int, int]  # task index -> developer index
+    score: float
+    greedy_assignments: dict[int, int]
+    greedy_score: float
+
+    @property
+    def score_gap(self) -> float:
+        """Total score gained over greedy assignment."""
+        return self.score - self.greedy_score
+
+
+def assignment_score(scores: list[list[float]], assignments: dict[int, int]) -> float:
+    """Get the total score of an assignment."""
+    return sum(scores[task][dev] for task, dev in assignments.items())
+
+
+def _fixed_assignments(
+    capacities: list[int],
+    required: Iterable[tuple[int, int]],
+) -> tuple[dict[int, int], list[int]]:
+    """Apply required pairs, returning them and the capacity left per developer.
+
+    Required pairs are honored even when they exceed a developer's capacity.
+    """
+    assignments: dict[int, int] = {}
+    remaining = list(capacities)
+    for task, dev in required:
+        if task in assignments:
+            continue
+        assignments[task] = dev
+        remaining[dev] -= 1
+    return assignments, [max(slots, 0) for slots in remaining]
+
+
+def greedy_assignment(
+    scores: list[list[float]],
+    capacities: list[int],
+    required: Iterable[tuple[int, int]] = (),
+    forbidden: Iterable[tuple[int, int]] = (),
+) -> dict[int, int]:
+    """Assign pairs in descending score order while capacity remains."""
+    assignments, remaining = _fixed_assignments(capacities, required)
+    forbidden = set(forbidden)
+
+    pairs = sorted(
+        (
+            (score, task, dev)
+            for task, row in enumerate(scores)
+            if task not in assignments
+            for dev, score in enumerate(row)
+            if (task, dev) not in forbidden
+        ),
+        key=lambda pair: pair[0],
+        reverse=True,
+    )
+    for _, task, dev in pairs:
+        if task in assignments or remaining[dev] <= 0:
+            continue
+        assignments[task] = dev
+        remaining[dev] -= 1
+    return assignments
+
+
+def solve_assignment(
+    scores: list[list[float]],
+    capacities: list[int],
+    required: Iterable[tuple[int, int]] = (),
+    forbidden: Iterable[tuple[int, int]] = (),
+) -> AssignmentResult:
+    """Find the assignment of tasks to developers with the highest total score.
+
+    Args:
+        scores: Score matrix, one row per task and one column per developer.
+        capacities: Number of tasks each developer can still take.
+        required: (task, developer) pairs that must be assigned.
+        forbidden: (task, developer) pairs that must not be assigned.
+
+    Returns:
+        Optimal assignment, with the greedy assignment for comparison.
+    """
+    required = list(required)
+    forbidden = set(forbidden)
+    n_tasks = len(scores)
+    n_devs = len(capacities)
+    assignments, remaining = _fixed_assignments(capacities, required)
+
+    # Nodes: source, tasks, developers, sink
+    source = 0
+    sink = n_tasks + n_devs + 1
+    graph: list[list[int]] = [[] for _ in range(sink + 1)]
+    heads: list[int] = []
+    caps: list[int] = []
+    costs: list[float] = []
+
+    def add_edge(u: int, v: int, cap: int, cost: float) -> None:
+        # Edge i and its residual edge i ^ 1 are stored next to each other
+        graph[u].append(len(heads))
+        heads.append(v)
+        caps.append(cap)
+        costs.append(cost)
+        graph[v].append(len(heads))
+        heads.append(u)
+        caps.append(0)
+        costs.append(-cost)
+
+    # Initial potentials keep reduced costs non-negative: the graph is a DAG
+    # and only task -> developer edges have (negative) costs
+    potentials = [0.0] * (sink + 1)
+    for task in range(n_tasks):
+        if task in assignments:
+            continue
+        add_edge(source, 1 + task, 1, 0.0)
+        for dev in range(n_devs):
+            if remaining[dev] > 0 and (task, dev) not in forbidden:
+                node = 1 + n_tasks + dev
+                add_edge(1 + task, node, 1, -scores[task][dev])
+                potentials[node] = min(potentials[node], -scores[task][dev])
+    for dev in range(n_devs):
+        if remaining[dev] > 0:
+            node = 1 + n_tasks + dev
+            add_edge(node, sink, remaining[dev], 0.0)
+            potentials[sink] = min(potentials[sink], potentials[node])
+
+    while True:
+        # Dijkstra over reduced costs
+        dist = [float("inf")] * (sink + 1)
+        prev_edge = [-1] * (sink + 1)
+        dist[source] = 0.0
+        heap = [(0.0, source)]
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            for edge in graph[u]:
+                if caps[edge] <= 0:
+                    continue
+                v = heads[edge]
+                nd = d + max(costs[edge] + potentials[u] - potentials[v], 0.0)
+                if nd < dist[v] - EPSILON:
+                    dist[v] = nd
+                    prev_edge[v] = edge
+                    heapq.heappush(heap, (nd, v))
+
+        if dist[sink] == float("inf"):
+            break
+        # Stop once another assignment would lower the total score
+        if dist[sink] + potentials[sink] - potentials[source] > EPSILON:
+            break
+
+        for node, d in enumerate(dist):
+            if d < float("inf"):
+                potentials[node] += d
+
+        # Every path carries one task
+        node = sink
+        while node != source:
+            edge = prev_edge[node]
+            caps[edge] -= 1
+            caps[edge ^ 1] += 1
+            node = heads[edge ^ 1]
+
+    for task in range(n_tasks):
+        for edge in graph[1 + task]:
+            v = heads[edge]
+            if 1 + n_tasks <= v < sink and edge % 2 == 0 and caps[edge] == 0:
+                assignments[task] = v - 1 - n_tasks
+
+    greedy = greedy_assignment(scores, capacities, required, forbidden)
+    return AssignmentResult(
+        assignments=assignments,
+        score=assignment_score(scores, assignments),
+        greedy_assignments=greedy,
+        greedy_score=assignment_score(scores, greedy),
+    )
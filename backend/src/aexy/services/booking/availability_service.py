@@ -16,11 +16,22 @@ from aexy.models.booking import (
     BookingStatus,
     CalendarConnection,
 )
+from aexy.services.booking.intervals import (
+    Interval,
+    clip_intervals,
+    intersect_all,
+    merge_intervals,
+    subtract_intervals,
+)
 
 if TYPE_CHECKING:
     from aexy.services.booking.calendar_sync_service import CalendarSyncService
 
 
+# Spacing between candidate slot start times
+SLOT_INCREMENT_MINUTES = 15
+
+
 class AvailabilityServiceError(Exception):
     """Base exception for availability service errors."""
 
@@ -317,11 +328,11 @@ class AvailabilityService:
 
         # Get calendar busy times if service is provided
         if calendar_service:
-            for host_id in host_ids:
-                calendar_busy = await calendar_service.get_busy_times(
-                    host_id, target_date, target_date
-                )
-                busy_times.extend(calendar_busy)
+            calendar_busy = await calendar_service.get_busy_times_for_users(
+                host_ids, target_date, target_date
+            )
+            for host_busy in calendar_busy.values():
+                busy_times.extend(host_busy)
 
         # Generate slots
         slots = self._generate_slots(
@@ -388,51 +399,71 @@ class AvailabilityService:
         target_date: date,
     ) -> list[dict]:
         """Get availability windows for a specific day."""
-        windows = []
+        windows_by_user = await self._get_availability_windows(
+            user_ids, workspace_id, target_date, target_date
+        )
+        return [
+            window
+            for user_id in user_ids
+            for window in windows_by_user[user_id].get(target_date, [])
+        ]
 
-        for user_id in user_ids:
-            # Check for override first
-            override_stmt = select(AvailabilityOverride).where(
-                and_(
-                    AvailabilityOverride.user_id == user_id,
-                    AvailabilityOverride.date == target_date,
-                )
-            )
-            override_result = await self.db.execute(override_stmt)
-            override = override_result.scalar_one_or_none()
+    async def _get_availability_windows(
+        self,
+        user_ids: list[str],
+        workspace_id: str,
+        start_date: date,
+        end_date: date,
+    ) -> dict[str, dict[date, list[dict]]]:
+        """Get availability windows per user per day for a date range.
 
-            if override:
-                if override.is_available and override.start_time and override.end_time:
-                    windows.append(
-                        {
-                            "user_id": user_id,
-                            "start_time": override.start_time,
-                            "end_time": override.end_time,
-                        }
-                    )
-                # If override exists but is_available=False, skip this user for this date
-                continue
+        Loads overrides and weekly availability with one query each. An
+        override replaces the weekly availability of its day; an override
+        that is not available leaves the day without windows.
+        """
+        override_stmt = select(AvailabilityOverride).where(
+            and_(
+                AvailabilityOverride.user_id.in_(user_ids),
+                AvailabilityOverride.date >= start_date,
+                AvailabilityOverride.date <= end_date,
+            )
+        )
+        override_result = await self.db.execute(override_stmt)
+        overrides = {(o.user_id, o.date): o for o in override_result.scalars().all()}
 
-            # Get regular availability
-            avail_stmt = select(UserAvailability).where(
-                and_(
-                    UserAvailability.user_id == user_id,
-                    UserAvailability.workspace_id == workspace_id,
-                    UserAvailability.day_of_week == day_of_week,
-                    UserAvailability.is_active == True,
-                )
+        avail_stmt = select(UserAvailability).where(
+            and_(
+                UserAvailability.user_id.in_(user_ids),
+                UserAvailability.workspace_id == workspace_id,
+                UserAvailability.is_active == True,
             )
-            avail_result = await self.db.execute(avail_stmt)
-            availabilities = avail_result.scalars().all()
+        )
+        avail_result = await self.db.execute(avail_stmt)
+        weekly: dict[tuple[str, int], list[UserAvailability]] = {}
+        for avail in avail_result.scalars().all():
+            weekly.setdefault((avail.user_id, avail.day_of_week), []).append(avail)
 
-            for avail in availabilities:
-                windows.append(
-                    {
-                        "user_id": user_id,
-                        "start_time": avail.start_time,
-                        "end_time": avail.end_time,
-                    }
-                )
+        windows: dict[str, dict[date, list[dict]]] = {user_id: {} for user_id in user_ids}
+        current_date = start_date
+        while current_date <= end_date:
+            for user_id in user_ids:
+                override = overrides.get((user_id, current_date))
+                if override:
+                    if override.is_available and override.start_time and override.end_time:
+                        ranges = [(override.start_time, override.end_time)]
+                    else:
+                        ranges = []
+                else:
+                    ranges = [
+                        (avail.start_time, avail.end_time)
+                        for avail in weekly.get((user_id, current_date.weekday()), [])
+                    ]
+
+                windows[user_id][current_date] = [
+                    {"user_id": user_id, "start_time": start, "end_time": end}
+                    for start, end in ranges
+                ]
+            current_date += timedelta(days=1)
 
         return windows
 
@@ -443,33 +474,55 @@ class AvailabilityService:
         timezone: str,
     ) -> list[dict]:
         """Get busy times from existing bookings."""
+        busy_by_host = await self._get_busy_times_by_host(
+            user_ids, target_date, target_date, timezone
+        )
+        return [busy for host_busy in busy_by_host.values() for busy in host_busy]
+
+    async def _get_busy_times_by_host(
+        self,
+        user_ids: list[str],
+        start_date: date,
+        end_date: date,
+        timezone: str,
+    ) -> dict[str, list[dict]]:
+        """Get busy times from existing bookings per host for a date range."""
+        bookings = await self._get_active_bookings(user_ids, start_date, end_date, timezone)
+
+        busy_by_host: dict[str, list[dict]] = {user_id: [] for user_id in user_ids}
+        for booking in bookings:
+            busy_by_host.setdefault(booking.host_id, []).append(
+                {
+                    "start": booking.start_time,
+                    "end": booking.end_time,
+                }
+            )
+        return busy_by_host
+
+    async def _get_active_bookings(
+        self,
+        user_ids: list[str],
+        start_date: date,
+        end_date: date,
+        timezone: str,
+    ) -> list[Booking]:
+        """Get pending and confirmed bookings of hosts within a date range."""
         tz = ZoneInfo(timezone)
-        start_of_day = datetime.combine(target_date, time.min, tzinfo=tz)
-        end_of_day = datetime.combine(target_date, time.max, tzinfo=tz)
+        range_start = datetime.combine(start_date, time.min, tzinfo=tz)
+        range_end = datetime.combine(end_date, time.max, tzinfo=tz)
 
         stmt = select(Booking).where(
             and_(
                 Booking.host_id.in_(user_ids),
-                Booking.start_time >= start_of_day,
-                Booking.end_time <= end_of_day,
+                Booking.start_time >= range_start,
+                Booking.end_time <= range_end,
                 Booking.status.in_(
                     [BookingStatus.PENDING.value, BookingStatus.CONFIRMED.value]
                 ),
             )
         )
         result = await self.db.execute(stmt)
-        bookings = result.scalars().all()
-
-        busy_times = []
-        for booking in bookings:
-            busy_times.append(
-                {
-                    "start": booking.start_time,
-                    "end": booking.end_time,
-                }
-            )
-
-        return busy_times
+        return list(result.scalars().all())
 
     def _generate_slots(
         self,
@@ -482,11 +535,19 @@ class AvailabilityService:
         timezone: str,
         min_booking_datetime: datetime,
     ) -> list[dict]:
-        """Generate available time slots."""
+        """Generate available time slots.
+
+        Busy times are merged into sorted, non-overlapping intervals once;
+        the candidate slots of a window are increasing, so a single pointer
+        sweeps the busy intervals alongside them.
+        """
         tz = ZoneInfo(timezone)
         slots = []
         slot_duration = timedelta(minutes=duration_minutes)
-        total_buffer = buffer_before + buffer_after
+        before = timedelta(minutes=buffer_before)
+        after = timedelta(minutes=buffer_after)
+        step = timedelta(minutes=SLOT_INCREMENT_MINUTES)
+        busy = merge_intervals((busy["start"], busy["end"]) for busy in busy_times)
 
         for window in available_windows:
             # Convert window times to datetime
@@ -495,40 +556,31 @@ class AvailabilityService:
             )
             window_end = datetime.combine(target_date, window["end_time"], tzinfo=tz)
 
-            # Generate slots within the window
+            # Start at the first increment after the minimum booking time
             current = window_start
+            if current < min_booking_datetime:
+                current += -((window_start - min_booking_datetime) // step) * step
+
+            i = 0
             while current + slot_duration <= window_end:
                 slot_start = current
                 slot_end = current + slot_duration
 
-                # Check if slot is after minimum booking time
-                if slot_start < min_booking_datetime:
-                    current += timedelta(minutes=15)  # Move to next 15-min increment
-                    continue
-
                 # Check for conflicts with busy times (including buffers)
-                buffered_start = slot_start - timedelta(minutes=buffer_before)
-                buffered_end = slot_end + timedelta(minutes=buffer_after)
-
-                is_available = True
-                for busy in busy_times:
-                    busy_start = busy["start"]
-                    busy_end = busy["end"]
-
-                    # Check for overlap
-                    if buffered_start < busy_end and buffered_end > busy_start:
-                        is_available = False
-                        break
+                buffered_start = slot_start - before
+                buffered_end = slot_end + after
+                while i < len(busy) and busy[i][1] <= buffered_start:
+                    i += 1
 
                 slots.append(
                     {
                         "start_time": slot_start,
                         "end_time": slot_end,
-                        "available": is_available,
+                        "available": i == len(busy) or busy[i][0] >= buffered_end,
                     }
                 )
 
-                current += timedelta(minutes=15)  # 15-minute increments
+                current += step
 
         return slots
 
@@ -541,7 +593,13 @@ class AvailabilityService:
         timezone: str = "UTC",
         calendar_service: "CalendarSyncService | None" = None,
     ) -> list[dict]:
-        """Get available slots for a team event (all members must be free for collective)."""
+        """Get available slots for a team event.
+
+        Collective events need every member free: slots are generated from
+        the intersection of the members' windows against the union of their
+        busy times. Round-robin events need any member free: the union of
+        each member's available slots.
+        """
         from aexy.models.booking import TeamEventMember, AssignmentType
 
         # Get event type
@@ -567,84 +625,74 @@ class AvailabilityService:
         if not members:
             return []
 
+        member_ids = [member.user_id for member in members]
+        tz = ZoneInfo(timezone)
+        windows_by_user = await self._get_availability_windows(
+            member_ids, event_type.workspace_id, target_date, target_date
+        )
+        busy_by_host = await self._get_busy_times_by_host(
+            member_ids, target_date, target_date, timezone
+        )
+        if calendar_service:
+            calendar_busy = await calendar_service.get_busy_times_for_users(
+                member_ids, target_date, target_date
+            )
+            for user_id in member_ids:
+                busy_by_host[user_id].extend(calendar_busy[user_id])
+
+        slot_options = {
+            "duration_minutes": event_type.duration_minutes,
+            "buffer_before": event_type.buffer_before,
+            "buffer_after": event_type.buffer_after,
+            "target_date": target_date,
+            "timezone": timezone,
+            "min_booking_datetime": datetime.now(tz)
+            + timedelta(hours=event_type.min_notice_hours),
+        }
+
         # Check assignment type (assume all same for simplicity)
         assignment_type = members[0].assignment_type
 
         if assignment_type == AssignmentType.COLLECTIVE.value:
             # All members must be free - intersection of availability
-            all_slots = []
-            for member in members:
-                # Create a temporary single-user event type context
-                member_slots = await self._get_user_slots(
-                    member.user_id,
-                    event_type,
-                    target_date,
-                    timezone,
-                    calendar_service,
-                )
-                all_slots.append(set(s["start_time"] for s in member_slots if s["available"]))
-
-            if not all_slots:
-                return []
-
-            # Find intersection
-            common_times = all_slots[0]
-            for slot_set in all_slots[1:]:
-                common_times = common_times.intersection(slot_set)
-
-            # Build slot list
-            return [
-                {"start_time": t, "end_time": t + timedelta(minutes=event_type.duration_minutes), "available": True}
-                for t in sorted(common_times)
-            ]
+            common_windows = intersect_all(
+                [
+                    self._window_intervals(windows_by_user[user_id][target_date], target_date, tz)
+                    for user_id in member_ids
+                ]
+            )
+            slots = self._generate_slots(
+                available_windows=[
+                    {"start_time": start.timetz(), "end_time": end.timetz()}
+                    for start, end in common_windows
+                ],
+                busy_times=[busy for user_id in member_ids for busy in busy_by_host[user_id]],
+                **slot_options,
+            )
+            return [slot for slot in slots if slot["available"]]
 
         else:
             # Round-robin - union of availability (any member free is fine)
-            return await self.get_available_slots(
-                event_type_id, target_date, timezone, calendar_service
-            )
-
-    async def _get_user_slots(
-        self,
-        user_id: str,
-        event_type: EventType,
-        target_date: date,
-        timezone: str,
-        calendar_service: "CalendarSyncService | None",
-    ) -> list[dict]:
-        """Get available slots for a single user."""
-        tz = ZoneInfo(timezone)
-        now = datetime.now(tz)
-        day_of_week = target_date.weekday()
-
-        # Get availability windows
-        windows = await self._get_day_availability(
-            [user_id], event_type.workspace_id, day_of_week, target_date
-        )
-
-        if not windows:
-            return []
-
-        # Get busy times
-        busy_times = await self._get_busy_times([user_id], target_date, timezone)
-
-        if calendar_service:
-            calendar_busy = await calendar_service.get_busy_times(
-                user_id, target_date, target_date
+            available: dict[datetime, dict] = {}
+            for user_id in member_ids:
+                for slot in self._generate_slots(
+                    available_windows=windows_by_user[user_id][target_date],
+                    busy_times=busy_by_host[user_id],
+                    **slot_options,
+                ):
+                    if slot["available"]:
+                        available.setdefault(slot["start_time"], slot)
+            return [available[start] for start in sorted(available)]
+
+    @staticmethod
+    def _window_intervals(windows: list[dict], target_date: date, tz: ZoneInfo) -> list[Interval]:
+        """Convert availability windows of a day to merged datetime intervals."""
+        return merge_intervals(
+            (
+                datetime.combine(target_date, window["start_time"], tzinfo=tz),
+                datetime.combine(target_date, window["end_time"], tzinfo=tz),
             )
-            busy_times.extend(calendar_busy)
-
-        min_booking_datetime = now + timedelta(hours=event_type.min_notice_hours)
-
-        return self._generate_slots(
-            available_windows=windows,
-            busy_times=busy_times,
-            duration_minutes=event_type.duration_minutes,
-            buffer_before=event_type.buffer_before,
-            buffer_after=event_type.buffer_after,
-            target_date=target_date,
-            timezone=timezone,
-            min_booking_datetime=min_booking_datetime,
+            for window in windows
         )
 
     # Team availability for calendar view
@@ -710,145 +758,106 @@ class AvailabilityService:
         user_result = await self.db.execute(user_stmt)
         users = {u.id: u for u in user_result.scalars().all()}
 
+        # Load the whole range up front: one query per table and one
+        # free/busy lookup for all members
+        tz = ZoneInfo(timezone)
+        windows_by_user = await self._get_availability_windows(
+            member_ids, workspace_id, start_date, end_date
+        )
+        bookings = await self._get_active_bookings(member_ids, start_date, end_date, timezone)
+
+        busy_by_user: dict[str, list[dict]] = {user_id: [] for user_id in member_ids}
+        for booking in bookings:
+            if booking.host_id in busy_by_user:
+                busy_by_user[booking.host_id].append(
+                    {"start": booking.start_time, "end": booking.end_time}
+                )
+        if calendar_service:
+            calendar_busy = await calendar_service.get_busy_times_for_users(
+                member_ids, start_date, end_date
+            )
+            for user_id in member_ids:
+                busy_by_user[user_id].extend(calendar_busy[user_id])
+
+        busy_intervals = {
+            user_id: merge_intervals((bt["start"], bt["end"]) for bt in busy_times)
+            for user_id, busy_times in busy_by_user.items()
+        }
+
         # Build response structure
-        members_data = []
-        all_available_times: dict[str, list[set]] = {}  # date -> list of time sets per user
+        members_data = [
+            {
+                "user_id": user_id,
+                "user": {
+                    "id": user_id,
+                    "name": users[user_id].name if user_id in users else None,
+                    "email": users[user_id].email if user_id in users else None,
+                    "avatar_url": users[user_id].avatar_url if user_id in users else None,
+                },
+                "availability": [],
+            }
+            for user_id in member_ids
+        ]
+        overlapping_slots = []
 
         # Process each day in the range
         current_date = start_date
         while current_date <= end_date:
             date_str = current_date.isoformat()
-            all_available_times[date_str] = []
-
-            for user_id in member_ids:
-                # Initialize member data on first iteration
-                member_entry = next(
-                    (m for m in members_data if m["user_id"] == user_id), None
-                )
-                if not member_entry:
-                    user = users.get(user_id)
-                    member_entry = {
-                        "user_id": user_id,
-                        "user": {
-                            "id": user_id,
-                            "name": user.name if user else None,
-                            "email": user.email if user else None,
-                            "avatar_url": user.avatar_url if user else None,
-                        },
-                        "availability": [],
-                    }
-                    members_data.append(member_entry)
-
-                # Get day's availability
-                day_of_week = current_date.weekday()
-                windows = await self._get_day_availability(
-                    [user_id], workspace_id, day_of_week, current_date
-                )
-
-                # Get busy times from bookings
-                busy_times = await self._get_busy_times([user_id], current_date, timezone)
+            day_start = datetime.combine(current_date, time.min, tzinfo=tz)
+            day_end = datetime.combine(current_date + timedelta(days=1), time.min, tzinfo=tz)
+            free_by_user = []
+
+            for user_id, member_entry in zip(member_ids, members_data):
+                windows = windows_by_user[user_id][current_date]
+                day_busy = [
+                    bt
+                    for bt in busy_by_user[user_id]
+                    if bt["start"] < day_end and bt["end"] > day_start
+                ]
 
-                # Get calendar busy times if available
-                if calendar_service:
-                    calendar_busy = await calendar_service.get_busy_times(
-                        user_id, current_date, current_date
+                # Free time is the day's windows minus its busy time
+                free_by_user.append(
+                    subtract_intervals(
+                        self._window_intervals(windows, current_date, tz),
+                        clip_intervals(busy_intervals[user_id], day_start, day_end),
                     )
-                    busy_times.extend(calendar_busy)
-
-                # Format windows
-                formatted_windows = []
-                available_minutes = set()
-
-                for window in windows:
-                    formatted_windows.append({
-                        "start": window["start_time"].strftime("%H:%M"),
-                        "end": window["end_time"].strftime("%H:%M"),
-                    })
-
-                    # Track available times (in 15-min increments)
-                    start_minutes = window["start_time"].hour * 60 + window["start_time"].minute
-                    end_minutes = window["end_time"].hour * 60 + window["end_time"].minute
-                    for m in range(start_minutes, end_minutes, 15):
-                        available_minutes.add(m)
-
-                # Remove busy times from available minutes
-                for busy in busy_times:
-                    busy_start = busy["start"]
-                    busy_end = busy["end"]
-                    if busy_start.date() == current_date:
-                        start_m = busy_start.hour * 60 + busy_start.minute
-                        end_m = busy_end.hour * 60 + busy_end.minute
-                        for m in range(start_m, end_m, 15):
-                            available_minutes.discard(m)
-
-                all_available_times[date_str].append(available_minutes)
-
-                # Format busy times
-                formatted_busy = [
-                    {
-                        "start": bt["start"].isoformat(),
-                        "end": bt["end"].isoformat(),
-                        "title": None,
-                    }
-                    for bt in busy_times
-                ]
+                )
 
                 member_entry["availability"].append({
                     "date": date_str,
-                    "windows": formatted_windows,
-                    "busy_times": formatted_busy,
+                    "windows": [
+                        {
+                            "start": window["start_time"].strftime("%H:%M"),
+                            "end": window["end_time"].strftime("%H:%M"),
+                        }
+                        for window in windows
+                    ],
+                    "busy_times": [
+                        {
+                            "start": bt["start"].isoformat(),
+                            "end": bt["end"].isoformat(),
+                            "title": None,
+                        }
+                        for bt in day_busy
+                    ],
                 })
 
-            current_date += timedelta(days=1)
-
-        # Calculate overlapping slots (times when ALL members are free)
-        overlapping_slots = []
-        for date_str, time_sets in all_available_times.items():
-            if time_sets:
-                common_times = time_sets[0]
-                for ts in time_sets[1:]:
-                    common_times = common_times.intersection(ts)
-
-                if common_times:
-                    # Convert back to windows
-                    sorted_times = sorted(common_times)
-                    windows = []
-                    if sorted_times:
-                        window_start = sorted_times[0]
-                        prev = sorted_times[0]
-                        for t in sorted_times[1:] + [sorted_times[-1] + 15]:
-                            if t - prev > 15:
-                                # End of window
-                                windows.append({
-                                    "start": f"{window_start // 60:02d}:{window_start % 60:02d}",
-                                    "end": f"{prev // 60 + (1 if prev % 60 == 45 else 0):02d}:{(prev % 60 + 15) % 60:02d}",
-                                })
-                                window_start = t
-                            prev = t
-
-                    overlapping_slots.append({
-                        "date": date_str,
-                        "windows": windows,
-                    })
-
-        # Get existing bookings for the team in this range
-        tz = ZoneInfo(timezone)
-        range_start = datetime.combine(start_date, time.min, tzinfo=tz)
-        range_end = datetime.combine(end_date, time.max, tzinfo=tz)
+            # Times when ALL members are free
+            common = intersect_all(free_by_user)
+            if common:
+                overlapping_slots.append({
+                    "date": date_str,
+                    "windows": [
+                        {
+                            "start": start.astimezone(tz).strftime("%H:%M"),
+                            "end": end.astimezone(tz).strftime("%H:%M"),
+                        }
+                        for start, end in common
+                    ],
+                })
 
-        booking_stmt = select(Booking).where(
-            and_(
-                Booking.host_id.in_(member_ids),
-                Booking.start_time >= range_start,
-                Booking.end_time <= range_end,
-                Booking.status.in_([
-                    BookingStatus.PENDING.value,
-                    BookingStatus.CONFIRMED.value,
-                ]),
-            )
-        )
-        booking_result = await self.db.execute(booking_stmt)
-        bookings = booking_result.scalars().all()
+            current_date += timedelta(days=1)
 
         bookings_data = []
         for b in bookings:
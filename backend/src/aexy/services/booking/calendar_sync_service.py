@@ -4,6 +4,7 @@ Provides actual integration with Google Calendar and Microsoft Graph APIs
 for busy time checking and event creation.
 """
 
+import asyncio
 import logging
 from datetime import date, datetime, timedelta
 from uuid import uuid4
@@ -13,6 +14,8 @@ import httpx
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from aexy.cache.calendar_busy_cache import get_calendar_busy_cache
+from aexy.core.async_runtime import get_http_client
 from aexy.core.config import get_settings
 from aexy.models.booking import CalendarConnection, CalendarProvider, Booking
 
@@ -27,6 +30,20 @@ MICROSOFT_GRAPH_API = "https://graph.microsoft.com/v1.0"
 MICROSOFT_TOKEN_URL = "https://login.microsoftonline.com/{tenant}/oauth2/v2.0/token"
 
 
+def _busy_times_by_day(busy_times: list[dict], days: list[date]) -> dict[date, list[dict]]:
+    """Group busy periods under every UTC day they overlap."""
+    by_day = {}
+    for day in days:
+        day_start = datetime.combine(day, datetime.min.time()).replace(tzinfo=ZoneInfo("UTC"))
+        day_end = day_start + timedelta(days=1)
+        by_day[day] = [
+            period
+            for period in busy_times
+            if period["start"] < day_end and period["end"] > day_start
+        ]
+    return by_day
+
+
 class CalendarSyncServiceError(Exception):
     """Base exception for calendar sync service errors."""
 
@@ -268,132 +285,215 @@ class CalendarSyncService:
         Returns:
             List of dicts with 'start' and 'end' datetime objects for busy periods.
         """
+        busy_by_user = await self.get_busy_times_for_users([user_id], start_date, end_date)
+        return busy_by_user[user_id]
+
+    async def get_busy_times_for_users(
+        self,
+        user_ids: list[str],
+        start_date: date,
+        end_date: date,
+    ) -> dict[str, list[dict]]:
+        """Get busy times from the connected calendars of several users.
+
+        Days cached per connection are served from the free/busy cache. The
+        other connections are fetched for the whole range at once: one
+        freeBusy request per Google account (it accepts several calendars)
+        and one calendarView request per Microsoft calendar, all running
+        concurrently.
+
+        Returns:
+            Busy periods per user ID.
+        """
+        busy_by_user: dict[str, list[dict]] = {user_id: [] for user_id in user_ids}
+
         # Get connections that check conflicts
         stmt = select(CalendarConnection).where(
             and_(
-                CalendarConnection.user_id == user_id,
+                CalendarConnection.user_id.in_(user_ids),
                 CalendarConnection.check_conflicts == True,
                 CalendarConnection.sync_enabled == True,
             )
         )
         result = await self.db.execute(stmt)
         connections = list(result.scalars().all())
+        if not connections:
+            return busy_by_user
 
-        busy_times = []
+        days = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+        cache = get_calendar_busy_cache()
+
+        busy_by_connection: dict[str, dict[date, list[dict]]] = {}
+        missing = []
+        for connection in connections:
+            cached = await cache.get_days(connection.id, days) if cache else {}
+            busy_by_connection[connection.id] = cached
+            if len(cached) < len(days):
+                missing.append(connection)
+
+        if missing:
+            fetched = await self._fetch_busy_times(missing, start_date, end_date)
+            for connection in missing:
+                periods = fetched.get(connection.id)
+                if periods is None:
+                    # Failed: leave the connection uncached and without busy times
+                    continue
+                by_day = _busy_times_by_day(periods, days)
+                busy_by_connection[connection.id] = by_day
+                if cache:
+                    await cache.set_days(connection.id, by_day)
+
+        for connection in connections:
+            seen = set()
+            for day in days:
+                for period in busy_by_connection[connection.id].get(day, []):
+                    # Periods spanning midnight are cached under every day
+                    key = (period["start"], period["end"], period.get("calendar_id"))
+                    if key not in seen:
+                        seen.add(key)
+                        busy_by_user[connection.user_id].append(period)
+
+        return busy_by_user
+
+    async def _fetch_busy_times(
+        self,
+        connections: list[CalendarConnection],
+        start_date: date,
+        end_date: date,
+    ) -> dict[str, list[dict]]:
+        """Fetch busy times from the providers for a date range.
 
+        Returns:
+            Busy periods per connection ID; connections whose lookup failed
+            are absent.
+        """
         # Convert dates to datetime for API calls
         start_dt = datetime.combine(start_date, datetime.min.time()).replace(tzinfo=ZoneInfo("UTC"))
         end_dt = datetime.combine(end_date + timedelta(days=1), datetime.min.time()).replace(tzinfo=ZoneInfo("UTC"))
 
+        # Token refreshes write to the session, so they run one at a time
+        google_accounts: dict[str, list[CalendarConnection]] = {}
+        requests = []
         for connection in connections:
             try:
-                # Refresh token if needed
                 connection = await self._refresh_token_if_needed(connection)
-
-                if connection.provider == CalendarProvider.GOOGLE.value:
-                    google_busy = await self._get_google_busy_times(
-                        connection, start_dt, end_dt
-                    )
-                    busy_times.extend(google_busy)
-                elif connection.provider == CalendarProvider.MICROSOFT.value:
-                    microsoft_busy = await self._get_microsoft_busy_times(
-                        connection, start_dt, end_dt
-                    )
-                    busy_times.extend(microsoft_busy)
             except Exception as e:
                 logger.error(
                     f"Failed to get busy times from {connection.provider} "
                     f"calendar {connection.calendar_id}: {e}"
                 )
-                # Continue with other calendars
                 continue
 
-        return busy_times
+            if connection.provider == CalendarProvider.GOOGLE.value:
+                google_accounts.setdefault(connection.access_token, []).append(connection)
+            elif connection.provider == CalendarProvider.MICROSOFT.value:
+                requests.append(self._get_microsoft_busy_times(connection, start_dt, end_dt))
+
+        requests.extend(
+            self._get_google_busy_times(account_connections, start_dt, end_dt)
+            for account_connections in google_accounts.values()
+        )
+
+        busy_by_connection: dict[str, list[dict]] = {}
+        for outcome in await asyncio.gather(*requests, return_exceptions=True):
+            if isinstance(outcome, Exception):
+                logger.error(f"Failed to get calendar busy times: {outcome}")
+                continue
+            busy_by_connection.update(outcome)
+
+        return busy_by_connection
 
     async def _get_google_busy_times(
         self,
-        connection: CalendarConnection,
+        connections: list[CalendarConnection],
         start_dt: datetime,
         end_dt: datetime,
-    ) -> list[dict]:
-        """Get busy times from Google Calendar using freeBusy API."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{GOOGLE_CALENDAR_API}/freeBusy",
-                headers={
-                    "Authorization": f"Bearer {connection.access_token}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "timeMin": start_dt.isoformat(),
-                    "timeMax": end_dt.isoformat(),
-                    "items": [{"id": connection.calendar_id}],
-                },
-                timeout=30.0,
-            )
+    ) -> dict[str, list[dict]]:
+        """Get busy times of one Google account's calendars using freeBusy API."""
+        calendar_ids = list(dict.fromkeys(c.calendar_id for c in connections))
+        response = await get_http_client().post(
+            f"{GOOGLE_CALENDAR_API}/freeBusy",
+            headers={
+                "Authorization": f"Bearer {connections[0].access_token}",
+                "Content-Type": "application/json",
+            },
+            json={
+                "timeMin": start_dt.isoformat(),
+                "timeMax": end_dt.isoformat(),
+                "items": [{"id": calendar_id} for calendar_id in calendar_ids],
+            },
+            timeout=30.0,
+        )
 
-            if response.status_code != 200:
-                logger.error(f"Google freeBusy API error: {response.status_code} - {response.text}")
-                return []
+        if response.status_code != 200:
+            logger.error(f"Google freeBusy API error: {response.status_code} - {response.text}")
+            return {}
 
-            data = response.json()
+        calendars = response.json().get("calendars", {})
 
-        busy_times = []
-        calendars = data.get("calendars", {})
-        calendar_data = calendars.get(connection.calendar_id, {})
+        busy_by_connection = {}
+        for connection in connections:
+            calendar_data = calendars.get(connection.calendar_id, {})
+            if calendar_data.get("errors"):
+                logger.error(
+                    f"Google freeBusy error for calendar {connection.calendar_id}: "
+                    f"{calendar_data['errors']}"
+                )
+                continue
 
-        for busy_period in calendar_data.get("busy", []):
-            start_str = busy_period.get("start")
-            end_str = busy_period.get("end")
+            busy_times = []
+            for busy_period in calendar_data.get("busy", []):
+                start_str = busy_period.get("start")
+                end_str = busy_period.get("end")
 
-            if start_str and end_str:
-                busy_times.append({
-                    "start": datetime.fromisoformat(start_str.replace("Z", "+00:00")),
-                    "end": datetime.fromisoformat(end_str.replace("Z", "+00:00")),
-                    "calendar_id": connection.calendar_id,
-                    "provider": CalendarProvider.GOOGLE.value,
-                })
+                if start_str and end_str:
+                    busy_times.append({
+                        "start": datetime.fromisoformat(start_str.replace("Z", "+00:00")),
+                        "end": datetime.fromisoformat(end_str.replace("Z", "+00:00")),
+                        "calendar_id": connection.calendar_id,
+                        "provider": CalendarProvider.GOOGLE.value,
+                    })
+            busy_by_connection[connection.id] = busy_times
 
-        return busy_times
+        return busy_by_connection
 
     async def _get_microsoft_busy_times(
         self,
         connection: CalendarConnection,
         start_dt: datetime,
         end_dt: datetime,
-    ) -> list[dict]:
+    ) -> dict[str, list[dict]]:
         """Get busy times from Microsoft Graph using calendarView API."""
-        async with httpx.AsyncClient() as client:
-            # Use calendarView to get events in the time range
-            # This is more reliable than getSchedule for personal calendars
-            params = {
-                "startDateTime": start_dt.isoformat(),
-                "endDateTime": end_dt.isoformat(),
-                "$select": "start,end,showAs",
-                "$filter": "showAs ne 'free'",  # Only get busy/tentative/oof events
-            }
+        # Use calendarView to get events in the time range
+        # This is more reliable than getSchedule for personal calendars
+        params = {
+            "startDateTime": start_dt.isoformat(),
+            "endDateTime": end_dt.isoformat(),
+            "$select": "start,end,showAs",
+            "$filter": "showAs ne 'free'",  # Only get busy/tentative/oof events
+        }
 
-            # Construct URL based on calendar_id
-            if connection.calendar_id == "primary":
-                url = f"{MICROSOFT_GRAPH_API}/me/calendar/calendarView"
-            else:
-                url = f"{MICROSOFT_GRAPH_API}/me/calendars/{connection.calendar_id}/calendarView"
+        # Construct URL based on calendar_id
+        if connection.calendar_id == "primary":
+            url = f"{MICROSOFT_GRAPH_API}/me/calendar/calendarView"
+        else:
+            url = f"{MICROSOFT_GRAPH_API}/me/calendars/{connection.calendar_id}/calendarView"
 
-            response = await client.get(
-                url,
-                headers={
-                    "Authorization": f"Bearer {connection.access_token}",
-                    "Content-Type": "application/json",
-                },
-                params=params,
-                timeout=30.0,
-            )
+        response = await get_http_client().get(
+            url,
+            headers={
+                "Authorization": f"Bearer {connection.access_token}",
+                "Content-Type": "application/json",
+            },
+            params=params,
+            timeout=30.0,
+        )
 
-            if response.status_code != 200:
-                logger.error(f"Microsoft Graph API error: {response.status_code} - {response.text}")
-                return []
+        if response.status_code != 200:
+            logger.error(f"Microsoft Graph API error: {response.status_code} - {response.text}")
+            return {}
 
-            data = response.json()
+        data = response.json()
 
         busy_times = []
         for event in data.get("value", []):
@@ -427,7 +527,40 @@ class CalendarSyncService:
                     logger.warning(f"Failed to parse Microsoft event times: {e}")
                     continue
 
-        return busy_times
+        return {connection.id: busy_times}
+
+    async def _invalidate_busy_times(
+        self,
+        user_id: str,
+        booking: Booking,
+        previous_start: datetime | None = None,
+        previous_end: datetime | None = None,
+    ) -> None:
+        """Drop a user's cached free/busy days covering a booking's event.
+
+        When the event was moved, pass its previous times so the days it
+        was moved away from are dropped too.
+        """
+        cache = get_calendar_busy_cache()
+        if not cache:
+            return
+
+        ranges = [(booking.start_time, booking.end_time)]
+        if previous_start and previous_end:
+            ranges.append((previous_start, previous_end))
+
+        days: set[date] = set()
+        for start, end in ranges:
+            first_day = start.astimezone(ZoneInfo("UTC")).date()
+            last_day = end.astimezone(ZoneInfo("UTC")).date()
+            days.update(
+                first_day + timedelta(days=i) for i in range((last_day - first_day).days + 1)
+            )
+
+        stmt = select(CalendarConnection.id).where(CalendarConnection.user_id == user_id)
+        result = await self.db.execute(stmt)
+        for connection_id in result.scalars().all():
+            await cache.invalidate(connection_id, sorted(days))
 
     # Calendar event management
 
@@ -509,6 +642,8 @@ class CalendarSyncService:
                     f"Provider: {connection.provider}, location_type: {event_type.location_type if event_type else 'N/A'}"
                 )
 
+            await self._invalidate_busy_times(booking.host_id, booking)
+
             return {
                 "calendar_event_id": event_id,
                 "calendar_provider": connection.provider,
@@ -755,6 +890,8 @@ class CalendarSyncService:
                 else:
                     continue
 
+                await self._invalidate_busy_times(user_id, booking)
+
                 results.append({
                     "user_id": user_id,
                     "role": "attendee",
@@ -772,8 +909,14 @@ class CalendarSyncService:
     async def update_calendar_event(
         self,
         booking: Booking,
+        previous_start: datetime | None = None,
+        previous_end: datetime | None = None,
     ) -> dict | None:
-        """Update a calendar event for a booking."""
+        """Update a calendar event for a booking.
+
+        Pass the event's previous times when it was rescheduled, so cached
+        free/busy data for the old days is invalidated as well.
+        """
         if not booking.calendar_event_id or not booking.host_id:
             return None
 
@@ -807,6 +950,10 @@ class CalendarSyncService:
                     connection, booking.calendar_event_id, booking, event_title, event_description
                 )
 
+            await self._invalidate_busy_times(
+                booking.host_id, booking, previous_start, previous_end
+            )
+
             return {
                 "calendar_event_id": booking.calendar_event_id,
                 "updated": True,
@@ -928,6 +1075,8 @@ class CalendarSyncService:
             elif connection.provider == CalendarProvider.MICROSOFT.value:
                 await self._delete_microsoft_event(connection, booking.calendar_event_id)
 
+            await self._invalidate_busy_times(booking.host_id, booking)
+
             return True
 
         except Exception as e:
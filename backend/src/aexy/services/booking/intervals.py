@@ -0,0 +1,84 @@
+"""Interval algebra for availability calculations.
+
+Intervals are half-open ``(start, end)`` tuples of datetimes. Every function
+returning a list of intervals returns it normalized: sorted by start,
+non-overlapping, and without empty intervals, so results can be fed to the
+other functions directly.
+"""
+
+from collections.abc import Iterable
+from datetime import datetime
+
+Interval = tuple[datetime, datetime]
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> list[Interval]:
+    """Sort intervals and merge the ones that overlap or touch."""
+    merged: list[Interval] = []
+    for start, end in sorted(intervals):
+        if start >= end:
+            continue
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def union_intervals(*interval_lists: Iterable[Interval]) -> list[Interval]:
+    """Get the time covered by any of the interval lists."""
+    return merge_intervals(interval for intervals in interval_lists for interval in intervals)
+
+
+def intersect_intervals(a: list[Interval], b: list[Interval]) -> list[Interval]:
+    """Get the time covered by both normalized interval lists."""
+    result: list[Interval] = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        start = max(a[i][0], b[j][0])
+        end = min(a[i][1], b[j][1])
+        if start < end:
+            result.append((start, end))
+        # Advance whichever interval ends first
+        if a[i][1] <= b[j][1]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def intersect_all(interval_lists: list[list[Interval]]) -> list[Interval]:
+    """Get the time covered by every one of the normalized interval lists."""
+    if not interval_lists:
+        return []
+    result = interval_lists[0]
+    for intervals in interval_lists[1:]:
+        if not result:
+            break
+        result = intersect_intervals(result, intervals)
+    return result
+
+
+def subtract_intervals(a: list[Interval], b: list[Interval]) -> list[Interval]:
+    """Get the time covered by ``a`` but not by ``b`` (both normalized)."""
+    result: list[Interval] = []
+    j = 0
+    for start, end in a:
+        # Skip removals that end before this interval starts
+        while j < len(b) and b[j][1] <= start:
+            j += 1
+        k = j
+        while k < len(b) and b[k][0] < end:
+            if b[k][0] > start:
+                result.append((start, b[k][0]))
+            start = max(start, b[k][1])
+            k += 1
+        if start < end:
+            result.append((start, end))
+    return result
+
+
+def clip_intervals(intervals: list[Interval], start: datetime, end: datetime) -> list[Interval]:
+    """Restrict normalized intervals to ``[start, end)``."""
+    return intersect_intervals(intervals, [(start, end)] if start < end else [])
@@ -1,15 +1,19 @@
 """CRM Automation service for managing and executing automation workflows."""
 
 import asyncio
+import logging
 import httpx
+from collections import Counter
 from datetime import datetime, timezone
 from typing import Any
 from uuid import uuid4
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, or_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import lazyload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
+from aexy.core.database import run_after_commit
 from aexy.models.crm import (
     CRMAutomation,
     CRMAutomationRun,
@@ -25,10 +29,23 @@ from aexy.models.crm import (
     CRMSequenceEnrollmentStatus,
 )
 from aexy.services.crm_service import CRMRecordService, CRMActivityService
+from aexy.services.crm_trigger_index import get_trigger_index, invalidate_trigger_index
 from aexy.services.slack_integration import SlackIntegrationService
 from aexy.schemas.integrations import SlackMessage, SlackNotificationType
 from aexy.models.developer import Developer
 
+logger = logging.getLogger(__name__)
+
+
+async def _dispatch_runs(run_ids: list[str]) -> None:
+    """Enqueue committed automation runs as one task."""
+    from aexy.processing.tasks import execute_crm_automation_runs_task
+
+    try:
+        execute_crm_automation_runs_task.delay(run_ids)
+    except Exception as e:
+        logger.error(f"Failed to enqueue {len(run_ids)} CRM automation runs: {e}")
+
 
 class CRMAutomationService:
     """Service for CRM automation CRUD and execution."""
@@ -74,6 +91,7 @@ class CRMAutomationService:
         self.db.add(automation)
         await self.db.flush()
         await self.db.refresh(automation)
+        await invalidate_trigger_index(workspace_id)
         return automation
 
     async def get_automation(self, automation_id: str) -> CRMAutomation | None:
@@ -119,6 +137,7 @@ class CRMAutomationService:
 
         await self.db.flush()
         await self.db.refresh(automation)
+        await invalidate_trigger_index(automation.workspace_id)
         return automation
 
     async def delete_automation(self, automation_id: str) -> bool:
@@ -127,8 +146,10 @@ class CRMAutomationService:
         if not automation:
             return False
 
+        workspace_id = automation.workspace_id
         await self.db.delete(automation)
         await self.db.flush()
+        await invalidate_trigger_index(workspace_id)
         return True
 
     async def toggle_automation(self, automation_id: str) -> CRMAutomation | None:
@@ -140,6 +161,7 @@ class CRMAutomationService:
         automation.is_active = not automation.is_active
         await self.db.flush()
         await self.db.refresh(automation)
+        await invalidate_trigger_index(automation.workspace_id)
         return automation
 
     async def get_automation_run(self, run_id: str) -> CRMAutomationRun | None:
@@ -171,53 +193,151 @@ class CRMAutomationService:
         trigger_data: dict | None = None,
     ) -> list[CRMAutomationRun]:
         """Process a trigger event and run all matching automations."""
-        # Find all active automations matching this trigger
-        stmt = select(CRMAutomation).where(
-            CRMAutomation.workspace_id == workspace_id,
-            CRMAutomation.object_id == object_id,
-            CRMAutomation.trigger_type == trigger_type,
-            CRMAutomation.is_active == True,
+        return await self.process_trigger_batch(
+            workspace_id=workspace_id,
+            object_id=object_id,
+            trigger_type=trigger_type,
+            events=[(record_id, trigger_data)],
         )
-        result = await self.db.execute(stmt)
-        automations = list(result.scalars().all())
 
-        runs = []
-        for automation in automations:
-            # Check trigger config to see if this specific trigger matches
-            trigger_config = automation.trigger_config or {}
-
-            # For field_changed trigger, check if the specific field matches
-            if trigger_type == "field_changed":
-                watched_field = trigger_config.get("field")
-                changed_field = (trigger_data or {}).get("changed_field")
-                if watched_field and watched_field != changed_field:
-                    continue
+    async def process_trigger_batch(
+        self,
+        workspace_id: str,
+        object_id: str,
+        trigger_type: str,
+        events: list[tuple[str | None, dict | None]],
+    ) -> list[CRMAutomationRun]:
+        """Queue runs for all automations triggered by a batch of events.
 
-            # For stage_changed trigger, check if stages match
-            if trigger_type == "stage_changed":
-                from_stage = trigger_config.get("from_stage")
-                to_stage = trigger_config.get("to_stage")
-                actual_old = (trigger_data or {}).get("old_stage")
-                actual_new = (trigger_data or {}).get("new_stage")
+        Events are matched against the workspace's in-process trigger index,
+        so writes that trigger nothing do not touch the automations table.
+        Matching runs are inserted as pending and dispatched to the worker as
+        one task once the surrounding transaction commits.
 
-                if from_stage and from_stage != actual_old:
-                    continue
-                if to_stage and to_stage != actual_new:
+        Args:
+            workspace_id: Workspace ID.
+            object_id: CRM object the events belong to.
+            trigger_type: Trigger type shared by all events.
+            events: (record_id, trigger_data) pairs.
+
+        Returns:
+            Pending automation runs that were queued.
+        """
+        if not events:
+            return []
+
+        index = await get_trigger_index(self.db, workspace_id)
+        matches = [
+            (automation_id, record_id, trigger_data or {})
+            for record_id, trigger_data in events
+            for automation_id in index.match(trigger_type, object_id, trigger_data or {})
+        ]
+        if not matches:
+            return []
+
+        automations = await self._get_active_automations({m[0] for m in matches})
+
+        runs = []
+        queued: Counter[str] = Counter()
+        for automation_id, record_id, trigger_data in matches:
+            automation = automations.get(automation_id)
+            if not automation:
+                continue
+
+            # Skip automations whose monthly run limit this batch would exceed.
+            # The counter may be stale; execute_pending_runs enforces the limit.
+            if automation.run_limit_per_month:
+                pending = automation.runs_this_month + queued[automation_id]
+                if pending >= automation.run_limit_per_month:
                     continue
 
-            try:
-                run = await self.trigger_automation(
-                    automation_id=automation.id,
+            queued[automation_id] += 1
+            runs.append(
+                CRMAutomationRun(
+                    id=str(uuid4()),
+                    automation_id=automation_id,
                     record_id=record_id,
                     trigger_data=trigger_data,
+                    status="pending",
+                    steps_executed=[],
                 )
-                runs.append(run)
-            except ValueError:
-                # Skip if automation can't run (limit exceeded, etc.)
-                continue
+            )
+
+        if runs:
+            self.db.add_all(runs)
+            await self.db.flush()
+            run_ids = [run.id for run in runs]
+            run_after_commit(self.db, lambda: _dispatch_runs(run_ids))
 
         return runs
 
+    async def _get_active_automations(self, automation_ids: set[str]) -> dict[str, CRMAutomation]:
+        """Load active automations by ID without their relationships."""
+        result = await self.db.execute(
+            select(CRMAutomation)
+            .where(
+                CRMAutomation.id.in_(automation_ids),
+                CRMAutomation.is_active == True,
+            )
+            .options(lazyload("*"))
+        )
+        return {automation.id: automation for automation in result.scalars().all()}
+
+    async def execute_pending_runs(self, run_ids: list[str]) -> int:
+        """Execute queued automation runs.
+
+        Runs that are no longer pending (e.g. on task redelivery) are skipped.
+        Each run reserves a slot in its automation's monthly run limit right
+        before executing; runs past the limit are marked failed.
+
+        Args:
+            run_ids: IDs of runs queued by :meth:`process_trigger_batch`.
+
+        Returns:
+            Number of runs executed.
+        """
+        result = await self.db.execute(
+            select(CRMAutomationRun)
+            .where(
+                CRMAutomationRun.id.in_(run_ids),
+                CRMAutomationRun.status == "pending",
+            )
+            .options(lazyload("*"))
+            .with_for_update(skip_locked=True)
+        )
+        runs = {run.id: run for run in result.scalars().all()}
+        if not runs:
+            return 0
+
+        automations = await self._get_active_automations(
+            {run.automation_id for run in runs.values()}
+        )
+
+        executed = 0
+        for run_id in run_ids:
+            run = runs.get(run_id)
+            if not run:
+                continue
+
+            automation = automations.get(run.automation_id)
+            if not automation:
+                run.status = "failed"
+                run.error_message = "Automation is not active"
+                run.completed_at = datetime.now(timezone.utc)
+                continue
+
+            if not await self._reserve_run(automation):
+                run.status = "failed"
+                run.error_message = "Automation run limit exceeded for this month"
+                run.completed_at = datetime.now(timezone.utc)
+                continue
+
+            await self._execute_automation(automation, run, run.record_id)
+            executed += 1
+
+        await self.db.flush()
+        return executed
+
     async def trigger_automation(
         self,
         automation_id: str,
@@ -229,18 +349,26 @@ class CRMAutomationService:
         if not automation:
             raise ValueError("Automation not found")
 
+        return await self._start_run(automation, record_id, trigger_data)
+
+    async def _start_run(
+        self,
+        automation: CRMAutomation,
+        record_id: str | None,
+        trigger_data: dict | None,
+    ) -> CRMAutomationRun:
+        """Create a run for a loaded automation and execute it."""
         if not automation.is_active:
             raise ValueError("Automation is not active")
 
         # Check run limit
-        if automation.run_limit_per_month:
-            if automation.runs_this_month >= automation.run_limit_per_month:
-                raise ValueError("Automation run limit exceeded for this month")
+        if not await self._reserve_run(automation):
+            raise ValueError("Automation run limit exceeded for this month")
 
         # Create run record
         run = CRMAutomationRun(
             id=str(uuid4()),
-            automation_id=automation_id,
+            automation_id=automation.id,
             record_id=record_id,
             trigger_data=trigger_data or {},
             status="pending",
@@ -254,6 +382,35 @@ class CRMAutomationService:
 
         return run
 
+    async def _reserve_run(self, automation: CRMAutomation) -> bool:
+        """Count a run against the automation's monthly run limit if it has room.
+
+        Checking and incrementing runs_this_month in one conditional UPDATE
+        keeps concurrent workers from exceeding the limit with stale counts.
+
+        Returns:
+            True if the run may execute.
+        """
+        result = await self.db.execute(
+            update(CRMAutomation)
+            .where(
+                CRMAutomation.id == automation.id,
+                or_(
+                    CRMAutomation.run_limit_per_month.is_(None),
+                    CRMAutomation.runs_this_month < CRMAutomation.run_limit_per_month,
+                ),
+            )
+            .values(runs_this_month=CRMAutomation.runs_this_month + 1)
+            .returning(CRMAutomation.runs_this_month)
+            .execution_options(synchronize_session=False)
+        )
+        runs_this_month = result.scalar_one_or_none()
+        if runs_this_month is None:
+            return False
+
+        set_committed_value(automation, "runs_this_month", runs_this_month)
+        return True
+
     async def _execute_automation(
         self,
         automation: CRMAutomation,
@@ -325,7 +482,6 @@ class CRMAutomationService:
 
             automation.total_runs += 1
             automation.successful_runs += 1
-            automation.runs_this_month += 1
             automation.last_run_at = datetime.now(timezone.utc)
 
         except Exception as e:
@@ -338,7 +494,6 @@ class CRMAutomationService:
 
             automation.total_runs += 1
             automation.failed_runs += 1
-            automation.runs_this_month += 1
             automation.last_run_at = datetime.now(timezone.utc)
 
         await self.db.flush()
@@ -722,53 +877,19 @@ class CRMAutomationService:
         record: CRMRecord | None = None,
         event_data: dict | None = None,
     ) -> list[CRMAutomation]:
-        """Find automations that match a trigger event."""
-        stmt = select(CRMAutomation).where(
-            CRMAutomation.workspace_id == workspace_id,
-            CRMAutomation.trigger_type == trigger_type,
-            CRMAutomation.is_active == True,
-        )
-
-        if record:
-            stmt = stmt.where(
-                (CRMAutomation.object_id == None) |
-                (CRMAutomation.object_id == record.object_id)
-            )
-
-        result = await self.db.execute(stmt)
-        automations = list(result.scalars().all())
-
-        # Filter by trigger config
-        matching = []
-        for automation in automations:
-            if self._matches_trigger_config(automation.trigger_config, record, event_data):
-                matching.append(automation)
-
-        return matching
+        """Find automations that match a trigger event.
 
-    def _matches_trigger_config(
-        self,
-        trigger_config: dict,
-        record: CRMRecord | None,
-        event_data: dict | None,
-    ) -> bool:
-        """Check if trigger config matches the event."""
-        # Field change trigger
-        if "attribute_slug" in trigger_config and event_data:
-            changed_field = event_data.get("changed_field")
-            if changed_field != trigger_config["attribute_slug"]:
-                return False
-
-            # Check from/to values if specified
-            from_value = trigger_config.get("from_value")
-            to_value = trigger_config.get("to_value")
-
-            if from_value and event_data.get("old_value") != from_value:
-                return False
-            if to_value and event_data.get("new_value") != to_value:
-                return False
+        Without a record only automations that apply to every object match.
+        """
+        index = await get_trigger_index(self.db, workspace_id)
+        automation_ids = index.match(
+            trigger_type, record.object_id if record else None, event_data or {}
+        )
+        if not automation_ids:
+            return []
 
-        return True
+        automations = await self._get_active_automations(set(automation_ids))
+        return [automations[a] for a in automation_ids if a in automations]
 
     async def process_record_event(
         self,
@@ -776,26 +897,15 @@ class CRMAutomationService:
         trigger_type: str,
         record: CRMRecord,
         event_data: dict | None = None,
-    ):
-        """Process a record event and trigger matching automations."""
-        automations = await self.find_matching_automations(
+    ) -> list[CRMAutomationRun]:
+        """Process a record event and queue matching automations."""
+        return await self.process_trigger_batch(
             workspace_id=workspace_id,
+            object_id=record.object_id,
             trigger_type=trigger_type,
-            record=record,
-            event_data=event_data,
+            events=[(record.id, event_data)],
         )
 
-        for automation in automations:
-            try:
-                await self.trigger_automation(
-                    automation_id=automation.id,
-                    record_id=record.id,
-                    trigger_data=event_data,
-                )
-            except Exception:
-                # Log error but continue with other automations
-                pass
-
     # =========================================================================
     # RUN HISTORY
     # =========================================================================
@@ -1485,9 +1595,21 @@ class CRMWebhookService:
 
         This method filters by object_id if the webhook is scoped to a specific object.
         """
-        webhooks = await self.list_webhooks(workspace_id, is_active=True)
+        await self.emit_events(workspace_id, event, object_id, [payload or {}])
 
-        for webhook in webhooks:
+    async def emit_events(
+        self,
+        workspace_id: str,
+        event: str,
+        object_id: str | None,
+        payloads: list[dict],
+    ):
+        """Emit many CRM events of one type with a single webhook lookup."""
+        if not payloads:
+            return
+
+        webhooks = []
+        for webhook in await self.list_webhooks(workspace_id, is_active=True):
             # Check if webhook is subscribed to this event
             if event not in webhook.events and "*" not in webhook.events:
                 continue
@@ -1497,7 +1619,11 @@ class CRMWebhookService:
             if webhook_object_id and object_id and webhook_object_id != object_id:
                 continue
 
-            await self._deliver_to_webhook(webhook, event, payload or {})
+            webhooks.append(webhook)
+
+        for payload in payloads:
+            for webhook in webhooks:
+                await self._deliver_to_webhook(webhook, event, payload)
 
     async def _deliver_to_webhook(
         self,
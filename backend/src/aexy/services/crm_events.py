@@ -21,43 +21,71 @@ class CRMEventService:
         created_by_id: str | None = None,
     ):
         """Emit event when a record is created."""
+        await self.emit_records_created(
+            workspace_id=workspace_id,
+            object_id=object_id,
+            records=[(record_id, values)],
+            created_by_id=created_by_id,
+        )
+
+    async def emit_records_created(
+        self,
+        workspace_id: str,
+        object_id: str,
+        records: list[tuple[str, dict[str, Any]]],
+        created_by_id: str | None = None,
+    ):
+        """Emit events for records created in one batch.
+
+        Args:
+            workspace_id: Workspace ID.
+            object_id: CRM object ID.
+            records: (record_id, values) pairs.
+            created_by_id: Creator.
+        """
         from aexy.services.crm_automation_service import (
             CRMAutomationService,
             CRMWebhookService,
         )
 
-        trigger_data = {
-            "trigger_type": "record_created",
-            "workspace_id": workspace_id,
-            "object_id": object_id,
-            "record_id": record_id,
-            "values": values,
-            "created_by_id": created_by_id,
-        }
-
         # Trigger matching automations
         automation_service = CRMAutomationService(self.db)
-        await automation_service.process_trigger(
+        await automation_service.process_trigger_batch(
             workspace_id=workspace_id,
             object_id=object_id,
             trigger_type=CRMAutomationTriggerType.RECORD_CREATED.value,
-            record_id=record_id,
-            trigger_data=trigger_data,
+            events=[
+                (
+                    record_id,
+                    {
+                        "trigger_type": "record_created",
+                        "workspace_id": workspace_id,
+                        "object_id": object_id,
+                        "record_id": record_id,
+                        "values": values,
+                        "created_by_id": created_by_id,
+                    },
+                )
+                for record_id, values in records
+            ],
         )
 
         # Deliver webhooks
         webhook_service = CRMWebhookService(self.db)
-        await webhook_service.emit_event(
+        await webhook_service.emit_events(
             workspace_id=workspace_id,
             event="record.created",
             object_id=object_id,
-            payload={
-                "event": "record.created",
-                "object_id": object_id,
-                "record_id": record_id,
-                "values": values,
-                "created_by": created_by_id,
-            },
+            payloads=[
+                {
+                    "event": "record.created",
+                    "object_id": object_id,
+                    "record_id": record_id,
+                    "values": values,
+                    "created_by": created_by_id,
+                }
+                for record_id, values in records
+            ],
         )
 
     async def emit_record_updated(
@@ -71,66 +99,103 @@ class CRMEventService:
         updated_by_id: str | None = None,
     ):
         """Emit event when a record is updated."""
+        await self.emit_records_updated(
+            workspace_id=workspace_id,
+            object_id=object_id,
+            updates=[
+                {
+                    "record_id": record_id,
+                    "old_values": old_values,
+                    "new_values": new_values,
+                    "changes": changes,
+                }
+            ],
+            updated_by_id=updated_by_id,
+        )
+
+    async def emit_records_updated(
+        self,
+        workspace_id: str,
+        object_id: str,
+        updates: list[dict[str, Any]],
+        updated_by_id: str | None = None,
+    ):
+        """Emit events for records updated in one batch.
+
+        Args:
+            workspace_id: Workspace ID.
+            object_id: CRM object ID.
+            updates: Dicts with record_id, old_values, new_values and changes.
+            updated_by_id: Updater.
+        """
         from aexy.services.crm_automation_service import (
             CRMAutomationService,
             CRMWebhookService,
         )
 
-        trigger_data = {
-            "trigger_type": "record_updated",
-            "workspace_id": workspace_id,
-            "object_id": object_id,
-            "record_id": record_id,
-            "old_values": old_values,
-            "new_values": new_values,
-            "changes": changes,
-            "updated_by_id": updated_by_id,
-        }
+        updated_events = []
+        field_events = []
+        for update in updates:
+            record_id = update["record_id"]
+            trigger_data = {
+                "trigger_type": "record_updated",
+                "workspace_id": workspace_id,
+                "object_id": object_id,
+                "record_id": record_id,
+                "old_values": update["old_values"],
+                "new_values": update["new_values"],
+                "changes": update["changes"],
+                "updated_by_id": updated_by_id,
+            }
+            updated_events.append((record_id, trigger_data))
+
+            # Check for field_changed triggers
+            for change in update["changes"]:
+                field_events.append(
+                    (
+                        record_id,
+                        {
+                            **trigger_data,
+                            "changed_field": change.get("field"),
+                            "old_value": change.get("old"),
+                            "new_value": change.get("new"),
+                        },
+                    )
+                )
 
         # Trigger matching automations
         automation_service = CRMAutomationService(self.db)
-        await automation_service.process_trigger(
+        await automation_service.process_trigger_batch(
             workspace_id=workspace_id,
             object_id=object_id,
             trigger_type=CRMAutomationTriggerType.RECORD_UPDATED.value,
-            record_id=record_id,
-            trigger_data=trigger_data,
+            events=updated_events,
+        )
+        await automation_service.process_trigger_batch(
+            workspace_id=workspace_id,
+            object_id=object_id,
+            trigger_type=CRMAutomationTriggerType.FIELD_CHANGED.value,
+            events=field_events,
         )
-
-        # Check for field_changed triggers
-        for change in changes:
-            field_name = change.get("field")
-            old_val = change.get("old")
-            new_val = change.get("new")
-
-            await automation_service.process_trigger(
-                workspace_id=workspace_id,
-                object_id=object_id,
-                trigger_type=CRMAutomationTriggerType.FIELD_CHANGED.value,
-                record_id=record_id,
-                trigger_data={
-                    **trigger_data,
-                    "changed_field": field_name,
-                    "old_value": old_val,
-                    "new_value": new_val,
-                },
-            )
 
         # Deliver webhooks
         webhook_service = CRMWebhookService(self.db)
-        await webhook_service.emit_event(
+        await webhook_service.emit_events(
             workspace_id=workspace_id,
             event="record.updated",
             object_id=object_id,
-            payload={
-                "event": "record.updated",
-                "object_id": object_id,
-                "record_id": record_id,
-                "old_values": old_values,
-                "new_values": new_values,
-                "changes": changes,
-                "updated_by": updated_by_id,
-            },
+            payloads=[
+                {
+                    "event": "record.updated",
+                    "object_id": object_id,
+                    "record_id": update["record_id"],
+                    "old_values": update["old_values"],
+                    "new_values": update["new_values"],
+                    "changes": update["changes"],
+                    "updated_by": updated_by_id,
+                }
+                for update in updates
+            ],
         )
 
     async def emit_record_deleted(
@@ -143,45 +208,76 @@ class CRMEventService:
         deleted_by_id: str | None = None,
     ):
         """Emit event when a record is deleted."""
+        await self.emit_records_deleted(
+            workspace_id=workspace_id,
+            object_id=object_id,
+            records=[(record_id, values)],
+            permanent=permanent,
+            deleted_by_id=deleted_by_id,
+        )
+
+    async def emit_records_deleted(
+        self,
+        workspace_id: str,
+        object_id: str,
+        records: list[tuple[str, dict[str, Any]]],
+        permanent: bool = False,
+        deleted_by_id: str | None = None,
+    ):
+        """Emit events for records deleted in one batch.
+
+        Args:
+            workspace_id: Workspace ID.
+            object_id: CRM object ID.
+            records: (record_id, values) pairs.
+            permanent: Whether the records were hard-deleted.
+            deleted_by_id: Deleter.
+        """
         from aexy.services.crm_automation_service import (
             CRMAutomationService,
             CRMWebhookService,
         )
 
-        trigger_data = {
-            "trigger_type": "record_deleted",
-            "workspace_id": workspace_id,
-            "object_id": object_id,
-            "record_id": record_id,
-            "values": values,
-            "permanent": permanent,
-            "deleted_by_id": deleted_by_id,
-        }
-
         # Trigger matching automations
         automation_service = CRMAutomationService(self.db)
-        await automation_service.process_trigger(
+        await automation_service.process_trigger_batch(
             workspace_id=workspace_id,
             object_id=object_id,
             trigger_type=CRMAutomationTriggerType.RECORD_DELETED.value,
-            record_id=record_id,
-            trigger_data=trigger_data,
+            events=[
+                (
+                    record_id,
+                    {
+                        "trigger_type": "record_deleted",
+                        "workspace_id": workspace_id,
+                        "object_id": object_id,
+                        "record_id": record_id,
+                        "values": values,
+                        "permanent": permanent,
+                        "deleted_by_id": deleted_by_id,
+                    },
+                )
+                for record_id, values in records
+            ],
         )
 
         # Deliver webhooks
         webhook_service = CRMWebhookService(self.db)
-        await webhook_service.emit_event(
+        await webhook_service.emit_events(
             workspace_id=workspace_id,
             event="record.deleted",
             object_id=object_id,
-            payload={
-                "event": "record.deleted",
-                "object_id": object_id,
-                "record_id": record_id,
-                "values": values,
-                "permanent": permanent,
-                "deleted_by": deleted_by_id,
-            },
+            payloads=[
+                {
+                    "event": "record.deleted",
+                    "object_id": object_id,
+                    "record_id": record_id,
+                    "values": values,
+                    "permanent": permanent,
+                    "deleted_by": deleted_by_id,
+                }
+                for record_id, values in records
+            ],
         )
 
     async def emit_stage_changed(
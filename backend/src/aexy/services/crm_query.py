@@ -0,0 +1,391 @@
+"""Compile CRM record filters and sorts into index-friendly SQL.
+
+Equality and membership filters are compiled to JSONB containment
+(``values @> '{"slug": value}'``), which is served by the
+``ix_crm_records_values_gin`` index. Range filters and sorts on numeric and
+date attributes use ``attribute_value(slug)``, the same expression the
+per-attribute expression indexes are built on (see ``attribute_index_ddl``);
+numeric range filters also match numbers stored as strings, which needs a
+cast the index cannot serve.
+Pagination is keyset-based: the cursor carries the sort key values of the
+last row, so deep pages cost the same as the first one.
+"""
+
+import base64
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import (
+    Numeric,
+    String,
+    and_,
+    case,
+    cast,
+    false,
+    func,
+    literal,
+    literal_column,
+    not_,
+    or_,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql.elements import ColumnElement
+
+from aexy.models.crm import CRMAttribute, CRMAttributeType, CRMRecord
+
+NUMERIC_ATTRIBUTE_TYPES = {
+    CRMAttributeType.NUMBER.value,
+    CRMAttributeType.CURRENCY.value,
+    CRMAttributeType.RATING.value,
+}
+TEMPORAL_ATTRIBUTE_TYPES = {
+    CRMAttributeType.DATE.value,
+    CRMAttributeType.TIMESTAMP.value,
+}
+# Attribute types that get an expression index for range filters and sorting
+INDEXED_ATTRIBUTE_TYPES = NUMERIC_ATTRIBUTE_TYPES | TEMPORAL_ATTRIBUTE_TYPES
+
+# Record columns that can be sorted on directly
+COLUMN_SORTS: dict[str, Any] = {
+    "created_at": CRMRecord.created_at,
+    "updated_at": CRMRecord.updated_at,
+    "display_name": CRMRecord.display_name,
+}
+
+_INDEXABLE_SLUG = re.compile(r"^[a-z0-9_]+$")
+_RANGE_OPERATORS = {"gt", "gte", "lt", "lte", "between"}
+# Strings Postgres can cast to numeric, e.g. "1200", " -3.5 ", "1e3"
+_NUMERIC_STRING_PATTERN = r"^\s*[-+]?([0-9]+(\.[0-9]*)?|\.[0-9]+)([eE][-+]?[0-9]+)?\s*$"
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor does not match the requested sort."""
+
+
+def attribute_value(slug: str) -> ColumnElement:
+    """JSONB value of an attribute, with JSON null folded into SQL NULL.
+
+    The slug is rendered inline rather than as a bind parameter so the
+    planner can match the per-attribute expression indexes.
+    """
+    return func.nullif(
+        CRMRecord.values.op("->", return_type=JSONB)(literal(slug, String, literal_execute=True)),
+        literal_column("'null'::jsonb"),
+        type_=JSONB,
+    )
+
+
+def attribute_text(slug: str) -> ColumnElement:
+    """Text value of an attribute (``values ->> slug``)."""
+    return CRMRecord.values[slug].astext
+
+
+def attribute_index_name(slug: str) -> str:
+    """Name of the expression index for an attribute slug."""
+    name = f"ix_crm_records_attr_{slug}"
+    if len(name) > 63:
+        name = f"ix_crm_records_attr_{hashlib.sha256(slug.encode()).hexdigest()[:16]}"
+    return name
+
+
+def attribute_index_ddl(slug: str) -> str | None:
+    """DDL for the (object_id, attribute value) expression index of a slug.
+
+    The index is shared by every object with an attribute of that slug.
+    Returns None for slugs that are not safe to inline into DDL.
+    """
+    if not _INDEXABLE_SLUG.match(slug):
+        return None
+    # Must stay equivalent to attribute_value() for the planner to match it
+    return (
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {attribute_index_name(slug)} "
+        f"ON crm_records (object_id, (NULLIF(\"values\" -> '{slug}', 'null'::jsonb)))"
+    )
+
+
+def _to_number(value: Any) -> int | float | None:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        number = float(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+    return int(number) if number.is_integer() else number
+
+
+def _compare(expression: ColumnElement, operator: str, bounds: list[Any]) -> ColumnElement:
+    """Compare an expression with the bound(s) of a range operator."""
+    if operator == "gt":
+        return expression > bounds[0]
+    if operator == "gte":
+        return expression >= bounds[0]
+    if operator == "lt":
+        return expression < bounds[0]
+    if operator == "lte":
+        return expression <= bounds[0]
+    return and_(expression >= bounds[0], expression <= bounds[1])
+
+
+def _escape_like(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+@dataclass
+class SortKey:
+    """A compiled sort key."""
+
+    attribute: str
+    expression: ColumnElement
+    ascending: bool
+    nulls_last: bool
+    is_datetime: bool = False
+
+    def order_by(self) -> ColumnElement:
+        ordered = self.expression.asc() if self.ascending else self.expression.desc()
+        return ordered.nulls_last() if self.nulls_last else ordered.nulls_first()
+
+    def value_of(self, record: CRMRecord) -> Any:
+        """Sort key value of a loaded record, as stored in a cursor."""
+        column = COLUMN_SORTS.get(self.attribute)
+        if column is not None:
+            value = getattr(record, self.attribute)
+            return value.isoformat() if isinstance(value, datetime) else value
+        return (record.values or {}).get(self.attribute)
+
+    def bound(self, value: Any) -> Any:
+        if self.is_datetime:
+            return datetime.fromisoformat(value)
+        if self.attribute in COLUMN_SORTS:
+            return value
+        return literal(value, JSONB)
+
+    def equal_to(self, value: Any) -> ColumnElement:
+        if value is None:
+            return self.expression.is_(None)
+        return self.expression == self.bound(value)
+
+    def after(self, value: Any) -> ColumnElement:
+        """Rows that sort strictly after ``value`` on this key."""
+        if value is None:
+            return false() if self.nulls_last else self.expression.isnot(None)
+        bound = self.bound(value)
+        beyond = self.expression > bound if self.ascending else self.expression < bound
+        return or_(beyond, self.expression.is_(None)) if self.nulls_last else beyond
+
+
+class CRMQueryCompiler:
+    """Compiles record filters and sorts for one CRM object."""
+
+    def __init__(self, attributes: list[CRMAttribute]):
+        self.attribute_types = {attr.slug: attr.attribute_type for attr in attributes}
+
+    # ==================== Filters ====================
+
+    def compile_filters(self, filters: list[dict] | None) -> ColumnElement | None:
+        """Combine filter conditions left to right by their conjunction."""
+        combined = None
+        for f in filters or []:
+            condition = self.compile_filter(f.get("attribute"), f.get("operator"), f.get("value"))
+            if condition is None:
+                continue
+            if combined is None:
+                combined = condition
+            elif f.get("conjunction") == "or":
+                combined = or_(combined, condition)
+            else:
+                combined = and_(combined, condition)
+        return combined
+
+    def compile_filter(self, attribute: str | None, operator: str | None, value: Any) -> ColumnElement | None:
+        """Compile a single filter condition; unknown operators are ignored."""
+        if not attribute or not operator:
+            return None
+
+        if operator == "equals":
+            return self._equals(attribute, value)
+        if operator == "not_equals":
+            return not_(self._equals(attribute, value))
+        if operator in ("in", "not_in"):
+            values = value if isinstance(value, list) else [value]
+            if not values:
+                return false() if operator == "in" else None
+            condition = or_(*[self._equals(attribute, v) for v in values])
+            return condition if operator == "in" else not_(condition)
+
+        if operator in ("contains", "not_contains", "starts_with", "ends_with"):
+            escaped = _escape_like(value)
+            pattern = {
+                "contains": f"%{escaped}%",
+                "not_contains": f"%{escaped}%",
+                "starts_with": f"{escaped}%",
+                "ends_with": f"%{escaped}",
+            }[operator]
+            matches = attribute_text(attribute).ilike(pattern, escape="\\")
+            if operator == "not_contains":
+                return or_(attribute_text(attribute).is_(None), not_(matches))
+            return matches
+
+        if operator in _RANGE_OPERATORS:
+            return self._range(attribute, operator, value)
+
+        if operator == "is_empty":
+            return or_(attribute_value(attribute).is_(None), attribute_text(attribute) == "")
+        if operator == "is_not_empty":
+            return and_(attribute_value(attribute).isnot(None), attribute_text(attribute) != "")
+
+        return None
+
+    def _equals(self, attribute: str, value: Any) -> ColumnElement:
+        """Containment match of every JSON representation the value may be stored as."""
+        return or_(
+            *[CRMRecord.values.contains({attribute: candidate}) for candidate in self._json_candidates(attribute, value)]
+        )
+
+    def _json_candidates(self, attribute: str, value: Any) -> list[Any]:
+        attr_type = self.attribute_types.get(attribute)
+
+        if value is None:
+            return [None]
+        if attr_type == CRMAttributeType.CHECKBOX.value:
+            return [value is True or str(value).lower() in ("true", "1", "yes")]
+        if attr_type == CRMAttributeType.MULTI_SELECT.value:
+            return [[value], value]
+
+        candidates: list[Any] = []
+        if attr_type in NUMERIC_ATTRIBUTE_TYPES:
+            number = _to_number(value)
+            if number is not None:
+                candidates.append(number)
+        elif not isinstance(value, str):
+            candidates.append(value)
+
+        # Imported and form-submitted values are often stored as strings
+        text = str(value)
+        if text not in candidates:
+            candidates.append(text)
+        return candidates
+
+    def _range(self, attribute: str, operator: str, value: Any) -> ColumnElement | None:
+        attr_type = self.attribute_types.get(attribute)
+        bounds = value if operator == "between" else [value]
+        if operator == "between" and (not isinstance(value, list) or len(value) != 2):
+            return None
+
+        numeric = attr_type in NUMERIC_ATTRIBUTE_TYPES or (
+            attr_type not in TEMPORAL_ATTRIBUTE_TYPES
+            and all(_to_number(b) is not None for b in bounds)
+        )
+        if numeric:
+            typed_bounds = [_to_number(b) for b in bounds]
+            if any(b is None for b in typed_bounds):
+                return None
+        else:
+            typed_bounds = [b.isoformat() if isinstance(b, datetime) else str(b) for b in bounds]
+
+        expression = attribute_value(attribute)
+        # JSONB orders values by type first, so pin the type before comparing
+        type_guard = func.jsonb_typeof(expression) == ("number" if numeric else "string")
+        typed = and_(
+            _compare(expression, operator, [literal(b, JSONB) for b in typed_bounds]),
+            type_guard,
+        )
+        if not numeric:
+            return typed
+
+        # Imported and form-submitted numbers are often stored as strings.
+        # Cast the ones that look numeric; the CASE keeps the cast from ever
+        # seeing other strings. This branch is not served by the index.
+        text_value = attribute_text(attribute)
+        string_number = case(
+            (
+                and_(
+                    func.jsonb_typeof(expression) == "string",
+                    text_value.op("~")(_NUMERIC_STRING_PATTERN),
+                ),
+                cast(text_value, Numeric),
+            ),
+        )
+        return or_(
+            typed,
+            _compare(string_number, operator, [literal(b, Numeric) for b in typed_bounds]),
+        )
+
+    # ==================== Sorting and pagination ====================
+
+    def compile_sorts(self, sorts: list[dict] | None) -> list[SortKey]:
+        """Compile sort conditions; defaults to newest first."""
+        keys = []
+        for s in sorts or []:
+            attribute = s.get("attribute")
+            if not attribute:
+                continue
+            ascending = s.get("direction", "asc") != "desc"
+            nulls = s.get("nulls")
+            # Postgres default placement keeps plain index scans usable
+            nulls_last = nulls == "last" if nulls else ascending
+            column = COLUMN_SORTS.get(attribute)
+            keys.append(
+                SortKey(
+                    attribute=attribute,
+                    expression=column if column is not None else attribute_value(attribute),
+                    ascending=ascending,
+                    nulls_last=nulls_last,
+                    is_datetime=attribute in ("created_at", "updated_at"),
+                )
+            )
+
+        if not keys:
+            keys.append(
+                SortKey(
+                    attribute="created_at",
+                    expression=CRMRecord.created_at,
+                    ascending=False,
+                    nulls_last=False,
+                    is_datetime=True,
+                )
+            )
+        return keys
+
+    @staticmethod
+    def encode_cursor(keys: list[SortKey], record: CRMRecord) -> str:
+        """Encode the position after ``record`` for keyset pagination."""
+        payload = {
+            "s": [key.attribute for key in keys],
+            "v": [key.value_of(record) for key in keys],
+            "id": str(record.id),
+        }
+        data = json.dumps(payload, separators=(",", ":"), default=str).encode()
+        return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+    @staticmethod
+    def keyset_condition(keys: list[SortKey], cursor: str) -> ColumnElement:
+        """Condition selecting rows after the cursor position.
+
+        Expands to ``k1 after c1 OR (k1 = c1 AND k2 after c2) OR ...``, with
+        the record ID as the final tie-breaker.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or was issued for
+                a different sort.
+        """
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+            attributes, values, record_id = payload["s"], payload["v"], payload["id"]
+        except (ValueError, KeyError, TypeError) as e:
+            raise InvalidCursorError("Invalid cursor") from e
+        if attributes != [key.attribute for key in keys] or len(values) != len(keys):
+            raise InvalidCursorError("Cursor does not match the requested sort")
+
+        branches = []
+        prefix: list[ColumnElement] = []
+        for key, value in zip(keys, values):
+            branches.append(and_(*prefix, key.after(value)))
+            prefix.append(key.equal_to(value))
+        branches.append(and_(*prefix, CRMRecord.id > record_id))
+        return or_(*branches)
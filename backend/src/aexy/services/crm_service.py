@@ -1,14 +1,18 @@
 """CRM service for managing objects, records, lists, and activities."""
 
+import logging
 import re
+from collections import defaultdict
 from datetime import datetime, timezone
 from typing import Any
 from uuid import uuid4
 
-from sqlalchemy import select, func, and_, or_, delete
+from sqlalchemy import select, func, and_, or_, delete, insert, literal, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import lazyload, selectinload
 
+from aexy.cache import get_crm_count_cache
 from aexy.models.crm import (
     CRMObject,
     CRMAttribute,
@@ -21,6 +25,37 @@ from aexy.models.crm import (
     CRMObjectType,
     CRMAttributeType,
 )
+from aexy.services.crm_query import (
+    INDEXED_ATTRIBUTE_TYPES,
+    NUMERIC_ATTRIBUTE_TYPES,
+    CRMQueryCompiler,
+)
+
+logger = logging.getLogger(__name__)
+
+# Rows per multi-row INSERT/UPDATE statement in bulk operations
+BULK_BATCH_SIZE = 1000
+BULK_MAX_REPORTED_ERRORS = 20
+
+
+class CRMBulkValidationError(ValueError):
+    """Raised when rows of a bulk operation fail validation.
+
+    ``errors`` maps the 1-based row number to that row's validation errors.
+    """
+
+    def __init__(self, errors: dict[int, list[str]]):
+        self.errors = errors
+        messages = [
+            f"Row {row}: {error}" for row, row_errors in errors.items() for error in row_errors
+        ]
+        super().__init__("; ".join(messages[:BULK_MAX_REPORTED_ERRORS]))
+
+
+def _chunks(items: list, size: int):
+    """Split a list into consecutive chunks."""
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
 
 
 def generate_slug(name: str) -> str:
@@ -487,6 +522,7 @@ class CRMAttributeService:
         self.db.add(attr)
         await self.db.flush()
         await self.db.refresh(attr)
+        self._schedule_attribute_index(attr)
         return attr
 
     async def get_attribute(self, attribute_id: str) -> CRMAttribute | None:
@@ -547,8 +583,28 @@ class CRMAttributeService:
 
         await self.db.flush()
         await self.db.refresh(attr)
+        if is_filterable or is_sortable:
+            self._schedule_attribute_index(attr)
         return attr
 
+    def _schedule_attribute_index(self, attr: CRMAttribute) -> None:
+        """Build the expression index for numeric/date attributes in the background.
+
+        Indexes are created ``CONCURRENTLY`` by a Celery task, so large record
+        tables are not locked and the request does not wait for the build.
+        """
+        if attr.attribute_type not in INDEXED_ATTRIBUTE_TYPES:
+            return
+        if not (attr.is_filterable or attr.is_sortable):
+            return
+
+        try:
+            from aexy.processing.tasks import ensure_crm_attribute_index_task
+
+            ensure_crm_attribute_index_task.delay(attr.slug)
+        except Exception as e:
+            logger.warning(f"Failed to schedule CRM attribute index for {attr.slug}: {e}")
+
     async def delete_attribute(self, attribute_id: str) -> bool:
         """Delete an attribute."""
         attr = await self.get_attribute(attribute_id)
@@ -609,20 +665,7 @@ class CRMRecordService:
         if not obj:
             raise ValueError("Object not found")
 
-        # Compute display name from primary attribute
-        display_name = None
-        if obj.primary_attribute_id:
-            attr_service = CRMAttributeService(self.db)
-            primary_attr = await attr_service.get_attribute(obj.primary_attribute_id)
-            if primary_attr:
-                display_name = str(values.get(primary_attr.slug, ""))[:500]
-
-        # Fallback to first text value
-        if not display_name:
-            for attr in obj.attributes:
-                if attr.attribute_type == CRMAttributeType.TEXT.value:
-                    display_name = str(values.get(attr.slug, ""))[:500]
-                    break
+        display_name = self._display_name(obj, values)
 
         record = CRMRecord(
             id=str(uuid4()),
@@ -641,6 +684,7 @@ class CRMRecordService:
 
         await self.db.flush()
         await self.db.refresh(record)
+        await self._invalidate_counts(object_id)
 
         # Log activity
         await self._log_activity(
@@ -691,92 +735,98 @@ class CRMRecordService:
         include_archived: bool = False,
         limit: int = 50,
         offset: int = 0,
-    ) -> tuple[list[CRMRecord], int]:
-        """List records with filtering and sorting."""
+        cursor: str | None = None,
+        include_total: bool = True,
+    ) -> tuple[list[CRMRecord], int | None, str | None]:
+        """List records with filtering and sorting.
+
+        Filters and sorts are compiled by ``CRMQueryCompiler``. Pass the
+        returned cursor back to fetch the next page by keyset instead of
+        ``offset``. Totals are cached per filter set; pass
+        ``include_total=False`` to skip counting (e.g. on subsequent pages).
+
+        Returns:
+            Records, total count (None when skipped) and the next page
+            cursor (None on the last page).
+
+        Raises:
+            InvalidCursorError: If the cursor does not match the sort.
+        """
+        conditions = [
+            CRMRecord.workspace_id == workspace_id,
+            CRMRecord.object_id == object_id,
+        ]
+        if not include_archived:
+            conditions.append(CRMRecord.is_archived == False)
+
+        attributes = []
+        if filters:
+            attributes = await CRMAttributeService(self.db).list_attributes(object_id)
+        compiler = CRMQueryCompiler(attributes)
+
+        filter_condition = compiler.compile_filters(filters)
+        if filter_condition is not None:
+            conditions.append(filter_condition)
+
+        total = None
+        if include_total:
+            total = await self._count_records(
+                object_id,
+                conditions,
+                {"filters": filters or [], "include_archived": include_archived},
+            )
+
+        keys = compiler.compile_sorts(sorts)
         stmt = (
             select(CRMRecord)
-            .where(
-                CRMRecord.workspace_id == workspace_id,
-                CRMRecord.object_id == object_id,
-            )
+            .where(*conditions)
+            .order_by(*[key.order_by() for key in keys], CRMRecord.id.asc())
+            .options(lazyload("*"))
         )
 
-        if not include_archived:
-            stmt = stmt.where(CRMRecord.is_archived == False)
+        if cursor:
+            stmt = stmt.where(CRMQueryCompiler.keyset_condition(keys, cursor))
+        else:
+            stmt = stmt.offset(offset)
 
-        # Apply filters (basic implementation - can be extended)
-        if filters:
-            for f in filters:
-                attr = f.get("attribute")
-                op = f.get("operator")
-                value = f.get("value")
-
-                if attr and op:
-                    # Use JSONB operators for filtering
-                    if op == "equals":
-                        stmt = stmt.where(
-                            CRMRecord.values[attr].astext == str(value)
-                        )
-                    elif op == "not_equals":
-                        stmt = stmt.where(
-                            CRMRecord.values[attr].astext != str(value)
-                        )
-                    elif op == "contains":
-                        stmt = stmt.where(
-                            CRMRecord.values[attr].astext.ilike(f"%{value}%")
-                        )
-                    elif op == "is_empty":
-                        stmt = stmt.where(
-                            or_(
-                                CRMRecord.values[attr].is_(None),
-                                CRMRecord.values[attr].astext == "",
-                            )
-                        )
-                    elif op == "is_not_empty":
-                        stmt = stmt.where(
-                            and_(
-                                CRMRecord.values[attr].isnot(None),
-                                CRMRecord.values[attr].astext != "",
-                            )
-                        )
+        # Fetch one extra row to know whether another page exists
+        result = await self.db.execute(stmt.limit(limit + 1))
+        records = list(result.scalars().all())
 
-        # Get total count
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        count_result = await self.db.execute(count_stmt)
-        total = count_result.scalar() or 0
+        next_cursor = None
+        if len(records) > limit:
+            records = records[:limit]
+            next_cursor = CRMQueryCompiler.encode_cursor(keys, records[-1])
 
-        # Apply sorting
-        if sorts:
-            for s in sorts:
-                attr = s.get("attribute")
-                direction = s.get("direction", "asc")
-                if attr:
-                    if attr == "created_at":
-                        if direction == "desc":
-                            stmt = stmt.order_by(CRMRecord.created_at.desc())
-                        else:
-                            stmt = stmt.order_by(CRMRecord.created_at.asc())
-                    elif attr == "updated_at":
-                        if direction == "desc":
-                            stmt = stmt.order_by(CRMRecord.updated_at.desc())
-                        else:
-                            stmt = stmt.order_by(CRMRecord.updated_at.asc())
-                    else:
-                        # Sort by JSONB field
-                        if direction == "desc":
-                            stmt = stmt.order_by(CRMRecord.values[attr].desc())
-                        else:
-                            stmt = stmt.order_by(CRMRecord.values[attr].asc())
-        else:
-            stmt = stmt.order_by(CRMRecord.created_at.desc())
+        return records, total, next_cursor
 
-        # Apply pagination
-        stmt = stmt.limit(limit).offset(offset)
+    async def _count_records(
+        self,
+        object_id: str,
+        conditions: list,
+        cache_query: dict[str, Any],
+    ) -> int:
+        """Count matching records, served from the count cache when possible."""
+        cache = get_crm_count_cache()
+        if cache:
+            cached = await cache.get(object_id, cache_query)
+            if cached is not None:
+                return cached
+
+        result = await self.db.execute(
+            select(func.count()).select_from(CRMRecord).where(*conditions)
+        )
+        total = result.scalar() or 0
 
-        result = await self.db.execute(stmt)
-        records = list(result.scalars().all())
+        if cache:
+            await cache.set(object_id, cache_query, total)
+        return total
 
-        return records, total
+    async def _invalidate_counts(self, object_id: str) -> None:
+        """Drop cached record totals of an object."""
+        cache = get_crm_count_cache()
+        if cache:
+            await cache.invalidate(object_id)
 
     async def update_record(
         self,
@@ -798,12 +848,8 @@ class CRMRecordService:
             record.values = new_values
 
             # Update display name
-            obj = record.object
-            if obj and obj.primary_attribute_id:
-                attr_service = CRMAttributeService(self.db)
-                primary_attr = await attr_service.get_attribute(obj.primary_attribute_id)
-                if primary_attr:
-                    record.display_name = str(new_values.get(primary_attr.slug, ""))[:500]
+            if record.object:
+                record.display_name = self._display_name(record.object, new_values)
 
         if owner_id is not None:
             record.owner_id = owner_id
@@ -883,6 +929,7 @@ class CRMRecordService:
             )
 
         await self.db.flush()
+        await self._invalidate_counts(object_id)
 
         # Trigger CRM events (automations and webhooks)
         try:
@@ -909,17 +956,91 @@ class CRMRecordService:
         records_data: list[dict],
         created_by_id: str | None = None,
     ) -> list[CRMRecord]:
-        """Bulk create records."""
-        records = []
+        """Bulk create records with set-based statements.
+
+        The attribute schema is loaded once and every row is validated in
+        memory before anything is written. The batch is all-or-nothing: if
+        any row is invalid nothing is inserted, and the errors of every row
+        are reported so the caller can fix or drop those rows and retry.
+        Records and their activities are inserted with multi-row INSERTs, the
+        object's record count is updated once and events are emitted as one
+        batch.
+
+        Raises:
+            CRMBulkValidationError: If any row is invalid.
+            ValueError: If the object does not exist.
+        """
+        if not records_data:
+            return []
+
+        obj_service = CRMObjectService(self.db)
+        obj = await obj_service.get_object(object_id)
+        if not obj:
+            raise ValueError("Object not found")
+
+        errors = {}
+        for i, data in enumerate(records_data):
+            row_errors = self._validate_values(obj.attributes, data.get("values", {}))
+            if row_errors:
+                errors[i + 1] = row_errors
+        if errors:
+            raise CRMBulkValidationError(errors)
+
+        now = datetime.now(timezone.utc)
+        rows = []
         for data in records_data:
-            record = await self.create_record(
+            values = data.get("values", {})
+            rows.append({
+                "id": str(uuid4()),
+                "workspace_id": workspace_id,
+                "object_id": object_id,
+                "values": values,
+                "display_name": self._display_name(obj, values),
+                "owner_id": data.get("owner_id"),
+                "created_by_id": created_by_id,
+                "is_archived": False,
+            })
+
+        records = []
+        for chunk in _chunks(rows, BULK_BATCH_SIZE):
+            stmt = insert(CRMRecord).values(chunk).returning(CRMRecord)
+            result = await self.db.execute(
+                select(CRMRecord)
+                .from_statement(stmt)
+                .options(lazyload("*"))
+                .execution_options(populate_existing=True)
+            )
+            records.extend(result.scalars().all())
+
+        await self.db.execute(
+            update(CRMObject)
+            .where(CRMObject.id == object_id)
+            .values(record_count=CRMObject.record_count + len(records))
+        )
+        await self._log_activities(
+            workspace_id,
+            "record.created",
+            created_by_id,
+            [(record.id, {"values": record.values}) for record in records],
+            occurred_at=now,
+        )
+        await self.db.flush()
+        await self._invalidate_counts(object_id)
+
+        # Trigger CRM events (automations and webhooks)
+        try:
+            from aexy.services.crm_events import CRMEventService
+            event_service = CRMEventService(self.db)
+            await event_service.emit_records_created(
                 workspace_id=workspace_id,
                 object_id=object_id,
-                values=data.get("values", {}),
-                owner_id=data.get("owner_id"),
+                records=[(record.id, record.values) for record in records],
                 created_by_id=created_by_id,
             )
-            records.append(record)
+        except Exception as e:
+            # Don't fail record creation if event triggering fails
+            logger.warning(f"Failed to emit bulk record.created events: {e}")
+
         return records
 
     async def bulk_update_records(
@@ -928,17 +1049,107 @@ class CRMRecordService:
         values: dict[str, Any],
         updated_by_id: str | None = None,
     ) -> int:
-        """Bulk update records."""
-        updated = 0
-        for record_id in record_ids:
-            record = await self.update_record(
-                record_id=record_id,
-                values=values,
-                updated_by_id=updated_by_id,
+        """Bulk merge values into records with one UPDATE per object.
+
+        Changes, activities and events are derived from the previous values,
+        which are read in a single query.
+        """
+        if not record_ids or not values:
+            return 0
+
+        result = await self.db.execute(
+            select(
+                CRMRecord.id,
+                CRMRecord.workspace_id,
+                CRMRecord.object_id,
+                CRMRecord.values,
+            ).where(CRMRecord.id.in_(record_ids))
+        )
+        rows = result.all()
+        if not rows:
+            return 0
+
+        by_object: dict[str, list] = defaultdict(list)
+        for row in rows:
+            by_object[row.object_id].append(row)
+
+        objects = await self._get_objects(list(by_object))
+        for object_id, object_rows in by_object.items():
+            assignments: dict[str, Any] = {
+                "values": CRMRecord.values.op("||")(literal(values, JSONB)),
+                "updated_at": func.now(),
+            }
+
+            # Records whose display name may change are grouped by their new
+            # name, which depends on each record's merged values
+            obj = objects.get(object_id)
+            if obj and self._display_name_slugs(obj).intersection(values):
+                ids_by_name: dict[str | None, list[str]] = defaultdict(list)
+                for row in object_rows:
+                    name = self._display_name(obj, {**(row.values or {}), **values})
+                    ids_by_name[name].append(row.id)
+                batches = [
+                    ({**assignments, "display_name": name}, ids)
+                    for name, ids in ids_by_name.items()
+                ]
+            else:
+                batches = [(assignments, [row.id for row in object_rows])]
+
+            for batch_assignments, ids in batches:
+                for chunk in _chunks(ids, BULK_BATCH_SIZE):
+                    await self.db.execute(
+                        update(CRMRecord)
+                        .where(CRMRecord.id.in_(chunk))
+                        .values(**batch_assignments)
+                        .execution_options(synchronize_session=False)
+                    )
+
+        # Log activities and collect events for records that actually changed
+        activities = []
+        updates_by_object: dict[str, list[dict]] = defaultdict(list)
+        for row in rows:
+            old_values = row.values or {}
+            changes = [
+                {"field": key, "old": old_values.get(key), "new": new_val}
+                for key, new_val in values.items()
+                if old_values.get(key) != new_val
+            ]
+            if not changes:
+                continue
+            activities.append((row.id, {"changes": changes}, row.workspace_id))
+            updates_by_object[row.object_id].append({
+                "record_id": row.id,
+                "old_values": old_values,
+                "new_values": {**old_values, **values},
+                "changes": changes,
+            })
+
+        for workspace_id in {workspace_id for _, _, workspace_id in activities}:
+            await self._log_activities(
+                workspace_id,
+                "record.updated",
+                updated_by_id,
+                [(rid, meta) for rid, meta, ws in activities if ws == workspace_id],
             )
-            if record:
-                updated += 1
-        return updated
+        await self.db.flush()
+
+        # Trigger CRM events (automations and webhooks)
+        workspaces = {row.object_id: row.workspace_id for row in rows}
+        for object_id, updates in updates_by_object.items():
+            try:
+                from aexy.services.crm_events import CRMEventService
+                event_service = CRMEventService(self.db)
+                await event_service.emit_records_updated(
+                    workspace_id=workspaces[object_id],
+                    object_id=object_id,
+                    updates=updates,
+                    updated_by_id=updated_by_id,
+                )
+            except Exception as e:
+                # Don't fail record update if event triggering fails
+                logger.warning(f"Failed to emit bulk record.updated events: {e}")
+
+        return len(rows)
 
     async def bulk_delete_records(
         self,
@@ -946,12 +1157,179 @@ class CRMRecordService:
         permanent: bool = False,
         deleted_by_id: str | None = None,
     ) -> int:
-        """Bulk delete records."""
-        deleted = 0
-        for record_id in record_ids:
-            if await self.delete_record(record_id, permanent, deleted_by_id):
-                deleted += 1
-        return deleted
+        """Bulk delete records (archive by default) with set-based statements."""
+        if not record_ids:
+            return 0
+
+        result = await self.db.execute(
+            select(
+                CRMRecord.id,
+                CRMRecord.workspace_id,
+                CRMRecord.object_id,
+                CRMRecord.values,
+            ).where(CRMRecord.id.in_(record_ids))
+        )
+        rows = result.all()
+        if not rows:
+            return 0
+
+        ids = [row.id for row in rows]
+        if permanent:
+            for chunk in _chunks(ids, BULK_BATCH_SIZE):
+                await self.db.execute(
+                    delete(CRMRecord)
+                    .where(CRMRecord.id.in_(chunk))
+                    .execution_options(synchronize_session=False)
+                )
+
+            deleted_per_object: dict[str, int] = defaultdict(int)
+            for row in rows:
+                deleted_per_object[row.object_id] += 1
+            for object_id, count in deleted_per_object.items():
+                await self.db.execute(
+                    update(CRMObject)
+                    .where(CRMObject.id == object_id)
+                    .values(record_count=func.greatest(CRMObject.record_count - count, 0))
+                )
+        else:
+            now = datetime.now(timezone.utc)
+            for chunk in _chunks(ids, BULK_BATCH_SIZE):
+                await self.db.execute(
+                    update(CRMRecord)
+                    .where(CRMRecord.id.in_(chunk))
+                    .values(is_archived=True, archived_at=now)
+                    .execution_options(synchronize_session=False)
+                )
+
+            for workspace_id in {row.workspace_id for row in rows}:
+                await self._log_activities(
+                    workspace_id,
+                    "record.deleted",
+                    deleted_by_id,
+                    [
+                        (row.id, {"permanent": permanent})
+                        for row in rows
+                        if row.workspace_id == workspace_id
+                    ],
+                    occurred_at=now,
+                )
+
+        await self.db.flush()
+
+        by_object: dict[str, list] = defaultdict(list)
+        for row in rows:
+            by_object[row.object_id].append(row)
+
+        for object_id, object_rows in by_object.items():
+            await self._invalidate_counts(object_id)
+
+            # Trigger CRM events (automations and webhooks)
+            try:
+                from aexy.services.crm_events import CRMEventService
+                event_service = CRMEventService(self.db)
+                await event_service.emit_records_deleted(
+                    workspace_id=object_rows[0].workspace_id,
+                    object_id=object_id,
+                    records=[(row.id, row.values or {}) for row in object_rows],
+                    permanent=permanent,
+                    deleted_by_id=deleted_by_id,
+                )
+            except Exception as e:
+                # Don't fail record deletion if event triggering fails
+                logger.warning(f"Failed to emit bulk record.deleted events: {e}")
+
+        return len(rows)
+
+    async def _get_objects(self, object_ids: list[str]) -> dict[str, CRMObject]:
+        """Load objects with their attributes, keyed by ID."""
+        result = await self.db.execute(
+            select(CRMObject)
+            .where(CRMObject.id.in_(object_ids))
+            .options(selectinload(CRMObject.attributes))
+        )
+        return {obj.id: obj for obj in result.scalars().all()}
+
+    @staticmethod
+    def _primary_attribute_slug(obj: CRMObject) -> str | None:
+        """Slug of the object's primary attribute, from its loaded attributes."""
+        if not obj.primary_attribute_id:
+            return None
+        for attr in obj.attributes:
+            if attr.id == obj.primary_attribute_id:
+                return attr.slug
+        return None
+
+    @classmethod
+    def _display_name(cls, obj: CRMObject, values: dict[str, Any]) -> str | None:
+        """Display name of a record: its primary attribute value, else its first text value."""
+        primary_slug = cls._primary_attribute_slug(obj)
+        if primary_slug and values.get(primary_slug):
+            return str(values[primary_slug])[:500]
+
+        # Fallback to first non-empty text value
+        for attr in obj.attributes:
+            if attr.attribute_type == CRMAttributeType.TEXT.value and values.get(attr.slug):
+                return str(values[attr.slug])[:500]
+        return None
+
+    @classmethod
+    def _display_name_slugs(cls, obj: CRMObject) -> set[str]:
+        """Slugs of the attributes a record's display name can come from."""
+        slugs = {
+            attr.slug
+            for attr in obj.attributes
+            if attr.attribute_type == CRMAttributeType.TEXT.value
+        }
+        primary_slug = cls._primary_attribute_slug(obj)
+        if primary_slug:
+            slugs.add(primary_slug)
+        return slugs
+
+    @staticmethod
+    def _validate_values(attributes: list[CRMAttribute], values: Any) -> list[str]:
+        """Validate record values against an object's attribute schema in memory."""
+        if not isinstance(values, dict):
+            return ["values must be an object"]
+
+        errors = []
+        for attr in attributes:
+            value = values.get(attr.slug)
+            if value is None or value == "":
+                if attr.is_required:
+                    errors.append(f"'{attr.slug}' is required")
+                continue
+            if attr.attribute_type in NUMERIC_ATTRIBUTE_TYPES and not isinstance(value, bool):
+                try:
+                    float(value)
+                except (TypeError, ValueError):
+                    errors.append(f"'{attr.slug}' must be a number")
+        return errors
+
+    async def _log_activities(
+        self,
+        workspace_id: str,
+        activity_type: str,
+        actor_id: str | None,
+        entries: list[tuple[str, dict]],
+        occurred_at: datetime | None = None,
+    ) -> None:
+        """Insert activities for many records with multi-row INSERTs."""
+        occurred_at = occurred_at or datetime.now(timezone.utc)
+        rows = [
+            {
+                "id": str(uuid4()),
+                "workspace_id": workspace_id,
+                "record_id": record_id,
+                "activity_type": activity_type,
+                "actor_type": "user" if actor_id else "system",
+                "actor_id": actor_id,
+                "activity_metadata": metadata,
+                "occurred_at": occurred_at,
+            }
+            for record_id, metadata in entries
+        ]
+        for chunk in _chunks(rows, BULK_BATCH_SIZE):
+            await self.db.execute(insert(CRMActivity).values(chunk))
 
     async def _log_activity(
         self,
@@ -969,7 +1347,7 @@ class CRMRecordService:
             activity_type=activity_type,
             actor_type="user" if actor_id else "system",
             actor_id=actor_id,
-            metadata=metadata or {},
+            activity_metadata=metadata or {},
             occurred_at=datetime.now(timezone.utc),
         )
         self.db.add(activity)
@@ -0,0 +1,208 @@
+"""In-process index of active CRM automation triggers."""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from aexy.cache.crm_trigger_cache import get_crm_trigger_version_cache
+from aexy.models.crm import CRMAutomation, CRMAutomationTriggerType
+
+logger = logging.getLogger(__name__)
+
+# Number of workspace indexes kept per process
+MAX_CACHED_INDEXES = 256
+
+# Upper bound on how long an index is trusted, covering a rebuild that raced
+# with a not-yet-committed automation change
+INDEX_MAX_AGE_SECONDS = 30
+
+# Trigger config keys and event data keys compared for transition triggers:
+# trigger type -> ((config from, config to), (event old, event new))
+TRANSITION_KEYS: dict[str, tuple[tuple[str, str], tuple[str, str]]] = {
+    CRMAutomationTriggerType.FIELD_CHANGED.value: (
+        ("from_value", "to_value"),
+        ("old_value", "new_value"),
+    ),
+    CRMAutomationTriggerType.STAGE_CHANGED.value: (
+        ("from_stage", "to_stage"),
+        ("old_stage", "new_stage"),
+    ),
+}
+
+# Trigger config keys naming the watched attribute of field change triggers
+FIELD_KEYS = ("field", "attribute_slug", "field_slug")
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledTrigger:
+    """An automation's trigger reduced to the values events are matched on."""
+
+    automation_id: str
+    from_value: Any = None
+    to_value: Any = None
+
+    def matches(self, old_value: Any, new_value: Any) -> bool:
+        """Check the transition of an event against the configured values."""
+        if self.from_value and old_value != self.from_value:
+            return False
+        if self.to_value and new_value != self.to_value:
+            return False
+        return True
+
+
+class TriggerIndex:
+    """Active automation triggers of a workspace, bucketed for direct lookup.
+
+    Triggers are keyed by trigger type, then object ID (None for automations
+    that apply to every object), then the watched attribute slug for
+    field change triggers (None when any field change applies).
+    """
+
+    def __init__(self, version: int | None) -> None:
+        self.version = version
+        self.built_at = time.monotonic()
+        self._triggers: dict[str, dict[str | None, dict[str | None, list[CompiledTrigger]]]] = {}
+
+    @classmethod
+    def from_automations(
+        cls,
+        version: int | None,
+        automations: Iterable[tuple[str, str | None, str, dict | None]],
+    ) -> "TriggerIndex":
+        """Compile an index from (id, object_id, trigger_type, trigger_config) rows."""
+        index = cls(version)
+        for automation_id, object_id, trigger_type, trigger_config in automations:
+            index.add(automation_id, object_id, trigger_type, trigger_config or {})
+        return index
+
+    def add(
+        self,
+        automation_id: str,
+        object_id: str | None,
+        trigger_type: str,
+        trigger_config: dict,
+    ) -> None:
+        """Add one automation's trigger to the index."""
+        field = None
+        if trigger_type == CRMAutomationTriggerType.FIELD_CHANGED.value:
+            field = next((trigger_config[k] for k in FIELD_KEYS if trigger_config.get(k)), None)
+
+        from_value = to_value = None
+        if trigger_type in TRANSITION_KEYS:
+            (from_key, to_key), _ = TRANSITION_KEYS[trigger_type]
+            from_value = trigger_config.get(from_key)
+            to_value = trigger_config.get(to_key)
+
+        by_object = self._triggers.setdefault(trigger_type, {})
+        by_field = by_object.setdefault(object_id, {})
+        by_field.setdefault(field, []).append(
+            CompiledTrigger(automation_id, from_value, to_value)
+        )
+
+    def __len__(self) -> int:
+        return sum(
+            len(triggers)
+            for by_object in self._triggers.values()
+            for by_field in by_object.values()
+            for triggers in by_field.values()
+        )
+
+    def match(self, trigger_type: str, object_id: str | None, trigger_data: dict) -> list[str]:
+        """Get the IDs of automations triggered by an event.
+
+        Args:
+            trigger_type: Trigger type of the event.
+            object_id: CRM object the event belongs to (None to match only
+                automations that apply to every object).
+            trigger_data: Event payload.
+
+        Returns:
+            Matching automation IDs.
+        """
+        by_object = self._triggers.get(trigger_type)
+        if not by_object:
+            return []
+
+        fields: tuple[str | None, ...] = (None,)
+        if trigger_type == CRMAutomationTriggerType.FIELD_CHANGED.value:
+            fields = (trigger_data.get("changed_field"), None)
+
+        old_value = new_value = None
+        if trigger_type in TRANSITION_KEYS:
+            _, (old_key, new_key) = TRANSITION_KEYS[trigger_type]
+            old_value = trigger_data.get(old_key)
+            new_value = trigger_data.get(new_key)
+
+        matched = []
+        for key in (object_id, None) if object_id else (None,):
+            by_field = by_object.get(key)
+            if not by_field:
+                continue
+            for field in fields:
+                for trigger in by_field.get(field, ()):
+                    if trigger.matches(old_value, new_value):
+                        matched.append(trigger.automation_id)
+        return matched
+
+
+_indexes: "OrderedDict[str, TriggerIndex]" = OrderedDict()
+
+
+async def get_trigger_index(db: AsyncSession, workspace_id: str) -> TriggerIndex:
+    """Get the trigger index of a workspace, rebuilding it when stale.
+
+    The shared version is read before the automations, so an index can only
+    be newer than its stamp. Without Redis the version is unknown and the
+    index is rebuilt on every lookup.
+    """
+    cache = get_crm_trigger_version_cache()
+    version = await cache.get_version(workspace_id) if cache else None
+
+    index = _indexes.get(workspace_id)
+    if (
+        index is not None
+        and version is not None
+        and index.version == version
+        and time.monotonic() - index.built_at < INDEX_MAX_AGE_SECONDS
+    ):
+        _indexes.move_to_end(workspace_id)
+        return index
+
+    result = await db.execute(
+        select(
+            CRMAutomation.id,
+            CRMAutomation.object_id,
+            CRMAutomation.trigger_type,
+            CRMAutomation.trigger_config,
+        ).where(
+            CRMAutomation.workspace_id == workspace_id,
+            CRMAutomation.is_active == True,
+        )
+    )
+    index = TriggerIndex.from_automations(version, result.all())
+
+    if version is not None:
+        _indexes[workspace_id] = index
+        _indexes.move_to_end(workspace_id)
+        while len(_indexes) > MAX_CACHED_INDEXES:
+            _indexes.popitem(last=False)
+
+    logger.debug(
+        f"Built CRM trigger index for workspace {workspace_id} "
+        f"(version {version}, {len(index)} triggers)"
+    )
+    return index
+
+
+async def invalidate_trigger_index(workspace_id: str) -> None:
+    """Drop the local trigger index of a workspace and bump the shared version."""
+    _indexes.pop(workspace_id, None)
+
+    cache = get_crm_trigger_version_cache()
+    if cache:
+        await cache.bump_version(workspace_id)
@@ -1,13 +1,18 @@
 """Document management service for Notion-like documentation."""
 
+import json
+from collections import defaultdict
 from datetime import datetime, timezone
 from typing import Any
 from uuid import uuid4
 
-from sqlalchemy import and_, delete, func, or_, select, update
+from sqlalchemy import and_, cast, delete, func, or_, select, update
+from sqlalchemy.dialects.postgresql import REGCONFIG
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import lazyload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
+from aexy.cache import get_document_tree_cache, get_knowledge_graph_cache
 from aexy.models.documentation import (
     CollaborationSession,
     Document,
@@ -18,6 +23,7 @@ from aexy.models.documentation import (
     DocumentNotification,
     DocumentNotificationType,
     DocumentPermission,
+    DocumentSpace,
     DocumentStatus,
     DocumentSyncQueue,
     DocumentTemplate,
@@ -25,6 +31,20 @@ from aexy.models.documentation import (
     DocumentVisibility,
     TemplateCategory,
 )
+from aexy.services.document_version_store import (
+    AUTO_SAVE_COALESCE_SECONDS,
+    SNAPSHOT_INTERVAL,
+    SNAPSHOT_PATCH_RATIO,
+    apply_patch,
+    decode_json,
+    decode_json_text,
+    diff_content,
+    encode_json,
+)
+
+# Text search configuration used by Document.search_vector
+SEARCH_CONFIG = "english"
+SEARCH_HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2"
 
 
 class DocumentService:
@@ -59,6 +79,8 @@ class DocumentService:
                 content = content or template.content_template
                 icon = icon or template.icon
 
+        content = content or {"type": "doc", "content": []}
+
         # Only auto-assign space for workspace visibility docs that don't have a space
         # Private docs should NOT have a space (they're personal)
         # Shared docs without space_id are workspace-level shared
@@ -70,7 +92,8 @@ class DocumentService:
             parent_id=parent_id,
             space_id=space_id,
             title=title,
-            content=content or {"type": "doc", "content": []},
+            content=content,
+            content_text=self._extract_text(content),
             icon=icon,
             cover_image=cover_image,
             visibility=visibility,
@@ -92,6 +115,7 @@ class DocumentService:
         )
 
         await self.db.commit()
+        await self._invalidate_tree(workspace_id)
         await self.db.refresh(document)
         return document
 
@@ -165,6 +189,9 @@ class DocumentService:
             )
 
         await self.db.commit()
+        # Every update changes updated_at, which is part of the cached tree
+        await self._invalidate_tree(document.workspace_id)
+        await self._invalidate_graph(document.workspace_id)
         await self.db.refresh(document)
         return document
 
@@ -181,6 +208,8 @@ class DocumentService:
         # Delete recursively (cascade will handle children)
         await self.db.delete(document)
         await self.db.commit()
+        await self._invalidate_tree(workspace_id)
+        await self._invalidate_graph(workspace_id)
         return True
 
     async def duplicate_document(
@@ -208,6 +237,7 @@ class DocumentService:
 
         if include_children:
             await self._duplicate_children(original.id, duplicate.id, duplicated_by_id)
+            await self._invalidate_tree(workspace_id)
 
         return duplicate
 
@@ -253,38 +283,38 @@ class DocumentService:
         visibility: str | None = None,
         space_id: str | None = None,
     ) -> list[dict[str, Any]]:
-        """Get hierarchical document tree for sidebar."""
-        stmt = (
-            select(Document)
-            .where(
-                and_(
-                    Document.workspace_id == workspace_id,
-                    Document.parent_id == parent_id,
-                )
-            )
-            .order_by(Document.position)
-        )
-
-        if not include_templates:
-            stmt = stmt.where(Document.is_template == False)  # noqa: E712
-
-        # Filter by space if specified
-        if space_id:
-            if space_id == "none":
-                # Special value to get docs without a space
-                stmt = stmt.where(Document.space_id == None)  # noqa: E711
-            else:
-                stmt = stmt.where(Document.space_id == space_id)
-
-        # Filter by visibility if specified
-        if visibility:
-            stmt = stmt.where(Document.visibility == visibility)
-            # For private docs, only show docs created by the user
-            if visibility == DocumentVisibility.PRIVATE.value and developer_id:
-                stmt = stmt.where(Document.created_by_id == developer_id)
+        """Get hierarchical document tree for sidebar.
+
+        Built from one flat query over the workspace (or the tree cache) and
+        one favorites query, then assembled in memory. Filters apply at every
+        level, so children of a filtered-out document are omitted too.
+        """
+        nodes = await self._get_tree_nodes(workspace_id)
+
+        def matches(node: dict[str, Any]) -> bool:
+            if not include_templates and node["is_template"]:
+                return False
+            if space_id:
+                expected_space = None if space_id == "none" else space_id
+                if node["space_id"] != expected_space:
+                    return False
+            if visibility:
+                if node["visibility"] != visibility:
+                    return False
+                # For private docs, only show docs created by the user
+                if (
+                    visibility == DocumentVisibility.PRIVATE.value
+                    and developer_id
+                    and node["created_by_id"] != developer_id
+                ):
+                    return False
+            return True
 
-        result = await self.db.execute(stmt)
-        documents = result.scalars().all()
+        # Nodes are ordered by position, so sibling lists stay ordered
+        children_by_parent: dict[str | None, list[dict[str, Any]]] = defaultdict(list)
+        for node in nodes:
+            if matches(node):
+                children_by_parent[node["parent_id"]].append(node)
 
         # Get user's favorites to mark them
         favorite_ids: set[str] = set()
@@ -295,31 +325,102 @@ class DocumentService:
             fav_result = await self.db.execute(fav_stmt)
             favorite_ids = {row[0] for row in fav_result.fetchall()}
 
-        tree = []
-        for doc in documents:
-            children = await self.get_document_tree(
-                workspace_id, developer_id, doc.id, include_templates, visibility, space_id
-            )
-            tree.append(
-                {
-                    "id": doc.id,
-                    "title": doc.title,
-                    "icon": doc.icon,
-                    "parent_id": doc.parent_id,
-                    "space_id": doc.space_id,
-                    "space_name": doc.space.name if doc.space else None,
-                    "position": doc.position,
-                    "visibility": doc.visibility,
-                    "created_by_id": doc.created_by_id,
-                    "is_favorited": doc.id in favorite_ids,
-                    "has_children": len(children) > 0,
-                    "children": children,
-                    "created_at": doc.created_at.isoformat(),
-                    "updated_at": doc.updated_at.isoformat(),
-                }
+        def build(parent: str | None) -> list[dict[str, Any]]:
+            tree = []
+            for node in children_by_parent.get(parent, []):
+                children = build(node["id"])
+                tree.append(
+                    {
+                        "id": node["id"],
+                        "title": node["title"],
+                        "icon": node["icon"],
+                        "parent_id": node["parent_id"],
+                        "space_id": node["space_id"],
+                        "space_name": node["space_name"],
+                        "position": node["position"],
+                        "visibility": node["visibility"],
+                        "created_by_id": node["created_by_id"],
+                        "is_favorited": node["id"] in favorite_ids,
+                        "has_children": len(children) > 0,
+                        "children": children,
+                        "created_at": node["created_at"],
+                        "updated_at": node["updated_at"],
+                    }
+                )
+            return tree
+
+        return build(parent_id)
+
+    async def _get_tree_nodes(self, workspace_id: str) -> list[dict[str, Any]]:
+        """Get the flat tree nodes of every document in a workspace.
+
+        Only the columns the tree needs are loaded, with space names joined
+        in. Results are served from the document tree cache when enabled.
+        """
+        cache = get_document_tree_cache()
+        if cache:
+            cached = await cache.get(workspace_id)
+            if cached is not None:
+                return cached
+
+        stmt = (
+            select(
+                Document.id,
+                Document.title,
+                Document.icon,
+                Document.parent_id,
+                Document.space_id,
+                DocumentSpace.name.label("space_name"),
+                Document.position,
+                Document.visibility,
+                Document.created_by_id,
+                Document.is_template,
+                Document.created_at,
+                Document.updated_at,
             )
+            .outerjoin(DocumentSpace, DocumentSpace.id == Document.space_id)
+            .where(Document.workspace_id == workspace_id)
+            .order_by(Document.position)
+        )
+        result = await self.db.execute(stmt)
+
+        nodes = [
+            {
+                "id": row.id,
+                "title": row.title,
+                "icon": row.icon,
+                "parent_id": row.parent_id,
+                "space_id": row.space_id,
+                "space_name": row.space_name,
+                "position": row.position,
+                "visibility": row.visibility,
+                "created_by_id": row.created_by_id,
+                "is_template": row.is_template,
+                "created_at": row.created_at.isoformat(),
+                "updated_at": row.updated_at.isoformat(),
+            }
+            for row in result.all()
+        ]
+
+        if cache:
+            await cache.set(workspace_id, nodes)
 
-        return tree
+        return nodes
+
+    async def _invalidate_tree(self, workspace_id: str) -> None:
+        """Drop the cached document tree of a workspace."""
+        cache = get_document_tree_cache()
+        if cache:
+            await cache.invalidate(workspace_id)
+
+    async def _invalidate_graph(self, workspace_id: str) -> None:
+        """Make cached knowledge graph payloads of a workspace stale.
+
+        Graph payloads embed document titles, spaces and timestamps.
+        """
+        cache = get_knowledge_graph_cache()
+        if cache:
+            await cache.invalidate(workspace_id)
 
     async def move_document(
         self,
@@ -349,6 +450,8 @@ class DocumentService:
         document.updated_at = datetime.now(timezone.utc)
 
         await self.db.commit()
+        await self._invalidate_tree(workspace_id)
+        await self._invalidate_graph(workspace_id)
         await self.db.refresh(document)
         return document
 
@@ -397,18 +500,23 @@ class DocumentService:
         limit: int = 50,
         offset: int = 0,
     ) -> list[DocumentVersion]:
-        """Get version history for a document."""
+        """Get version history for a document with reconstructed content."""
         stmt = (
             select(DocumentVersion)
             .where(DocumentVersion.document_id == document_id)
             .order_by(DocumentVersion.version_number.desc())
             .limit(limit)
             .offset(offset)
-            .options(selectinload(DocumentVersion.created_by))
+            .options(
+                selectinload(DocumentVersion.created_by),
+                lazyload(DocumentVersion.document),
+            )
         )
 
         result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        versions = list(result.scalars().all())
+        await self._load_version_contents(document_id, versions)
+        return versions
 
     async def restore_version(
         self,
@@ -418,11 +526,15 @@ class DocumentService:
     ) -> Document | None:
         """Restore a document to a previous version."""
         # Get the version
-        stmt = select(DocumentVersion).where(
-            and_(
-                DocumentVersion.id == version_id,
-                DocumentVersion.document_id == document_id,
+        stmt = (
+            select(DocumentVersion)
+            .where(
+                and_(
+                    DocumentVersion.id == version_id,
+                    DocumentVersion.document_id == document_id,
+                )
             )
+            .options(lazyload(DocumentVersion.document))
         )
         result = await self.db.execute(stmt)
         version = result.scalar_one_or_none()
@@ -430,6 +542,8 @@ class DocumentService:
         if not version:
             return None
 
+        await self._load_version_contents(document_id, [version])
+
         # Update document with version content
         document = await self.update_document(
             document_id=document_id,
@@ -450,30 +564,142 @@ class DocumentService:
         is_auto_save: bool = False,
         is_auto_generated: bool = False,
     ) -> DocumentVersion:
-        """Create a new version for a document."""
-        # Get next version number
-        stmt = select(func.max(DocumentVersion.version_number)).where(
-            DocumentVersion.document_id == document_id
+        """Create a new version for a document.
+
+        Content is stored as a patch against the latest snapshot (see
+        ``document_version_store``). Consecutive auto-saves by the same author
+        within ``AUTO_SAVE_COALESCE_SECONDS`` update the latest version instead
+        of adding one.
+        """
+        stmt = (
+            select(DocumentVersion)
+            .where(DocumentVersion.document_id == document_id)
+            .order_by(DocumentVersion.version_number.desc())
+            .limit(1)
+            .options(lazyload("*"))
         )
         result = await self.db.execute(stmt)
-        max_version = result.scalar()
-        next_version = (max_version or 0) + 1
+        latest = result.scalar_one_or_none()
+
+        if (
+            latest is not None
+            and is_auto_save
+            and latest.is_auto_save
+            and latest.created_by_id == created_by_id
+            and latest.created_at is not None
+            and (datetime.now(timezone.utc) - latest.created_at).total_seconds()
+            < AUTO_SAVE_COALESCE_SECONDS
+        ):
+            base_version_number = latest.base_version_number
+            if base_version_number is None:
+                # The latest version is a snapshot nothing depends on yet
+                latest.content, latest.content_blob = None, encode_json(content)
+            else:
+                await self._encode_version_content(
+                    latest, document_id, content, base_version_number
+                )
+            await self.db.flush()
+            return latest
 
+        next_version = (latest.version_number if latest else 0) + 1
         version = DocumentVersion(
             id=str(uuid4()),
             document_id=document_id,
             version_number=next_version,
-            content=content,
             created_by_id=created_by_id,
             change_summary=change_summary,
             is_auto_save=is_auto_save,
             is_auto_generated=is_auto_generated,
         )
 
+        snapshot_number = None
+        if latest is not None:
+            snapshot_number = latest.base_version_number or latest.version_number
+        if snapshot_number is None or next_version - snapshot_number >= SNAPSHOT_INTERVAL:
+            version.content_blob = encode_json(content)
+        else:
+            await self._encode_version_content(version, document_id, content, snapshot_number)
+
         self.db.add(version)
         await self.db.flush()
         return version
 
+    async def _encode_version_content(
+        self,
+        version: DocumentVersion,
+        document_id: str,
+        content: dict,
+        snapshot_number: int,
+    ) -> None:
+        """Store content as a patch against a snapshot, or as a new snapshot
+        when the patch would not be meaningfully smaller."""
+        snapshot = await self._get_snapshot_contents(document_id, [snapshot_number])
+        full_blob = encode_json(content)
+        version.content = None
+
+        if snapshot_number in snapshot:
+            patch_blob = encode_json(diff_content(json.loads(snapshot[snapshot_number]), content))
+            if len(patch_blob) <= len(full_blob) * SNAPSHOT_PATCH_RATIO:
+                version.content_blob = patch_blob
+                version.base_version_number = snapshot_number
+                return
+
+        version.content_blob = full_blob
+        version.base_version_number = None
+
+    async def _get_snapshot_contents(
+        self,
+        document_id: str,
+        version_numbers: list[int],
+    ) -> dict[int, str]:
+        """Load snapshot versions as serialized JSON keyed by version number.
+
+        Serialized JSON is returned so each dependent version can cheaply
+        decode its own copy before patching it in place.
+        """
+        stmt = select(
+            DocumentVersion.version_number,
+            DocumentVersion.content,
+            DocumentVersion.content_blob,
+        ).where(
+            DocumentVersion.document_id == document_id,
+            DocumentVersion.version_number.in_(version_numbers),
+        )
+        result = await self.db.execute(stmt)
+
+        snapshots = {}
+        for version_number, content, content_blob in result.all():
+            if content_blob is not None:
+                snapshots[version_number] = decode_json_text(content_blob)
+            else:
+                snapshots[version_number] = json.dumps(content)
+        return snapshots
+
+    async def _load_version_contents(
+        self,
+        document_id: str,
+        versions: list[DocumentVersion],
+    ) -> None:
+        """Reconstruct ``content`` on loaded versions without marking them dirty."""
+        needed = {
+            v.base_version_number
+            for v in versions
+            if v.base_version_number is not None
+        }
+        snapshots = await self._get_snapshot_contents(document_id, list(needed)) if needed else {}
+
+        for version in versions:
+            if version.content_blob is None:
+                continue  # Legacy row with uncompressed content
+            if version.base_version_number is None:
+                content = decode_json(version.content_blob)
+            else:
+                content = apply_patch(
+                    json.loads(snapshots[version.base_version_number]),
+                    decode_json(version.content_blob),
+                )
+            set_committed_value(version, "content", content)
+
     # ==================== Search ====================
 
     async def search_documents(
@@ -482,30 +708,73 @@ class DocumentService:
         query: str,
         limit: int = 20,
         offset: int = 0,
-    ) -> list[Document]:
-        """Full-text search in document titles and content."""
-        # Simple LIKE search for now (can be upgraded to full-text search)
-        search_pattern = f"%{query}%"
+    ) -> list[tuple[Document, str | None]]:
+        """Full-text search in document titles and content.
+
+        Results are ranked by ``ts_rank_cd`` over the weighted search vector
+        (title matches outrank body matches) and returned with a highlighted
+        snippet. Queries with no full-text hits, e.g. partial words, fall back
+        to a trigram-indexed substring match on title or content, ranked by
+        title similarity first, without a snippet.
+
+        Returns:
+            (document, snippet) pairs.
+        """
+        tsquery = func.websearch_to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), query)
+        snippet = func.ts_headline(
+            cast(SEARCH_CONFIG, REGCONFIG),
+            func.coalesce(Document.content_text, ""),
+            tsquery,
+            SEARCH_HEADLINE_OPTIONS,
+        )
+        filters = [
+            Document.workspace_id == workspace_id,
+            Document.is_template == False,  # noqa: E712
+        ]
 
         stmt = (
+            select(Document, snippet.label("snippet"))
+            .where(*filters, Document.search_vector.bool_op("@@")(tsquery))
+            .order_by(
+                func.ts_rank_cd(Document.search_vector, tsquery).desc(),
+                Document.updated_at.desc(),
+            )
+            .limit(limit)
+            .offset(offset)
+        )
+        rows = (await self.db.execute(stmt)).all()
+        if rows:
+            return [(document, snippet) for document, snippet in rows]
+
+        if offset:
+            # Past the last page of full-text results, not a fallback query
+            has_matches = await self.db.scalar(
+                select(Document.id)
+                .where(*filters, Document.search_vector.bool_op("@@")(tsquery))
+                .limit(1)
+            )
+            if has_matches:
+                return []
+
+        fallback_stmt = (
             select(Document)
             .where(
-                and_(
-                    Document.workspace_id == workspace_id,
-                    Document.is_template == False,  # noqa: E712
-                    or_(
-                        Document.title.ilike(search_pattern),
-                        Document.content_text.ilike(search_pattern),
-                    ),
-                )
+                *filters,
+                or_(
+                    Document.title.ilike(f"%{query}%"),
+                    Document.content_text.ilike(f"%{query}%"),
+                ),
+            )
+            .order_by(
+                func.similarity(Document.title, query).desc(),
+                func.word_similarity(query, func.coalesce(Document.content_text, "")).desc(),
+                Document.updated_at.desc(),
             )
-            .order_by(Document.updated_at.desc())
             .limit(limit)
             .offset(offset)
         )
-
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        result = await self.db.execute(fallback_stmt)
+        return [(document, None) for document in result.scalars().all()]
 
     # ==================== Templates ====================
 
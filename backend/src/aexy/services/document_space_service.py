@@ -8,6 +8,8 @@ from sqlalchemy import and_, delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from aexy.cache import get_document_tree_cache
+from aexy.core.database import run_after_commit
 from aexy.models.documentation import (
     Document,
     DocumentSpace,
@@ -222,6 +224,9 @@ class DocumentSpaceService:
 
         await self.db.flush()
         await self.db.refresh(space)
+
+        # Space names are part of the cached document tree
+        self._invalidate_tree_after_commit(space.workspace_id)
         return space
 
     async def delete_space(self, space_id: str) -> bool:
@@ -243,8 +248,20 @@ class DocumentSpaceService:
             delete(DocumentSpace).where(DocumentSpace.id == space_id)
         )
         await self.db.flush()
+
+        self._invalidate_tree_after_commit(space.workspace_id)
         return True
 
+    def _invalidate_tree_after_commit(self, workspace_id: str) -> None:
+        """Drop the cached document tree once the caller commits.
+
+        Invalidating before the commit would let a concurrent read cache the
+        tree from the old, still committed, rows.
+        """
+        tree_cache = get_document_tree_cache()
+        if tree_cache:
+            run_after_commit(self.db, lambda: tree_cache.invalidate(workspace_id))
+
     # ==================== Space Listing ====================
 
     async def get_user_spaces(
@@ -0,0 +1,146 @@
+"""Delta-compressed storage for document version content.
+
+Versions are stored either as a full snapshot or as a patch against the
+most recent snapshot, both as zlib-compressed JSON. Patching against the
+snapshot rather than the previous version keeps reconstruction to a single
+patch application no matter how long the history is; a new snapshot is taken
+every ``SNAPSHOT_INTERVAL`` versions or when the patch stops paying off.
+
+Patches are lists of operations on TipTap JSON:
+
+- ``["set", path, value]``: set a dict key or list index (``path == []``
+  replaces the whole document)
+- ``["del", path]``: remove a dict key
+- ``["splice", path, start, delete_count, items]``: replace a list slice
+"""
+
+import json
+import zlib
+from typing import Any
+
+# Take a full snapshot at least every N versions
+SNAPSHOT_INTERVAL = 20
+
+# Take a full snapshot when a patch is larger than this fraction of the content
+SNAPSHOT_PATCH_RATIO = 0.5
+
+# Auto-saves by the same author within this window update one version
+AUTO_SAVE_COALESCE_SECONDS = 300
+
+COMPRESSION_LEVEL = 6
+
+
+def encode_json(value: Any) -> bytes:
+    """Serialize and compress a JSON value."""
+    return zlib.compress(
+        json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode(),
+        COMPRESSION_LEVEL,
+    )
+
+
+def decode_json(data: bytes) -> Any:
+    """Decompress and deserialize a JSON value."""
+    return json.loads(zlib.decompress(data))
+
+
+def decode_json_text(data: bytes) -> str:
+    """Decompress a JSON value without deserializing it."""
+    return zlib.decompress(data).decode()
+
+
+def diff_content(old: Any, new: Any) -> list[list[Any]]:
+    """Compute a patch that turns ``old`` into ``new``.
+
+    Dicts are diffed per key. Lists are trimmed to the differing middle
+    section; same-length sections (edits inside existing blocks) are diffed
+    element-wise, anything else becomes a single splice.
+    """
+    ops: list[list[Any]] = []
+    _diff(old, new, [], ops)
+    return ops
+
+
+def _same(old: Any, new: Any) -> bool:
+    """Compare JSON values, telling apart values Python treats as equal.
+
+    ``True == 1`` and ``1 == 1.0`` hold in Python, but they are different
+    JSON values and must produce a patch.
+    """
+    if type(old) is not type(new):
+        return False
+    if isinstance(old, dict):
+        return old.keys() == new.keys() and all(_same(old[k], new[k]) for k in old)
+    if isinstance(old, list):
+        return len(old) == len(new) and all(map(_same, old, new))
+    return old == new
+
+
+def _diff(old: Any, new: Any, path: list[Any], ops: list[list[Any]]) -> None:
+    if _same(old, new):
+        return
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                ops.append(["del", path + [key]])
+        for key, value in new.items():
+            if key in old:
+                _diff(old[key], value, path + [key], ops)
+            else:
+                ops.append(["set", path + [key], value])
+        return
+
+    if isinstance(old, list) and isinstance(new, list):
+        start = 0
+        shortest = min(len(old), len(new))
+        while start < shortest and _same(old[start], new[start]):
+            start += 1
+
+        old_end, new_end = len(old), len(new)
+        while old_end > start and new_end > start and _same(old[old_end - 1], new[new_end - 1]):
+            old_end -= 1
+            new_end -= 1
+
+        if old_end - start == new_end - start:
+            for i in range(start, old_end):
+                _diff(old[i], new[i], path + [i], ops)
+        else:
+            ops.append(["splice", path, start, old_end - start, new[start:new_end]])
+        return
+
+    ops.append(["set", path, new])
+
+
+def apply_patch(content: Any, patch: list[list[Any]]) -> Any:
+    """Apply a patch produced by :func:`diff_content`.
+
+    ``content`` is modified in place, so callers must pass a value they own
+    (e.g. freshly decoded); the patched document is returned.
+    """
+    for op in patch:
+        kind, path = op[0], op[1]
+
+        if kind == "splice":
+            target = content
+            for key in path:
+                target = target[key]
+            start, delete_count, items = op[2], op[3], op[4]
+            target[start : start + delete_count] = items
+            continue
+
+        if not path:
+            content = op[2]
+            continue
+
+        parent = content
+        for key in path[:-1]:
+            parent = parent[key]
+
+        if kind == "set":
+            parent[path[-1]] = op[2]
+        elif kind == "del":
+            del parent[path[-1]]
+        else:
+            raise ValueError(f"Unknown patch operation: {kind}")
+
+    return content
@@ -1,15 +1,18 @@
 """Export service for generating reports in various formats."""
 
+import asyncio
 import csv
 import io
 import json
 import os
 import tempfile
+from collections.abc import AsyncIterator, Callable, Sequence
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Any, IO
 from uuid import uuid4
 
-from sqlalchemy import select, and_
+from sqlalchemy import Select, select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from aexy.models.analytics import ExportJob
@@ -52,6 +55,11 @@ except ImportError:
 # Default export directory
 DEFAULT_EXPORT_DIR = Path(tempfile.gettempdir()) / "aexy_exports"
 
+# Rows fetched per server-side cursor batch and handed to the writer thread
+EXPORT_BATCH_SIZE = 1000
+# PDF tables can't be streamed; cap the rows rendered into a document
+PDF_MAX_ROWS = 500
+
 
 class ExportService:
     """Service for generating exportable reports in various formats."""
@@ -203,6 +211,8 @@ class ExportService:
                 file_path = await self._export_csv(job, data)
             elif format_type == ExportFormat.JSON:
                 file_path = await self._export_json(job, data)
+            elif format_type == ExportFormat.JSONL:
+                file_path = await self._export_jsonl(job, data)
             elif format_type == ExportFormat.PDF:
                 file_path = await self._export_pdf(job, data)
             elif format_type == ExportFormat.XLSX:
@@ -227,6 +237,90 @@ class ExportService:
             )
             raise
 
+    async def process_streaming_export(
+        self,
+        job_id: str,
+        db: AsyncSession,
+        headers: list[str],
+        rows: AsyncIterator[Sequence[Any]],
+        title: str | None = None,
+    ) -> ExportJob | None:
+        """Process an export job from an async stream of rows.
+
+        Rows are consumed in batches of EXPORT_BATCH_SIZE and appended to the
+        output file from a worker thread, so memory stays constant regardless
+        of export size and the event loop is never blocked on rendering.
+        CSV/JSON/JSONL are written incrementally, XLSX
+        uses openpyxl's write-only mode and PDF renders the first
+        PDF_MAX_ROWS rows.
+
+        Args:
+            job_id: Export job ID.
+            db: Database session.
+            headers: Column headers.
+            rows: Async iterator of row values, e.g. from stream_query_rows.
+            title: Document title for PDF/XLSX output.
+        """
+        job = await self.get_export_job(job_id, db)
+        if not job:
+            return None
+
+        try:
+            await self.update_job_status(job_id, db, ExportStatus.PROCESSING)
+
+            writer = await asyncio.to_thread(
+                _StreamingExportWriter,
+                self.export_dir,
+                job,
+                headers,
+                title or "Aexy Export",
+            )
+            try:
+                batch: list[Sequence[Any]] = []
+                async for row in rows:
+                    batch.append(row)
+                    if len(batch) >= EXPORT_BATCH_SIZE:
+                        await asyncio.to_thread(writer.write_rows, batch)
+                        batch = []
+                if batch:
+                    await asyncio.to_thread(writer.write_rows, batch)
+                file_path = await asyncio.to_thread(writer.close)
+            except BaseException:
+                await asyncio.to_thread(writer.abort)
+                raise
+
+            return await self.update_job_status(
+                job_id, db, ExportStatus.COMPLETED,
+                file_path=file_path,
+                file_size=os.path.getsize(file_path),
+            )
+
+        except Exception as e:
+            await self.update_job_status(
+                job_id, db, ExportStatus.FAILED,
+                error_message=str(e),
+            )
+            raise
+
+    @staticmethod
+    async def stream_query_rows(
+        db: AsyncSession,
+        stmt: Select,
+        to_row: Callable[[Any], Sequence[Any]],
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> AsyncIterator[Sequence[Any]]:
+        """Yield export rows from a query using a server-side cursor.
+
+        Args:
+            db: Database session.
+            stmt: Select statement returning ORM entities.
+            to_row: Converts an entity into a row of values.
+            batch_size: Rows fetched from the cursor per round trip.
+        """
+        result = await db.stream_scalars(stmt.execution_options(yield_per=batch_size))
+        async for obj in result:
+            yield to_row(obj)
+
     def get_download_path(self, job: ExportJob) -> Path | None:
         """Get the download path for a completed export."""
         if not job.file_path:
@@ -239,6 +333,10 @@ class ExportService:
     # -------------------------------------------------------------------------
 
     async def _export_csv(self, job: ExportJob, data: dict) -> str:
+        """Export data to CSV format in a worker thread."""
+        return await asyncio.to_thread(self._write_csv, job, data)
+
+    def _write_csv(self, job: ExportJob, data: dict) -> str:
         """Export data to CSV format."""
         filename = f"{job.id}.csv"
         file_path = self.export_dir / filename
@@ -345,6 +443,10 @@ class ExportService:
                 writer.writerow([full_key, value])
 
     async def _export_json(self, job: ExportJob, data: dict) -> str:
+        """Export data to JSON format in a worker thread."""
+        return await asyncio.to_thread(self._write_json, job, data)
+
+    def _write_json(self, job: ExportJob, data: dict) -> str:
         """Export data to JSON format."""
         filename = f"{job.id}.json"
         file_path = self.export_dir / filename
@@ -364,6 +466,32 @@ class ExportService:
         return str(file_path)
 
     async def _export_pdf(self, job: ExportJob, data: dict) -> str:
+        """Export data to PDF format in a worker thread."""
+        return await asyncio.to_thread(self._write_pdf, job, data)
+
+    async def _export_jsonl(self, job: ExportJob, data: dict) -> str:
+        """Export data to JSON Lines format in a worker thread."""
+        return await asyncio.to_thread(self._write_jsonl, job, data)
+
+    def _write_jsonl(self, job: ExportJob, data: dict) -> str:
+        """Write one JSON object per line for the primary record list."""
+        file_path = self.export_dir / f"{job.id}.jsonl"
+
+        records = next(
+            (data[key] for key in ("tasks", "developers", "developer_trends") if key in data),
+            None,
+        )
+        if records is None and "rows" in data and "headers" in data:
+            records = [dict(zip(data["headers"], row)) for row in data["rows"]]
+
+        with open(file_path, "w") as f:
+            for record in records if records is not None else [data]:
+                f.write(json.dumps(record, default=str))
+                f.write("\n")
+
+        return str(file_path)
+
+    def _write_pdf(self, job: ExportJob, data: dict) -> str:
         """Export data to PDF format."""
         if not REPORTLAB_AVAILABLE:
             raise ImportError("reportlab is required for PDF export")
@@ -604,6 +732,10 @@ class ExportService:
         return None
 
     async def _export_xlsx(self, job: ExportJob, data: dict) -> str:
+        """Export data to Excel format in a worker thread."""
+        return await asyncio.to_thread(self._write_xlsx, job, data)
+
+    def _write_xlsx(self, job: ExportJob, data: dict) -> str:
         """Export data to Excel format."""
         if not OPENPYXL_AVAILABLE:
             raise ImportError("openpyxl is required for Excel export")
@@ -879,6 +1011,123 @@ class ExportService:
         return await self.process_export(job.id, db, report_data)
 
 
+class _StreamingExportWriter:
+    """Incremental file writer used by ExportService.process_streaming_export.
+
+    All methods do blocking I/O and are meant to run in a worker thread.
+    """
+
+    def __init__(
+        self,
+        export_dir: Path,
+        job: ExportJob,
+        headers: list[str],
+        title: str,
+    ) -> None:
+        self.format = ExportFormat(job.format)
+        self.headers = headers
+        self.title = title
+        self.row_count = 0
+        self._file: IO[str] | None = None
+        self._workbook = None
+        self._sheet = None
+        self._pdf_rows: list[list[str]] = []
+
+        self.file_path = Path(export_dir) / f"{job.id}.{self.format.value}"
+
+        if self.format in (ExportFormat.CSV, ExportFormat.JSON, ExportFormat.JSONL):
+            self._file = open(self.file_path, "w", newline="")
+
+        if self.format == ExportFormat.CSV:
+            self._csv = csv.writer(self._file)
+            self._csv.writerow(headers)
+        elif self.format == ExportFormat.JSON:
+            self._file.write("[")
+        elif self.format == ExportFormat.XLSX:
+            if not OPENPYXL_AVAILABLE:
+                raise ImportError("openpyxl is required for Excel export")
+            self._workbook = Workbook(write_only=True)
+            self._sheet = self._workbook.create_sheet(title="Export")
+            self._sheet.append([title])
+            self._sheet.append([f"Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}"])
+            self._sheet.append([])
+            self._sheet.append(headers)
+        elif self.format == ExportFormat.PDF:
+            if not REPORTLAB_AVAILABLE:
+                raise ImportError("reportlab is required for PDF export")
+
+    def write_rows(self, rows: list[Sequence[Any]]) -> None:
+        """Append a batch of rows to the output."""
+        if self.format == ExportFormat.CSV:
+            self._csv.writerows(rows)
+        elif self.format == ExportFormat.JSONL:
+            for row in rows:
+                self._file.write(json.dumps(dict(zip(self.headers, row)), default=str))
+                self._file.write("\n")
+        elif self.format == ExportFormat.JSON:
+            for row in rows:
+                if self.row_count:
+                    self._file.write(",")
+                self._file.write(json.dumps(dict(zip(self.headers, row)), default=str))
+                self.row_count += 1
+            return
+        elif self.format == ExportFormat.XLSX:
+            for row in rows:
+                self._sheet.append(list(row))
+        elif self.format == ExportFormat.PDF:
+            remaining = PDF_MAX_ROWS - len(self._pdf_rows)
+            self._pdf_rows.extend(
+                [str(v) if v is not None else "" for v in row] for row in rows[:remaining]
+            )
+        self.row_count += len(rows)
+
+    def close(self) -> str:
+        """Finalize the output file and return its path."""
+        if self.format == ExportFormat.JSON:
+            self._file.write("]")
+        if self._file:
+            self._file.close()
+        if self._workbook:
+            self._workbook.save(self.file_path)
+        if self.format == ExportFormat.PDF:
+            self._build_pdf()
+        return str(self.file_path)
+
+    def abort(self) -> None:
+        """Close and remove a partially written file."""
+        if self._file:
+            self._file.close()
+        self.file_path.unlink(missing_ok=True)
+
+    def _build_pdf(self) -> None:
+        styles = getSampleStyleSheet()
+        doc = SimpleDocTemplate(str(self.file_path), pagesize=letter)
+        elements = [
+            Paragraph(self.title, styles["Heading1"]),
+            Paragraph(
+                f"Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}",
+                styles["Normal"],
+            ),
+            Spacer(1, 20),
+        ]
+        if self._pdf_rows:
+            table = Table([self.headers] + self._pdf_rows, repeatRows=1)
+            table.setStyle(TableStyle([
+                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#4472C4")),
+                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                ("FONTSIZE", (0, 0), (-1, -1), 8),
+                ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+            ]))
+            elements.append(table)
+        if self.row_count > len(self._pdf_rows):
+            elements.append(Paragraph(
+                f"... and {self.row_count - len(self._pdf_rows)} more rows",
+                styles["Normal"],
+            ))
+        doc.build(elements)
+
+
 # Convenience function
 def get_export_service(export_dir: Path | None = None) -> ExportService:
     """Get an instance of the export service."""
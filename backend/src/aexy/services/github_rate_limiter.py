@@ -45,6 +45,7 @@ class RateLimitStatus:
     graphql: RateLimitInfo | None = None
     can_proceed: bool = True
     wait_seconds: float = 0
+    requests_saved: int = 0  # Requests served from cache via 304 Not Modified
 
 
 class GitHubRateLimiter:
@@ -176,6 +177,7 @@ class GitHubRateLimiter:
                 return status  # No cached data, assume OK
 
             now = datetime.now(timezone.utc)
+            status.requests_saved = int(data.get("requests_saved", 0))
 
             for resource in ["core", "search", "graphql"]:
                 limit_key = f"{resource}_limit"
@@ -282,6 +284,21 @@ class GitHubRateLimiter:
         except Exception as e:
             logger.error(f"Failed to record request: {e}")
 
+    async def record_cache_hit(self, access_token: str) -> None:
+        """Record that a request was answered with 304 Not Modified.
+
+        Conditional requests that return 304 don't count against the rate
+        limit; the saved count is exposed via RateLimitStatus.requests_saved.
+        """
+        try:
+            r = await self._get_redis()
+            key = self._token_key(access_token)
+
+            await r.hincrby(key, "requests_saved", 1)
+
+        except Exception as e:
+            logger.error(f"Failed to record cache hit: {e}")
+
 
 # Global instance for convenience
 _rate_limiter: GitHubRateLimiter | None = None
@@ -1,12 +1,130 @@
 """GitHub API integration service."""
 
-from typing import Any
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlencode
 
 import httpx
 
 from aexy.core.config import get_settings
 from aexy.schemas.auth import GitHubAuthResponse, GitHubUserInfo
 
+if TYPE_CHECKING:
+    from aexy.cache.github_response_cache import GitHubResponseCache
+    from aexy.services.github_rate_limiter import GitHubRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# GraphQL page size (GitHub's maximum for connections)
+GRAPHQL_PAGE_SIZE = 100
+# Pause pagination when the GraphQL budget drops below this many points
+GRAPHQL_MIN_REMAINING = 50
+
+_RATE_LIMIT_FRAGMENT = """
+  rateLimit { cost remaining resetAt }
+"""
+
+_REVIEW_FRAGMENT = """
+fragment ReviewFields on PullRequestReview {
+  databaseId
+  state
+  body
+  submittedAt
+  author { login }
+  comments { totalCount }
+}
+"""
+
+COMMIT_HISTORY_QUERY = """
+query($owner: String!, $repo: String!, $first: Int!, $after: String,
+      $since: GitTimestamp, $authorId: ID) {
+  repository(owner: $owner, name: $repo) {
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(first: $first, after: $after, since: $since,
+                  author: {id: $authorId}) {
+            pageInfo { hasNextPage endCursor }
+            nodes {
+              oid
+              message
+              committedDate
+              additions
+              deletions
+              changedFilesIfAvailable
+              author { user { login } }
+            }
+          }
+        }
+      }
+    }
+  }
+""" + _RATE_LIMIT_FRAGMENT + """
+}
+"""
+
+PULL_REQUESTS_QUERY = """
+query($owner: String!, $repo: String!, $first: Int!, $after: String) {
+  repository(owner: $owner, name: $repo) {
+    pullRequests(first: $first, after: $after,
+                 orderBy: {field: UPDATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        databaseId
+        number
+        title
+        state
+        additions
+        deletions
+        changedFiles
+        createdAt
+        updatedAt
+        mergedAt
+        closedAt
+        author { login }
+        commits { totalCount }
+        comments { totalCount }
+        reviews(first: 100) {
+          pageInfo { hasNextPage endCursor }
+          nodes { ...ReviewFields }
+        }
+      }
+    }
+  }
+""" + _RATE_LIMIT_FRAGMENT + """
+}
+""" + _REVIEW_FRAGMENT
+
+PULL_REQUEST_REVIEWS_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!, $first: Int!, $after: String) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $number) {
+      reviews(first: $first, after: $after) {
+        pageInfo { hasNextPage endCursor }
+        nodes { ...ReviewFields }
+      }
+    }
+  }
+""" + _RATE_LIMIT_FRAGMENT + """
+}
+""" + _REVIEW_FRAGMENT
+
+USER_ID_QUERY = """
+query($login: String!) {
+  user(login: $login) { id }
+}
+"""
+
+
+def _parse_github_datetime(value: str | None) -> datetime | None:
+    """Parse an ISO 8601 timestamp returned by the GitHub API."""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
 
 class GitHubServiceError(Exception):
     """Base exception for GitHub service errors."""
@@ -29,10 +147,23 @@ class GitHubAPIError(GitHubServiceError):
 class GitHubService:
     """Service for interacting with GitHub API."""
 
-    def __init__(self, access_token: str | None = None) -> None:
-        """Initialize GitHub service."""
+    def __init__(
+        self,
+        access_token: str | None = None,
+        response_cache: "GitHubResponseCache | None" = None,
+        rate_limiter: "GitHubRateLimiter | None" = None,
+    ) -> None:
+        """Initialize GitHub service.
+
+        Args:
+            access_token: GitHub access token.
+            response_cache: Optional cache enabling conditional (ETag) requests.
+            rate_limiter: Optional rate limiter fed with response headers and cache hits.
+        """
         self.settings = get_settings()
         self.access_token = access_token
+        self.response_cache = response_cache
+        self.rate_limiter = rate_limiter
         self._client: httpx.AsyncClient | None = None
 
     async def __aenter__(self) -> "GitHubService":
@@ -53,6 +184,52 @@ class GitHubService:
         if self._client:
             await self._client.aclose()
 
+    async def _get(self, path: str, params: dict[str, Any] | None = None) -> httpx.Response:
+        """Send a GET request, conditionally when a response cache is configured.
+
+        Cached ETag/Last-Modified validators are sent as If-None-Match /
+        If-Modified-Since. A 304 Not Modified (free against the rate limit) is
+        answered with the cached body as a regular 200 response.
+        """
+        if not self._client:
+            raise GitHubServiceError("Service not initialized. Use async context manager.")
+
+        if self.response_cache is None or not self.access_token:
+            return await self._client.get(path, params=params)
+
+        cache_url = f"{path}?{urlencode(sorted(params.items()))}" if params else path
+        cached = await self.response_cache.get(self.access_token, cache_url)
+
+        response = await self._client.get(
+            path,
+            params=params,
+            headers=cached.conditional_headers() if cached else None,
+        )
+
+        if self.rate_limiter:
+            await self.rate_limiter.record_rate_limit(self.access_token, dict(response.headers))
+
+        if response.status_code == 304 and cached:
+            if self.rate_limiter:
+                await self.rate_limiter.record_cache_hit(self.access_token)
+            return httpx.Response(
+                200,
+                content=cached.body,
+                headers={"content-type": "application/json"},
+                request=response.request,
+            )
+
+        if response.status_code == 200:
+            await self.response_cache.set(
+                self.access_token,
+                cache_url,
+                response.content,
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
+            )
+
+        return response
+
     def get_oauth_url(self, state: str) -> str:
         """Generate GitHub OAuth authorization URL."""
         scopes = "repo read:org read:user user:email"
@@ -96,7 +273,7 @@ class GitHubService:
         if not self._client:
             raise GitHubServiceError("Service not initialized. Use async context manager.")
 
-        response = await self._client.get("/user")
+        response = await self._get("/user")
 
         if response.status_code != 200:
             raise GitHubAPIError(f"Failed to get user info: {response.text}")
@@ -115,7 +292,7 @@ class GitHubService:
         if not self._client:
             raise GitHubServiceError("Service not initialized. Use async context manager.")
 
-        response = await self._client.get("/user/emails")
+        response = await self._get("/user/emails")
 
         if response.status_code != 200:
             raise GitHubAPIError(f"Failed to get user emails: {response.text}")
@@ -127,7 +304,7 @@ class GitHubService:
         if not self._client:
             raise GitHubServiceError("Service not initialized. Use async context manager.")
 
-        response = await self._client.get(
+        response = await self._get(
             "/user/repos",
             params={
                 "per_page": per_page,
@@ -158,7 +335,7 @@ class GitHubService:
         if author:
             params["author"] = author
 
-        response = await self._client.get(f"/repos/{owner}/{repo}/commits", params=params)
+        response = await self._get(f"/repos/{owner}/{repo}/commits", params=params)
 
         if response.status_code != 200:
             raise GitHubAPIError(f"Failed to get commits: {response.text}")
@@ -170,7 +347,7 @@ class GitHubService:
         if not self._client:
             raise GitHubServiceError("Service not initialized. Use async context manager.")
 
-        response = await self._client.get(f"/repos/{owner}/{repo}/commits/{sha}")
+        response = await self._get(f"/repos/{owner}/{repo}/commits/{sha}")
 
         if response.status_code != 200:
             raise GitHubAPIError(f"Failed to get commit details: {response.text}")
@@ -189,7 +366,7 @@ class GitHubService:
         if not self._client:
             raise GitHubServiceError("Service not initialized. Use async context manager.")
 
-        response = await self._client.get(
+        response = await self._get(
             f"/repos/{owner}/{repo}/pulls",
             params={"state": state, "per_page": per_page, "page": page},
         )
@@ -209,13 +386,238 @@ class GitHubService:
         if not self._client:
             raise GitHubServiceError("Service not initialized. Use async context manager.")
 
-        response = await self._client.get(f"/repos/{owner}/{repo}/pulls/{pull_number}/reviews")
+        response = await self._get(f"/repos/{owner}/{repo}/pulls/{pull_number}/reviews")
 
         if response.status_code != 200:
             raise GitHubAPIError(f"Failed to get PR reviews: {response.text}")
 
         return response.json()
 
+    # GraphQL bulk fetch methods
+
+    async def graphql(self, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Execute a GraphQL query and return its ``data`` payload."""
+        if not self._client:
+            raise GitHubServiceError("Service not initialized. Use async context manager.")
+
+        response = await self._client.post(
+            "/graphql",
+            json={"query": query, "variables": variables or {}},
+        )
+
+        if self.rate_limiter and self.access_token:
+            await self.rate_limiter.record_rate_limit(self.access_token, dict(response.headers))
+
+        if response.status_code != 200:
+            raise GitHubAPIError(f"GraphQL request failed: {response.text}")
+
+        payload = response.json()
+        if payload.get("errors"):
+            messages = "; ".join(e.get("message", "") for e in payload["errors"])
+            raise GitHubAPIError(f"GraphQL error: {messages}")
+
+        return payload.get("data") or {}
+
+    async def _wait_for_graphql_budget(self, rate_limit: dict[str, Any] | None) -> None:
+        """Sleep until reset when the next page would exhaust the GraphQL budget."""
+        if not rate_limit:
+            return
+
+        cost = int(rate_limit.get("cost") or 1)
+        remaining = int(rate_limit.get("remaining") or 0)
+        if remaining - cost >= GRAPHQL_MIN_REMAINING:
+            return
+
+        reset_at = _parse_github_datetime(rate_limit.get("resetAt"))
+        if reset_at is None:
+            return
+
+        wait_seconds = min((reset_at - datetime.now(timezone.utc)).total_seconds(), 900)
+        if wait_seconds > 0:
+            logger.info(
+                f"GraphQL budget low ({remaining} remaining, cost {cost}), "
+                f"waiting {wait_seconds:.0f}s until reset"
+            )
+            await asyncio.sleep(wait_seconds)
+
+    async def get_user_node_id(self, login: str) -> str | None:
+        """Resolve a GitHub login to its GraphQL node ID."""
+        data = await self.graphql(USER_ID_QUERY, {"login": login})
+        user = data.get("user")
+        return user["id"] if user else None
+
+    async def iter_commits_graphql(
+        self,
+        owner: str,
+        repo: str,
+        author: str | None = None,
+        since: datetime | None = None,
+        page_size: int = GRAPHQL_PAGE_SIZE,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield pages of default-branch commits including line stats.
+
+        Commits are shaped like the REST commit details payload (``sha``,
+        ``commit.message``, ``commit.committer.date``, ``stats``) with
+        ``files_changed`` in place of the per-file list. Callers that need
+        changed file names still use ``get_commit_details``.
+        """
+        author_id = await self.get_user_node_id(author) if author else None
+        if author and not author_id:
+            return
+
+        variables: dict[str, Any] = {
+            "owner": owner,
+            "repo": repo,
+            "first": page_size,
+            "after": None,
+            "since": since.isoformat() if since else None,
+            "authorId": author_id,
+        }
+
+        while True:
+            data = await self.graphql(COMMIT_HISTORY_QUERY, variables)
+            branch = (data.get("repository") or {}).get("defaultBranchRef")
+            if not branch:
+                return
+
+            history = branch["target"]["history"]
+            yield [
+                {
+                    "sha": node["oid"],
+                    "commit": {
+                        "message": node.get("message") or "",
+                        "committer": {"date": node["committedDate"]},
+                    },
+                    "author": {"login": ((node.get("author") or {}).get("user") or {}).get("login")},
+                    "stats": {
+                        "additions": node.get("additions") or 0,
+                        "deletions": node.get("deletions") or 0,
+                    },
+                    "files_changed": node.get("changedFilesIfAvailable") or 0,
+                }
+                for node in history["nodes"]
+            ]
+
+            if not history["pageInfo"]["hasNextPage"]:
+                return
+            variables["after"] = history["pageInfo"]["endCursor"]
+            await self._wait_for_graphql_budget(data.get("rateLimit"))
+
+    async def iter_pull_requests_graphql(
+        self,
+        owner: str,
+        repo: str,
+        since: datetime | None = None,
+        page_size: int = GRAPHQL_PAGE_SIZE,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield pages of pull requests with their reviews embedded.
+
+        Pull requests are shaped like the REST pulls payload, plus a
+        ``reviews`` list shaped like the REST reviews payload, so one query
+        replaces a ``get_pull_request_reviews`` call per pull request.
+        Pull requests with more than one page of reviews are completed with
+        follow-up review queries.
+        Pages are ordered by most recently updated; iteration stops at the
+        first pull request not updated since ``since``.
+        """
+        variables: dict[str, Any] = {
+            "owner": owner,
+            "repo": repo,
+            "first": page_size,
+            "after": None,
+        }
+
+        while True:
+            data = await self.graphql(PULL_REQUESTS_QUERY, variables)
+            connection = (data.get("repository") or {}).get("pullRequests")
+            if not connection:
+                return
+
+            page = []
+            reached_since = False
+            for node in connection["nodes"]:
+                updated_at = _parse_github_datetime(node.get("updatedAt"))
+                if since and updated_at and updated_at < since:
+                    reached_since = True
+                    break
+                await self._fetch_remaining_reviews(owner, repo, node, page_size)
+                page.append(self._graphql_pull_request_to_rest(node))
+
+            if page:
+                yield page
+
+            if reached_since or not connection["pageInfo"]["hasNextPage"]:
+                return
+            variables["after"] = connection["pageInfo"]["endCursor"]
+            await self._wait_for_graphql_budget(data.get("rateLimit"))
+
+    async def _fetch_remaining_reviews(
+        self,
+        owner: str,
+        repo: str,
+        node: dict[str, Any],
+        page_size: int = GRAPHQL_PAGE_SIZE,
+    ) -> None:
+        """Append review pages beyond the first to a pull request node in place."""
+        reviews = node.get("reviews") or {}
+        page_info = reviews.get("pageInfo") or {}
+        variables: dict[str, Any] = {
+            "owner": owner,
+            "repo": repo,
+            "number": node["number"],
+            "first": page_size,
+            "after": page_info.get("endCursor"),
+        }
+
+        while page_info.get("hasNextPage"):
+            data = await self.graphql(PULL_REQUEST_REVIEWS_QUERY, variables)
+            pull_request = (data.get("repository") or {}).get("pullRequest") or {}
+            connection = pull_request.get("reviews")
+            if not connection:
+                return
+
+            reviews.setdefault("nodes", []).extend(connection["nodes"])
+            page_info = connection["pageInfo"]
+            variables["after"] = page_info["endCursor"]
+            await self._wait_for_graphql_budget(data.get("rateLimit"))
+
+    @staticmethod
+    def _graphql_pull_request_to_rest(node: dict[str, Any]) -> dict[str, Any]:
+        """Convert a GraphQL pull request node into the REST payload shape."""
+        review_comments = 0
+        reviews = []
+        for review in (node.get("reviews") or {}).get("nodes", []):
+            comments_count = (review.get("comments") or {}).get("totalCount", 0)
+            review_comments += comments_count
+            reviews.append({
+                "id": review["databaseId"],
+                "user": {"login": (review.get("author") or {}).get("login")},
+                "state": review["state"],
+                "body": review.get("body"),
+                "submitted_at": review.get("submittedAt"),
+                "comments_count": comments_count,
+            })
+
+        return {
+            "id": node["databaseId"],
+            "number": node["number"],
+            "title": node.get("title") or "",
+            # REST reports merged pull requests as closed
+            "state": "open" if node["state"] == "OPEN" else "closed",
+            "user": {"login": (node.get("author") or {}).get("login")},
+            "additions": node.get("additions") or 0,
+            "deletions": node.get("deletions") or 0,
+            "changed_files": node.get("changedFiles") or 0,
+            "commits": (node.get("commits") or {}).get("totalCount", 0),
+            "comments": (node.get("comments") or {}).get("totalCount", 0),
+            "review_comments": review_comments,
+            "created_at": node["createdAt"],
+            "updated_at": node.get("updatedAt"),
+            "merged_at": node.get("mergedAt"),
+            "closed_at": node.get("closedAt"),
+            "reviews": reviews,
+        }
+
     # Organization methods
 
     async def get_user_orgs(self, per_page: int = 100, page: int = 1) -> list[dict[str, Any]]:
@@ -223,7 +625,7 @@ class GitHubService:
         if not self._client:
             raise GitHubServiceError("Service not initialized. Use async context manager.")
 
-        response = await self._client.get(
+        response = await self._get(
             "/user/orgs",
             params={"per_page": per_page, "page": page},
         )
@@ -238,7 +640,7 @@ class GitHubService:
         if not self._client:
             raise GitHubServiceError("Service not initialized. Use async context manager.")
 
-        response = await self._client.get(f"/orgs/{org}")
+        response = await self._get(f"/orgs/{org}")
 
         if response.status_code != 200:
             raise GitHubAPIError(f"Failed to get org: {response.text}")
@@ -256,7 +658,7 @@ class GitHubService:
         if not self._client:
             raise GitHubServiceError("Service not initialized. Use async context manager.")
 
-        response = await self._client.get(
+        response = await self._get(
             f"/orgs/{org}/repos",
             params={
                 "per_page": per_page,
@@ -323,7 +725,7 @@ class GitHubService:
         if not self._client:
             raise GitHubServiceError("Service not initialized. Use async context manager.")
 
-        response = await self._client.get(f"/repos/{owner}/{repo}/hooks")
+        response = await self._get(f"/repos/{owner}/{repo}/hooks")
 
         if response.status_code != 200:
             raise GitHubAPIError(f"Failed to get webhooks: {response.text}")
@@ -13,6 +13,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from aexy.cache import get_document_tree_cache, get_knowledge_graph_cache
 from aexy.models.documentation import Document, DocumentGitHubSync, DocumentVersion
 from aexy.services.github_app_service import GitHubAppService
 
@@ -316,6 +317,13 @@ class GitHubSyncService:
 
         await self.db.commit()
 
+        tree_cache = get_document_tree_cache()
+        if tree_cache:
+            await tree_cache.invalidate(document.workspace_id)
+        graph_cache = get_knowledge_graph_cache()
+        if graph_cache:
+            await graph_cache.invalidate(document.workspace_id)
+
         return {
             "status": "success",
             "file_sha": file_content.get("sha"),
@@ -1,18 +1,25 @@
 """Service for extracting knowledge entities from documents using LLM."""
 
+import asyncio
+import hashlib
 import json
 import logging
 import re
+from collections import defaultdict
 from datetime import datetime, timezone
 from typing import Any
+from uuid import uuid4
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, literal_column, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
 from aexy.llm.base import AnalysisRequest, AnalysisType
 from aexy.llm.gateway import get_llm_gateway
 from aexy.models.documentation import Document
 from aexy.models.knowledge_graph import (
+    KnowledgeDocumentExtraction,
     KnowledgeEntity,
     KnowledgeEntityMention,
     KnowledgeEntityType,
@@ -23,9 +30,22 @@ from aexy.models.knowledge_graph import (
     KnowledgeRelationType,
     KnowledgeDocumentRelationship,
 )
+from aexy.services.knowledge_graph_index import bump_graph_version
+from aexy.services.knowledge_graph_service import KnowledgeGraphService
 
 logger = logging.getLogger(__name__)
 
+# Rows per bulk upsert statement (6 bind params each, well under asyncpg's limit)
+DOCUMENT_RELATIONSHIP_BATCH_SIZE = 1000
+
+# Entity extraction pipeline limits
+ENTITY_UPSERT_BATCH_SIZE = 500  # Rows per entity upsert statement
+EXTRACTION_BATCH_SIZE = 20  # Documents resolved and committed together
+EXTRACTION_CONCURRENCY = 4  # Concurrent LLM requests
+EXTRACTION_CHUNK_CHARS = 15000  # Characters of document text per LLM request
+EXTRACTION_MAX_CHUNKS = 8  # Chunks sent per document; the rest is skipped with a warning
+MIN_EXTRACTION_CHARS = 50
+
 
 # LLM prompt for entity extraction
 ENTITY_EXTRACTION_SYSTEM_PROMPT = """You are an expert at analyzing technical documentation and extracting structured knowledge entities.
@@ -164,63 +184,12 @@ class KnowledgeExtractionService:
             logger.error(f"Document {document_id} not found")
             return []
 
-        # Extract plain text content
-        content_text = self._extract_text_from_tiptap(document.content)
-        if not content_text or len(content_text.strip()) < 50:
-            logger.info(f"Document {document_id} has insufficient content for extraction")
-            return []
-
-        # Prepare prompt
-        formatted_prompt = ENTITY_EXTRACTION_PROMPT.format(
-            title=document.title or "Untitled",
-            content=content_text[:15000],  # Limit content to avoid token limits
-        )
-
-        # Create analysis request
-        request = AnalysisRequest(
-            content=formatted_prompt,
-            analysis_type=AnalysisType.CODE,  # Using CODE as generic analysis type
-            context={
-                "system_prompt": ENTITY_EXTRACTION_SYSTEM_PROMPT,
-                "output_format": "json",
-            },
+        extracted, failed = await self._extract_documents(
+            str(document.workspace_id), [document], developer_id=developer_id
         )
-
-        try:
-            # Execute LLM request
-            llm_result = await self.gateway.analyze(
-                request,
-                use_cache=True,
-                db=self.db,
-                developer_id=developer_id,
-            )
-
-            # Parse the result
-            extracted_data = self._parse_json_response(llm_result.raw_response)
-            entities_data = extracted_data.get("entities", [])
-
-            # Create or update entities in database
-            entities = []
-            for entity_data in entities_data:
-                entity = await self._create_or_update_entity(
-                    workspace_id=str(document.workspace_id),
-                    entity_data=entity_data,
-                )
-                if entity:
-                    entities.append(entity)
-                    # Create mention for this document
-                    await self._create_entity_mention(
-                        entity_id=str(entity.id),
-                        document_id=document_id,
-                        confidence_score=entity_data.get("confidence", 0.5),
-                    )
-
-            await self.db.commit()
-            return entities
-
-        except Exception as e:
-            logger.error(f"Entity extraction failed for document {document_id}: {e}")
-            raise
+        if document_id in failed:
+            raise failed[document_id]
+        return extracted.get(document_id, [])
 
     async def extract_relationships(
         self,
@@ -315,6 +284,7 @@ class KnowledgeExtractionService:
                 if relationship:
                     relationships.append(relationship)
 
+            await bump_graph_version(self.db, workspace_id)
             await self.db.commit()
             return relationships
 
@@ -325,72 +295,198 @@ class KnowledgeExtractionService:
     async def build_document_relationships(
         self,
         workspace_id: str,
-    ) -> list[KnowledgeDocumentRelationship]:
+        document_id: str | None = None,
+    ) -> dict[str, int]:
         """Build document-to-document relationships based on shared entities.
 
+        Candidate pairs come from an entity -> documents inverted index, so
+        only documents that actually co-mention an entity are compared. With
+        ``document_id`` set, only pairs touching that document are recomputed.
+        Relationships are bulk upserted and pairs that no longer share any
+        entity are removed.
+
         Args:
             workspace_id: Workspace ID to analyze.
+            document_id: Optional changed document to limit the rebuild to.
 
         Returns:
-            List of document relationships created.
+            Counts of relationships created, updated and removed.
         """
-        # Get all documents with their entity mentions
-        stmt = select(KnowledgeEntityMention).join(
-            KnowledgeEntity
-        ).where(
-            KnowledgeEntity.workspace_id == workspace_id
+        if document_id:
+            doc_entities = await self._load_document_entities(
+                workspace_id, around_document_id=document_id
+            )
+            entity_counts = await self._count_document_entities(
+                workspace_id, list(doc_entities.keys())
+            )
+        else:
+            doc_entities = await self._load_document_entities(workspace_id)
+            entity_counts = {doc_id: len(entities) for doc_id, entities in doc_entities.items()}
+
+        # Invert to entity -> documents and emit each co-occurring pair once
+        entity_docs: dict[str, set[str]] = defaultdict(set)
+        for doc_id, entity_ids in doc_entities.items():
+            for entity_id in entity_ids:
+                entity_docs[entity_id].add(doc_id)
+
+        shared_by_pair: dict[tuple[str, str], list[str]] = defaultdict(list)
+        for entity_id, doc_ids in entity_docs.items():
+            if document_id:
+                if document_id not in doc_ids:
+                    continue
+                pairs = [
+                    tuple(sorted((document_id, other)))
+                    for other in doc_ids
+                    if other != document_id
+                ]
+            else:
+                ordered = sorted(doc_ids)
+                pairs = [
+                    (doc_a, doc_b)
+                    for i, doc_a in enumerate(ordered)
+                    for doc_b in ordered[i + 1:]
+                ]
+            for pair in pairs:
+                shared_by_pair[pair].append(entity_id)
+
+        rows = []
+        for (doc_a, doc_b), shared in shared_by_pair.items():
+            # Strength is the share of the larger document's entities in common
+            max_entities = max(entity_counts.get(doc_a, 0), entity_counts.get(doc_b, 0))
+            rows.append({
+                "id": str(uuid4()),
+                "workspace_id": workspace_id,
+                "source_document_id": doc_a,
+                "target_document_id": doc_b,
+                "relationship_type": KnowledgeRelationType.SHARES_ENTITY.value,
+                "shared_entities": sorted(shared),
+                "strength": len(shared) / max_entities if max_entities > 0 else 0,
+            })
+
+        created, updated = await self._upsert_document_relationships(rows)
+
+        # Rows not touched by the upsert above (updated_at is the transaction
+        # timestamp) no longer share any entity.
+        stale_stmt = delete(KnowledgeDocumentRelationship).where(
+            KnowledgeDocumentRelationship.workspace_id == workspace_id,
+            KnowledgeDocumentRelationship.relationship_type == KnowledgeRelationType.SHARES_ENTITY.value,
+            KnowledgeDocumentRelationship.updated_at < func.now(),
         )
-        result = await self.db.execute(stmt)
-        mentions = result.scalars().all()
-
-        # Build document -> entity mapping
-        doc_entities: dict[str, set[str]] = {}
-        for mention in mentions:
-            doc_id = str(mention.document_id)
-            entity_id = str(mention.entity_id)
-            if doc_id not in doc_entities:
-                doc_entities[doc_id] = set()
-            doc_entities[doc_id].add(entity_id)
-
-        # Find document pairs with shared entities
-        doc_ids = list(doc_entities.keys())
-        relationships = []
-
-        for i, doc_a in enumerate(doc_ids):
-            for doc_b in doc_ids[i + 1:]:
-                shared = doc_entities[doc_a] & doc_entities[doc_b]
-                if shared:
-                    # Calculate strength based on number of shared entities
-                    max_entities = max(len(doc_entities[doc_a]), len(doc_entities[doc_b]))
-                    strength = len(shared) / max_entities if max_entities > 0 else 0
-
-                    # Check if relationship already exists
-                    existing_stmt = select(KnowledgeDocumentRelationship).where(
-                        KnowledgeDocumentRelationship.workspace_id == workspace_id,
-                        KnowledgeDocumentRelationship.source_document_id == doc_a,
-                        KnowledgeDocumentRelationship.target_document_id == doc_b,
-                        KnowledgeDocumentRelationship.relationship_type == KnowledgeRelationType.SHARES_ENTITY.value,
-                    )
-                    existing_result = await self.db.execute(existing_stmt)
-                    existing = existing_result.scalar_one_or_none()
-
-                    if existing:
-                        existing.shared_entities = list(shared)
-                        existing.strength = strength
-                    else:
-                        relationship = KnowledgeDocumentRelationship(
-                            workspace_id=workspace_id,
-                            source_document_id=doc_a,
-                            target_document_id=doc_b,
-                            relationship_type=KnowledgeRelationType.SHARES_ENTITY.value,
-                            shared_entities=list(shared),
-                            strength=strength,
-                        )
-                        self.db.add(relationship)
-                        relationships.append(relationship)
+        if document_id:
+            stale_stmt = stale_stmt.where(
+                or_(
+                    KnowledgeDocumentRelationship.source_document_id == document_id,
+                    KnowledgeDocumentRelationship.target_document_id == document_id,
+                )
+            )
+        removed = (await self.db.execute(stale_stmt)).rowcount
 
+        await bump_graph_version(self.db, workspace_id)
         await self.db.commit()
-        return relationships
+        return {"created": created, "updated": updated, "removed": removed}
+
+    async def _load_document_entities(
+        self,
+        workspace_id: str,
+        around_document_id: str | None = None,
+    ) -> dict[str, set[str]]:
+        """Load the document -> entity IDs mapping for a workspace.
+
+        Args:
+            workspace_id: Workspace ID.
+            around_document_id: When set, only mentions of entities that this
+                document mentions are loaded.
+
+        Returns:
+            Mapping of document ID to the set of entity IDs it mentions.
+        """
+        stmt = (
+            select(KnowledgeEntityMention.document_id, KnowledgeEntityMention.entity_id)
+            .join(KnowledgeEntity)
+            .where(KnowledgeEntity.workspace_id == workspace_id)
+            .distinct()
+        )
+        if around_document_id:
+            stmt = stmt.where(
+                KnowledgeEntityMention.entity_id.in_(
+                    select(KnowledgeEntityMention.entity_id).where(
+                        KnowledgeEntityMention.document_id == around_document_id
+                    )
+                )
+            )
+
+        doc_entities: dict[str, set[str]] = defaultdict(set)
+        for doc_id, entity_id in (await self.db.execute(stmt)).all():
+            doc_entities[str(doc_id)].add(str(entity_id))
+        return doc_entities
+
+    async def _count_document_entities(
+        self,
+        workspace_id: str,
+        document_ids: list[str],
+    ) -> dict[str, int]:
+        """Count distinct mentioned entities per document.
+
+        Args:
+            workspace_id: Workspace ID.
+            document_ids: Documents to count.
+
+        Returns:
+            Mapping of document ID to its distinct entity count.
+        """
+        if not document_ids:
+            return {}
+
+        stmt = (
+            select(
+                KnowledgeEntityMention.document_id,
+                func.count(func.distinct(KnowledgeEntityMention.entity_id)),
+            )
+            .join(KnowledgeEntity)
+            .where(
+                KnowledgeEntity.workspace_id == workspace_id,
+                KnowledgeEntityMention.document_id.in_(document_ids),
+            )
+            .group_by(KnowledgeEntityMention.document_id)
+        )
+        return {str(doc_id): count for doc_id, count in (await self.db.execute(stmt)).all()}
+
+    async def _upsert_document_relationships(
+        self,
+        rows: list[dict[str, Any]],
+    ) -> tuple[int, int]:
+        """Bulk upsert document relationships on their unique key.
+
+        Args:
+            rows: Relationship column values.
+
+        Returns:
+            Tuple of (created, updated) row counts.
+        """
+        created = updated = 0
+        for start in range(0, len(rows), DOCUMENT_RELATIONSHIP_BATCH_SIZE):
+            stmt = pg_insert(KnowledgeDocumentRelationship).values(
+                rows[start:start + DOCUMENT_RELATIONSHIP_BATCH_SIZE]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[
+                    KnowledgeDocumentRelationship.workspace_id,
+                    KnowledgeDocumentRelationship.source_document_id,
+                    KnowledgeDocumentRelationship.target_document_id,
+                    KnowledgeDocumentRelationship.relationship_type,
+                ],
+                set_={
+                    "shared_entities": stmt.excluded.shared_entities,
+                    "strength": stmt.excluded.strength,
+                    "updated_at": func.now(),
+                },
+            )
+            # xmax is 0 only for rows inserted (not updated) by this statement
+            stmt = stmt.returning(literal_column("xmax = 0").label("inserted"))
+            inserted = (await self.db.execute(stmt)).scalars().all()
+            created += sum(1 for row in inserted if row)
+            updated += len(inserted) - sum(1 for row in inserted if row)
+        return created, updated
 
     async def run_full_extraction(
         self,
@@ -399,6 +495,10 @@ class KnowledgeExtractionService:
     ) -> KnowledgeExtractionJob:
         """Run full extraction for all documents in a workspace.
 
+        Documents whose content hash matches their last extraction are
+        skipped; the rest are extracted in batches with bounded LLM
+        concurrency.
+
         Args:
             workspace_id: Workspace ID to process.
             developer_id: Developer ID for usage tracking.
@@ -418,33 +518,46 @@ class KnowledgeExtractionService:
         await self.db.commit()
 
         try:
-            # Get all documents
-            stmt = select(Document).where(
+            if not self.gateway:
+                raise RuntimeError("LLM gateway not configured")
+
+            # Get all document IDs; content is loaded batch by batch
+            stmt = select(Document.id).where(
                 Document.workspace_id == workspace_id,
                 Document.is_template == False,
             )
-            result = await self.db.execute(stmt)
-            documents = result.scalars().all()
+            all_document_ids = [str(doc_id) for doc_id in (await self.db.scalars(stmt)).all()]
 
             total_entities = 0
             total_relationships = 0
             document_ids = []
 
-            # Extract entities from each document
-            for doc in documents:
-                try:
-                    entities = await self.extract_entities_from_document(
-                        document_id=str(doc.id),
-                        developer_id=developer_id,
-                    )
+            for start in range(0, len(all_document_ids), EXTRACTION_BATCH_SIZE):
+                batch_ids = all_document_ids[start:start + EXTRACTION_BATCH_SIZE]
+                documents = (
+                    await self.db.scalars(select(Document).where(Document.id.in_(batch_ids)))
+                ).all()
+
+                extracted, failed = await self._extract_documents(
+                    workspace_id,
+                    documents,
+                    developer_id=developer_id,
+                    skip_unchanged=True,
+                )
+                for doc_id, entities in extracted.items():
                     total_entities += len(entities)
-                    document_ids.append(str(doc.id))
+                    document_ids.append(doc_id)
                     job.documents_processed += 1
-                except Exception as e:
-                    logger.error(f"Failed to extract from document {doc.id}: {e}")
+                for doc_id, error in failed.items():
+                    logger.error(f"Failed to extract from document {doc_id}: {error}")
+
+            logger.info(
+                f"Extracted {len(document_ids)} of {len(all_document_ids)} documents "
+                f"in workspace {workspace_id}; the rest were unchanged or failed"
+            )
 
-            # Extract relationships between entities
             if document_ids:
+                # Extract relationships between entities
                 relationships = await self.extract_relationships(
                     workspace_id=workspace_id,
                     document_ids=document_ids,
@@ -452,9 +565,12 @@ class KnowledgeExtractionService:
                 )
                 total_relationships += len(relationships)
 
-            # Build document relationships
-            doc_relationships = await self.build_document_relationships(workspace_id)
-            total_relationships += len(doc_relationships)
+                # Build document relationships
+                doc_relationships = await self.build_document_relationships(workspace_id)
+                total_relationships += doc_relationships["created"] + doc_relationships["updated"]
+
+                # Precompute statistics for the graph view
+                await KnowledgeGraphService(self.db).refresh_graph_statistics(workspace_id)
 
             # Update job
             job.status = KnowledgeExtractionStatus.COMPLETED.value
@@ -500,23 +616,39 @@ class KnowledgeExtractionService:
         await self.db.commit()
 
         try:
-            # Clear existing mentions for this document
-            await self._clear_document_mentions(document_id)
-
-            # Extract entities
-            entities = await self.extract_entities_from_document(
-                document_id=document_id,
+            if not self.gateway:
+                raise RuntimeError("LLM gateway not configured")
+
+            document = (
+                await self.db.execute(select(Document).where(Document.id == document_id))
+            ).scalar_one_or_none()
+            if not document:
+                raise ValueError(f"Document {document_id} not found")
+
+            # Re-extract (replacing the document's mentions) unless unchanged
+            extracted, failed = await self._extract_documents(
+                workspace_id,
+                [document],
                 developer_id=developer_id,
+                skip_unchanged=True,
             )
-
-            # Rebuild document relationships
-            doc_relationships = await self.build_document_relationships(workspace_id)
+            if document_id in failed:
+                raise failed[document_id]
+
+            entities = extracted.get(document_id, [])
+            doc_relationships = {"created": 0, "updated": 0}
+            if document_id in extracted:
+                # Recompute only the relationships touching this document
+                doc_relationships = await self.build_document_relationships(
+                    workspace_id, document_id=document_id
+                )
+                await KnowledgeGraphService(self.db).refresh_graph_statistics(workspace_id)
 
             # Update job
             job.status = KnowledgeExtractionStatus.COMPLETED.value
             job.entities_found = len(entities)
-            job.relationships_found = len(doc_relationships)
-            job.documents_processed = 1
+            job.relationships_found = doc_relationships["created"] + doc_relationships["updated"]
+            job.documents_processed = len(extracted)
             job.completed_at = datetime.now(timezone.utc)
 
         except Exception as e:
@@ -528,25 +660,224 @@ class KnowledgeExtractionService:
         await self.db.commit()
         return job
 
-    async def _create_or_update_entity(
+    async def _extract_documents(
         self,
         workspace_id: str,
-        entity_data: dict[str, Any],
-    ) -> KnowledgeEntity | None:
-        """Create or update an entity in the database.
+        documents: list[Document],
+        developer_id: str | None = None,
+        skip_unchanged: bool = False,
+    ) -> tuple[dict[str, list[KnowledgeEntity]], dict[str, Exception]]:
+        """Extract entities from a batch of documents and store them.
+
+        LLM requests for all chunks of all documents run concurrently (up to
+        EXTRACTION_CONCURRENCY). Entities are then resolved with one lookup
+        and one bulk upsert, each extracted document's mentions are replaced
+        and its content hash is recorded, all in a single commit.
 
         Args:
-            workspace_id: Workspace ID.
-            entity_data: Extracted entity data from LLM.
+            workspace_id: Workspace the documents belong to.
+            documents: Documents to extract from.
+            developer_id: Developer ID for usage tracking.
+            skip_unchanged: Skip documents whose content hash is unchanged.
 
         Returns:
-            Created or updated entity.
+            Tuple of (entities per extracted document ID, error per failed
+            document ID). Skipped documents appear in neither.
+        """
+        hashes = {}
+        if skip_unchanged and documents:
+            hash_stmt = select(
+                KnowledgeDocumentExtraction.document_id,
+                KnowledgeDocumentExtraction.content_hash,
+            ).where(
+                KnowledgeDocumentExtraction.document_id.in_([str(d.id) for d in documents])
+            )
+            hashes = {str(doc_id): h for doc_id, h in (await self.db.execute(hash_stmt)).all()}
+
+        pending: list[tuple[Document, str, list[str]]] = []
+        for document in documents:
+            content_text = self._extract_text_from_tiptap(document.content)
+            content_hash = hashlib.sha256(
+                f"{document.title or ''}\n{content_text}".encode()
+            ).hexdigest()
+            if skip_unchanged and hashes.get(str(document.id)) == content_hash:
+                continue
+
+            if len(content_text.strip()) < MIN_EXTRACTION_CHARS:
+                logger.info(f"Document {document.id} has insufficient content for extraction")
+                chunks = []
+            else:
+                chunks = self._chunk_text(content_text)
+                if len(chunks) > EXTRACTION_MAX_CHUNKS:
+                    logger.warning(
+                        f"Document {document.id} has {len(chunks)} chunks, extracting only "
+                        f"the first {EXTRACTION_MAX_CHUNKS}"
+                    )
+                    chunks = chunks[:EXTRACTION_MAX_CHUNKS]
+            pending.append((document, content_hash, chunks))
+
+        if not pending:
+            return {}, {}
+
+        semaphore = asyncio.Semaphore(EXTRACTION_CONCURRENCY)
+
+        async def extract_chunk(document: Document, chunk: str):
+            async with semaphore:
+                return await self._extract_chunk_entities(document.title, chunk)
+
+        tasks = [
+            [asyncio.create_task(extract_chunk(document, chunk)) for chunk in chunks]
+            for document, _, chunks in pending
+        ]
+        await asyncio.gather(*(t for doc_tasks in tasks for t in doc_tasks), return_exceptions=True)
+
+        failed: dict[str, Exception] = {}
+        entities_by_doc: dict[str, dict[tuple[str, str], dict[str, Any]]] = {}
+        llm_results = []
+        for (document, _, _), doc_tasks in zip(pending, tasks):
+            doc_id = str(document.id)
+            errors = [t.exception() for t in doc_tasks if t.exception()]
+            if errors:
+                failed[doc_id] = errors[0]
+                continue
+
+            merged: dict[tuple[str, str], dict[str, Any]] = {}
+            for task in doc_tasks:
+                entities_data, llm_result = task.result()
+                llm_results.append(llm_result)
+                for entity_data in entities_data:
+                    self._merge_entity_data(merged, entity_data)
+            entities_by_doc[doc_id] = merged
+
+        # Usage is recorded here rather than by the gateway: the session
+        # cannot be shared by the concurrent requests above.
+        await self._record_llm_usage(llm_results, developer_id)
+
+        entities = await self._upsert_entities(workspace_id, entities_by_doc)
+
+        extracted_ids = list(entities_by_doc.keys())
+        await self._clear_document_mentions(extracted_ids)
+
+        extracted: dict[str, list[KnowledgeEntity]] = {}
+        mentions = []
+        for doc_id, merged in entities_by_doc.items():
+            extracted[doc_id] = []
+            for key, entity_data in merged.items():
+                entity = entities.get(key)
+                if not entity:
+                    continue
+                extracted[doc_id].append(entity)
+                mentions.append(
+                    KnowledgeEntityMention(
+                        entity_id=str(entity.id),
+                        document_id=doc_id,
+                        confidence_score=entity_data.get("confidence", 0.5),
+                    )
+                )
+        self.db.add_all(mentions)
+
+        hash_rows = [
+            {
+                "document_id": str(document.id),
+                "workspace_id": workspace_id,
+                "content_hash": content_hash,
+                "entities_found": len(extracted.get(str(document.id), [])),
+            }
+            for document, content_hash, _ in pending
+            if str(document.id) in extracted
+        ]
+        if hash_rows:
+            hash_stmt = pg_insert(KnowledgeDocumentExtraction).values(hash_rows)
+            hash_stmt = hash_stmt.on_conflict_do_update(
+                index_elements=[KnowledgeDocumentExtraction.document_id],
+                set_={
+                    "content_hash": hash_stmt.excluded.content_hash,
+                    "entities_found": hash_stmt.excluded.entities_found,
+                    "extracted_at": func.now(),
+                },
+            )
+            await self.db.execute(hash_stmt)
+
+        await bump_graph_version(self.db, workspace_id)
+        await self.db.commit()
+        return extracted, failed
+
+    async def _extract_chunk_entities(
+        self,
+        title: str | None,
+        content_text: str,
+    ) -> tuple[list[dict[str, Any]], Any]:
+        """Run LLM entity extraction on one chunk of document text.
+
+        Args:
+            title: Document title.
+            content_text: Chunk of plain document text.
+
+        Returns:
+            Tuple of (raw entity dicts, LLM analysis result).
+        """
+        formatted_prompt = ENTITY_EXTRACTION_PROMPT.format(
+            title=title or "Untitled",
+            content=content_text,
+        )
+        request = AnalysisRequest(
+            content=formatted_prompt,
+            analysis_type=AnalysisType.CODE,  # Using CODE as generic analysis type
+            context={
+                "system_prompt": ENTITY_EXTRACTION_SYSTEM_PROMPT,
+                "output_format": "json",
+            },
+        )
+
+        llm_result = await self.gateway.analyze(request, use_cache=True)
+        extracted_data = self._parse_json_response(llm_result.raw_response)
+        return extracted_data.get("entities", []), llm_result
+
+    async def _record_llm_usage(self, llm_results: list[Any], developer_id: str | None) -> None:
+        """Record billing usage for LLM results of a batch.
+
+        Args:
+            llm_results: Analysis results returned by the gateway.
+            developer_id: Developer ID for billing.
         """
-        name = entity_data.get("name", "").strip()
+        if not developer_id:
+            return
+
+        from aexy.services.usage_service import UsageService
+
+        usage_service = UsageService(self.db)
+        for llm_result in llm_results:
+            if not llm_result.input_tokens and not llm_result.output_tokens:
+                continue
+            try:
+                await usage_service.record_usage(
+                    developer_id=developer_id,
+                    provider=llm_result.provider,
+                    model=llm_result.model,
+                    input_tokens=llm_result.input_tokens,
+                    output_tokens=llm_result.output_tokens,
+                    analysis_type=f"analysis:{AnalysisType.CODE.value}",
+                )
+            except Exception as e:
+                # Log but don't fail the extraction if usage tracking fails
+                logger.warning(f"Failed to record usage: {e}")
+
+    def _merge_entity_data(
+        self,
+        merged: dict[tuple[str, str], dict[str, Any]],
+        entity_data: dict[str, Any],
+    ) -> None:
+        """Merge an extracted entity into a per-document map keyed by (normalized_name, type).
+
+        Args:
+            merged: Entities extracted so far for the document.
+            entity_data: Extracted entity data from LLM.
+        """
+        name = (entity_data.get("name") or "").strip()
         if not name:
-            return None
+            return
 
-        normalized_name = name.lower().strip()
+        normalized_name = name.lower()
         entity_type = entity_data.get("type", "concept")
 
         # Validate entity type
@@ -554,71 +885,124 @@ class KnowledgeExtractionService:
         if entity_type not in valid_types:
             entity_type = KnowledgeEntityType.CONCEPT.value
 
-        # Check for existing entity
-        stmt = select(KnowledgeEntity).where(
-            KnowledgeEntity.workspace_id == workspace_id,
-            KnowledgeEntity.normalized_name == normalized_name,
-            KnowledgeEntity.entity_type == entity_type,
-        )
-        result = await self.db.execute(stmt)
-        existing = result.scalar_one_or_none()
-
-        if existing:
-            # Update existing entity
-            existing.occurrence_count += 1
-            existing.last_seen_at = datetime.now(timezone.utc)
-            # Merge aliases
-            new_aliases = entity_data.get("aliases", [])
-            existing_aliases = set(existing.aliases or [])
-            for alias in new_aliases:
-                if alias and alias.lower() != normalized_name:
-                    existing_aliases.add(alias)
-            existing.aliases = list(existing_aliases)
-            # Update confidence if higher
-            new_confidence = entity_data.get("confidence", 0.5)
-            if new_confidence > existing.confidence_score:
-                existing.confidence_score = new_confidence
-            return existing
-        else:
-            # Create new entity
-            entity = KnowledgeEntity(
-                workspace_id=workspace_id,
-                name=name,
-                normalized_name=normalized_name,
-                entity_type=entity_type,
-                description=entity_data.get("description"),
-                aliases=entity_data.get("aliases", []),
-                confidence_score=entity_data.get("confidence", 0.5),
-            )
-            self.db.add(entity)
-            return entity
-
-    async def _create_entity_mention(
+        aliases = [a for a in entity_data.get("aliases") or [] if a and a.lower() != normalized_name]
+        confidence = entity_data.get("confidence", 0.5)
+
+        key = (normalized_name, entity_type)
+        existing = merged.get(key)
+        if existing is None:
+            merged[key] = {
+                "name": name,
+                "description": entity_data.get("description"),
+                "aliases": aliases,
+                "confidence": confidence,
+            }
+            return
+
+        existing["aliases"] = list(dict.fromkeys(existing["aliases"] + aliases))
+        existing["confidence"] = max(existing["confidence"], confidence)
+        if not existing["description"]:
+            existing["description"] = entity_data.get("description")
+
+    async def _upsert_entities(
         self,
-        entity_id: str,
-        document_id: str,
-        confidence_score: float = 0.5,
-        context_text: str | None = None,
-    ) -> KnowledgeEntityMention:
-        """Create a mention linking an entity to a document.
+        workspace_id: str,
+        entities_by_doc: dict[str, dict[tuple[str, str], dict[str, Any]]],
+    ) -> dict[tuple[str, str], KnowledgeEntity]:
+        """Create or update all entities of a batch of documents.
+
+        Existing entities are looked up once on (workspace, normalized_name,
+        entity_type) to merge aliases, then everything is written with a
+        single INSERT ... ON CONFLICT on the same unique key.
 
         Args:
-            entity_id: Entity ID.
-            document_id: Document ID.
-            confidence_score: Confidence of the mention.
-            context_text: Optional context around the mention.
+            workspace_id: Workspace ID.
+            entities_by_doc: Merged entity data per document.
 
         Returns:
-            Created mention.
+            Entities keyed by (normalized_name, entity_type).
         """
-        mention = KnowledgeEntityMention(
-            entity_id=entity_id,
-            document_id=document_id,
-            confidence_score=confidence_score,
-            context_text=context_text,
+        combined: dict[tuple[str, str], dict[str, Any]] = {}
+        for merged in entities_by_doc.values():
+            for key, entity_data in merged.items():
+                current = combined.get(key)
+                if current is None:
+                    combined[key] = {**entity_data, "occurrences": 1}
+                    continue
+                current["aliases"] = list(dict.fromkeys(current["aliases"] + entity_data["aliases"]))
+                current["confidence"] = max(current["confidence"], entity_data["confidence"])
+                current["description"] = current["description"] or entity_data["description"]
+                current["occurrences"] += 1
+
+        if not combined:
+            return {}
+
+        existing_stmt = select(
+            KnowledgeEntity.normalized_name,
+            KnowledgeEntity.entity_type,
+            KnowledgeEntity.aliases,
+        ).where(
+            KnowledgeEntity.workspace_id == workspace_id,
+            tuple_(KnowledgeEntity.normalized_name, KnowledgeEntity.entity_type).in_(
+                list(combined.keys())
+            ),
         )
-        self.db.add(mention)
-        return mention
+        existing_aliases = {
+            (normalized_name, entity_type): aliases or []
+            for normalized_name, entity_type, aliases in (await self.db.execute(existing_stmt)).all()
+        }
+
+        rows = [
+            {
+                "id": str(uuid4()),
+                "workspace_id": workspace_id,
+                "name": entity_data["name"],
+                "normalized_name": normalized_name,
+                "entity_type": entity_type,
+                "description": entity_data["description"],
+                "aliases": list(dict.fromkeys(
+                    existing_aliases.get((normalized_name, entity_type), []) + entity_data["aliases"]
+                )),
+                "confidence_score": entity_data["confidence"],
+                "occurrence_count": entity_data["occurrences"],
+            }
+            for (normalized_name, entity_type), entity_data in combined.items()
+        ]
+
+        entities: dict[tuple[str, str], KnowledgeEntity] = {}
+        for start in range(0, len(rows), ENTITY_UPSERT_BATCH_SIZE):
+            stmt = pg_insert(KnowledgeEntity).values(
+                rows[start:start + ENTITY_UPSERT_BATCH_SIZE]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[
+                    KnowledgeEntity.workspace_id,
+                    KnowledgeEntity.normalized_name,
+                    KnowledgeEntity.entity_type,
+                ],
+                set_={
+                    "occurrence_count": KnowledgeEntity.occurrence_count + stmt.excluded.occurrence_count,
+                    "aliases": stmt.excluded.aliases,
+                    "confidence_score": func.greatest(
+                        KnowledgeEntity.confidence_score, stmt.excluded.confidence_score
+                    ),
+                    "description": func.coalesce(
+                        KnowledgeEntity.description, stmt.excluded.description
+                    ),
+                    "last_seen_at": func.now(),
+                    "updated_at": func.now(),
+                },
+            ).returning(KnowledgeEntity)
+            result = await self.db.scalars(
+                select(KnowledgeEntity)
+                .from_statement(stmt)
+                .options(lazyload("*"))
+                .execution_options(populate_existing=True)
+            )
+            for entity in result.all():
+                entities[(entity.normalized_name, entity.entity_type)] = entity
+
+        return entities
 
     async def _create_relationship(
         self,
@@ -681,18 +1065,57 @@ class KnowledgeExtractionService:
             self.db.add(relationship)
             return relationship
 
-    async def _clear_document_mentions(self, document_id: str) -> None:
-        """Clear all entity mentions for a document.
+    async def _clear_document_mentions(self, document_ids: list[str]) -> None:
+        """Clear all entity mentions for a set of documents.
 
         Args:
-            document_id: Document ID to clear.
+            document_ids: Document IDs to clear.
         """
-        from sqlalchemy import delete
+        if not document_ids:
+            return
+
         stmt = delete(KnowledgeEntityMention).where(
-            KnowledgeEntityMention.document_id == document_id
+            KnowledgeEntityMention.document_id.in_(document_ids)
         )
         await self.db.execute(stmt)
 
+    def _chunk_text(self, content_text: str) -> list[str]:
+        """Split document text into LLM-sized chunks.
+
+        Chunks end on line boundaries. Lines longer than a chunk are split at
+        the last whitespace that fits, and only hard-split when a single word
+        exceeds the chunk size.
+
+        Args:
+            content_text: Plain document text.
+
+        Returns:
+            Chunks of up to EXTRACTION_CHUNK_CHARS.
+        """
+        chunks: list[str] = []
+        current = ""
+        for line in content_text.splitlines(keepends=True):
+            while len(line) > EXTRACTION_CHUNK_CHARS:
+                if current:
+                    chunks.append(current)
+                    current = ""
+                cut = max(
+                    line.rfind(" ", 0, EXTRACTION_CHUNK_CHARS),
+                    line.rfind("\t", 0, EXTRACTION_CHUNK_CHARS),
+                ) + 1
+                if cut <= 0:
+                    cut = EXTRACTION_CHUNK_CHARS
+                chunks.append(line[:cut])
+                line = line[cut:]
+            if len(current) + len(line) > EXTRACTION_CHUNK_CHARS:
+                chunks.append(current)
+                current = ""
+            current += line
+        if current.strip():
+            chunks.append(current)
+
+        return chunks
+
     def _extract_text_from_tiptap(self, content: dict | None) -> str:
         """Extract plain text from TipTap JSON content.
 
@@ -0,0 +1,321 @@
+"""In-memory adjacency snapshots of workspace knowledge graphs."""
+
+import logging
+from array import array
+from collections import OrderedDict
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import func
+
+from aexy.models.knowledge_graph import KnowledgeGraphSummary, KnowledgeRelationship
+
+logger = logging.getLogger(__name__)
+
+# Number of workspace snapshots kept per process
+MAX_CACHED_SNAPSHOTS = 32
+
+
+class GraphAdjacency:
+    """Compressed sparse row (CSR) adjacency of a workspace's entity graph.
+
+    Every relationship is stored in both endpoints' rows so traversal is
+    undirected; ``edge_outgoing`` keeps the original direction. Entity IDs
+    are mapped to dense integer indices and relationship types to small
+    integer codes, so the arrays stay compact for large graphs.
+    """
+
+    def __init__(
+        self,
+        version: int,
+        node_ids: list[str],
+        offsets: array,
+        neighbors: array,
+        edge_types: array,
+        edge_strengths: array,
+        edge_outgoing: array,
+        relationship_types: list[str],
+    ):
+        self.version = version
+        self.node_ids = node_ids
+        self.node_index = {node_id: i for i, node_id in enumerate(node_ids)}
+        self.offsets = offsets
+        self.neighbors = neighbors
+        self.edge_types = edge_types
+        self.edge_strengths = edge_strengths
+        self.edge_outgoing = edge_outgoing
+        self.relationship_types = relationship_types
+
+    @classmethod
+    def from_edges(
+        cls,
+        version: int,
+        edges: Iterable[tuple[str, str, str, float]],
+    ) -> "GraphAdjacency":
+        """Build a snapshot from (source, target, relationship_type, strength) rows."""
+        node_index: dict[str, int] = {}
+        type_index: dict[str, int] = {}
+        sources = array("i")
+        targets = array("i")
+        types = array("H")
+        strengths = array("d")
+
+        for source_id, target_id, rel_type, strength in edges:
+            sources.append(node_index.setdefault(str(source_id), len(node_index)))
+            targets.append(node_index.setdefault(str(target_id), len(node_index)))
+            types.append(type_index.setdefault(rel_type, len(type_index)))
+            strengths.append(strength or 0.0)
+
+        node_count = len(node_index)
+        degrees = [0] * node_count
+        for i in range(len(sources)):
+            degrees[sources[i]] += 1
+            degrees[targets[i]] += 1
+
+        offsets = array("i", [0]) * (node_count + 1)
+        for i, degree in enumerate(degrees):
+            offsets[i + 1] = offsets[i] + degree
+
+        slot_count = offsets[node_count]
+        neighbors = array("i", [0]) * slot_count
+        edge_types = array("H", [0]) * slot_count
+        edge_strengths = array("d", [0.0]) * slot_count
+        edge_outgoing = array("b", [0]) * slot_count
+
+        cursor = array("i", offsets[:node_count])
+        for i in range(len(sources)):
+            for node, other, outgoing in ((sources[i], targets[i], 1), (targets[i], sources[i], 0)):
+                slot = cursor[node]
+                cursor[node] += 1
+                neighbors[slot] = other
+                edge_types[slot] = types[i]
+                edge_strengths[slot] = strengths[i]
+                edge_outgoing[slot] = outgoing
+
+        node_ids = [""] * node_count
+        for node_id, i in node_index.items():
+            node_ids[i] = node_id
+        relationship_types = [""] * len(type_index)
+        for rel_type, i in type_index.items():
+            relationship_types[i] = rel_type
+
+        return cls(
+            version=version,
+            node_ids=node_ids,
+            offsets=offsets,
+            neighbors=neighbors,
+            edge_types=edge_types,
+            edge_strengths=edge_strengths,
+            edge_outgoing=edge_outgoing,
+            relationship_types=relationship_types,
+        )
+
+    def degree(self, node_id: str) -> int:
+        """Number of relationships touching a node."""
+        i = self.node_index.get(node_id)
+        if i is None:
+            return 0
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def most_connected(self, limit: int = 10) -> list[tuple[str, int]]:
+        """Nodes with the highest degree centrality, as (node_id, degree)."""
+        ranked = sorted(
+            range(len(self.node_ids)),
+            key=lambda i: self.offsets[i + 1] - self.offsets[i],
+            reverse=True,
+        )[:limit]
+        return [(self.node_ids[i], self.offsets[i + 1] - self.offsets[i]) for i in ranked]
+
+    def neighborhood(
+        self,
+        node_id: str,
+        depth: int = 1,
+    ) -> tuple[list[str], list[tuple[str, str, str, float]]]:
+        """Collect the k-hop neighborhood of a node.
+
+        Args:
+            node_id: Starting node.
+            depth: Number of hops to include.
+
+        Returns:
+            Node IDs in BFS order and the distinct (source, target,
+            relationship_type, strength) edges expanded from nodes closer
+            than ``depth``.
+        """
+        start = self.node_index.get(node_id)
+        if start is None:
+            return [node_id], []
+
+        distance = {start: 0}
+        order = [start]
+        edges: dict[tuple[int, int, int], float] = {}
+        frontier = [start]
+
+        for hop in range(depth):
+            next_frontier = []
+            for node in frontier:
+                for slot in range(self.offsets[node], self.offsets[node + 1]):
+                    other = self.neighbors[slot]
+                    if self.edge_outgoing[slot]:
+                        key = (node, other, self.edge_types[slot])
+                    else:
+                        key = (other, node, self.edge_types[slot])
+                    edges.setdefault(key, self.edge_strengths[slot])
+                    if other not in distance:
+                        distance[other] = hop + 1
+                        order.append(other)
+                        next_frontier.append(other)
+            frontier = next_frontier
+
+        return (
+            [self.node_ids[i] for i in order],
+            [
+                (self.node_ids[s], self.node_ids[t], self.relationship_types[r], strength)
+                for (s, t, r), strength in edges.items()
+            ],
+        )
+
+    def shortest_path(
+        self,
+        source_id: str,
+        target_id: str,
+        max_hops: int,
+    ) -> list[tuple[str, str | None]] | None:
+        """Find a shortest undirected path with a bidirectional BFS.
+
+        Args:
+            source_id: Start node.
+            target_id: End node.
+            max_hops: Maximum number of relationships on the path.
+
+        Returns:
+            (node_id, relationship_type_from_previous) pairs from source to
+            target, or None if no path within ``max_hops`` exists.
+        """
+        if source_id == target_id:
+            return [(source_id, None)]
+
+        source = self.node_index.get(source_id)
+        target = self.node_index.get(target_id)
+        if source is None or target is None or max_hops < 1:
+            return None
+
+        # node -> (previous node towards the search origin, slot of the edge)
+        forward: dict[int, tuple[int, int] | None] = {source: None}
+        backward: dict[int, tuple[int, int] | None] = {target: None}
+        forward_frontier, backward_frontier = [source], [target]
+        forward_depth = backward_depth = 0
+        meeting: int | None = None
+
+        while forward_frontier and backward_frontier:
+            if forward_depth + backward_depth >= max_hops:
+                return None
+
+            # Expand the smaller side one full level
+            expand_forward = len(forward_frontier) <= len(backward_frontier)
+            visited, other_visited = (forward, backward) if expand_forward else (backward, forward)
+            frontier = forward_frontier if expand_forward else backward_frontier
+
+            next_frontier = []
+            for node in frontier:
+                for slot in range(self.offsets[node], self.offsets[node + 1]):
+                    neighbor = self.neighbors[slot]
+                    if neighbor in visited:
+                        continue
+                    visited[neighbor] = (node, slot)
+                    next_frontier.append(neighbor)
+                    if meeting is None and neighbor in other_visited:
+                        meeting = neighbor
+
+            if expand_forward:
+                forward_frontier, forward_depth = next_frontier, forward_depth + 1
+            else:
+                backward_frontier, backward_depth = next_frontier, backward_depth + 1
+
+            if meeting is not None:
+                break
+
+        if meeting is None:
+            return None
+
+        # Walk back to the source, then forward to the target
+        path: list[tuple[str, str | None]] = []
+        node = meeting
+        while forward[node] is not None:
+            previous, slot = forward[node]
+            path.append((self.node_ids[node], self.relationship_types[self.edge_types[slot]]))
+            node = previous
+        path.append((self.node_ids[source], None))
+        path.reverse()
+
+        node = meeting
+        while backward[node] is not None:
+            following, slot = backward[node]
+            path.append((self.node_ids[following], self.relationship_types[self.edge_types[slot]]))
+            node = following
+
+        return path
+
+
+_snapshots: "OrderedDict[str, GraphAdjacency]" = OrderedDict()
+
+
+async def get_graph_version(db: AsyncSession, workspace_id: str) -> int:
+    """Get the current knowledge graph version of a workspace."""
+    result = await db.execute(
+        select(KnowledgeGraphSummary.graph_version).where(
+            KnowledgeGraphSummary.workspace_id == workspace_id
+        )
+    )
+    return result.scalar_one_or_none() or 0
+
+
+async def bump_graph_version(db: AsyncSession, workspace_id: str) -> None:
+    """Increment a workspace's graph version in the caller's transaction."""
+    stmt = pg_insert(KnowledgeGraphSummary).values(workspace_id=workspace_id, graph_version=1)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[KnowledgeGraphSummary.workspace_id],
+        set_={
+            "graph_version": KnowledgeGraphSummary.graph_version + 1,
+            "updated_at": func.now(),
+        },
+    )
+    await db.execute(stmt)
+
+
+async def get_graph_adjacency(db: AsyncSession, workspace_id: str) -> GraphAdjacency:
+    """Get the adjacency snapshot of a workspace, rebuilding it when stale.
+
+    The version is read before the relationships, so a snapshot can only be
+    newer than its stamp, never older; a concurrent extraction just causes
+    one extra rebuild.
+    """
+    version = await get_graph_version(db, workspace_id)
+
+    snapshot = _snapshots.get(workspace_id)
+    if snapshot is not None and snapshot.version == version:
+        _snapshots.move_to_end(workspace_id)
+        return snapshot
+
+    result = await db.execute(
+        select(
+            KnowledgeRelationship.source_entity_id,
+            KnowledgeRelationship.target_entity_id,
+            KnowledgeRelationship.relationship_type,
+            KnowledgeRelationship.strength,
+        ).where(KnowledgeRelationship.workspace_id == workspace_id)
+    )
+    snapshot = GraphAdjacency.from_edges(version, result.all())
+
+    _snapshots[workspace_id] = snapshot
+    _snapshots.move_to_end(workspace_id)
+    while len(_snapshots) > MAX_CACHED_SNAPSHOTS:
+        _snapshots.popitem(last=False)
+
+    logger.debug(
+        f"Built knowledge graph snapshot for workspace {workspace_id} "
+        f"(version {version}, {len(snapshot.node_ids)} nodes)"
+    )
+    return snapshot
@@ -1,14 +1,17 @@
 """Service for querying and analyzing the knowledge graph."""
 
+import json
 import logging
-from collections import deque
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, cast, func, or_, select
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import lazyload, selectinload
 
+from aexy.cache import get_knowledge_graph_cache
 from aexy.models.documentation import Document
 from aexy.models.knowledge_graph import (
     KnowledgeDocumentRelationship,
@@ -16,12 +19,17 @@ from aexy.models.knowledge_graph import (
     KnowledgeEntityMention,
     KnowledgeEntityType,
     KnowledgeExtractionJob,
+    KnowledgeGraphSummary,
     KnowledgeRelationship,
     KnowledgeRelationType,
 )
+from aexy.services.knowledge_graph_index import get_graph_adjacency, get_graph_version
 
 logger = logging.getLogger(__name__)
 
+# Text search configuration used by the search_vector columns
+SEARCH_CONFIG = "english"
+
 
 class GraphFilters:
     """Filters for graph queries."""
@@ -48,6 +56,23 @@ class GraphFilters:
         self.include_entities = include_entities
         self.max_nodes = max_nodes
 
+    def cache_key(self) -> str:
+        """Canonical representation of the filter set for payload caching."""
+        return json.dumps(
+            {
+                "entity_types": sorted(self.entity_types or []),
+                "relationship_types": sorted(self.relationship_types or []),
+                "space_ids": sorted(self.space_ids or []),
+                "date_from": self.date_from.isoformat() if self.date_from else None,
+                "date_to": self.date_to.isoformat() if self.date_to else None,
+                "min_confidence": self.min_confidence,
+                "include_documents": self.include_documents,
+                "include_entities": self.include_entities,
+                "max_nodes": self.max_nodes,
+            },
+            sort_keys=True,
+        )
+
 
 class GraphNode:
     """Represents a node in the knowledge graph."""
@@ -153,6 +178,69 @@ class GraphData:
             "temporal": self.temporal,
         }
 
+    def to_compact_dict(self) -> dict[str, Any]:
+        """Columnar representation for large graphs.
+
+        Node fields are parallel arrays, edges reference nodes by index and
+        relationship types by index into ``relationship_types``.
+
+        Raises:
+            ValueError: If an edge references a node that is not in the graph.
+        """
+        node_index = {n.id: i for i, n in enumerate(self.nodes)}
+        relationship_types: dict[str, int] = {}
+        edges = self.edges
+        dangling = [e for e in edges if e.source not in node_index or e.target not in node_index]
+        if dangling:
+            raise ValueError(
+                f"{len(dangling)} edges reference nodes missing from the graph, "
+                f"e.g. {dangling[0].source} -> {dangling[0].target}"
+            )
+
+        return {
+            "node_ids": [n.id for n in self.nodes],
+            "node_labels": [n.label for n in self.nodes],
+            "node_types": [n.node_type for n in self.nodes],
+            "node_metadata": [n.metadata for n in self.nodes],
+            "edge_sources": [node_index[e.source] for e in edges],
+            "edge_targets": [node_index[e.target] for e in edges],
+            "edge_types": [
+                relationship_types.setdefault(e.relationship_type, len(relationship_types))
+                for e in edges
+            ],
+            "edge_strengths": [e.strength for e in edges],
+            "relationship_types": list(relationship_types),
+            "statistics": self.statistics.to_dict(),
+            "temporal": self.temporal,
+        }
+
+    @classmethod
+    def from_compact_dict(cls, data: dict[str, Any]) -> "GraphData":
+        """Rebuild graph data from its compact representation."""
+        node_ids = data["node_ids"]
+        relationship_types = data["relationship_types"]
+        return cls(
+            nodes=[
+                GraphNode(id=node_id, label=label, node_type=node_type, metadata=metadata)
+                for node_id, label, node_type, metadata in zip(
+                    node_ids, data["node_labels"], data["node_types"], data["node_metadata"]
+                )
+            ],
+            edges=[
+                GraphEdge(
+                    source=node_ids[source],
+                    target=node_ids[target],
+                    relationship_type=relationship_types[rel_type],
+                    strength=strength,
+                )
+                for source, target, rel_type, strength in zip(
+                    data["edge_sources"], data["edge_targets"], data["edge_types"], data["edge_strengths"]
+                )
+            ],
+            statistics=GraphStatistics(**data["statistics"]),
+            temporal=data["temporal"],
+        )
+
 
 class KnowledgeGraphService:
     """Service for querying the knowledge graph."""
@@ -182,6 +270,36 @@ class KnowledgeGraphService:
         if filters is None:
             filters = GraphFilters()
 
+        # Payloads are cached per graph version, so extraction invalidates them,
+        # and per cache generation, which document edits bump
+        cache = get_knowledge_graph_cache()
+        version = await get_graph_version(self.db, workspace_id)
+        generation = 0
+        if cache:
+            generation = await cache.generation(workspace_id)
+            cached = await cache.get(workspace_id, version, generation, filters.cache_key())
+            if cached:
+                return GraphData.from_compact_dict(cached)
+
+        graph_data = await self._build_graph_data(workspace_id, filters)
+
+        if cache:
+            await cache.set(
+                workspace_id,
+                version,
+                generation,
+                filters.cache_key(),
+                graph_data.to_compact_dict(),
+            )
+
+        return graph_data
+
+    async def _build_graph_data(
+        self,
+        workspace_id: str,
+        filters: GraphFilters,
+    ) -> GraphData:
+        """Build graph data from the database."""
         nodes: list[GraphNode] = []
         edges: list[GraphEdge] = []
         node_ids: set[str] = set()
@@ -258,72 +376,37 @@ class KnowledgeGraphService:
         Returns:
             Graph data for the neighborhood.
         """
-        nodes: list[GraphNode] = []
-        edges: list[GraphEdge] = []
-        visited_ids: set[str] = set()
-        to_visit: deque[tuple[str, int]] = deque([(entity_id, 0)])
-
-        while to_visit:
-            current_id, current_depth = to_visit.popleft()
-
-            if current_id in visited_ids:
-                continue
-            visited_ids.add(current_id)
-
-            # Get entity node
-            stmt = select(KnowledgeEntity).where(
-                KnowledgeEntity.workspace_id == workspace_id,
-                KnowledgeEntity.id == current_id,
+        adjacency = await get_graph_adjacency(self.db, workspace_id)
+        node_ids, neighborhood_edges = adjacency.neighborhood(entity_id, depth=depth)
+
+        entities = await self._get_entities_by_id(workspace_id, node_ids)
+        if entity_id not in entities:
+            return GraphData()
+
+        nodes = [
+            GraphNode(
+                id=str(entity.id),
+                label=entity.name,
+                node_type=entity.entity_type,
+                metadata={
+                    "description": entity.description,
+                    "confidence_score": entity.confidence_score,
+                    "occurrence_count": entity.occurrence_count,
+                    "aliases": entity.aliases,
+                },
+            )
+            for entity in (entities.get(node_id) for node_id in node_ids)
+            if entity
+        ]
+        edges = [
+            GraphEdge(
+                source=source,
+                target=target,
+                relationship_type=rel_type,
+                strength=strength,
             )
-            result = await self.db.execute(stmt)
-            entity = result.scalar_one_or_none()
-
-            if entity:
-                nodes.append(GraphNode(
-                    id=str(entity.id),
-                    label=entity.name,
-                    node_type=entity.entity_type,
-                    metadata={
-                        "description": entity.description,
-                        "confidence_score": entity.confidence_score,
-                        "occurrence_count": entity.occurrence_count,
-                        "aliases": entity.aliases,
-                    },
-                ))
-
-                # Get relationships for this entity if not at max depth
-                if current_depth < depth:
-                    # Get outgoing relationships
-                    out_stmt = select(KnowledgeRelationship).where(
-                        KnowledgeRelationship.workspace_id == workspace_id,
-                        KnowledgeRelationship.source_entity_id == current_id,
-                    )
-                    out_result = await self.db.execute(out_stmt)
-                    for rel in out_result.scalars().all():
-                        edges.append(GraphEdge(
-                            source=str(rel.source_entity_id),
-                            target=str(rel.target_entity_id),
-                            relationship_type=rel.relationship_type,
-                            strength=rel.strength,
-                        ))
-                        if rel.target_entity_id not in visited_ids:
-                            to_visit.append((str(rel.target_entity_id), current_depth + 1))
-
-                    # Get incoming relationships
-                    in_stmt = select(KnowledgeRelationship).where(
-                        KnowledgeRelationship.workspace_id == workspace_id,
-                        KnowledgeRelationship.target_entity_id == current_id,
-                    )
-                    in_result = await self.db.execute(in_stmt)
-                    for rel in in_result.scalars().all():
-                        edges.append(GraphEdge(
-                            source=str(rel.source_entity_id),
-                            target=str(rel.target_entity_id),
-                            relationship_type=rel.relationship_type,
-                            strength=rel.strength,
-                        ))
-                        if rel.source_entity_id not in visited_ids:
-                            to_visit.append((str(rel.source_entity_id), current_depth + 1))
+            for source, target, rel_type, strength in neighborhood_edges
+        ]
 
         return GraphData(nodes=nodes, edges=edges)
 
@@ -433,60 +516,25 @@ class KnowledgeGraphService:
         Returns:
             List of path nodes with relationships.
         """
-        # BFS to find shortest path
-        visited: set[str] = {source_id}
-        queue: deque[list[tuple[str, str | None, str | None]]] = deque()
-        queue.append([(source_id, None, None)])  # (node_id, rel_type, from_node)
-
-        while queue:
-            path = queue.popleft()
-            current_id, _, _ = path[-1]
-
-            if len(path) > max_depth:
-                continue
-
-            if current_id == target_id:
-                # Found path, build result
-                result = []
-                for i, (node_id, rel_type, from_node) in enumerate(path):
-                    # Get node details
-                    entity_stmt = select(KnowledgeEntity).where(
-                        KnowledgeEntity.id == node_id
-                    )
-                    entity_result = await self.db.execute(entity_stmt)
-                    entity = entity_result.scalar_one_or_none()
-
-                    if entity:
-                        result.append({
-                            "id": str(entity.id),
-                            "label": entity.name,
-                            "type": entity.entity_type,
-                            "relationship_from_previous": rel_type,
-                        })
-                return result
-
-            # Get neighbors
-            rel_stmt = select(KnowledgeRelationship).where(
-                KnowledgeRelationship.workspace_id == workspace_id,
-                or_(
-                    KnowledgeRelationship.source_entity_id == current_id,
-                    KnowledgeRelationship.target_entity_id == current_id,
-                )
-            )
-            rel_result = await self.db.execute(rel_stmt)
-            for rel in rel_result.scalars().all():
-                # Determine neighbor
-                if str(rel.source_entity_id) == current_id:
-                    neighbor_id = str(rel.target_entity_id)
-                else:
-                    neighbor_id = str(rel.source_entity_id)
-
-                if neighbor_id not in visited:
-                    visited.add(neighbor_id)
-                    new_path = path + [(neighbor_id, rel.relationship_type, current_id)]
-                    queue.append(new_path)
+        # A path may contain at most max_depth nodes
+        adjacency = await get_graph_adjacency(self.db, workspace_id)
+        path = adjacency.shortest_path(source_id, target_id, max_hops=max_depth - 1)
+        if not path:
+            return []
 
-        return []  # No path found
+        entities = await self._get_entities_by_id(
+            workspace_id, [node_id for node_id, _ in path]
+        )
+        return [
+            {
+                "id": str(entities[node_id].id),
+                "label": entities[node_id].name,
+                "type": entities[node_id].entity_type,
+                "relationship_from_previous": rel_type,
+            }
+            for node_id, rel_type in path
+            if node_id in entities
+        ]
 
     async def search_entities(
         self,
@@ -506,19 +554,35 @@ class KnowledgeGraphService:
         Returns:
             List of matching entities.
         """
-        stmt = select(KnowledgeEntity).where(
-            KnowledgeEntity.workspace_id == workspace_id,
-            or_(
-                KnowledgeEntity.name.ilike(f"%{query}%"),
-                KnowledgeEntity.normalized_name.ilike(f"%{query}%"),
-                KnowledgeEntity.description.ilike(f"%{query}%"),
-            )
+        stmt = (
+            select(KnowledgeEntity)
+            .where(KnowledgeEntity.workspace_id == workspace_id)
+            .options(lazyload("*"))
         )
 
         if entity_type:
             stmt = stmt.where(KnowledgeEntity.entity_type == entity_type)
 
-        stmt = stmt.order_by(KnowledgeEntity.occurrence_count.desc()).limit(limit)
+        normalized_query = query.strip().lower()
+        if normalized_query:
+            # Full-text match on name/description, trigram match for typos
+            # and partial names; both are served by GIN indexes
+            tsquery = func.websearch_to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), query)
+            similarity = func.similarity(KnowledgeEntity.normalized_name, normalized_query)
+            stmt = stmt.where(
+                or_(
+                    KnowledgeEntity.search_vector.bool_op("@@")(tsquery),
+                    KnowledgeEntity.normalized_name.bool_op("%")(normalized_query),
+                    KnowledgeEntity.normalized_name.ilike(f"%{normalized_query}%"),
+                )
+            ).order_by(
+                func.greatest(func.ts_rank_cd(KnowledgeEntity.search_vector, tsquery), similarity).desc(),
+                KnowledgeEntity.occurrence_count.desc(),
+            )
+        else:
+            stmt = stmt.order_by(KnowledgeEntity.occurrence_count.desc())
+
+        stmt = stmt.limit(limit)
 
         result = await self.db.execute(stmt)
         entities = result.scalars().all()
@@ -542,12 +606,69 @@ class KnowledgeGraphService:
     ) -> GraphStatistics:
         """Get statistics about the knowledge graph.
 
+        Served from the workspace summary row. If the graph changed since they
+        were stored, they are recomputed without writing; the extraction and
+        cleanup paths store fresh statistics with ``refresh_graph_statistics``.
+
         Args:
             workspace_id: Workspace ID.
 
         Returns:
             Graph statistics.
         """
+        result = await self.db.execute(
+            select(
+                KnowledgeGraphSummary.graph_version,
+                KnowledgeGraphSummary.statistics,
+                KnowledgeGraphSummary.statistics_version,
+            ).where(KnowledgeGraphSummary.workspace_id == workspace_id)
+        )
+        summary = result.one_or_none()
+        if summary and summary.statistics is not None and summary.statistics_version == summary.graph_version:
+            return GraphStatistics(**summary.statistics)
+
+        return await self._compute_graph_statistics(workspace_id)
+
+    async def refresh_graph_statistics(
+        self,
+        workspace_id: str,
+    ) -> GraphStatistics:
+        """Recompute graph statistics and store them in the summary row.
+
+        The caller commits, together with the graph changes the statistics
+        describe.
+
+        Args:
+            workspace_id: Workspace ID.
+
+        Returns:
+            Fresh graph statistics.
+        """
+        version = await get_graph_version(self.db, workspace_id)
+        statistics = await self._compute_graph_statistics(workspace_id)
+
+        stmt = pg_insert(KnowledgeGraphSummary).values(
+            workspace_id=workspace_id,
+            graph_version=version,
+            statistics=statistics.to_dict(),
+            statistics_version=version,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[KnowledgeGraphSummary.workspace_id],
+            set_={
+                "statistics": stmt.excluded.statistics,
+                "statistics_version": stmt.excluded.statistics_version,
+            },
+        )
+        await self.db.execute(stmt)
+
+        return statistics
+
+    async def _compute_graph_statistics(
+        self,
+        workspace_id: str,
+    ) -> GraphStatistics:
+        """Compute graph statistics with aggregate queries."""
         # Count entities by type
         entity_type_stmt = select(
             KnowledgeEntity.entity_type,
@@ -597,37 +718,21 @@ class KnowledgeGraphService:
         if total_entities > 0:
             avg_connections = (total_relationships * 2) / total_entities
 
-        # Get most connected entities
-        most_connected_stmt = select(
-            KnowledgeEntity.id,
-            KnowledgeEntity.name,
-            KnowledgeEntity.entity_type,
-            func.count(KnowledgeRelationship.id).label("connection_count")
-        ).outerjoin(
-            KnowledgeRelationship,
-            or_(
-                KnowledgeEntity.id == KnowledgeRelationship.source_entity_id,
-                KnowledgeEntity.id == KnowledgeRelationship.target_entity_id,
-            )
-        ).where(
-            KnowledgeEntity.workspace_id == workspace_id
-        ).group_by(
-            KnowledgeEntity.id,
-            KnowledgeEntity.name,
-            KnowledgeEntity.entity_type,
-        ).order_by(
-            func.count(KnowledgeRelationship.id).desc()
-        ).limit(10)
-
-        most_connected_result = await self.db.execute(most_connected_stmt)
+        # Get most connected entities (degree centrality from the snapshot)
+        adjacency = await get_graph_adjacency(self.db, workspace_id)
+        most_connected = adjacency.most_connected(limit=10)
+        entities = await self._get_entities_by_id(
+            workspace_id, [entity_id for entity_id, _ in most_connected]
+        )
         most_connected_entities = [
             {
-                "id": str(row[0]),
-                "name": row[1],
-                "type": row[2],
-                "connection_count": row[3],
+                "id": entity_id,
+                "name": entities[entity_id].name,
+                "type": entities[entity_id].entity_type,
+                "connection_count": degree,
             }
-            for row in most_connected_result.all()
+            for entity_id, degree in most_connected
+            if entity_id in entities
         ]
 
         return GraphStatistics(
@@ -830,6 +935,22 @@ class KnowledgeGraphService:
 
     # Private helper methods
 
+    async def _get_entities_by_id(
+        self,
+        workspace_id: str,
+        entity_ids: list[str],
+    ) -> dict[str, KnowledgeEntity]:
+        """Fetch entities by ID in a single query."""
+        if not entity_ids:
+            return {}
+
+        stmt = select(KnowledgeEntity).where(
+            KnowledgeEntity.workspace_id == workspace_id,
+            KnowledgeEntity.id.in_(entity_ids),
+        )
+        result = await self.db.execute(stmt)
+        return {str(e.id): e for e in result.scalars().all()}
+
     async def _get_entity_nodes(
         self,
         workspace_id: str,
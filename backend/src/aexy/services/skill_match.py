@@ -0,0 +1,113 @@
+"""Deterministic skill matching between tasks and developer fingerprints.
+
+Used as a cheap pre-scorer before LLM ranking and as the score source for
+assignment optimization. Fingerprints and task signals are indexed once, so
+scoring a pair is a handful of dict lookups.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class SkillIndex:
+    """Lower-cased skill lookups of a developer's skill fingerprint."""
+
+    languages: dict[str, float]
+    frameworks: dict[str, float]
+    domains: dict[str, float]
+
+    @classmethod
+    def from_fingerprint(cls, fingerprint: dict[str, Any] | None) -> "SkillIndex":
+        fingerprint = fingerprint or {}
+        return cls(
+            languages={
+                s.get("name", "").lower(): s.get("proficiency_score", 0)
+                for s in (fingerprint.get("languages") or [])
+            },
+            frameworks={
+                s.get("name", "").lower(): s.get("proficiency_score", 0)
+                for s in (fingerprint.get("frameworks") or [])
+            },
+            domains={
+                s.get("name", "").lower(): s.get("confidence_score", 0)
+                for s in (fingerprint.get("domains") or [])
+            },
+        )
+
+
+@dataclass(frozen=True)
+class TaskRequirements:
+    """Lower-cased skill requirements of a task."""
+
+    required_skills: tuple[str, ...]
+    preferred_skills: tuple[str, ...]
+    domain: str
+
+    @classmethod
+    def from_signals(cls, signals: dict[str, Any] | None) -> "TaskRequirements":
+        signals = signals or {}
+        return cls(
+            required_skills=tuple(s.lower() for s in (signals.get("required_skills") or [])),
+            preferred_skills=tuple(s.lower() for s in (signals.get("preferred_skills") or [])),
+            domain=(signals.get("domain") or "").lower(),
+        )
+
+
+def score_skill_match(
+    requirements: TaskRequirements,
+    skills: SkillIndex,
+) -> tuple[float, float, float]:
+    """Score how well a developer's skills cover a task.
+
+    Returns:
+        Tuple of (overall_score, skill_match, growth_opportunity), each 0-1.
+    """
+    # Calculate skill match
+    skill_matches = 0.0
+    skill_gaps = 0
+
+    for skill in requirements.required_skills:
+        if skill in skills.languages:
+            skill_matches += skills.languages[skill] / 100
+        elif skill in skills.frameworks:
+            skill_matches += skills.frameworks[skill] / 100
+        else:
+            skill_gaps += 1
+
+    for skill in requirements.preferred_skills:
+        if skill in skills.languages or skill in skills.frameworks:
+            skill_matches += 0.5
+
+    total_required = len(requirements.required_skills) or 1
+    skill_match = min(skill_matches / total_required, 1.0)
+
+    # Domain match
+    domain_match = 0.5  # Default
+    if requirements.domain and requirements.domain in skills.domains:
+        domain_match = skills.domains[requirements.domain] / 100
+
+    # Growth opportunity (inverse of skill match for skills they don't have)
+    growth_opportunity = 0.0
+    if skill_gaps > 0 and skill_match > 0.3:  # They can do it but will learn
+        growth_opportunity = min(skill_gaps / total_required, 0.5)
+
+    # Overall score
+    overall = skill_match * 0.6 + domain_match * 0.2 + growth_opportunity * 0.2
+
+    return round(overall, 3), round(skill_match, 3), round(growth_opportunity, 3)
+
+
+def score_matrix(
+    requirements: list[TaskRequirements],
+    skills: list[SkillIndex],
+) -> list[list[float]]:
+    """Score every task against every developer.
+
+    Returns:
+        Overall scores (0-1), one row per task and one column per developer.
+    """
+    return [
+        [score_skill_match(task, developer)[0] for developer in skills]
+        for task in requirements
+    ]
@@ -1,11 +1,14 @@
 """Slack history import and continuous sync service."""
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
+from contextlib import nullcontext
 from datetime import datetime, timedelta
 from typing import Any
 
 import httpx
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, union
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from aexy.models.integrations import SlackIntegration
@@ -29,6 +32,8 @@ class SlackHistorySyncService:
 
     SLACK_API_BASE = "https://slack.com/api"
     MESSAGES_PER_PAGE = 200  # Max allowed by Slack API
+    MAX_CONCURRENT_CHANNELS = 3  # Stay well under Tier 3 (~50 req/min) limits
+    MAX_RATE_LIMIT_RETRIES = 5  # Consecutive 429s tolerated per page
 
     def __init__(self):
         self.parser = SlackMessageParser()
@@ -123,18 +128,18 @@ class SlackHistorySyncService:
                 return data.get("user")
             return None
 
-    async def fetch_channel_history(
+    async def fetch_channel_history_pages(
         self,
         integration: SlackIntegration,
         channel_id: str,
         oldest: datetime | None = None,
         latest: datetime | None = None,
         limit: int | None = None,
-    ) -> list[dict]:
-        """Fetch message history from a channel."""
-        messages = []
+    ) -> AsyncIterator[list[dict]]:
+        """Yield message history from a channel one API page at a time."""
         cursor = None
         fetched = 0
+        rate_limited = 0
 
         async with httpx.AsyncClient() as client:
             while True:
@@ -154,20 +159,34 @@ class SlackHistorySyncService:
                     headers={"Authorization": f"Bearer {integration.bot_token}"},
                     params=params,
                 )
+
+                if response.status_code == 429:
+                    rate_limited += 1
+                    if rate_limited > self.MAX_RATE_LIMIT_RETRIES:
+                        logger.error(f"Slack rate limit retries exhausted on {channel_id}")
+                        break
+                    # conversations.history is a Tier 3 method; honour Retry-After
+                    retry_after = int(response.headers.get("Retry-After", "1"))
+                    logger.info(f"Slack rate limited on {channel_id}, retrying in {retry_after}s")
+                    await asyncio.sleep(retry_after)
+                    continue
+
+                rate_limited = 0
                 data = response.json()
 
                 if not data.get("ok"):
                     error = data.get("error")
                     if error == "not_in_channel":
                         # Try to join the channel
-                        await self._join_channel(integration, channel_id, client)
-                        continue
+                        if await self._join_channel(integration, channel_id, client):
+                            continue
                     logger.error(f"Failed to fetch history: {error}")
                     break
 
                 batch = data.get("messages", [])
-                messages.extend(batch)
                 fetched += len(batch)
+                if batch:
+                    yield batch
 
                 if limit and fetched >= limit:
                     break
@@ -176,8 +195,6 @@ class SlackHistorySyncService:
                 if not cursor or not data.get("has_more"):
                     break
 
-        return messages
-
     async def _join_channel(
         self,
         integration: SlackIntegration,
@@ -201,15 +218,23 @@ class SlackHistorySyncService:
         days_back: int = 30,
         team_id: str | None = None,
         sprint_id: str | None = None,
+        oldest: datetime | None = None,
+        db_lock: asyncio.Lock | None = None,
     ) -> dict:
-        """Import and parse channel history into tracking data."""
-        oldest = datetime.utcnow() - timedelta(days=days_back)
-        messages = await self.fetch_channel_history(
-            integration, channel_id, oldest=oldest
-        )
+        """Import and parse channel history into tracking data.
+
+        Each history page is deduplicated against already-imported messages
+        with a single query, and its new records are inserted in one flush.
+
+        Args:
+            oldest: Import messages after this time (overrides days_back).
+            db_lock: Lock guarding a session shared between concurrent imports.
+        """
+        if oldest is None:
+            oldest = datetime.utcnow() - timedelta(days=days_back)
 
         stats = {
-            "total_messages": len(messages),
+            "total_messages": 0,
             "standups_imported": 0,
             "work_logs_imported": 0,
             "blockers_imported": 0,
@@ -219,135 +244,148 @@ class SlackHistorySyncService:
         # Get user mappings
         user_mappings = integration.user_mappings or {}
 
-        for msg in messages:
-            # Skip bot messages and system messages
-            if msg.get("bot_id") or msg.get("subtype"):
-                stats["skipped"] += 1
-                continue
-
-            user_id = msg.get("user")
-            if not user_id:
-                stats["skipped"] += 1
-                continue
-
-            # Map Slack user to developer
-            developer_id = user_mappings.get(user_id)
-            if not developer_id:
-                stats["skipped"] += 1
-                continue
-
-            text = msg.get("text", "")
-            ts = msg.get("ts", "")
-            message_time = datetime.fromtimestamp(float(ts)) if ts else datetime.utcnow()
-
-            # Parse the message
-            parsed = self.parser.parse_message(text)
-
-            # Check if we already imported this message
-            existing = await self._message_exists(db, channel_id, ts)
-            if existing:
-                stats["skipped"] += 1
+        async for messages in self.fetch_channel_history_pages(
+            integration, channel_id, oldest=oldest
+        ):
+            stats["total_messages"] += len(messages)
+
+            candidates = []
+            for msg in messages:
+                # Skip bot messages, system messages and unmapped users
+                if (
+                    msg.get("bot_id")
+                    or msg.get("subtype")
+                    or not msg.get("ts")
+                    or not user_mappings.get(msg.get("user"))
+                ):
+                    stats["skipped"] += 1
+                    continue
+                candidates.append(msg)
+
+            if not candidates:
                 continue
 
-            # Create tracking records based on parsed content
-            if parsed.standup_content:
-                standup = DeveloperStandup(
-                    developer_id=developer_id,
-                    team_id=team_id,
-                    sprint_id=sprint_id,
-                    workspace_id=integration.organization_id,
-                    standup_date=message_time.date(),
-                    yesterday_summary=parsed.standup_content.yesterday,
-                    today_plan=parsed.standup_content.today,
-                    blockers_summary=parsed.standup_content.blockers,
-                    source=TrackingSource.SLACK_CHANNEL,
-                    slack_message_ts=ts,
-                    slack_channel_id=channel_id,
+            async with db_lock or nullcontext():
+                # Resolve already imported messages for the whole page at once
+                imported = await self._imported_message_ts(
+                    db, channel_id, [msg["ts"] for msg in candidates]
                 )
-                db.add(standup)
-                stats["standups_imported"] += 1
-
-            if parsed.blocker_mentions:
-                for blocker in parsed.blocker_mentions:
-                    blocker_record = Blocker(
-                        developer_id=developer_id,
-                        team_id=team_id,
-                        sprint_id=sprint_id,
-                        description=blocker.description,
-                        severity=BlockerSeverity.MEDIUM,
-                        category=BlockerCategory.TECHNICAL,
-                        status="active",
-                        source=TrackingSource.SLACK_CHANNEL,
-                        slack_message_ts=ts,
-                        slack_channel_id=channel_id,
-                    )
-                    db.add(blocker_record)
-                    stats["blockers_imported"] += 1
-
-            # Create work log for task references
-            if parsed.task_references:
-                for task_ref in parsed.task_references:
-                    work_log = WorkLog(
-                        developer_id=developer_id,
-                        task_id=None,  # Would need to resolve task_ref.task_key to actual ID
-                        sprint_id=sprint_id,
-                        notes=f"[{task_ref.task_key}] {task_ref.context or text[:200]}",
-                        log_type=WorkLogType.NOTE,
-                        source=TrackingSource.SLACK_CHANNEL,
-                        slack_message_ts=ts,
-                        slack_channel_id=channel_id,
-                        logged_at=message_time,
+
+                records: list[DeveloperStandup | Blocker | WorkLog] = []
+                for msg in candidates:
+                    ts = msg["ts"]
+                    if ts in imported:
+                        stats["skipped"] += 1
+                        continue
+                    imported.add(ts)
+
+                    records.extend(
+                        self._build_tracking_records(
+                            msg,
+                            developer_id=user_mappings[msg["user"]],
+                            channel_id=channel_id,
+                            workspace_id=integration.organization_id,
+                            team_id=team_id,
+                            sprint_id=sprint_id,
+                            stats=stats,
+                        )
                     )
-                    db.add(work_log)
-                    stats["work_logs_imported"] += 1
 
-        await db.commit()
+                if records:
+                    db.add_all(records)
+                    await db.commit()
+
         return stats
 
-    async def _message_exists(
+    def _build_tracking_records(
+        self,
+        msg: dict,
+        developer_id: str,
+        channel_id: str,
+        workspace_id: str,
+        team_id: str | None,
+        sprint_id: str | None,
+        stats: dict,
+    ) -> list[DeveloperStandup | Blocker | WorkLog]:
+        """Parse a Slack message into standup, blocker and work log records."""
+        text = msg.get("text", "")
+        ts = msg["ts"]
+        message_time = datetime.fromtimestamp(float(ts))
+        parsed = self.parser.parse_message(text)
+        records: list[DeveloperStandup | Blocker | WorkLog] = []
+
+        if parsed.standup_content:
+            records.append(DeveloperStandup(
+                developer_id=developer_id,
+                team_id=team_id,
+                sprint_id=sprint_id,
+                workspace_id=workspace_id,
+                standup_date=message_time.date(),
+                yesterday_summary=parsed.standup_content.yesterday,
+                today_plan=parsed.standup_content.today,
+                blockers_summary=parsed.standup_content.blockers,
+                source=TrackingSource.SLACK_CHANNEL,
+                slack_message_ts=ts,
+                slack_channel_id=channel_id,
+            ))
+            stats["standups_imported"] += 1
+
+        for blocker in parsed.blocker_mentions or []:
+            records.append(Blocker(
+                developer_id=developer_id,
+                team_id=team_id,
+                sprint_id=sprint_id,
+                description=blocker.description,
+                severity=BlockerSeverity.MEDIUM,
+                category=BlockerCategory.TECHNICAL,
+                status="active",
+                source=TrackingSource.SLACK_CHANNEL,
+                slack_message_ts=ts,
+                slack_channel_id=channel_id,
+            ))
+            stats["blockers_imported"] += 1
+
+        # Create work log for task references
+        for task_ref in parsed.task_references or []:
+            records.append(WorkLog(
+                developer_id=developer_id,
+                task_id=None,  # Would need to resolve task_ref.task_key to actual ID
+                sprint_id=sprint_id,
+                notes=f"[{task_ref.task_key}] {task_ref.context or text[:200]}",
+                log_type=WorkLogType.NOTE,
+                source=TrackingSource.SLACK_CHANNEL,
+                slack_message_ts=ts,
+                slack_channel_id=channel_id,
+                logged_at=message_time,
+            ))
+            stats["work_logs_imported"] += 1
+
+        return records
+
+    async def _imported_message_ts(
         self,
         db: AsyncSession,
         channel_id: str,
-        message_ts: str,
-    ) -> bool:
-        """Check if a message has already been imported."""
-        # Check standups
-        result = await db.execute(
-            select(DeveloperStandup).where(
-                and_(
-                    DeveloperStandup.slack_channel_id == channel_id,
-                    DeveloperStandup.slack_message_ts == message_ts,
-                )
-            )
-        )
-        if result.scalar_one_or_none():
-            return True
+        message_ts: list[str],
+    ) -> set[str]:
+        """Return which of the given message timestamps were already imported.
 
-        # Check work logs
-        result = await db.execute(
-            select(WorkLog).where(
-                and_(
-                    WorkLog.slack_channel_id == channel_id,
-                    WorkLog.slack_message_ts == message_ts,
-                )
-            )
-        )
-        if result.scalar_one_or_none():
-            return True
+        Checks standups, work logs and blockers in a single UNION query.
+        """
+        if not message_ts:
+            return set()
 
-        # Check blockers
-        result = await db.execute(
-            select(Blocker).where(
+        stmt = union(*(
+            select(model.slack_message_ts).where(
                 and_(
-                    Blocker.slack_channel_id == channel_id,
-                    Blocker.slack_message_ts == message_ts,
+                    model.slack_channel_id == channel_id,
+                    model.slack_message_ts.in_(message_ts),
                 )
             )
-        )
-        if result.scalar_one_or_none():
-            return True
-
-        return False
+            for model in (DeveloperStandup, WorkLog, Blocker)
+        ))
+        result = await db.execute(stmt)
+        return set(result.scalars().all())
 
     async def get_last_sync_timestamp(
         self,
@@ -391,20 +429,18 @@ class SlackHistorySyncService:
             # First sync - get last 7 days
             oldest = datetime.utcnow() - timedelta(days=7)
 
-        messages = await self.fetch_channel_history(
-            integration, channel_id, oldest=oldest
-        )
-
-        if not messages:
-            return {"synced": 0, "message": "No new messages"}
-
-        return await self.import_channel_history(
+        stats = await self.import_channel_history(
             integration, channel_id, db,
-            days_back=0,  # We already filtered by oldest
             team_id=team_id,
             sprint_id=sprint_id,
+            oldest=oldest,
         )
 
+        if not stats["total_messages"]:
+            return {"synced": 0, "message": "No new messages"}
+
+        return stats
+
     async def full_import(
         self,
         integration: SlackIntegration,
@@ -440,23 +476,38 @@ class SlackHistorySyncService:
             "errors": [],
         }
 
-        for channel_id in channel_ids:
-            try:
-                stats = await self.import_channel_history(
+        # Slack history is fetched concurrently; the shared session is
+        # serialized through a lock since AsyncSession isn't concurrency-safe.
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_CHANNELS)
+        db_lock = asyncio.Lock()
+
+        async def import_channel(channel_id: str) -> dict:
+            async with semaphore:
+                return await self.import_channel_history(
                     integration, channel_id, db,
                     days_back=days_back,
                     team_id=team_id,
                     sprint_id=sprint_id,
+                    db_lock=db_lock,
                 )
-                total_stats["channels_processed"] += 1
-                total_stats["total_messages"] += stats["total_messages"]
-                total_stats["standups_imported"] += stats["standups_imported"]
-                total_stats["work_logs_imported"] += stats["work_logs_imported"]
-                total_stats["blockers_imported"] += stats["blockers_imported"]
-                total_stats["skipped"] += stats["skipped"]
-            except Exception as e:
-                logger.error(f"Error importing channel {channel_id}: {e}")
-                total_stats["errors"].append({"channel": channel_id, "error": str(e)})
+
+        results = await asyncio.gather(
+            *(import_channel(channel_id) for channel_id in channel_ids),
+            return_exceptions=True,
+        )
+
+        for channel_id, stats in zip(channel_ids, results):
+            if isinstance(stats, Exception):
+                logger.error(f"Error importing channel {channel_id}: {stats}")
+                total_stats["errors"].append({"channel": channel_id, "error": str(stats)})
+                continue
+
+            total_stats["channels_processed"] += 1
+            total_stats["total_messages"] += stats["total_messages"]
+            total_stats["standups_imported"] += stats["standups_imported"]
+            total_stats["work_logs_imported"] += stats["work_logs_imported"]
+            total_stats["blockers_imported"] += stats["blockers_imported"]
+            total_stats["skipped"] += stats["skipped"]
 
         return total_stats
 
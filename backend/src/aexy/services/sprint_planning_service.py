@@ -1,5 +1,6 @@
 """Sprint planning service for AI-powered task assignment and optimization."""
 
+import asyncio
 import logging
 from typing import Any
 from dataclasses import dataclass
@@ -12,7 +13,7 @@ from aexy.models.sprint import Sprint, SprintTask
 from aexy.models.team import TeamMember
 from aexy.models.developer import Developer
 from aexy.llm.gateway import LLMGateway
-from aexy.services.task_matcher import TaskMatcher, TaskMatchRequest, RankedCandidate
+from aexy.services.task_matcher import TaskMatcher, TaskMatchRequest
 from aexy.services.whatif_analyzer import WhatIfAnalyzer, WhatIfScenario
 
 logger = logging.getLogger(__name__)
@@ -109,14 +110,20 @@ class SprintPlanningService:
         if not team_members:
             return []
 
-        suggestions = []
+        # Build matching profiles once for all tasks
+        profiles = [self._developer_to_profile(m, sprint.tasks) for m in team_members]
 
-        for task in unassigned_tasks:
-            suggestion = await self._suggest_assignment_for_task(
-                task, team_members, sprint.tasks
-            )
-            if suggestion:
-                suggestions.append(suggestion)
+        # Matching makes no database calls, so tasks can be matched concurrently
+        semaphore = asyncio.Semaphore(TaskMatcher.MAX_CONCURRENT_MATCHES)
+
+        async def suggest(task: SprintTask) -> AssignmentSuggestion | None:
+            async with semaphore:
+                return await self._suggest_assignment_for_task(
+                    task, team_members, sprint.tasks, profiles
+                )
+
+        results = await asyncio.gather(*(suggest(task) for task in unassigned_tasks))
+        suggestions = [s for s in results if s]
 
         return suggestions
 
@@ -125,6 +132,7 @@ class SprintPlanningService:
         task: SprintTask,
         team_members: list[Developer],
         all_tasks: list[SprintTask],
+        profiles: list[dict[str, Any]] | None = None,
     ) -> AssignmentSuggestion | None:
         """Generate assignment suggestion for a single task."""
         if not self.task_matcher:
@@ -142,31 +150,12 @@ class SprintPlanningService:
                 estimated_points=task.story_points,
             )
 
-            # Extract task signals
-            task_signals = await self.task_matcher.extract_task_signals(request)
+            if profiles is None:
+                profiles = [self._developer_to_profile(m, all_tasks) for m in team_members]
 
-            # Score each team member
-            candidates: list[RankedCandidate] = []
-            for member in team_members:
-                developer_profile = self._developer_to_profile(member, all_tasks)
-                score = await self.task_matcher.score_developer(
-                    task_signals, developer_profile
-                )
-                candidates.append(
-                    RankedCandidate(
-                        developer_id=str(member.id),
-                        developer_name=member.name,
-                        match_score=score,
-                        rank=0,
-                    )
-                )
-
-            # Sort by score
-            candidates.sort(
-                key=lambda c: c.match_score.overall_score, reverse=True
-            )
-            for i, c in enumerate(candidates):
-                c.rank = i + 1
+            # Shortlist and rank team members
+            match_result = await self.task_matcher.match_task(request, profiles)
+            candidates = match_result.candidates
 
             if not candidates:
                 return None
@@ -186,8 +175,8 @@ class SprintPlanningService:
                 task_title=task.title,
                 suggested_developer_id=best.developer_id,
                 suggested_developer_name=best.developer_name,
-                confidence=best.match_score.confidence,
-                reasoning=best.match_score.explanation or "Best skill and availability match",
+                confidence=round(best.match_score.overall_score / 100, 2),
+                reasoning=best.match_score.reasoning or "Best skill and availability match",
                 alternative_developers=alternatives,
             )
 
@@ -590,7 +579,7 @@ class SprintPlanningService:
             developer_profile = self._developer_to_profile(developer, [])
             score = await self.task_matcher.score_developer(task_signals, developer_profile)
 
-            return score.explanation or "This developer is a good match based on their skills and experience."
+            return score.reasoning or "This developer is a good match based on their skills and experience."
 
         except Exception as e:
             logger.error(f"Error generating explanation: {e}")
@@ -629,7 +618,9 @@ class SprintPlanningService:
         return {
             "id": str(developer.id),
             "name": developer.name,
-            "skills": [],  # Would come from developer profile
+            "skill_fingerprint": developer.skill_fingerprint or {},
+            "work_patterns": developer.work_patterns or {},
+            "growth_trajectory": developer.growth_trajectory or {},
             "current_tasks": current_tasks,
             "availability": max(0, 6 - current_tasks),  # Assume 6 task capacity
         }
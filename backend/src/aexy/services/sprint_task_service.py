@@ -3,9 +3,9 @@
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from sqlalchemy import select, func
+from sqlalchemy import Select, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import lazyload, selectinload
 
 from aexy.models.sprint import Sprint, SprintTask, TaskActivity
 from aexy.services.task_sources.base import TaskItem, TaskSourceConfig, TaskStatus
@@ -146,6 +146,23 @@ class SprintTaskService:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    def get_sprint_tasks_export_query(self, sprint_id: str) -> Select:
+        """Build the query used to stream a sprint's tasks for export.
+
+        Only the assignee and epic are loaded, so the query can be consumed
+        in batches from a server-side cursor.
+        """
+        return (
+            select(SprintTask)
+            .where(SprintTask.sprint_id == sprint_id)
+            .options(
+                lazyload("*"),
+                selectinload(SprintTask.assignee),
+                selectinload(SprintTask.epic),
+            )
+            .order_by(SprintTask.priority.desc(), SprintTask.created_at)
+        )
+
     async def get_tasks_by_assignee(
         self,
         assignee_id: str,
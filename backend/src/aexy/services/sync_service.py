@@ -10,6 +10,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from aexy.cache.github_response_cache import get_github_response_cache
 from aexy.core.config import get_settings
 from aexy.core.database import async_session_maker
 from aexy.models.activity import CodeReview, Commit, PullRequest
@@ -24,6 +25,38 @@ settings = get_settings()
 SyncMode = Literal["async", "celery"]
 SyncType = Literal["full", "incremental"]
 
+# Common file extensions mapped to languages for commit tagging
+EXTENSION_LANGUAGES = {
+    "py": "Python", "js": "JavaScript", "ts": "TypeScript",
+    "tsx": "TypeScript", "jsx": "JavaScript", "java": "Java",
+    "go": "Go", "rs": "Rust", "rb": "Ruby", "php": "PHP",
+    "cs": "C#", "cpp": "C++", "c": "C", "swift": "Swift",
+    "kt": "Kotlin", "scala": "Scala", "vue": "Vue",
+}
+
+
+def _commit_file_stats(
+    files: list[dict[str, Any]], repo_language: str | None = None
+) -> tuple[list[str] | None, list[str] | None]:
+    """Derive (languages, file types) from a commit's changed files."""
+    file_types = set()
+    detected_languages = set()
+    if repo_language:
+        detected_languages.add(repo_language)
+
+    for file in files:
+        filename = file.get("filename", "")
+        if "." in filename:
+            ext = filename.rsplit(".", 1)[-1].lower()
+            file_types.add(ext)
+            if ext in EXTENSION_LANGUAGES:
+                detected_languages.add(EXTENSION_LANGUAGES[ext])
+
+    return (
+        list(detected_languages) if detected_languages else None,
+        list(file_types) if file_types else None,
+    )
+
 
 class SyncService:
     """Service for historical data sync and webhook management."""
@@ -147,21 +180,39 @@ class SyncService:
                 # Get repo language for tagging commits
                 repo_language = repo.language if hasattr(repo, 'language') else None
 
-                async with GitHubService(access_token=access_token) as gh:
-                    # Sync commits
-                    commits_synced = await self._sync_commits_with_session(
-                        db, gh, owner, repo_name, developer_id, repository_id, github_username, repo_language
-                    )
+                async with GitHubService(
+                    access_token=access_token,
+                    response_cache=get_github_response_cache(),
+                ) as gh:
+                    graphql_synced = None
+                    if settings.github_graphql_sync_enabled:
+                        try:
+                            graphql_synced = await self._sync_with_graphql(
+                                db, gh, owner, repo_name, developer_id, github_username, repo_language
+                            )
+                        except GitHubAPIError as e:
+                            logger.warning(
+                                f"GraphQL sync failed for {repo.full_name}, falling back to REST: {e}"
+                            )
+                            await db.rollback()
+
+                    if graphql_synced:
+                        commits_synced, prs_synced, reviews_synced = graphql_synced
+                    else:
+                        # Sync commits
+                        commits_synced = await self._sync_commits_with_session(
+                            db, gh, owner, repo_name, developer_id, repository_id, github_username, repo_language
+                        )
 
-                    # Sync PRs
-                    prs_synced = await self._sync_pull_requests_with_session(
-                        db, gh, owner, repo_name, developer_id, repository_id, github_username
-                    )
+                        # Sync PRs
+                        prs_synced = await self._sync_pull_requests_with_session(
+                            db, gh, owner, repo_name, developer_id, repository_id, github_username
+                        )
 
-                    # Sync reviews
-                    reviews_synced = await self._sync_reviews_with_session(
-                        db, gh, owner, repo_name, developer_id, repository_id, github_username
-                    )
+                        # Sync reviews
+                        reviews_synced = await self._sync_reviews_with_session(
+                            db, gh, owner, repo_name, developer_id, repository_id, github_username
+                        )
 
                 # Refetch to update
                 result = await db.execute(
@@ -216,6 +267,138 @@ class SyncService:
                 except Exception as inner_e:
                     logger.error(f"Failed to update sync status: {inner_e}")
 
+    async def _sync_with_graphql(
+        self,
+        db: AsyncSession,
+        gh: GitHubService,
+        owner: str,
+        repo: str,
+        developer_id: str,
+        github_username: str | None,
+        repo_language: str | None = None,
+    ) -> tuple[int, int, int]:
+        """Sync commits, PRs and reviews using bulk GraphQL queries.
+
+        Commits come with line stats and PRs with their reviews, so a page of
+        100 nodes costs one request instead of one per PR. Only commits not
+        yet stored are fetched individually, for their changed file list.
+        Existing records are resolved per page with a single IN query.
+
+        Returns:
+            Tuple of (commits synced, PRs synced, reviews synced).
+        """
+        repository = f"{owner}/{repo}"
+        commits_synced = prs_synced = reviews_synced = 0
+
+        async for commits in gh.iter_commits_graphql(owner, repo, author=github_username):
+            shas = [c["sha"] for c in commits]
+            result = await db.execute(select(Commit.sha).where(Commit.sha.in_(shas)))
+            existing_shas = set(result.scalars().all())
+
+            for commit_data in commits:
+                if commit_data["sha"] in existing_shas:
+                    continue
+                existing_shas.add(commit_data["sha"])
+
+                # GraphQL exposes no per-file list, so file types and languages
+                # still come from the commit details of new commits
+                try:
+                    details = await gh.get_commit_details(owner, repo, commit_data["sha"])
+                    files = details.get("files", [])
+                except GitHubAPIError:
+                    files = []
+                languages, file_types = _commit_file_stats(files, repo_language)
+
+                message = commit_data["commit"]["message"]
+                db.add(Commit(
+                    id=str(uuid4()),
+                    developer_id=developer_id,
+                    repository=repository,
+                    sha=commit_data["sha"],
+                    message=message[:500] if message else "",
+                    additions=commit_data["stats"]["additions"],
+                    deletions=commit_data["stats"]["deletions"],
+                    files_changed=len(files) or commit_data["files_changed"],
+                    languages=languages,
+                    file_types=file_types,
+                    committed_at=datetime.fromisoformat(
+                        commit_data["commit"]["committer"]["date"].replace("Z", "+00:00")
+                    ),
+                ))
+                commits_synced += 1
+
+            await db.commit()
+
+        async for prs in gh.iter_pull_requests_graphql(owner, repo):
+            pr_ids = [pr["id"] for pr in prs]
+            review_ids = [r["id"] for pr in prs for r in pr["reviews"]]
+
+            result = await db.execute(
+                select(PullRequest.github_id).where(PullRequest.github_id.in_(pr_ids))
+            )
+            existing_prs = set(result.scalars().all())
+            existing_reviews: set[int] = set()
+            if review_ids:
+                result = await db.execute(
+                    select(CodeReview.github_id).where(CodeReview.github_id.in_(review_ids))
+                )
+                existing_reviews = set(result.scalars().all())
+
+            for pr_data in prs:
+                if (
+                    pr_data["id"] not in existing_prs
+                    and (not github_username or pr_data["user"]["login"] == github_username)
+                ):
+                    db.add(PullRequest(
+                        id=str(uuid4()),
+                        developer_id=developer_id,
+                        repository=repository,
+                        github_id=pr_data["id"],
+                        number=pr_data["number"],
+                        title=pr_data["title"][:500],
+                        state=pr_data["state"],
+                        additions=pr_data["additions"],
+                        deletions=pr_data["deletions"],
+                        files_changed=pr_data["changed_files"],
+                        commits_count=pr_data["commits"],
+                        comments_count=pr_data["comments"] + pr_data["review_comments"],
+                        created_at_github=datetime.fromisoformat(
+                            pr_data["created_at"].replace("Z", "+00:00")
+                        ),
+                        merged_at=datetime.fromisoformat(
+                            pr_data["merged_at"].replace("Z", "+00:00")
+                        ) if pr_data.get("merged_at") else None,
+                        closed_at=datetime.fromisoformat(
+                            pr_data["closed_at"].replace("Z", "+00:00")
+                        ) if pr_data.get("closed_at") else None,
+                    ))
+                    prs_synced += 1
+
+                for review_data in pr_data["reviews"]:
+                    if review_data["id"] in existing_reviews or not review_data.get("submitted_at"):
+                        continue
+                    if github_username and review_data["user"]["login"] != github_username:
+                        continue
+
+                    db.add(CodeReview(
+                        id=str(uuid4()),
+                        developer_id=developer_id,
+                        repository=repository,
+                        github_id=review_data["id"],
+                        pull_request_github_id=pr_data["id"],
+                        state=review_data["state"],
+                        body=review_data["body"][:1000] if review_data.get("body") else None,
+                        comments_count=review_data["comments_count"],
+                        submitted_at=datetime.fromisoformat(
+                            review_data["submitted_at"].replace("Z", "+00:00")
+                        ),
+                    ))
+                    reviews_synced += 1
+
+            await db.commit()
+
+        return commits_synced, prs_synced, reviews_synced
+
     async def _sync_commits_with_session(
         self,
         db: AsyncSession,
@@ -259,26 +442,7 @@ class SyncService:
                         files = []
 
                     # Extract file types from filenames
-                    file_types = set()
-                    detected_languages = set()
-                    if repo_language:
-                        detected_languages.add(repo_language)
-
-                    for file in files:
-                        filename = file.get("filename", "")
-                        if "." in filename:
-                            ext = filename.rsplit(".", 1)[-1].lower()
-                            file_types.add(ext)
-                            # Map common extensions to languages
-                            ext_to_lang = {
-                                "py": "Python", "js": "JavaScript", "ts": "TypeScript",
-                                "tsx": "TypeScript", "jsx": "JavaScript", "java": "Java",
-                                "go": "Go", "rs": "Rust", "rb": "Ruby", "php": "PHP",
-                                "cs": "C#", "cpp": "C++", "c": "C", "swift": "Swift",
-                                "kt": "Kotlin", "scala": "Scala", "vue": "Vue",
-                            }
-                            if ext in ext_to_lang:
-                                detected_languages.add(ext_to_lang[ext])
+                    languages, file_types = _commit_file_stats(files, repo_language)
 
                     commit = Commit(
                         id=str(uuid4()),
@@ -289,8 +453,8 @@ class SyncService:
                         additions=stats.get("additions", 0),
                         deletions=stats.get("deletions", 0),
                         files_changed=len(files),
-                        languages=list(detected_languages) if detected_languages else None,
-                        file_types=list(file_types) if file_types else None,
+                        languages=languages,
+                        file_types=file_types,
                         committed_at=datetime.fromisoformat(
                             commit_data["commit"]["committer"]["date"].replace("Z", "+00:00")
                         ),
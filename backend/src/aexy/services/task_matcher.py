@@ -1,5 +1,6 @@
 """Task Matcher service for intelligent developer-task matching."""
 
+import asyncio
 import json
 import logging
 from typing import Any
@@ -8,6 +9,8 @@ from pydantic import BaseModel, Field
 
 from aexy.llm.base import MatchScore, TaskSignals
 from aexy.llm.gateway import LLMGateway
+from aexy.services.assignment_solver import solve_assignment
+from aexy.services.skill_match import SkillIndex, TaskRequirements, score_skill_match
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +56,15 @@ class TaskMatcher:
         "team_dynamics": 0.10,
     }
 
+    # Developers kept for LLM ranking after deterministic pre-scoring
+    SHORTLIST_SIZE = 5
+
+    # Open task slots assumed for a developer with no assignments
+    DEFAULT_TASK_CAPACITY = 6
+
+    # Tasks matched concurrently by bulk_match
+    MAX_CONCURRENT_MATCHES = 4
+
     def __init__(self, llm_gateway: LLMGateway) -> None:
         """Initialize the task matcher.
 
@@ -97,16 +109,143 @@ class TaskMatcher:
         Returns:
             Match score.
         """
-        # Prepare developer skills for matching
-        skills = {
+        skills = self._developer_skills(developer)
+        return await self.llm.score_match(task_signals, skills)
+
+    def _developer_skills(self, developer: dict[str, Any]) -> dict[str, Any]:
+        """Prepare a developer's skills for LLM matching."""
+        fingerprint = developer.get("skill_fingerprint") or {}
+        return {
             "developer_id": str(developer.get("id", "")),
-            "languages": developer.get("skill_fingerprint", {}).get("languages", []),
-            "frameworks": developer.get("skill_fingerprint", {}).get("frameworks", []),
-            "domains": developer.get("skill_fingerprint", {}).get("domains", []),
+            "languages": fingerprint.get("languages", []),
+            "frameworks": fingerprint.get("frameworks", []),
+            "domains": fingerprint.get("domains", []),
             "recent_activity": self._summarize_recent_activity(developer),
         }
 
-        return await self.llm.score_match(task_signals, skills)
+    def prescore(
+        self,
+        task_signals: TaskSignals,
+        developers: list[dict[str, Any]],
+    ) -> list[tuple[float, dict[str, Any]]]:
+        """Score developers for a task without the LLM.
+
+        Combines skill overlap and proficiency from the skill fingerprint
+        with remaining capacity. Used to shortlist candidates for ranking.
+
+        Args:
+            task_signals: Extracted task signals.
+            developers: Developer profiles.
+
+        Returns:
+            (score 0-1, developer) pairs, best first.
+        """
+        requirements = TaskRequirements.from_signals(task_signals.model_dump())
+        scored = []
+        for developer in developers:
+            skills = SkillIndex.from_fingerprint(developer.get("skill_fingerprint"))
+            overall, _, _ = score_skill_match(requirements, skills)
+
+            availability = developer.get("availability")
+            capacity = (
+                1.0
+                if availability is None
+                else min(max(availability / self.DEFAULT_TASK_CAPACITY, 0.0), 1.0)
+            )
+            scored.append((round(overall * 0.8 + capacity * 0.2, 3), developer))
+
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return scored
+
+    def _prescore_match(
+        self,
+        task_signals: TaskSignals,
+        score: float,
+        developer: dict[str, Any],
+        reasoning: str,
+    ) -> MatchScore:
+        """Build a match score from the deterministic pre-score."""
+        requirements = TaskRequirements.from_signals(task_signals.model_dump())
+        skills = SkillIndex.from_fingerprint(developer.get("skill_fingerprint"))
+        _, skill_match, growth = score_skill_match(requirements, skills)
+        known = set(skills.languages) | set(skills.frameworks)
+        return MatchScore(
+            developer_id=str(developer.get("id", "")),
+            overall_score=round(score * 100, 1),
+            skill_match=round(skill_match * 100, 1),
+            # Proficiency scores are the only experience signal available here
+            experience_match=round(skill_match * 100, 1),
+            growth_opportunity=round(growth * 100, 1),
+            reasoning=reasoning,
+            strengths=[s for s in task_signals.required_skills if s.lower() in known],
+            gaps=[s for s in task_signals.required_skills if s.lower() not in known],
+        )
+
+    async def rank_candidates(
+        self,
+        task_signals: TaskSignals,
+        developers: list[dict[str, Any]],
+    ) -> list[RankedCandidate]:
+        """Rank developers for a task.
+
+        Developers are pre-scored deterministically and only the shortlist
+        is ranked by the LLM, in a single call. The rest follow in pre-score
+        order, with their scores scaled below the lowest shortlisted score so
+        ranks follow overall_score. If the LLM call fails, the pre-scores are
+        used throughout.
+
+        Args:
+            task_signals: Extracted task signals.
+            developers: Developer profiles.
+
+        Returns:
+            Ranked candidates, best first.
+        """
+        prescored = self.prescore(task_signals, developers)
+        shortlist = prescored[: self.SHORTLIST_SIZE]
+        by_id = {str(d.get("id", "")): d for _, d in prescored}
+
+        scores: list[MatchScore] = []
+        if shortlist:
+            try:
+                scores = await self.llm.rank_developers(
+                    task_signals, [self._developer_skills(d) for _, d in shortlist]
+                )
+            except Exception as e:
+                logger.warning(f"LLM ranking failed, using skill pre-scores: {e}")
+                scores = [
+                    self._prescore_match(task_signals, score, d, "Ranked by skill pre-score")
+                    for score, d in shortlist
+                ]
+
+        scores.sort(key=lambda score: score.overall_score, reverse=True)
+
+        rest = [
+            self._prescore_match(task_signals, score, d, "Not shortlisted by skill pre-score")
+            for score, d in prescored[self.SHORTLIST_SIZE :]
+        ]
+        if scores and rest and rest[0].overall_score >= scores[-1].overall_score:
+            # LLM and pre-scores are on different scales; keep the rest below
+            # the shortlist so optimize_assignments compares like with like
+            ceiling = max(scores[-1].overall_score - 0.1, 0.0)
+            factor = ceiling / rest[0].overall_score
+            rest = [
+                score.model_copy(
+                    update={"overall_score": round(score.overall_score * factor, 1)}
+                )
+                for score in rest
+            ]
+        scores.extend(rest)
+
+        return [
+            RankedCandidate(
+                developer_id=score.developer_id,
+                developer_name=by_id.get(score.developer_id, {}).get("name"),
+                match_score=score,
+                rank=i + 1,
+            )
+            for i, score in enumerate(scores)
+        ]
 
     def _summarize_recent_activity(self, developer: dict[str, Any]) -> str:
         """Summarize developer's recent activity.
@@ -153,28 +292,8 @@ class TaskMatcher:
         # Extract task signals
         task_signals = await self.extract_task_signals(request)
 
-        # Score all developers
-        candidates: list[RankedCandidate] = []
-        for developer in developers:
-            try:
-                score = await self.score_developer(task_signals, developer)
-                candidates.append(
-                    RankedCandidate(
-                        developer_id=str(developer.get("id", "")),
-                        developer_name=developer.get("name"),
-                        match_score=score,
-                        rank=0,  # Will be set after sorting
-                    )
-                )
-            except Exception as e:
-                logger.warning(f"Failed to score developer {developer.get('id')}: {e}")
-
-        # Sort by overall score
-        candidates.sort(key=lambda c: c.match_score.overall_score, reverse=True)
-
-        # Set ranks
-        for i, candidate in enumerate(candidates):
-            candidate.rank = i + 1
+        # Shortlist and rank developers
+        candidates = await self.rank_candidates(task_signals, developers)
 
         # Generate recommendations and warnings
         recommendations, warnings = self._generate_insights(task_signals, candidates)
@@ -263,16 +382,22 @@ class TaskMatcher:
         Returns:
             Dict mapping task title to match result.
         """
-        results = {}
-
-        for task in tasks:
-            try:
-                result = await self.match_task(task, developers)
-                results[task.title] = result
-            except Exception as e:
-                logger.error(f"Failed to match task '{task.title}': {e}")
-
-        return results
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_MATCHES)
+
+        async def match(task: TaskMatchRequest) -> TaskMatchResult | None:
+            async with semaphore:
+                try:
+                    return await self.match_task(task, developers)
+                except Exception as e:
+                    logger.error(f"Failed to match task '{task.title}': {e}")
+                    return None
+
+        matched = await asyncio.gather(*(match(task) for task in tasks))
+        return {
+            task.title: result
+            for task, result in zip(tasks, matched, strict=True)
+            if result is not None
+        }
 
     async def optimize_assignments(
         self,
@@ -282,50 +407,59 @@ class TaskMatcher:
     ) -> dict[str, str]:
         """Find optimal task-developer assignments.
 
-        Uses a greedy algorithm to assign tasks to developers,
-        respecting constraints like workload limits.
+        Assigns tasks to maximize the total match score while respecting
+        workload limits, using the scores of all candidates.
 
         Args:
             tasks: List of tasks to assign.
             developers: List of available developers.
-            constraints: Optional constraints (e.g., max tasks per developer).
+            constraints: Optional constraints: max_tasks_per_developer,
+                current_workloads (developer ID -> task count), and
+                required_assignments / forbidden_assignments as
+                (task title, developer ID) pairs.
 
         Returns:
             Dict mapping task title to assigned developer ID.
         """
         constraints = constraints or {}
         max_tasks_per_dev = constraints.get("max_tasks_per_developer", 3)
-
-        # Track assignments
-        assignments: dict[str, str] = {}
-        developer_load: dict[str, int] = {str(d.get("id", "")): 0 for d in developers}
+        current_workloads = constraints.get("current_workloads", {})
 
         # Match all tasks first
         all_matches = await self.bulk_match(tasks, developers)
 
-        # Sort tasks by priority/complexity (harder tasks first)
-        sorted_tasks = sorted(
-            tasks,
-            key=lambda t: (
-                1 if all_matches.get(t.title, TaskMatchResult(
-                    task_signals=TaskSignals(),
-                    candidates=[],
-                )).task_signals.complexity == "high" else 2
-            ),
-        )
+        titles = list(all_matches)
+        dev_ids = [str(d.get("id", "")) for d in developers]
+        task_index = {title: i for i, title in enumerate(titles)}
+        dev_index = {dev_id: i for i, dev_id in enumerate(dev_ids)}
 
-        # Greedy assignment
-        for task in sorted_tasks:
-            match_result = all_matches.get(task.title)
-            if not match_result or not match_result.candidates:
-                continue
-
-            # Find best available developer
+        # Pairs without a candidate score are left out
+        scores = [[0.0] * len(dev_ids) for _ in titles]
+        forbidden = {(t, d) for t in range(len(titles)) for d in range(len(dev_ids))}
+        for title, match_result in all_matches.items():
             for candidate in match_result.candidates:
-                dev_id = candidate.developer_id
-                if developer_load.get(dev_id, 0) < max_tasks_per_dev:
-                    assignments[task.title] = dev_id
-                    developer_load[dev_id] = developer_load.get(dev_id, 0) + 1
-                    break
+                if candidate.developer_id in dev_index:
+                    pair = (task_index[title], dev_index[candidate.developer_id])
+                    scores[pair[0]][pair[1]] = candidate.match_score.overall_score / 100
+                    forbidden.discard(pair)
+
+        def pairs(key: str) -> list[tuple[int, int]]:
+            return [
+                (task_index[title], dev_index[dev_id])
+                for title, dev_id in constraints.get(key) or []
+                if title in task_index and dev_id in dev_index
+            ]
+
+        forbidden.update(pairs("forbidden_assignments"))
+        result = solve_assignment(
+            scores,
+            [max(max_tasks_per_dev - current_workloads.get(d, 0), 0) for d in dev_ids],
+            required=pairs("required_assignments"),
+            forbidden=forbidden,
+        )
+        logger.info(
+            f"Assigned {len(result.assignments)} of {len(tasks)} tasks, "
+            f"score {result.score:.2f} ({result.score_gap:+.2f} vs greedy)"
+        )
 
-        return assignments
+        return {titles[task]: dev_ids[dev] for task, dev in result.assignments.items()}
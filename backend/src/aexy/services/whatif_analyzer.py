@@ -6,6 +6,13 @@ from typing import Any
 
 from aexy.llm.base import MatchScore, TaskSignals
 from aexy.models.developer import Developer
+from aexy.services.assignment_solver import solve_assignment
+from aexy.services.skill_match import (
+    SkillIndex,
+    TaskRequirements,
+    score_matrix,
+    score_skill_match,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -260,10 +267,15 @@ class WhatIfAnalyzer:
     ) -> WhatIfScenario:
         """Generate an optimized assignment scenario.
 
+        Finds the assignment with the highest total match score within
+        each developer's capacity and compares it with greedy assignment.
+
         Args:
             tasks: Tasks to assign.
             developers: Available developers.
-            constraints: Optional constraints (max_per_dev, required_assignments, etc.)
+            constraints: Optional constraints (max_per_dev, current_workloads,
+                required_assignments, forbidden_assignments). Required and
+                forbidden assignments are lists of {task_id, developer_id}.
 
         Returns:
             Optimized WhatIfScenario.
@@ -272,42 +284,54 @@ class WhatIfAnalyzer:
         max_per_dev = constraints.get("max_per_dev", self.OVERLOADED_THRESHOLD)
         current_workloads = constraints.get("current_workloads", {})
 
-        # Calculate all match scores
-        match_scores: list[tuple[str, str, float, float, float]] = []  # task_id, dev_id, score, skill, growth
-
-        for task in tasks:
-            task_id = task.get("id") or task.get("task_id")
-            for developer in developers:
-                dev_id = str(developer.id)
-                score, skill, growth = self._calculate_match(task, developer)
-                match_scores.append((task_id, dev_id, score, skill, growth))
-
-        # Sort by score descending
-        match_scores.sort(key=lambda x: x[2], reverse=True)
-
-        # Greedy assignment with constraints
-        assignments = []
-        assigned_tasks: set[str] = set()
-        dev_task_counts: dict[str, int] = {str(d.id): current_workloads.get(str(d.id), 0) for d in developers}
-
-        for task_id, dev_id, score, skill, growth in match_scores:
-            if task_id in assigned_tasks:
-                continue
-
-            if dev_task_counts.get(dev_id, 0) >= max_per_dev:
-                continue
+        task_ids = [task.get("id") or task.get("task_id") for task in tasks]
+        dev_ids = [str(d.id) for d in developers]
+        task_index = {task_id: i for i, task_id in enumerate(task_ids)}
+        dev_index = {dev_id: i for i, dev_id in enumerate(dev_ids)}
+
+        def pairs(key: str) -> list[tuple[int, int]]:
+            return [
+                (task_index[a["task_id"]], dev_index[a["developer_id"]])
+                for a in constraints.get(key) or []
+                if a.get("task_id") in task_index and a.get("developer_id") in dev_index
+            ]
+
+        # Score all task x developer pairs
+        scores = score_matrix(
+            [
+                TaskRequirements.from_signals(task.get("signals") or task.get("task_signals"))
+                for task in tasks
+            ],
+            [SkillIndex.from_fingerprint(d.skill_fingerprint) for d in developers],
+        )
+        capacities = [max(max_per_dev - current_workloads.get(dev_id, 0), 0) for dev_id in dev_ids]
 
-            assignments.append({"task_id": task_id, "developer_id": dev_id})
-            assigned_tasks.add(task_id)
-            dev_task_counts[dev_id] = dev_task_counts.get(dev_id, 0) + 1
+        result = solve_assignment(
+            scores,
+            capacities,
+            required=pairs("required_assignments"),
+            forbidden=pairs("forbidden_assignments"),
+        )
+        assignments = [
+            {"task_id": task_ids[task], "developer_id": dev_ids[dev]}
+            for task, dev in sorted(result.assignments.items())
+        ]
 
-        return self.create_scenario(
+        scenario = self.create_scenario(
             scenario_name="Optimized Assignment",
             tasks=tasks,
             developers=developers,
             proposed_assignments=assignments,
             current_workloads=current_workloads,
         )
+        scenario.comparison_to_baseline = {
+            "baseline": "greedy",
+            "total_match_score": round(result.score, 3),
+            "baseline_total_match_score": round(result.greedy_score, 3),
+            "score_gap": round(result.score_gap, 3),
+            "baseline_assigned_tasks": len(result.greedy_assignments),
+        }
+        return scenario
 
     def _calculate_match(
         self,
@@ -319,61 +343,11 @@ class WhatIfAnalyzer:
         Returns:
             Tuple of (overall_score, skill_match, growth_opportunity).
         """
-        fingerprint = developer.skill_fingerprint or {}
-
-        # Extract developer skills
-        dev_languages = {
-            s.get("name", "").lower(): s.get("proficiency_score", 0)
-            for s in (fingerprint.get("languages") or [])
-        }
-        dev_frameworks = {
-            s.get("name", "").lower(): s.get("proficiency_score", 0)
-            for s in (fingerprint.get("frameworks") or [])
-        }
-        dev_domains = {
-            s.get("name", "").lower(): s.get("confidence_score", 0)
-            for s in (fingerprint.get("domains") or [])
-        }
-
-        # Get task requirements
         task_signals = task.get("signals") or task.get("task_signals") or {}
-        required_skills = [s.lower() for s in (task_signals.get("required_skills") or [])]
-        preferred_skills = [s.lower() for s in (task_signals.get("preferred_skills") or [])]
-        domain = (task_signals.get("domain") or "").lower()
-
-        # Calculate skill match
-        skill_matches = 0
-        skill_gaps = 0
-
-        for skill in required_skills:
-            if skill in dev_languages:
-                skill_matches += dev_languages[skill] / 100
-            elif skill in dev_frameworks:
-                skill_matches += dev_frameworks[skill] / 100
-            else:
-                skill_gaps += 1
-
-        for skill in preferred_skills:
-            if skill in dev_languages or skill in dev_frameworks:
-                skill_matches += 0.5
-
-        total_required = len(required_skills) or 1
-        skill_match = min(skill_matches / total_required, 1.0)
-
-        # Domain match
-        domain_match = 0.5  # Default
-        if domain and domain in dev_domains:
-            domain_match = dev_domains[domain] / 100
-
-        # Growth opportunity (inverse of skill match for skills they don't have)
-        growth_opportunity = 0.0
-        if skill_gaps > 0 and skill_match > 0.3:  # They can do it but will learn
-            growth_opportunity = min(skill_gaps / total_required, 0.5)
-
-        # Overall score
-        overall = skill_match * 0.6 + domain_match * 0.2 + growth_opportunity * 0.2
-
-        return round(overall, 3), round(skill_match, 3), round(growth_opportunity, 3)
+        return score_skill_match(
+            TaskRequirements.from_signals(task_signals),
+            SkillIndex.from_fingerprint(developer.skill_fingerprint),
+        )
 
     def _calculate_team_impact(
         self,
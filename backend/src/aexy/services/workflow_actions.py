@@ -1,7 +1,10 @@
 """Workflow action handlers for executing different action types."""
 
+import asyncio
 import httpx
+import json
 import re
+import time
 from datetime import datetime, timezone
 from typing import Any
 from uuid import uuid4
@@ -18,9 +21,14 @@ from aexy.models.crm import (
     CRMSequence,
     CRMSequenceEnrollment,
 )
+from aexy.core.async_runtime import get_async_runtime
 from aexy.models.workflow import WorkflowExecution
 from aexy.schemas.workflow import WorkflowExecutionContext, NodeExecutionResult
 
+# Default per-action timeout for network actions, overridable per node with
+# data["timeout_seconds"]
+ACTION_TIMEOUT_SECONDS = 30.0
+
 
 class WorkflowActionHandler:
     """Handles execution of workflow action nodes."""
@@ -1051,6 +1059,68 @@ class SyncWorkflowActionHandler:
 
         return handler(data, context, execution)
 
+    def execute_actions(
+        self,
+        actions: list[dict],
+        context: dict,
+        execution: WorkflowExecution,
+    ) -> list[dict]:
+        """Execute independent actions concurrently.
+
+        Actions with an async implementation are started together on the
+        process's async runtime, each under its own timeout; the remaining
+        ones run in this thread while those are in flight. Callers must only
+        pass actions that do not use the database session.
+
+        Args:
+            actions: Action node data dicts.
+            context: Execution context.
+            execution: The workflow execution.
+
+        Returns:
+            One result per action, in input order, with ``duration_ms`` set.
+        """
+        async_handlers = {
+            "webhook_call": self._webhook_call_async,
+        }
+
+        results: list[dict | None] = [None] * len(actions)
+        futures = {}
+        runtime = get_async_runtime()
+        for i, data in enumerate(actions):
+            handler = async_handlers.get(data.get("action_type"))
+            if handler:
+                futures[i] = runtime.submit(self._run_timed(handler(data, context), data))
+
+        for i, data in enumerate(actions):
+            if i in futures:
+                continue
+            started = time.monotonic()
+            try:
+                result = self.execute_action(data.get("action_type"), data, context, execution)
+            except Exception as e:
+                result = {"status": "failed", "error": str(e)}
+            result["duration_ms"] = int((time.monotonic() - started) * 1000)
+            results[i] = result
+
+        for i, future in futures.items():
+            results[i] = future.result()
+
+        return results
+
+    async def _run_timed(self, coro, data: dict) -> dict:
+        """Await an async action under its timeout and record its duration."""
+        timeout = data.get("timeout_seconds") or ACTION_TIMEOUT_SECONDS
+        started = time.monotonic()
+        try:
+            result = await asyncio.wait_for(coro, timeout)
+        except asyncio.TimeoutError:
+            result = {"status": "failed", "error": f"Action timed out after {timeout}s"}
+        except Exception as e:
+            result = {"status": "failed", "error": str(e)}
+        result["duration_ms"] = int((time.monotonic() - started) * 1000)
+        return result
+
     def _update_record(self, data: dict, context: dict, execution: WorkflowExecution) -> dict:
         """Update a CRM record."""
         record_id = execution.record_id
@@ -1338,10 +1408,13 @@ class SyncWorkflowActionHandler:
         return {"status": "success", "output": {"sequence_id": sequence_id, "unenrolled": enrollment is not None}}
 
     def _webhook_call(self, data: dict, context: dict, execution: WorkflowExecution) -> dict:
-        """Make an HTTP webhook call."""
-        import json
-        import requests
+        """Make an HTTP webhook call on the async runtime's pooled client."""
+        return get_async_runtime().run(
+            self._run_timed(self._webhook_call_async(data, context), data)
+        )
 
+    async def _webhook_call_async(self, data: dict, context: dict) -> dict:
+        """Make an HTTP webhook call."""
         url = data.get("webhook_url")
         method = data.get("http_method", "POST").upper()
         headers = data.get("headers", {})
@@ -1353,24 +1426,23 @@ class SyncWorkflowActionHandler:
         body = self._render_template(body_template, context)
 
         try:
+            client = get_async_runtime().http_client
             if method in ["POST", "PUT", "PATCH"]:
-                response = requests.request(
+                response = await client.request(
                     method=method,
                     url=url,
                     headers=headers,
                     json=json.loads(body) if body else None,
-                    timeout=30,
                 )
             else:
-                response = requests.request(
+                response = await client.request(
                     method=method,
                     url=url,
                     headers=headers,
-                    timeout=30,
                 )
 
             return {
-                "status": "success" if response.ok else "failed",
+                "status": "success" if response.is_success else "failed",
                 "output": {
                     "status_code": response.status_code,
                     "response": response.text[:1000],
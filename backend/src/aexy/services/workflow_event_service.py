@@ -1,16 +1,18 @@
 """Workflow event service for handling external events and resuming workflows."""
 
+import json
 import logging
 from datetime import datetime, timezone, timedelta
 from typing import Any
 from uuid import uuid4
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func, tuple_, union
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from aexy.models.workflow import (
     WorkflowExecution,
+    WorkflowEventFilterKey,
     WorkflowEventSubscription,
     WorkflowExecutionStatus,
 )
@@ -73,6 +75,149 @@ EVENT_TYPES = {
 }
 
 
+def _canonical_filter_value(value: Any) -> str:
+    """Serialize a scalar filter value into its indexed form.
+
+    Numbers compare by value like ``_matches_filter`` does, so integral
+    floats and booleans are stored as ints (``5.0`` and ``5`` share a key).
+    """
+    if isinstance(value, (bool, int, float)) and float(value).is_integer():
+        value = int(value)
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def _is_indexable(value: Any) -> bool:
+    """Only non-null scalar filter values are indexed.
+
+    Objects and arrays are checked in Python, and so is None, which also
+    matches events that lack the key.
+    """
+    return value is not None and not isinstance(value, (dict, list))
+
+
+def _build_filter_keys(subscription: WorkflowEventSubscription) -> list[WorkflowEventFilterKey]:
+    """Normalize a subscription's filter into indexed key/value rows."""
+    filter_keys = [
+        WorkflowEventFilterKey(
+            subscription_id=subscription.id,
+            filter_key=key,
+            filter_value=_canonical_filter_value(value),
+            workspace_id=subscription.workspace_id,
+            event_type=subscription.event_type,
+        )
+        for key, value in (subscription.event_filter or {}).items()
+        if _is_indexable(value)
+    ]
+    subscription.filter_key_count = len(filter_keys)
+    return filter_keys
+
+
+def _event_filter_pairs(event_data: dict, prefix: str = "") -> list[tuple[str, str]]:
+    """Flatten event data into (key, canonical value) pairs.
+
+    Nested objects are also exposed under dotted paths (e.g. "record.id") so
+    they can be matched by filters that use nested keys.
+    """
+    pairs = []
+    for key, value in event_data.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            pairs.extend(_event_filter_pairs(value, prefix=f"{path}."))
+        elif _is_indexable(value):
+            pairs.append((path, _canonical_filter_value(value)))
+    return pairs
+
+
+def _matching_subscriptions_query(workspace_id: str, event_type: str, event_data: dict):
+    """Build the query for active subscriptions whose indexed filters all match.
+
+    Subscriptions without indexed keys are always candidates; the caller
+    re-checks every candidate with ``_matches_filter``. Matched rows are
+    locked so concurrent deliveries of the same event cannot resume an
+    execution twice.
+    """
+    subscription_scope = and_(
+        WorkflowEventSubscription.workspace_id == workspace_id,
+        WorkflowEventSubscription.event_type == event_type,
+        WorkflowEventSubscription.is_active == True,
+    )
+
+    unfiltered = select(WorkflowEventSubscription.id).where(
+        subscription_scope,
+        WorkflowEventSubscription.filter_key_count == 0,
+    )
+
+    candidate_ids = unfiltered
+    pairs = _event_filter_pairs(event_data)
+    if pairs:
+        filtered = (
+            select(WorkflowEventSubscription.id)
+            .join(
+                WorkflowEventFilterKey,
+                WorkflowEventFilterKey.subscription_id == WorkflowEventSubscription.id,
+            )
+            .where(
+                subscription_scope,
+                WorkflowEventFilterKey.workspace_id == workspace_id,
+                WorkflowEventFilterKey.event_type == event_type,
+                tuple_(
+                    WorkflowEventFilterKey.filter_key,
+                    WorkflowEventFilterKey.filter_value,
+                ).in_(pairs),
+            )
+            .group_by(WorkflowEventSubscription.id, WorkflowEventSubscription.filter_key_count)
+            .having(func.count() == WorkflowEventSubscription.filter_key_count)
+        )
+        candidate_ids = union(unfiltered, filtered)
+
+    return (
+        select(WorkflowEventSubscription)
+        .where(WorkflowEventSubscription.id.in_(candidate_ids))
+        .with_for_update(skip_locked=True)
+    )
+
+
+def _matches_filter(event_data: dict, event_filter: dict) -> bool:
+    """Check if event data matches the subscription filter."""
+    if not event_filter:
+        return True
+
+    for key, expected_value in event_filter.items():
+        actual_value = event_data.get(key)
+
+        # Handle nested paths (e.g., "record.id")
+        if "." in key:
+            parts = key.split(".")
+            actual_value = event_data
+            for part in parts:
+                if isinstance(actual_value, dict):
+                    actual_value = actual_value.get(part)
+                else:
+                    actual_value = None
+                    break
+
+        if actual_value != expected_value:
+            return False
+
+    return True
+
+
+def _apply_event_to_execution(
+    execution: WorkflowExecution,
+    event_type: str,
+    event_data: dict,
+) -> None:
+    """Record the received event on a paused execution's context."""
+    context = dict(execution.context or {})
+    context["event_data"] = event_data
+    context["event_type"] = event_type
+    context["event_received_at"] = datetime.now(timezone.utc).isoformat()
+
+    execution.context = context
+    execution.wait_event_type = None
+    execution.wait_timeout_at = None
+
+
 class WorkflowEventService:
     """Async service for handling workflow events."""
 
@@ -113,6 +258,7 @@ class WorkflowEventService:
         )
 
         self.db.add(subscription)
+        self.db.add_all(_build_filter_keys(subscription))
         await self.db.commit()
         await self.db.refresh(subscription)
 
@@ -142,100 +288,49 @@ class WorkflowEventService:
         """
         logger.info(f"Handling event {event_type} for workspace {workspace_id}")
 
-        # Find active subscriptions for this event type
-        stmt = select(WorkflowEventSubscription).where(
-            and_(
-                WorkflowEventSubscription.workspace_id == workspace_id,
-                WorkflowEventSubscription.event_type == event_type,
-                WorkflowEventSubscription.is_active == True,
-            )
+        result = await self.db.execute(
+            _matching_subscriptions_query(workspace_id, event_type, event_data)
         )
-        result = await self.db.execute(stmt)
-        subscriptions = result.scalars().all()
+        matched = [
+            subscription
+            for subscription in result.scalars().all()
+            if _matches_filter(event_data, subscription.event_filter)
+        ]
+        if not matched:
+            return []
 
+        now = datetime.now(timezone.utc)
+        for subscription in matched:
+            subscription.is_active = False
+            subscription.matched_at = now
+            subscription.matched_event_data = event_data
+
+        execution_ids = {subscription.execution_id for subscription in matched}
+        exec_result = await self.db.execute(
+            select(WorkflowExecution).where(
+                WorkflowExecution.id.in_(execution_ids),
+                WorkflowExecution.status == WorkflowExecutionStatus.PAUSED.value,
+            )
+        )
         resumed_executions = []
-
-        for subscription in subscriptions:
-            # Check if event matches the filter
-            if self._matches_filter(event_data, subscription.event_filter):
-                # Mark subscription as matched
-                subscription.is_active = False
-                subscription.matched_at = datetime.now(timezone.utc)
-                subscription.matched_event_data = event_data
-
-                # Resume the execution
-                execution_id = subscription.execution_id
-                await self._resume_execution(execution_id, event_type, event_data)
-                resumed_executions.append(execution_id)
-
-                logger.info(
-                    f"Event {event_type} matched subscription {subscription.id}, "
-                    f"resuming execution {execution_id}"
-                )
+        for execution in exec_result.scalars().all():
+            _apply_event_to_execution(execution, event_type, event_data)
+            resumed_executions.append(execution.id)
 
         await self.db.commit()
 
-        return resumed_executions
-
-    def _matches_filter(self, event_data: dict, event_filter: dict) -> bool:
-        """Check if event data matches the subscription filter."""
-        if not event_filter:
-            return True
-
-        for key, expected_value in event_filter.items():
-            actual_value = event_data.get(key)
-
-            # Handle nested paths (e.g., "record.id")
-            if "." in key:
-                parts = key.split(".")
-                actual_value = event_data
-                for part in parts:
-                    if isinstance(actual_value, dict):
-                        actual_value = actual_value.get(part)
-                    else:
-                        actual_value = None
-                        break
-
-            if actual_value != expected_value:
-                return False
-
-        return True
-
-    async def _resume_execution(
-        self,
-        execution_id: str,
-        event_type: str,
-        event_data: dict,
-    ):
-        """Resume a paused workflow execution."""
-        stmt = select(WorkflowExecution).where(WorkflowExecution.id == execution_id)
-        result = await self.db.execute(stmt)
-        execution = result.scalar_one_or_none()
-
-        if not execution:
-            logger.warning(f"Execution {execution_id} not found")
-            return
-
-        if execution.status != WorkflowExecutionStatus.PAUSED.value:
-            logger.warning(
-                f"Execution {execution_id} is not paused (status={execution.status})"
-            )
-            return
-
-        # Update context with event data
-        context = execution.context or {}
-        context["event_data"] = event_data
-        context["event_type"] = event_type
-        context["event_received_at"] = datetime.now(timezone.utc).isoformat()
+        # Queue resumption only once the context update is visible to workers
+        from aexy.processing.workflow_tasks import resume_workflow_task
 
-        execution.context = context
-        execution.wait_event_type = None
-        execution.wait_timeout_at = None
+        for execution_id in resumed_executions:
+            resume_workflow_task.delay(execution_id)
 
-        # Queue for resumption via Celery
-        from aexy.processing.workflow_tasks import resume_workflow_task
+        logger.info(
+            f"Event {event_type} matched {len(matched)} subscriptions, "
+            f"resuming {len(resumed_executions)} executions"
+        )
 
-        resume_workflow_task.delay(execution_id)
+        return resumed_executions
 
     async def cancel_subscriptions(self, execution_id: str):
         """Cancel all active subscriptions for an execution."""
@@ -266,17 +361,21 @@ class WorkflowEventService:
         result = await self.db.execute(stmt)
         timed_out = result.scalars().all()
 
+        executions = {}
+        if timed_out:
+            exec_result = await self.db.execute(
+                select(WorkflowExecution).where(
+                    WorkflowExecution.id.in_({s.execution_id for s in timed_out})
+                )
+            )
+            executions = {e.id: e for e in exec_result.scalars().all()}
+
         count = 0
         for subscription in timed_out:
             subscription.is_active = False
 
             # Fail the execution
-            exec_stmt = select(WorkflowExecution).where(
-                WorkflowExecution.id == subscription.execution_id
-            )
-            exec_result = await self.db.execute(exec_stmt)
-            execution = exec_result.scalar_one_or_none()
-
+            execution = executions.get(subscription.execution_id)
             if execution and execution.status == WorkflowExecutionStatus.PAUSED.value:
                 execution.status = WorkflowExecutionStatus.FAILED.value
                 execution.error = f"Timeout waiting for event: {subscription.event_type}"
@@ -330,6 +429,7 @@ class SyncWorkflowEventService:
         )
 
         self.db.add(subscription)
+        self.db.add_all(_build_filter_keys(subscription))
         self.db.commit()
 
         logger.info(
@@ -347,80 +447,44 @@ class SyncWorkflowEventService:
         """Handle an incoming event synchronously."""
         logger.info(f"Handling event {event_type} for workspace {workspace_id}")
 
-        stmt = select(WorkflowEventSubscription).where(
-            and_(
-                WorkflowEventSubscription.workspace_id == workspace_id,
-                WorkflowEventSubscription.event_type == event_type,
-                WorkflowEventSubscription.is_active == True,
-            )
+        result = self.db.execute(
+            _matching_subscriptions_query(workspace_id, event_type, event_data)
         )
-        result = self.db.execute(stmt)
-        subscriptions = result.scalars().all()
-
-        resumed_executions = []
-
-        for subscription in subscriptions:
-            if self._matches_filter(event_data, subscription.event_filter):
-                subscription.is_active = False
-                subscription.matched_at = datetime.now(timezone.utc)
-                subscription.matched_event_data = event_data
-
-                execution_id = subscription.execution_id
-                self._resume_execution(execution_id, event_type, event_data)
-                resumed_executions.append(execution_id)
-
-        self.db.commit()
-
-        return resumed_executions
+        matched = [
+            subscription
+            for subscription in result.scalars().all()
+            if _matches_filter(event_data, subscription.event_filter)
+        ]
+        if not matched:
+            return []
 
-    def _matches_filter(self, event_data: dict, event_filter: dict) -> bool:
-        """Check if event data matches filter."""
-        if not event_filter:
-            return True
-
-        for key, expected_value in event_filter.items():
-            actual_value = event_data.get(key)
-            if "." in key:
-                parts = key.split(".")
-                actual_value = event_data
-                for part in parts:
-                    if isinstance(actual_value, dict):
-                        actual_value = actual_value.get(part)
-                    else:
-                        actual_value = None
-                        break
-
-            if actual_value != expected_value:
-                return False
+        now = datetime.now(timezone.utc)
+        for subscription in matched:
+            subscription.is_active = False
+            subscription.matched_at = now
+            subscription.matched_event_data = event_data
+
+        execution_ids = {subscription.execution_id for subscription in matched}
+        executions = self.db.execute(
+            select(WorkflowExecution).where(
+                WorkflowExecution.id.in_(execution_ids),
+                WorkflowExecution.status == WorkflowExecutionStatus.PAUSED.value,
+            )
+        ).scalars().all()
 
-        return True
+        resumed_executions = []
+        for execution in executions:
+            _apply_event_to_execution(execution, event_type, event_data)
+            resumed_executions.append(execution.id)
 
-    def _resume_execution(
-        self,
-        execution_id: str,
-        event_type: str,
-        event_data: dict,
-    ):
-        """Resume a paused execution."""
-        execution = self.db.execute(
-            select(WorkflowExecution).where(WorkflowExecution.id == execution_id)
-        ).scalar_one_or_none()
-
-        if not execution or execution.status != WorkflowExecutionStatus.PAUSED.value:
-            return
-
-        context = execution.context or {}
-        context["event_data"] = event_data
-        context["event_type"] = event_type
-        context["event_received_at"] = datetime.now(timezone.utc).isoformat()
-        execution.context = context
-        execution.wait_event_type = None
-        execution.wait_timeout_at = None
         self.db.commit()
 
         from aexy.processing.workflow_tasks import resume_workflow_task
 
-        resume_workflow_task.delay(execution_id)
+        for execution_id in resumed_executions:
+            resume_workflow_task.delay(execution_id)
+
+        return resumed_executions
 
     def check_timed_out_subscriptions(self) -> int:
         """Check for and handle timed out subscriptions (sync version)."""
@@ -435,17 +499,21 @@ class SyncWorkflowEventService:
         result = self.db.execute(stmt)
         timed_out = result.scalars().all()
 
+        executions = {}
+        if timed_out:
+            exec_result = self.db.execute(
+                select(WorkflowExecution).where(
+                    WorkflowExecution.id.in_({s.execution_id for s in timed_out})
+                )
+            )
+            executions = {e.id: e for e in exec_result.scalars().all()}
+
         count = 0
         for subscription in timed_out:
             subscription.is_active = False
 
             # Fail the execution
-            exec_stmt = select(WorkflowExecution).where(
-                WorkflowExecution.id == subscription.execution_id
-            )
-            exec_result = self.db.execute(exec_stmt)
-            execution = exec_result.scalar_one_or_none()
-
+            execution = executions.get(subscription.execution_id)
             if execution and execution.status == WorkflowExecutionStatus.PAUSED.value:
                 execution.status = WorkflowExecutionStatus.FAILED.value
                 execution.error = f"Timeout waiting for event: {subscription.event_type}"
@@ -1,13 +1,13 @@
 """Synchronous workflow execution service for Celery tasks."""
 
 import logging
-from collections import defaultdict
 from datetime import datetime, timezone, timedelta
 from typing import Any
 from uuid import uuid4
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import flag_modified
 
 from aexy.models.workflow import (
     WorkflowDefinition,
@@ -17,15 +17,99 @@ from aexy.models.workflow import (
     WorkflowStepStatus,
 )
 from aexy.models.crm import CRMRecord
+from aexy.services.workflow_plan import CompiledNode, get_workflow_plan
 
 logger = logging.getLogger(__name__)
 
 
+# Node types whose execution has effects outside the journal (actions,
+# agent calls, event subscriptions), so the position is made durable first
+SIDE_EFFECT_NODE_TYPES = frozenset({"action", "agent", "wait"})
+
+
+class ExecutionJournal:
+    """Buffers step records and position updates of one execution.
+
+    Nothing is written until :meth:`flush`, which inserts all buffered steps
+    with one multi-row INSERT, stores the latest position together with the
+    execution context and commits. The persisted position and context
+    always describe the same point, so after a crash the unflushed nodes are
+    replayed from there; only nodes without outside effects are ever left
+    unflushed, and side-effecting nodes keep the previous at-most-once
+    behaviour.
+    """
+
+    def __init__(self, db: Session, execution: WorkflowExecution):
+        self.db = db
+        self.execution = execution
+        self._steps: list[dict] = []
+        self._position: tuple[str, str | None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def move_to(self, node_id: str, next_node_id: str | None) -> None:
+        """Record the node being executed and the one after it."""
+        self._position = (node_id, next_node_id)
+
+    def add_step(self, node: dict, result: dict) -> None:
+        """Buffer the step record of an executed node."""
+        self._steps.append({
+            "id": str(uuid4()),
+            "execution_id": self.execution.id,
+            "node_id": node["id"],
+            "node_type": node["type"],
+            "node_label": node.get("data", {}).get("label"),
+            "status": result["status"],
+            "input_data": result.get("input"),
+            "output_data": result.get("output"),
+            "condition_result": result.get("condition_result"),
+            "selected_branch": result.get("selected_branch"),
+            "error": result.get("error"),
+            "duration_ms": result.get("duration_ms", 0),
+            "executed_at": datetime.now(timezone.utc),
+        })
+
+    def flush(self, context: dict) -> None:
+        """Persist buffered steps, the position and the context in one commit."""
+        if self._steps:
+            self.db.execute(insert(WorkflowExecutionStep), self._steps)
+            self._steps = []
+
+        if self._position:
+            self.execution.current_node_id, self.execution.next_node_id = self._position
+
+        # The context dict is mutated in place, so flag it explicitly
+        self.execution.context = context
+        flag_modified(self.execution, "context")
+        self.db.commit()
+
+
 class SyncWorkflowExecutor:
     """Synchronous workflow executor for Celery tasks."""
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        journaled: bool | None = None,
+        flush_steps: int | None = None,
+    ):
+        """Initialize the executor.
+
+        Args:
+            db: Database session.
+            journaled: Buffer steps between durability boundaries instead of
+                committing twice per node. Defaults to the
+                ``workflow_journal_enabled`` setting.
+            flush_steps: Maximum buffered steps before a flush in journaled
+                mode. Defaults to the ``workflow_journal_flush_steps`` setting.
+        """
+        from aexy.core.config import get_settings
+
+        settings = get_settings()
         self.db = db
+        self.journaled = settings.workflow_journal_enabled if journaled is None else journaled
+        self.flush_steps = max(1, flush_steps or settings.workflow_journal_flush_steps)
 
     def execute(
         self,
@@ -44,27 +128,7 @@ class SyncWorkflowExecutor:
         Returns:
             Dict with execution result
         """
-        nodes = workflow.nodes
-        edges = workflow.edges
-
-        # Build execution helpers
-        node_map = {n["id"]: n for n in nodes}
-        graph = self._build_execution_graph(nodes, edges)
-
-        # Use precomputed execution order if available (performance optimization)
-        if workflow.execution_order:
-            execution_order = workflow.execution_order
-        else:
-            # Fallback to computing at runtime
-            execution_order = self._topological_sort(nodes, edges)
-
-        # Determine starting position
-        start_index = 0
-        if execution.next_node_id:
-            try:
-                start_index = execution_order.index(execution.next_node_id)
-            except ValueError:
-                logger.warning(f"Next node {execution.next_node_id} not in execution order")
+        plan = get_workflow_plan(workflow)
 
         # Build context from saved state
         context = execution.context or {}
@@ -73,47 +137,66 @@ class SyncWorkflowExecutor:
         context.setdefault("executed_nodes", [])
         context.setdefault("variables", {})
 
-        skip_nodes: set[str] = set(context.get("skip_nodes", []))
+        skip_mask = plan.mask_of(context.get("skip_nodes", []))
         results = []
+        journal = ExecutionJournal(self.db, execution)
+        flush_steps = self.flush_steps
+        executed_concurrently: set[int] = set()
 
-        # Execute nodes starting from start_index
-        for i in range(start_index, len(execution_order)):
-            node_id = execution_order[i]
-
-            if node_id in skip_nodes:
+        # Execute nodes starting from the saved position
+        for compiled, following in plan.steps_from(execution.next_node_id):
+            if skip_mask >> compiled.index & 1 or compiled.index in executed_concurrently:
                 continue
 
-            node = node_map.get(node_id)
-            if not node:
-                continue
-
-            # Update current position
-            execution.current_node_id = node_id
-            next_node_id = execution_order[i + 1] if i + 1 < len(execution_order) else None
-            execution.next_node_id = next_node_id
-            self.db.commit()
+            node = compiled.node
+            node_id = compiled.id
+
+            # Independent actions adjacent in execution order run together
+            if not execution.is_dry_run:
+                members, after = plan.concurrent_run(compiled)
+                members = [m for m in members if not skip_mask >> m.index & 1]
+                if len(members) > 1:
+                    journal.move_to(members[-1].id, after.id if after else None)
+                    journal.flush(context)
+
+                    group_results = self._execute_concurrent_actions(members, context, execution)
+                    failed = None
+                    for member, result in zip(members, group_results):
+                        results.append(result)
+                        journal.add_step(member.node, result)
+                        context["executed_nodes"].append(member.id)
+                        if result.get("output"):
+                            context["variables"][member.id] = result["output"]
+                        if failed is None and result["status"] == "failed":
+                            failed = (member, result)
+
+                    if failed:
+                        member, result = failed
+                        execution.status = WorkflowExecutionStatus.FAILED.value
+                        execution.error = result.get("error")
+                        execution.error_node_id = member.id
+                        execution.completed_at = datetime.now(timezone.utc)
+                        journal.flush(context)
+                        return {
+                            "status": "failed",
+                            "error": result.get("error"),
+                            "results": results,
+                        }
+
+                    journal.flush(context)
+                    executed_concurrently.update(m.index for m in members)
+                    continue
+
+            # Make the position durable before anything with outside effects
+            journal.move_to(node_id, following.id if following else None)
+            durable = not self.journaled or self._has_side_effects(compiled, execution)
+            if durable:
+                journal.flush(context)
 
             # Execute the node
-            result = self._execute_node(node, context, execution)
+            result = self._execute_node(compiled, context, execution)
             results.append(result)
-
-            # Create step record
-            step = WorkflowExecutionStep(
-                id=str(uuid4()),
-                execution_id=execution.id,
-                node_id=node_id,
-                node_type=node["type"],
-                node_label=node.get("data", {}).get("label"),
-                status=result["status"],
-                input_data=result.get("input"),
-                output_data=result.get("output"),
-                condition_result=result.get("condition_result"),
-                selected_branch=result.get("selected_branch"),
-                error=result.get("error"),
-                duration_ms=result.get("duration_ms", 0),
-            )
-            self.db.add(step)
-            self.db.commit()
+            journal.add_step(node, result)
 
             context["executed_nodes"].append(node_id)
 
@@ -123,15 +206,13 @@ class SyncWorkflowExecutor:
                 execution.error = result.get("error")
                 execution.error_node_id = node_id
                 execution.completed_at = datetime.now(timezone.utc)
-                execution.context = context
-                self.db.commit()
+                journal.flush(context)
                 return {"status": "failed", "error": result.get("error"), "results": results}
 
             if result["status"] == "waiting":
                 # Workflow is paused, waiting for something
                 execution.status = WorkflowExecutionStatus.PAUSED.value
                 execution.paused_at = datetime.now(timezone.utc)
-                execution.context = context
 
                 # Set up resumption based on wait type
                 wait_info = result.get("wait_info", {})
@@ -142,53 +223,54 @@ class SyncWorkflowExecutor:
                 if wait_info.get("timeout_at"):
                     execution.wait_timeout_at = wait_info["timeout_at"]
 
-                self.db.commit()
+                journal.flush(context)
+
+                # Register the wake-up only once the pause is committed
+                from aexy.processing.workflow_timers import schedule_wait_timers
+
+                schedule_wait_timers(
+                    execution.id,
+                    resume_at=wait_info.get("resume_at"),
+                    timeout_at=wait_info.get("timeout_at"),
+                )
                 return {"status": "paused", "wait_info": wait_info, "results": results}
 
-            # Handle branching/conditions
-            if node["type"] == "condition":
-                condition_result = result.get("condition_result", True)
-                if not condition_result:
-                    # Skip the 'true' branch
-                    true_targets = self._get_branch_targets(node_id, edges, "true")
-                    downstream = self._get_downstream_nodes(true_targets, graph)
-                    skip_nodes.update(downstream)
-                else:
-                    # Skip the 'false' branch
-                    false_targets = self._get_branch_targets(node_id, edges, "false")
-                    downstream = self._get_downstream_nodes(false_targets, graph)
-                    skip_nodes.update(downstream)
-                context["skip_nodes"] = list(skip_nodes)
-
-            if node["type"] == "branch":
-                selected_branch = result.get("selected_branch")
-                all_branches = self._get_all_branch_targets(node_id, edges)
-                for branch_id, targets in all_branches.items():
-                    if branch_id != selected_branch:
-                        downstream = self._get_downstream_nodes(targets, graph)
-                        skip_nodes.update(downstream)
-                context["skip_nodes"] = list(skip_nodes)
+            # Skip the branches that were not taken
+            if compiled.type in ("condition", "branch"):
+                skip_mask |= compiled.skip_mask(
+                    condition_result=result.get("condition_result", True),
+                    selected_branch=result.get("selected_branch"),
+                )
+                context["skip_nodes"] = plan.ids_of(skip_mask)
 
             # Store result in variables if needed
             if result.get("output"):
                 context["variables"][node_id] = result["output"]
 
+            # ...and its outcome right after, so replays see its output
+            if durable or len(journal) >= flush_steps:
+                journal.flush(context)
+
         # Workflow completed successfully
         execution.status = WorkflowExecutionStatus.COMPLETED.value
         execution.completed_at = datetime.now(timezone.utc)
-        execution.context = context
-        self.db.commit()
+        journal.flush(context)
 
         return {"status": "completed", "results": results}
 
+    def _has_side_effects(self, compiled: CompiledNode, execution: WorkflowExecution) -> bool:
+        """Check whether a node does anything a replay could not undo."""
+        return compiled.type in SIDE_EFFECT_NODE_TYPES and not execution.is_dry_run
+
     def _execute_node(
         self,
-        node: dict,
+        compiled: CompiledNode,
         context: dict,
         execution: WorkflowExecution,
     ) -> dict:
         """Execute a single workflow node."""
         start_time = datetime.now(timezone.utc)
+        node = compiled.node
         node_type = node.get("type")
         data = node.get("data", {})
 
@@ -198,13 +280,13 @@ class SyncWorkflowExecutor:
             elif node_type == "action":
                 result = self._execute_action(data, context, execution)
             elif node_type == "condition":
-                result = self._execute_condition(data, context)
+                result = self._execute_condition(compiled, context)
             elif node_type == "wait":
                 result = self._execute_wait(data, context, execution)
             elif node_type == "agent":
                 result = self._execute_agent(data, context, execution)
             elif node_type == "branch":
-                result = self._execute_branch(data, context)
+                result = self._execute_branch(compiled, context)
             else:
                 result = {"status": "failed", "error": f"Unknown node type: {node_type}"}
 
@@ -256,27 +338,26 @@ class SyncWorkflowExecutor:
         handler = SyncWorkflowActionHandler(self.db)
         return handler.execute_action(action_type, data, context, execution)
 
-    def _execute_condition(self, data: dict, context: dict) -> dict:
-        """Execute condition node."""
-        conditions = data.get("conditions", [])
-        conjunction = data.get("conjunction", "and")
+    def _execute_concurrent_actions(
+        self,
+        members: list[CompiledNode],
+        context: dict,
+        execution: WorkflowExecution,
+    ) -> list[dict]:
+        """Execute a run of independent action nodes concurrently."""
+        from aexy.services.workflow_actions import SyncWorkflowActionHandler
 
-        if not conditions:
-            return {"status": "success", "condition_result": True}
+        handler = SyncWorkflowActionHandler(self.db)
+        return handler.execute_actions(
+            [member.node.get("data", {}) for member in members], context, execution
+        )
 
-        results = []
-        for cond in conditions:
-            field = cond.get("field")
-            operator = cond.get("operator")
-            value = cond.get("value")
-            actual_value = self._get_field_value(field, context)
-            result = self._evaluate_condition(actual_value, operator, value)
-            results.append(result)
+    def _execute_condition(self, compiled: CompiledNode, context: dict) -> dict:
+        """Execute condition node."""
+        if not compiled.conditions:
+            return {"status": "success", "condition_result": True}
 
-        if conjunction == "and":
-            final_result = all(results)
-        else:
-            final_result = any(results)
+        final_result, results = compiled.evaluate_conditions(context)
 
         return {
             "status": "success",
@@ -339,6 +420,9 @@ class SyncWorkflowExecutor:
                     wait_until = datetime.fromisoformat(wait_until_str.replace("Z", "+00:00"))
                 else:
                     wait_until = wait_until_str
+                # Naive datetimes are taken as UTC, not the worker's local time
+                if wait_until.tzinfo is None:
+                    wait_until = wait_until.replace(tzinfo=timezone.utc)
 
                 return {
                     "status": "waiting",
@@ -472,38 +556,12 @@ class SyncWorkflowExecutor:
                 },
             }
 
-    def _execute_branch(self, data: dict, context: dict) -> dict:
+    def _execute_branch(self, compiled: CompiledNode, context: dict) -> dict:
         """Execute branch node."""
-        branches = data.get("branches", [])
-
-        for branch in branches:
-            branch_id = branch.get("id")
-            conditions = branch.get("conditions", [])
-
-            if not conditions:
-                # First branch without conditions is the default
-                return {
-                    "status": "success",
-                    "selected_branch": branch_id,
-                }
-
-            all_match = True
-            for cond in conditions:
-                field = cond.get("field")
-                operator = cond.get("operator")
-                value = cond.get("value")
-                actual_value = self._get_field_value(field, context)
-                if not self._evaluate_condition(actual_value, operator, value):
-                    all_match = False
-                    break
-
-            if all_match:
-                return {
-                    "status": "success",
-                    "selected_branch": branch_id,
-                }
-
-        return {"status": "success", "selected_branch": None}
+        return {
+            "status": "success",
+            "selected_branch": compiled.select_branch(context),
+        }
 
     def _get_field_value(self, field_path: str, context: dict) -> Any:
         """Get a value from context using dot notation path."""
@@ -532,120 +590,3 @@ class SyncWorkflowExecutor:
                 return None
 
         return current
-
-    def _evaluate_condition(self, actual: Any, operator: str, expected: Any) -> bool:
-        """Evaluate a condition."""
-        if operator == "equals":
-            return actual == expected
-        elif operator == "not_equals":
-            return actual != expected
-        elif operator == "contains":
-            return expected in str(actual) if actual else False
-        elif operator == "not_contains":
-            return expected not in str(actual) if actual else True
-        elif operator == "starts_with":
-            return str(actual).startswith(expected) if actual else False
-        elif operator == "ends_with":
-            return str(actual).endswith(expected) if actual else False
-        elif operator == "is_empty":
-            return actual is None or actual == "" or actual == []
-        elif operator == "is_not_empty":
-            return actual is not None and actual != "" and actual != []
-        elif operator == "gt":
-            try:
-                return float(actual) > float(expected) if actual else False
-            except (ValueError, TypeError):
-                return False
-        elif operator == "gte":
-            try:
-                return float(actual) >= float(expected) if actual else False
-            except (ValueError, TypeError):
-                return False
-        elif operator == "lt":
-            try:
-                return float(actual) < float(expected) if actual else False
-            except (ValueError, TypeError):
-                return False
-        elif operator == "lte":
-            try:
-                return float(actual) <= float(expected) if actual else False
-            except (ValueError, TypeError):
-                return False
-        elif operator == "in":
-            return actual in expected if isinstance(expected, list) else False
-        elif operator == "not_in":
-            return actual not in expected if isinstance(expected, list) else True
-        return False
-
-    def _build_execution_graph(
-        self, nodes: list[dict], edges: list[dict]
-    ) -> dict[str, list[str]]:
-        """Build adjacency list for workflow execution."""
-        graph: dict[str, list[str]] = defaultdict(list)
-        for edge in edges:
-            source = edge.get("source")
-            target = edge.get("target")
-            if source and target:
-                graph[source].append(target)
-        return dict(graph)
-
-    def _topological_sort(
-        self, nodes: list[dict], edges: list[dict]
-    ) -> list[str]:
-        """Topological sort of nodes for execution order."""
-        graph = self._build_execution_graph(nodes, edges)
-        in_degree: dict[str, int] = {n["id"]: 0 for n in nodes}
-
-        for edge in edges:
-            target = edge.get("target")
-            if target:
-                in_degree[target] = in_degree.get(target, 0) + 1
-
-        queue = [node_id for node_id, degree in in_degree.items() if degree == 0]
-        result = []
-
-        while queue:
-            node_id = queue.pop(0)
-            result.append(node_id)
-            for neighbor in graph.get(node_id, []):
-                in_degree[neighbor] -= 1
-                if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
-
-        return result
-
-    def _get_branch_targets(
-        self, node_id: str, edges: list[dict], handle: str
-    ) -> list[str]:
-        """Get target nodes for a specific branch handle."""
-        targets = []
-        for edge in edges:
-            if edge.get("source") == node_id:
-                source_handle = edge.get("sourceHandle", "")
-                if source_handle == handle or handle in str(source_handle):
-                    targets.append(edge.get("target"))
-        return targets
-
-    def _get_all_branch_targets(
-        self, node_id: str, edges: list[dict]
-    ) -> dict[str, list[str]]:
-        """Get all branch targets grouped by handle."""
-        branches: dict[str, list[str]] = defaultdict(list)
-        for edge in edges:
-            if edge.get("source") == node_id:
-                handle = edge.get("sourceHandle", "default")
-                branches[handle].append(edge.get("target"))
-        return dict(branches)
-
-    def _get_downstream_nodes(
-        self, start_nodes: list[str], graph: dict[str, list[str]]
-    ) -> set[str]:
-        """Get all downstream nodes from a set of starting nodes."""
-        downstream = set()
-        queue = list(start_nodes)
-        while queue:
-            node = queue.pop(0)
-            if node and node not in downstream:
-                downstream.add(node)
-                queue.extend(graph.get(node, []))
-        return downstream
@@ -0,0 +1,388 @@
+"""Compiled execution plans for workflow definitions.
+
+A plan turns a workflow's node/edge JSON into index-based arrays once per
+(workflow, version): execution order, downstream reachability as integer
+bitsets, per-node branch skip masks and conditions with their operators
+resolved. Plans are cached per process and dropped through
+``WorkflowCache.invalidate_workflow``.
+"""
+
+import logging
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Number of compiled plans kept per process
+MAX_CACHED_PLANS = 256
+
+# Action types that do not use the database session and can therefore run
+# concurrently with each other
+CONCURRENT_ACTION_TYPES = frozenset({"webhook_call", "send_slack", "send_sms", "send_email"})
+
+
+def _to_float_compare(compare: Callable[[float, float], bool]) -> Callable[[Any, Any], bool]:
+    def evaluate(actual: Any, expected: Any) -> bool:
+        try:
+            return compare(float(actual), float(expected)) if actual else False
+        except (ValueError, TypeError):
+            return False
+
+    return evaluate
+
+
+OPERATOR_EVALUATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "equals": lambda actual, expected: actual == expected,
+    "not_equals": lambda actual, expected: actual != expected,
+    "contains": lambda actual, expected: expected in str(actual) if actual else False,
+    "not_contains": lambda actual, expected: expected not in str(actual) if actual else True,
+    "starts_with": lambda actual, expected: str(actual).startswith(expected) if actual else False,
+    "ends_with": lambda actual, expected: str(actual).endswith(expected) if actual else False,
+    "is_empty": lambda actual, expected: actual is None or actual == "" or actual == [],
+    "is_not_empty": lambda actual, expected: actual is not None and actual != "" and actual != [],
+    "gt": _to_float_compare(lambda a, b: a > b),
+    "gte": _to_float_compare(lambda a, b: a >= b),
+    "lt": _to_float_compare(lambda a, b: a < b),
+    "lte": _to_float_compare(lambda a, b: a <= b),
+    "in": lambda actual, expected: actual in expected if isinstance(expected, list) else False,
+    "not_in": lambda actual, expected: (
+        actual not in expected if isinstance(expected, list) else True
+    ),
+}
+
+# Context roots addressable by the first segment of a condition field path
+CONTEXT_ROOTS = {"record": "record_data", "trigger": "trigger_data", "variables": "variables"}
+
+
+def _never(actual: Any, expected: Any) -> bool:
+    return False
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledCondition:
+    """A condition with its field path split and operator resolved."""
+
+    root: str
+    path: tuple[str, ...]
+    evaluate: Callable[[Any, Any], bool]
+    value: Any
+
+    @classmethod
+    def compile(cls, condition: dict) -> "CompiledCondition":
+        field_path = condition.get("field")
+        operator = condition.get("operator")
+
+        evaluate = OPERATOR_EVALUATORS.get(operator)
+        if evaluate is None:
+            logger.warning(f"Unknown workflow condition operator: {operator}")
+            evaluate = _never
+
+        if not field_path:
+            return cls("", (), evaluate, condition.get("value"))
+
+        parts = field_path.split(".")
+        if parts[0] in CONTEXT_ROOTS:
+            return cls(CONTEXT_ROOTS[parts[0]], tuple(parts[1:]), evaluate, condition.get("value"))
+        return cls("record_data", tuple(parts), evaluate, condition.get("value"))
+
+    def resolve(self, context: dict) -> Any:
+        """Get the field value from an execution context."""
+        if not self.root:
+            return None
+
+        current = context.get(self.root, {})
+        for part in self.path:
+            if isinstance(current, dict):
+                current = current.get(part)
+            else:
+                return None
+        return current
+
+    def matches(self, context: dict) -> bool:
+        return self.evaluate(self.resolve(context), self.value)
+
+
+@dataclass(slots=True)
+class CompiledNode:
+    """A workflow node with its precomputed control-flow data."""
+
+    node: dict
+    index: int
+    conditions: list[CompiledCondition] = field(default_factory=list)
+    match_all: bool = True
+    branches: list[tuple[str | None, list[CompiledCondition]]] = field(default_factory=list)
+    # Nodes skipped when a condition evaluates to True / False
+    skip_if_true: int = 0
+    skip_if_false: int = 0
+    # Nodes skipped per selected branch handle, and when no handle matches
+    branch_skips: dict[str, int] = field(default_factory=dict)
+    branch_skip_all: int = 0
+
+    @property
+    def id(self) -> str:
+        return self.node["id"]
+
+    @property
+    def type(self) -> str | None:
+        return self.node.get("type")
+
+    def evaluate_conditions(self, context: dict) -> tuple[bool, list[bool]]:
+        """Evaluate a condition node; empty conditions pass."""
+        if not self.conditions:
+            return True, []
+        results = [condition.matches(context) for condition in self.conditions]
+        return (all(results) if self.match_all else any(results)), results
+
+    def select_branch(self, context: dict) -> str | None:
+        """Get the first branch whose conditions all match (or that has none)."""
+        for branch_id, conditions in self.branches:
+            if all(condition.matches(context) for condition in conditions):
+                return branch_id
+        return None
+
+    def skip_mask(self, condition_result: bool | None = None, selected_branch: Any = None) -> int:
+        """Get the nodes to skip after this node ran."""
+        if self.type == "condition":
+            return self.skip_if_true if condition_result else self.skip_if_false
+        if self.type == "branch":
+            return self.branch_skips.get(selected_branch, self.branch_skip_all)
+        return 0
+
+
+class WorkflowPlan:
+    """Index-based execution plan of one workflow version."""
+
+    def __init__(
+        self,
+        workflow_id: str,
+        version: int,
+        nodes: list[dict],
+        edges: list[dict],
+        execution_order: list[str],
+    ) -> None:
+        self.workflow_id = workflow_id
+        self.version = version
+        self.node_ids: list[str] = [node["id"] for node in nodes]
+        self.index_of: dict[str, int] = {node_id: i for i, node_id in enumerate(self.node_ids)}
+
+        successors: list[list[int]] = [[] for _ in nodes]
+        handles: list[dict[str, list[int]]] = [defaultdict(list) for _ in nodes]
+        for edge in edges:
+            source = self.index_of.get(edge.get("source"))
+            target = self.index_of.get(edge.get("target"))
+            if source is None or target is None:
+                continue
+            successors[source].append(target)
+            handles[source][edge.get("sourceHandle", "default")].append(target)
+
+        self.reachable = self._compute_reachability(successors)
+
+        # Execution order as node indices; IDs without a node are dropped
+        self.order: list[int] = [self.index_of[n] for n in execution_order if n in self.index_of]
+        self.position: dict[str, int] = {
+            self.node_ids[index]: position for position, index in enumerate(self.order)
+        }
+
+        self.nodes: list[CompiledNode] = [
+            self._compile_node(node, i, handles[i]) for i, node in enumerate(nodes)
+        ]
+
+        # Longest-path depth of each node; nodes on the same level have no
+        # path between them and are independent of each other
+        self.level = [0] * len(nodes)
+        for index in self.order:
+            for target in successors[index]:
+                self.level[target] = max(self.level[target], self.level[index] + 1)
+
+        # Last position of the run of concurrent-safe actions on the same
+        # level that starts at each position
+        self.run_end = list(range(len(self.order)))
+        for position in range(len(self.order) - 2, -1, -1):
+            current, following = self.order[position], self.order[position + 1]
+            if (
+                self._is_concurrent_action(current)
+                and self._is_concurrent_action(following)
+                and self.level[current] == self.level[following]
+            ):
+                self.run_end[position] = self.run_end[position + 1]
+
+    def _compute_reachability(self, successors: list[list[int]]) -> list[int]:
+        """Compute, per node, the bitset of itself and every node downstream."""
+        reachable = [0] * len(successors)
+        for start in range(len(successors)):
+            mask = 1 << start
+            stack = [start]
+            while stack:
+                node = stack.pop()
+                for target in successors[node]:
+                    bit = 1 << target
+                    if reachable[target]:
+                        mask |= reachable[target]
+                    elif not mask & bit:
+                        mask |= bit
+                        stack.append(target)
+            reachable[start] = mask
+        return reachable
+
+    def _is_concurrent_action(self, index: int) -> bool:
+        node = self.nodes[index].node
+        return (
+            node.get("type") == "action"
+            and node.get("data", {}).get("action_type") in CONCURRENT_ACTION_TYPES
+        )
+
+    def _downstream(self, targets: list[int]) -> int:
+        mask = 0
+        for target in targets:
+            mask |= self.reachable[target]
+        return mask
+
+    def _compile_node(
+        self, node: dict, index: int, handles: dict[str, list[int]]
+    ) -> CompiledNode:
+        compiled = CompiledNode(node=node, index=index)
+        data = node.get("data", {})
+
+        if node.get("type") == "condition":
+            compiled.conditions = [
+                CompiledCondition.compile(c) for c in data.get("conditions", [])
+            ]
+            compiled.match_all = data.get("conjunction", "and") == "and"
+
+            # Handles are matched loosely, as the builder may suffix them
+            true_targets = [
+                t for handle, targets in handles.items()
+                if handle == "true" or "true" in str(handle) for t in targets
+            ]
+            false_targets = [
+                t for handle, targets in handles.items()
+                if handle == "false" or "false" in str(handle) for t in targets
+            ]
+            compiled.skip_if_true = self._downstream(false_targets)
+            compiled.skip_if_false = self._downstream(true_targets)
+
+        elif node.get("type") == "branch":
+            compiled.branches = [
+                (
+                    branch.get("id"),
+                    [CompiledCondition.compile(c) for c in branch.get("conditions", [])],
+                )
+                for branch in data.get("branches", [])
+            ]
+            masks = {handle: self._downstream(targets) for handle, targets in handles.items()}
+            for handle in masks:
+                skip = 0
+                for other, mask in masks.items():
+                    if other != handle:
+                        skip |= mask
+                compiled.branch_skips[handle] = skip
+            compiled.branch_skip_all = self._downstream(
+                [t for targets in handles.values() for t in targets]
+            )
+
+        return compiled
+
+    def mask_of(self, node_ids: list[str]) -> int:
+        """Convert node IDs to a bitset, ignoring unknown IDs."""
+        mask = 0
+        for node_id in node_ids:
+            index = self.index_of.get(node_id)
+            if index is not None:
+                mask |= 1 << index
+        return mask
+
+    def ids_of(self, mask: int) -> list[str]:
+        """Convert a bitset to node IDs in node order."""
+        return [node_id for i, node_id in enumerate(self.node_ids) if mask >> i & 1]
+
+    def steps_from(self, node_id: str | None) -> Iterator[tuple[CompiledNode, CompiledNode | None]]:
+        """Iterate (node, next node) pairs in execution order from a node."""
+        start = self.position.get(node_id, 0) if node_id else 0
+        if node_id and node_id not in self.position:
+            logger.warning(f"Next node {node_id} not in execution order")
+
+        for position in range(start, len(self.order)):
+            following = (
+                self.nodes[self.order[position + 1]] if position + 1 < len(self.order) else None
+            )
+            yield self.nodes[self.order[position]], following
+
+    def concurrent_run(
+        self, node: CompiledNode
+    ) -> tuple[list[CompiledNode], CompiledNode | None]:
+        """Get the independent actions that can run together with a node.
+
+        Returns:
+            The run of concurrent-safe actions starting at ``node`` (just the
+            node itself when it cannot run concurrently) and the node that
+            follows the run in execution order.
+        """
+        position = self.position[node.id]
+        end = self.run_end[position]
+        members = [self.nodes[self.order[p]] for p in range(position, end + 1)]
+        following = self.nodes[self.order[end + 1]] if end + 1 < len(self.order) else None
+        return members, following
+
+
+def topological_order(nodes: list[dict], edges: list[dict]) -> list[str]:
+    """Kahn's algorithm over node IDs; nodes on a cycle are left out."""
+    graph: dict[str, list[str]] = defaultdict(list)
+    in_degree: dict[str, int] = {n["id"]: 0 for n in nodes}
+
+    for edge in edges:
+        source = edge.get("source")
+        target = edge.get("target")
+        if source and target:
+            graph[source].append(target)
+            in_degree[target] = in_degree.get(target, 0) + 1
+
+    queue = [node_id for node_id, degree in in_degree.items() if degree == 0]
+    result = []
+    head = 0
+    while head < len(queue):
+        node_id = queue[head]
+        head += 1
+        result.append(node_id)
+        for neighbor in graph.get(node_id, []):
+            in_degree[neighbor] -= 1
+            if in_degree[neighbor] == 0:
+                queue.append(neighbor)
+
+    return result
+
+
+_plans: "OrderedDict[tuple[str, int], WorkflowPlan]" = OrderedDict()
+
+
+def get_workflow_plan(workflow: Any) -> WorkflowPlan:
+    """Get the compiled plan of a workflow definition, compiling it on a miss.
+
+    Plans are keyed by (workflow ID, version); the version is bumped on every
+    node/edge change, so other processes never run a stale plan.
+    """
+    key = (workflow.id, workflow.version or 0)
+    plan = _plans.get(key)
+    if plan is not None:
+        _plans.move_to_end(key)
+        return plan
+
+    nodes = workflow.nodes or []
+    edges = workflow.edges or []
+    execution_order = workflow.execution_order or topological_order(nodes, edges)
+    plan = WorkflowPlan(workflow.id, key[1], nodes, edges, execution_order)
+
+    _plans[key] = plan
+    while len(_plans) > MAX_CACHED_PLANS:
+        _plans.popitem(last=False)
+
+    logger.debug(
+        f"Compiled workflow plan for {workflow.id} v{key[1]} ({len(plan.node_ids)} nodes)"
+    )
+    return plan
+
+
+def invalidate_workflow_plans(workflow_id: str) -> None:
+    """Drop every cached plan of a workflow in this process."""
+    for key in [key for key in _plans if key[0] == workflow_id]:
+        del _plans[key]
@@ -15,6 +15,7 @@ from aexy.models.workflow import (
     NODE_TYPES,
     CONDITION_OPERATORS,
 )
+from aexy.cache.workflow_cache import get_workflow_cache
 from aexy.models.crm import CRMAutomation, CRMRecord
 from aexy.schemas.workflow import (
     WorkflowNode,
@@ -143,6 +144,9 @@ class WorkflowService:
 
         await self.db.flush()
         await self.db.refresh(workflow)
+
+        if has_changes:
+            await get_workflow_cache().invalidate_workflow(workflow_id)
         return workflow
 
     def _generate_change_summary(
@@ -233,6 +237,7 @@ class WorkflowService:
             return False
         await self.db.delete(workflow)
         await self.db.flush()
+        await get_workflow_cache().invalidate_workflow(workflow_id)
         return True
 
     async def publish_workflow(self, workflow_id: str) -> WorkflowDefinition | None:
@@ -0,0 +1,94 @@
+"""Tests for the LangGraph agent base class."""
+
+import asyncio
+import time
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.tools import BaseTool
+
+from aexy.agents.base import BaseAgent
+
+
+class SlowTool(BaseTool):
+    name: str = "slow"
+    description: str = "Sleeps, then echoes its input"
+
+    def _run(self, value: str) -> str:
+        raise NotImplementedError
+
+    async def _arun(self, value: str) -> str:
+        await asyncio.sleep(0.2)
+        return f"echo {value}"
+
+
+class ScriptedLLM:
+    """Chat model stand-in that replays canned responses."""
+
+    def __init__(self, responses: list[AIMessage]):
+        self.responses = list(responses)
+
+    async def ainvoke(self, messages):
+        return self.responses.pop(0)
+
+
+class EchoAgent(BaseAgent):
+    name = "echo"
+    description = "Echo agent"
+
+    def __init__(self, responses: list[AIMessage], **kwargs):
+        super().__init__(**kwargs)
+        self._llm_with_tools = ScriptedLLM(responses)
+
+    @property
+    def tools(self) -> list[BaseTool]:
+        return [SlowTool()]
+
+    @property
+    def system_prompt(self) -> str:
+        return "Echo things."
+
+
+def scripted_turns() -> list[AIMessage]:
+    return [
+        AIMessage(
+            content="",
+            tool_calls=[
+                {"name": "slow", "args": {"value": "a"}, "id": "call-1"},
+                {"name": "slow", "args": {"value": "b"}, "id": "call-2"},
+            ],
+            usage_metadata={"input_tokens": 10, "output_tokens": 5, "total_tokens": 15},
+        ),
+        AIMessage(content="done"),
+    ]
+
+
+class TestBaseAgent:
+    """Tests for BaseAgent."""
+
+    @pytest.mark.asyncio
+    async def test_runs_tool_calls_concurrently(self):
+        """Should run the tool calls of one turn together and time each step."""
+        agent = EchoAgent(scripted_turns())
+
+        started = time.monotonic()
+        result = await agent.run()
+        elapsed = time.monotonic() - started
+
+        assert result["status"] == "completed"
+        assert result["output"]["content"] == "done"
+        assert elapsed < 0.35
+        assert [step["type"] for step in result["steps"]] == [
+            "llm_call", "tool_call", "tool_call", "llm_call",
+        ]
+        assert result["steps"][0]["input_tokens"] == 10
+        assert all("duration_ms" in step for step in result["steps"])
+
+    @pytest.mark.asyncio
+    async def test_compiled_graph_is_shared(self):
+        """Should compile the graph once per agent class."""
+        first = EchoAgent(scripted_turns())
+        second = EchoAgent(scripted_turns())
+
+        assert first.compiled_graph is second.compiled_graph
+        assert (await second.run())["status"] == "completed"
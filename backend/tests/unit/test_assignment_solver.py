@@ -0,0 +1,69 @@
+"""Tests for the assignment solver."""
+
+from types import SimpleNamespace
+
+from aexy.services.assignment_solver import greedy_assignment, solve_assignment
+from aexy.services.whatif_analyzer import WhatIfAnalyzer
+
+
+class TestSolveAssignment:
+    """Tests for solve_assignment."""
+
+    def test_beats_greedy(self):
+        """Should give up the single best pair when that raises the total."""
+        scores = [
+            [0.9, 0.8],
+            [0.8, 0.1],
+        ]
+
+        result = solve_assignment(scores, [1, 1])
+
+        assert greedy_assignment(scores, [1, 1]) == {0: 0, 1: 1}
+        assert result.assignments == {0: 1, 1: 0}
+        assert round(result.score, 3) == 1.6
+        assert round(result.score_gap, 3) == 0.6
+
+    def test_respects_capacity(self):
+        """Should not give a developer more tasks than their capacity."""
+        scores = [[0.9, 0.2]] * 3
+
+        result = solve_assignment(scores, [2, 0])
+
+        assert sorted(result.assignments.values()) == [0, 0]
+        assert len(result.assignments) == 2
+
+    def test_required_and_forbidden_pairs(self):
+        """Should keep required pairs and never use forbidden ones."""
+        scores = [
+            [0.9, 0.1],
+            [0.9, 0.5],
+        ]
+
+        result = solve_assignment(scores, [1, 1], required=[(0, 1)], forbidden=[(1, 0)])
+
+        assert result.assignments == {0: 1}
+        assert result.greedy_assignments == {0: 1}
+
+
+class TestWhatIfOptimizeAssignments:
+    """Tests for WhatIfAnalyzer.optimize_assignments."""
+
+    def test_reports_gap_to_greedy(self):
+        """Should assign optimally and compare with greedy assignment."""
+        python = {"languages": [{"name": "Python", "proficiency_score": 90}]}
+        developers = [
+            SimpleNamespace(id="dev-1", name="Dev 1", skill_fingerprint=python),
+            SimpleNamespace(id="dev-2", name="Dev 2", skill_fingerprint={}),
+        ]
+        tasks = [
+            {"id": "task-1", "title": "API", "signals": {"required_skills": ["Python"]}},
+            {"id": "task-2", "title": "Docs", "signals": {}},
+        ]
+
+        scenario = WhatIfAnalyzer().optimize_assignments(
+            tasks, developers, {"max_per_dev": 1}
+        )
+
+        assigned = {a.task_id: a.developer_id for a in scenario.assignments}
+        assert assigned == {"task-1": "dev-1", "task-2": "dev-2"}
+        assert scenario.comparison_to_baseline["score_gap"] >= 0
@@ -0,0 +1,49 @@
+"""Tests for the process-wide async runtime."""
+
+import asyncio
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import pytest
+
+from aexy.core.async_runtime import AsyncRuntime
+
+
+class TestAsyncRuntime:
+    """Tests for AsyncRuntime."""
+
+    def test_runs_coroutines_on_one_loop(self):
+        """Should run every submitted coroutine on the same long-lived loop."""
+        runtime = AsyncRuntime()
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        try:
+            assert runtime.run(current_loop()) is runtime.run(current_loop()) is runtime.loop
+        finally:
+            runtime.stop()
+
+        assert not runtime.is_running
+
+    def test_cancels_on_timeout(self):
+        """Should cancel the coroutine when the caller stops waiting."""
+        runtime = AsyncRuntime()
+        cancelled = asyncio.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def was_cancelled():
+            await asyncio.wait_for(cancelled.wait(), 1)
+            return cancelled.is_set()
+
+        try:
+            with pytest.raises(FutureTimeoutError):
+                runtime.run(slow(), timeout=0.05)
+            assert runtime.run(was_cancelled())
+        finally:
+            runtime.stop()
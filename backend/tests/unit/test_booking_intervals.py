@@ -0,0 +1,99 @@
+"""Tests for booking availability interval algebra."""
+
+from datetime import date, datetime, time, timedelta, timezone
+from unittest.mock import MagicMock
+
+from aexy.services.booking.availability_service import AvailabilityService
+from aexy.services.booking.intervals import (
+    intersect_all,
+    merge_intervals,
+    subtract_intervals,
+    union_intervals,
+)
+
+DAY = date(2026, 3, 2)
+
+
+def at(hour: int, minute: int = 0) -> datetime:
+    return datetime.combine(DAY, time(hour, minute), tzinfo=timezone.utc)
+
+
+class TestIntervals:
+    """Tests for interval operations."""
+
+    def test_merge_sorts_and_joins(self):
+        """Should merge overlapping and touching intervals and drop empty ones."""
+        merged = merge_intervals(
+            [(at(11), at(12)), (at(9), at(10)), (at(10), at(10, 30)), (at(13), at(13))]
+        )
+
+        assert merged == [(at(9), at(10, 30)), (at(11), at(12))]
+
+    def test_intersect_and_union(self):
+        """Should intersect and unite per-member interval lists."""
+        alice = [(at(9), at(12)), (at(13), at(17))]
+        bob = [(at(10), at(14))]
+
+        assert intersect_all([alice, bob]) == [(at(10), at(12)), (at(13), at(14))]
+        assert union_intervals(alice, bob) == [(at(9), at(17))]
+        assert intersect_all([alice, []]) == []
+
+    def test_subtract(self):
+        """Should remove busy time from windows, splitting them as needed."""
+        windows = [(at(9), at(12)), (at(13), at(17))]
+        busy = [(at(8), at(9, 30)), (at(10), at(10, 30)), (at(11, 45), at(13, 15))]
+
+        assert subtract_intervals(windows, busy) == [
+            (at(9, 30), at(10)),
+            (at(10, 30), at(11, 45)),
+            (at(13, 15), at(17)),
+        ]
+
+
+class TestGenerateSlots:
+    """Tests for AvailabilityService._generate_slots."""
+
+    def test_marks_conflicts_with_buffers(self):
+        """Should flag slots whose buffered range overlaps busy time."""
+        service = AvailabilityService(MagicMock())
+
+        slots = service._generate_slots(
+            available_windows=[{"start_time": time(9), "end_time": time(11)}],
+            busy_times=[
+                {"start": at(10), "end": at(10, 30)},
+                {"start": at(10, 15), "end": at(10, 20)},
+            ],
+            duration_minutes=30,
+            buffer_before=0,
+            buffer_after=15,
+            target_date=DAY,
+            timezone="UTC",
+            min_booking_datetime=at(9) - timedelta(minutes=1),
+        )
+
+        assert [(s["start_time"].strftime("%H:%M"), s["available"]) for s in slots] == [
+            ("09:00", True),
+            ("09:15", True),
+            ("09:30", False),
+            ("09:45", False),
+            ("10:00", False),
+            ("10:15", False),
+            ("10:30", True),
+        ]
+
+    def test_skips_to_minimum_notice(self):
+        """Should start at the first increment after the minimum booking time."""
+        service = AvailabilityService(MagicMock())
+
+        slots = service._generate_slots(
+            available_windows=[{"start_time": time(9), "end_time": time(10)}],
+            busy_times=[],
+            duration_minutes=15,
+            buffer_before=0,
+            buffer_after=0,
+            target_date=DAY,
+            timezone="UTC",
+            min_booking_datetime=at(9, 20),
+        )
+
+        assert [s["start_time"] for s in slots] == [at(9, 30), at(9, 45)]
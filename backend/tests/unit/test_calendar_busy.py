@@ -0,0 +1,145 @@
+"""Tests for batched and cached calendar free/busy lookups."""
+
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from aexy.services.booking.calendar_sync_service import CalendarSyncService
+
+
+def build_connection(connection_id: str, user_id: str, calendar_id: str, token: str):
+    return SimpleNamespace(
+        id=connection_id,
+        user_id=user_id,
+        calendar_id=calendar_id,
+        provider="google",
+        access_token=token,
+    )
+
+
+def build_service(connections: list) -> CalendarSyncService:
+    db = MagicMock()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = connections
+    db.execute = AsyncMock(return_value=result)
+    service = CalendarSyncService(db)
+    service._refresh_token_if_needed = AsyncMock(side_effect=lambda connection: connection)
+    return service
+
+
+def freebusy_response(busy_by_calendar: dict) -> MagicMock:
+    response = MagicMock(status_code=200)
+    response.json.return_value = {
+        "calendars": {
+            calendar_id: {"busy": [{"start": start, "end": end} for start, end in busy]}
+            for calendar_id, busy in busy_by_calendar.items()
+        }
+    }
+    return response
+
+
+class TestBusyTimesForUsers:
+    """Tests for CalendarSyncService.get_busy_times_for_users."""
+
+    @pytest.mark.asyncio
+    async def test_batches_calendars_of_one_google_account(self):
+        """Should query all calendars sharing a token in one freeBusy request."""
+        service = build_service([
+            build_connection("c1", "alice", "work", "token-a"),
+            build_connection("c2", "alice", "personal", "token-a"),
+            build_connection("c3", "bob", "primary", "token-b"),
+        ])
+        client = MagicMock()
+        client.post = AsyncMock(side_effect=[
+            freebusy_response({
+                "work": [("2026-03-02T09:00:00Z", "2026-03-02T10:00:00Z")],
+                "personal": [("2026-03-03T12:00:00Z", "2026-03-03T13:00:00Z")],
+            }),
+            freebusy_response({"primary": []}),
+        ])
+
+        with (
+            patch(
+                "aexy.services.booking.calendar_sync_service.get_http_client",
+                return_value=client,
+            ),
+            patch(
+                "aexy.services.booking.calendar_sync_service.get_calendar_busy_cache",
+                return_value=None,
+            ),
+        ):
+            busy = await service.get_busy_times_for_users(
+                ["alice", "bob"], date(2026, 3, 2), date(2026, 3, 3)
+            )
+
+        assert client.post.await_count == 2
+        items = client.post.await_args_list[0].kwargs["json"]["items"]
+        assert items == [{"id": "work"}, {"id": "personal"}]
+        assert [period["calendar_id"] for period in busy["alice"]] == ["work", "personal"]
+        assert busy["bob"] == []
+
+    @pytest.mark.asyncio
+    async def test_serves_cached_days(self):
+        """Should skip provider requests when every day is cached."""
+        service = build_service([build_connection("c1", "alice", "work", "token-a")])
+        cache = MagicMock()
+        cache.get_days = AsyncMock(return_value={date(2026, 3, 2): []})
+        client = MagicMock()
+        client.post = AsyncMock()
+
+        with (
+            patch(
+                "aexy.services.booking.calendar_sync_service.get_http_client",
+                return_value=client,
+            ),
+            patch(
+                "aexy.services.booking.calendar_sync_service.get_calendar_busy_cache",
+                return_value=cache,
+            ),
+        ):
+            busy = await service.get_busy_times(
+                "alice", date(2026, 3, 2), date(2026, 3, 2)
+            )
+
+        assert busy == []
+        client.post.assert_not_awaited()
+
+
+class TestBusyCacheInvalidation:
+    """Tests for free/busy cache invalidation when events change."""
+
+    @pytest.mark.asyncio
+    async def test_rescheduled_event_invalidates_old_and_new_days(self):
+        """Should drop cached days for both the previous and the new event times."""
+        connection = build_connection("c1", "alice", "work", "token-a")
+        service = build_service([connection])
+        service.db.execute.return_value.scalar_one_or_none.return_value = connection
+        service._update_google_event = AsyncMock()
+        booking = SimpleNamespace(
+            calendar_event_id="evt-1",
+            calendar_provider="google",
+            host_id="alice",
+            event_type=None,
+            guest_name="Bob",
+            start_time=datetime(2026, 3, 5, 9, tzinfo=timezone.utc),
+            end_time=datetime(2026, 3, 5, 10, tzinfo=timezone.utc),
+        )
+        service._build_event_description = MagicMock(return_value="")
+        cache = MagicMock()
+        cache.invalidate = AsyncMock()
+
+        with patch(
+            "aexy.services.booking.calendar_sync_service.get_calendar_busy_cache",
+            return_value=cache,
+        ):
+            await service.update_calendar_event(
+                booking,
+                previous_start=datetime(2026, 3, 2, 23, 30, tzinfo=timezone.utc),
+                previous_end=datetime(2026, 3, 3, 0, 30, tzinfo=timezone.utc),
+            )
+
+        cache.invalidate.assert_awaited_once_with(
+            connection, [date(2026, 3, 2), date(2026, 3, 3), date(2026, 3, 5)]
+        )
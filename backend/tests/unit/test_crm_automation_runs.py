@@ -0,0 +1,95 @@
+"""Tests for executing queued CRM automation runs."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from aexy.services.crm_automation_service import CRMAutomationService
+
+
+def build_run(run_id: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=run_id, automation_id="auto-1", record_id=f"rec-{run_id}", status="pending"
+    )
+
+
+@pytest.fixture
+def db():
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=MagicMock())
+    db.flush = AsyncMock()
+    return db
+
+
+class TestExecutePendingRuns:
+    """Tests for CRMAutomationService.execute_pending_runs."""
+
+    @pytest.mark.asyncio
+    async def test_rechecks_monthly_limit_before_each_run(self, db):
+        """Should reserve a run slot per run and fail runs past the limit."""
+        runs = [build_run("run-1"), build_run("run-2")]
+        automation = SimpleNamespace(id="auto-1", runs_this_month=4, run_limit_per_month=5)
+        service = CRMAutomationService(db)
+        db.execute.return_value.scalars.return_value.all.return_value = runs
+        service._get_active_automations = AsyncMock(return_value={"auto-1": automation})
+        service._reserve_run = AsyncMock(side_effect=[True, False])
+        service._execute_automation = AsyncMock()
+
+        executed = await service.execute_pending_runs(["run-1", "run-2"])
+
+        assert executed == 1
+        service._execute_automation.assert_awaited_once_with(automation, runs[0], "rec-run-1")
+        assert runs[1].status == "failed"
+        assert runs[1].error_message == "Automation run limit exceeded for this month"
+
+    @pytest.mark.asyncio
+    async def test_reserve_run_is_a_conditional_increment(self, db):
+        """Should increment the counter only while it is below the limit."""
+        automation = MagicMock(id="auto-1")
+        db.execute.return_value.scalar_one_or_none.return_value = None
+
+        reserved = await CRMAutomationService(db)._reserve_run(automation)
+
+        sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "SET runs_this_month=(crm_automations.runs_this_month + " in sql
+        assert "crm_automations.run_limit_per_month IS NULL OR " in sql
+        assert "crm_automations.runs_this_month < crm_automations.run_limit_per_month" in sql
+        assert "RETURNING crm_automations.runs_this_month" in sql
+        assert reserved is False
+
+
+class TestProcessTriggerBatch:
+    """Tests for dispatching queued runs from process_trigger_batch."""
+
+    @pytest.mark.asyncio
+    async def test_dispatches_runs_after_commit(self, db):
+        """Should enqueue the batch's runs through run_after_commit."""
+        index = MagicMock()
+        index.match.return_value = ["auto-1"]
+        automation = SimpleNamespace(id="auto-1", runs_this_month=0, run_limit_per_month=None)
+        service = CRMAutomationService(db)
+        service._get_active_automations = AsyncMock(return_value={"auto-1": automation})
+        db.add_all = MagicMock()
+        queued = []
+
+        with (
+            patch(
+                "aexy.services.crm_automation_service.get_trigger_index",
+                AsyncMock(return_value=index),
+            ),
+            patch(
+                "aexy.services.crm_automation_service.run_after_commit",
+                side_effect=lambda session, callback: queued.append(callback),
+            ),
+            patch("aexy.processing.tasks.execute_crm_automation_runs_task") as task,
+        ):
+            runs = await service.process_trigger_batch(
+                "ws-1", "obj-1", "record.created", [("rec-1", {}), ("rec-2", {})]
+            )
+            task.delay.assert_not_called()
+            await queued[0]()
+
+        assert len(queued) == 1
+        task.delay.assert_called_once_with([run.id for run in runs])
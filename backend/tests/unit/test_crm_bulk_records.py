@@ -0,0 +1,225 @@
+"""Tests for bulk CRM record operations."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from aexy.services.crm_service import CRMBulkValidationError, CRMRecordService
+
+
+def build_object(primary: str | None = "name") -> SimpleNamespace:
+    attributes = [
+        SimpleNamespace(id="attr-email", slug="email", attribute_type="email", is_required=True),
+        SimpleNamespace(id="attr-name", slug="name", attribute_type="text", is_required=False),
+        SimpleNamespace(id="attr-nick", slug="nickname", attribute_type="text", is_required=False),
+        SimpleNamespace(
+            id="attr-value", slug="deal_value", attribute_type="currency", is_required=False
+        ),
+    ]
+    primary_id = {"name": "attr-name", "nickname": "attr-nick"}.get(primary)
+    return SimpleNamespace(id="obj-1", primary_attribute_id=primary_id, attributes=attributes)
+
+
+def record_row(record_id: str, object_id: str, values: dict | None = None) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=record_id, workspace_id="ws-1", object_id=object_id, values=values or {}
+    )
+
+
+def sql_of(call) -> str:
+    return str(call.args[0].compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def db():
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=MagicMock())
+    db.flush = AsyncMock()
+    return db
+
+
+@pytest.fixture
+def events():
+    event_service = MagicMock()
+    event_service.emit_records_created = AsyncMock()
+    event_service.emit_records_updated = AsyncMock()
+    event_service.emit_records_deleted = AsyncMock()
+    with (
+        patch("aexy.services.crm_events.CRMEventService", return_value=event_service),
+        patch("aexy.services.crm_service.get_crm_count_cache", return_value=None),
+    ):
+        yield event_service
+
+
+class TestRecordValues:
+    """Tests for in-memory validation and display names."""
+
+    def test_validate_values(self):
+        """Should report missing required values and non-numeric numbers."""
+        attributes = build_object().attributes
+
+        assert CRMRecordService._validate_values(attributes, {"email": "a@b.co"}) == []
+        assert CRMRecordService._validate_values(
+            attributes, {"email": "", "deal_value": "lots"}
+        ) == ["'email' is required", "'deal_value' must be a number"]
+        assert CRMRecordService._validate_values(
+            attributes, {"email": "a@b.co", "deal_value": "1200.50"}
+        ) == []
+        assert CRMRecordService._validate_values(attributes, ["x"]) == ["values must be an object"]
+
+    def test_display_name_falls_back_to_first_text_value(self):
+        """Should use the primary value, else the first text attribute's value."""
+        obj = build_object(primary="nickname")
+
+        assert CRMRecordService._display_name(obj, {"nickname": "Ada", "name": "A"}) == "Ada"
+        assert CRMRecordService._display_name(obj, {"nickname": "", "name": "Ada L"}) == "Ada L"
+        assert CRMRecordService._display_name(build_object(None), {"name": "Ada"}) == "Ada"
+        assert CRMRecordService._display_name(build_object(None), {"name": "x" * 600}) == "x" * 500
+        assert CRMRecordService._display_name(obj, {"email": "a@b.co"}) is None
+
+
+class TestBulkCreateRecords:
+    """Tests for CRMRecordService.bulk_create_records."""
+
+    @pytest.mark.asyncio
+    async def test_invalid_rows_fail_batch_with_per_row_errors(self, db, events):
+        """Should report every invalid row and write nothing."""
+        service = CRMRecordService(db)
+
+        with patch(
+            "aexy.services.crm_service.CRMObjectService.get_object",
+            AsyncMock(return_value=build_object()),
+        ):
+            with pytest.raises(CRMBulkValidationError) as exc_info:
+                await service.bulk_create_records(
+                    "ws-1",
+                    "obj-1",
+                    [
+                        {"values": {"email": "a@b.co"}},
+                        {"values": {"name": "No email"}},
+                        {"values": {"email": "c@d.co", "deal_value": "n/a"}},
+                    ],
+                )
+
+        assert exc_info.value.errors == {
+            2: ["'email' is required"],
+            3: ["'deal_value' must be a number"],
+        }
+        assert "Row 2: 'email' is required" in str(exc_info.value)
+        db.execute.assert_not_awaited()
+        events.emit_records_created.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_inserts_rows_and_emits_one_event_batch(self, db, events):
+        """Should insert records and activities in bulk and emit one event batch."""
+        service = CRMRecordService(db)
+        records = [
+            SimpleNamespace(id="rec-1", values={"email": "a@b.co", "name": "Ada"}),
+            SimpleNamespace(id="rec-2", values={"email": "c@d.co", "name": ""}),
+        ]
+        db.execute.return_value.scalars.return_value.all.return_value = records
+
+        with patch(
+            "aexy.services.crm_service.CRMObjectService.get_object",
+            AsyncMock(return_value=build_object()),
+        ):
+            created = await service.bulk_create_records(
+                "ws-1",
+                "obj-1",
+                [
+                    {"values": {"email": "a@b.co", "name": "Ada"}},
+                    {"values": {"email": "c@d.co", "name": "", "nickname": "Cee"}},
+                ],
+                created_by_id="dev-1",
+            )
+
+        statements = [sql_of(call) for call in db.execute.await_args_list]
+        assert len(statements) == 3
+        assert statements[0].startswith("INSERT INTO crm_records")
+        assert "UPDATE crm_objects SET record_count=(crm_objects.record_count +" in statements[1]
+        assert statements[2].startswith("INSERT INTO crm_activities")
+        inserted = db.execute.await_args_list[0].args[0].compile().params
+        assert inserted["display_name_m0"] == "Ada"
+        assert inserted["display_name_m1"] == "Cee"
+        assert created == records
+        events.emit_records_created.assert_awaited_once_with(
+            workspace_id="ws-1",
+            object_id="obj-1",
+            records=[("rec-1", records[0].values), ("rec-2", records[1].values)],
+            created_by_id="dev-1",
+        )
+
+
+class TestBulkUpdateAndDelete:
+    """Tests for bulk_update_records and bulk_delete_records."""
+
+    @pytest.mark.asyncio
+    async def test_update_emits_events_for_changed_records_only(self, db, events):
+        """Should merge values in one UPDATE and emit events only for changed records."""
+        service = CRMRecordService(db)
+        rows = [
+            record_row("rec-1", "obj-1", {"name": "A"}),
+            record_row("rec-2", "obj-1", {"name": "B"}),
+        ]
+        db.execute.return_value.all.return_value = rows
+        service._get_objects = AsyncMock(return_value={"obj-1": build_object()})
+
+        updated = await service.bulk_update_records(["rec-1", "rec-2"], {"name": "B"}, "dev-1")
+
+        update_sql = sql_of(db.execute.await_args_list[1])
+        assert update_sql.startswith("UPDATE crm_records SET")
+        assert "crm_records.values || " in update_sql
+        assert "display_name=" in update_sql
+        assert updated == 2
+        events.emit_records_updated.assert_awaited_once()
+        updates = events.emit_records_updated.await_args.kwargs["updates"]
+        assert [u["record_id"] for u in updates] == ["rec-1"]
+        assert updates[0]["changes"] == [{"field": "name", "old": "A", "new": "B"}]
+
+    @pytest.mark.asyncio
+    async def test_update_falls_back_to_text_value_per_record(self, db, events):
+        """Should derive each record's display name when the primary value is cleared."""
+        service = CRMRecordService(db)
+        rows = [
+            record_row("rec-1", "obj-1", {"nickname": "A", "name": "Ada"}),
+            record_row("rec-2", "obj-1", {"nickname": "B", "name": "Bob"}),
+            record_row("rec-3", "obj-1", {"nickname": "C", "name": "Ada"}),
+        ]
+        db.execute.return_value.all.return_value = rows
+        service._get_objects = AsyncMock(return_value={"obj-1": build_object("nickname")})
+
+        await service.bulk_update_records(["rec-1", "rec-2", "rec-3"], {"nickname": ""})
+
+        updates = {
+            call.args[0].compile().params["display_name"]: call.args[0].compile().params
+            for call in db.execute.await_args_list[1:3]
+        }
+        assert set(updates) == {"Ada", "Bob"}
+        assert updates["Ada"]["id_1"] == ["rec-1", "rec-3"]
+        assert updates["Bob"]["id_1"] == ["rec-2"]
+
+    @pytest.mark.asyncio
+    async def test_delete_archives_and_emits_one_batch_per_object(self, db, events):
+        """Should archive in one UPDATE and emit one event batch per object."""
+        service = CRMRecordService(db)
+        rows = [
+            record_row("rec-1", "obj-1"),
+            record_row("rec-2", "obj-2"),
+            record_row("rec-3", "obj-1"),
+        ]
+        db.execute.return_value.all.return_value = rows
+
+        deleted = await service.bulk_delete_records(["rec-1", "rec-2", "rec-3"])
+
+        statements = [sql_of(call) for call in db.execute.await_args_list]
+        assert statements[1].startswith("UPDATE crm_records SET is_archived=")
+        assert statements[2].startswith("INSERT INTO crm_activities")
+        assert deleted == 3
+        assert events.emit_records_deleted.await_count == 2
+        batches = {
+            call.kwargs["object_id"]: [rid for rid, _ in call.kwargs["records"]]
+            for call in events.emit_records_deleted.await_args_list
+        }
+        assert batches == {"obj-1": ["rec-1", "rec-3"], "obj-2": ["rec-2"]}
@@ -0,0 +1,132 @@
+"""Tests for the CRM record query compiler."""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from aexy.services.crm_query import CRMQueryCompiler, InvalidCursorError
+
+
+def compile_sql(clause) -> tuple[str, list]:
+    """Compile a clause for Postgres, returning the SQL and its bound values."""
+    compiled = clause.compile(dialect=postgresql.dialect())
+    return str(compiled), list(compiled.params.values())
+
+
+def build_compiler() -> CRMQueryCompiler:
+    return CRMQueryCompiler(
+        [
+            SimpleNamespace(slug="name", attribute_type="text"),
+            SimpleNamespace(slug="deal_value", attribute_type="currency"),
+            SimpleNamespace(slug="close_date", attribute_type="date"),
+            SimpleNamespace(slug="tags", attribute_type="multi_select"),
+        ]
+    )
+
+
+class TestCRMQueryCompiler:
+    """Tests for CRMQueryCompiler."""
+
+    def test_equals_uses_containment(self):
+        """Should compile equality to JSONB containment for every stored representation."""
+        compiler = build_compiler()
+
+        sql, params = compile_sql(compiler.compile_filter("deal_value", "equals", "1000"))
+
+        assert "@>" in sql
+        assert "->>" not in sql
+        assert params == [{"deal_value": 1000}, {"deal_value": "1000"}]
+
+    def test_multi_select_equals_matches_array_membership(self):
+        """Should match multi-select values contained in the stored array."""
+        _, params = compile_sql(build_compiler().compile_filter("tags", "in", ["vip", "lead"]))
+
+        assert {"tags": ["vip"]} in params
+        assert {"tags": ["lead"]} in params
+
+    def test_range_uses_indexed_expression(self):
+        """Should compare the typed attribute expression with a type guard."""
+        compiler = build_compiler()
+
+        numeric, numeric_params = compile_sql(compiler.compile_filter("deal_value", "gte", "500"))
+        _, date_params = compile_sql(
+            compiler.compile_filter("close_date", "between", ["2024-01-01", "2024-12-31"])
+        )
+
+        assert "nullif(crm_records.values -> __[POSTCOMPILE_param_1], 'null'::jsonb) >=" in numeric
+        assert "jsonb_typeof" in numeric
+        assert numeric_params[:3] == ["deal_value", 500, "number"]
+        assert date_params == ["close_date", "2024-01-01", "2024-12-31", "string"]
+
+    def test_numeric_range_matches_numeric_strings(self):
+        """Should also compare numbers stored as strings, casting only numeric ones."""
+        compiler = build_compiler()
+
+        sql, params = compile_sql(
+            compiler.compile_filter("deal_value", "between", ["100", 250.5])
+        )
+        _, date_params = compile_sql(compiler.compile_filter("close_date", "gt", "2024-01-01"))
+
+        assert " OR CASE WHEN" in sql
+        assert "(crm_records.values ->> %(values_1)s::TEXT) ~ %(param_4)s" in sql
+        assert "THEN CAST((crm_records.values ->> %(values_1)s::TEXT) AS NUMERIC) END >=" in sql
+        assert params[-2:] == [100, 250.5]
+        assert "CASE" not in compile_sql(compiler.compile_filter("close_date", "gt", "2024"))[0]
+        assert date_params == ["close_date", "2024-01-01", "string"]
+
+    def test_conjunctions_and_unknown_operators(self):
+        """Should join conditions by conjunction and skip unsupported ones."""
+        compiler = build_compiler()
+
+        combined = compiler.compile_filters(
+            [
+                {"attribute": "name", "operator": "contains", "value": "50%"},
+                {"attribute": "name", "operator": "bogus", "value": 1},
+                {"attribute": "deal_value", "operator": "is_empty", "conjunction": "or"},
+            ]
+        )
+        sql, params = compile_sql(combined)
+
+        assert " OR " in sql
+        assert "%50\\%%" in params
+        assert compiler.compile_filters([]) is None
+
+    def test_cursor_roundtrip(self):
+        """Should encode a record position and compile it into a keyset condition."""
+        compiler = build_compiler()
+        keys = compiler.compile_sorts([{"attribute": "deal_value", "direction": "desc"}])
+        record = SimpleNamespace(
+            id="00000000-0000-0000-0000-000000000001",
+            values={"deal_value": 250},
+            created_at=datetime(2024, 5, 1, tzinfo=timezone.utc),
+        )
+
+        cursor = CRMQueryCompiler.encode_cursor(keys, record)
+        sql, params = compile_sql(CRMQueryCompiler.keyset_condition(keys, cursor))
+
+        assert "'null'::jsonb) <" in sql
+        assert "crm_records.id >" in sql
+        assert 250 in params and record.id in params
+
+        with pytest.raises(InvalidCursorError):
+            CRMQueryCompiler.keyset_condition(compiler.compile_sorts(None), cursor)
+        with pytest.raises(InvalidCursorError):
+            CRMQueryCompiler.keyset_condition(keys, "not-a-cursor")
+
+    def test_default_sort_cursor_handles_datetimes(self):
+        """Should default to newest first and round-trip timestamps."""
+        keys = build_compiler().compile_sorts(None)
+        record = SimpleNamespace(
+            id="00000000-0000-0000-0000-000000000002",
+            values={},
+            created_at=datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc),
+        )
+
+        cursor = CRMQueryCompiler.encode_cursor(keys, record)
+        sql, params = compile_sql(CRMQueryCompiler.keyset_condition(keys, cursor))
+
+        assert keys[0].attribute == "created_at" and not keys[0].ascending
+        assert "crm_records.created_at <" in sql
+        assert record.created_at in params
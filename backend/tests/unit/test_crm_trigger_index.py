@@ -0,0 +1,55 @@
+"""Tests for the compiled CRM automation trigger index."""
+
+from aexy.services.crm_trigger_index import TriggerIndex
+
+
+def build_index() -> TriggerIndex:
+    return TriggerIndex.from_automations(
+        version=1,
+        automations=[
+            ("created-deals", "deals", "record.created", {}),
+            ("created-any", None, "record.created", None),
+            ("status-any", "deals", "field.changed", {}),
+            ("status-won", "deals", "field.changed", {"field": "status", "to_value": "won"}),
+            (
+                "amount",
+                "deals",
+                "field.changed",
+                {"attribute_slug": "amount", "from_value": 10, "to_value": 20},
+            ),
+            ("stage-to-won", "deals", "stage.changed", {"to_stage": "won"}),
+        ],
+    )
+
+
+class TestTriggerIndex:
+    """Tests for TriggerIndex."""
+
+    def test_match_by_object(self):
+        """Should match exact-object and all-object automations."""
+        index = build_index()
+
+        assert index.match("record.created", "deals", {}) == ["created-deals", "created-any"]
+        assert index.match("record.created", "people", {}) == ["created-any"]
+        assert index.match("record.deleted", "deals", {}) == []
+        assert len(index) == 6
+
+    def test_match_field_change(self):
+        """Should match the watched field and from/to values."""
+        index = build_index()
+
+        won = {"changed_field": "status", "old_value": "open", "new_value": "won"}
+        lost = {"changed_field": "status", "old_value": "open", "new_value": "lost"}
+        amount = {"changed_field": "amount", "old_value": 10, "new_value": 20}
+
+        assert index.match("field.changed", "deals", won) == ["status-won", "status-any"]
+        assert index.match("field.changed", "deals", lost) == ["status-any"]
+        assert index.match("field.changed", "deals", amount) == ["amount", "status-any"]
+        assert index.match("field.changed", "deals", {**amount, "old_value": 5}) == ["status-any"]
+
+    def test_match_stage_change(self):
+        """Should compare stage transitions."""
+        index = build_index()
+
+        assert index.match("stage.changed", "deals", {"new_stage": "won"}) == ["stage-to-won"]
+        assert index.match("stage.changed", "deals", {"new_stage": "lost"}) == []
@@ -0,0 +1,113 @@
+"""Tests for full-text document and entity search queries."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from aexy.services.document_service import DocumentService
+from aexy.services.knowledge_graph_service import KnowledgeGraphService
+
+
+def compile_query(stmt) -> tuple[str, dict]:
+    """Render a statement as PostgreSQL, returning the SQL and bound parameters."""
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    return str(compiled), compiled.params
+
+
+@pytest.fixture
+def db():
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=MagicMock())
+    db.scalar = AsyncMock()
+    return db
+
+
+class TestSearchDocuments:
+    """Tests for DocumentService.search_documents."""
+
+    @pytest.mark.asyncio
+    async def test_ranks_full_text_matches_with_snippets(self, db):
+        """Should match the search vector, rank by ts_rank_cd and add snippets."""
+        document = MagicMock()
+        db.execute.return_value.all.return_value = [(document, "a <mark>deploy</mark> guide")]
+
+        results = await DocumentService(db).search_documents("ws-1", "deploy guide", limit=5)
+
+        sql, params = compile_query(db.execute.await_args.args[0])
+        select_list, where = sql.split("FROM documents")
+        assert "ts_headline(" in select_list
+        assert "coalesce(documents.content_text" in select_list
+        assert "documents.search_vector" not in select_list
+        assert "documents.search_vector @@ websearch_to_tsquery(" in where
+        assert "ORDER BY ts_rank_cd(documents.search_vector" in where
+        assert "documents.is_template = false" in where
+        assert params["websearch_to_tsquery_1"] == "deploy guide"
+        assert "english" in params.values()
+        assert results == [(document, "a <mark>deploy</mark> guide")]
+        assert db.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_trigram_title_and_content_match(self, db):
+        """Should fall back to a similarity-ranked title or body match without snippets."""
+        document = MagicMock()
+        full_text, fallback = MagicMock(), MagicMock()
+        full_text.all.return_value = []
+        fallback.scalars.return_value.all.return_value = [document]
+        db.execute.side_effect = [full_text, fallback]
+
+        results = await DocumentService(db).search_documents("ws-1", "depl")
+
+        sql, params = compile_query(db.execute.await_args_list[1].args[0])
+        assert "documents.title ILIKE" in sql
+        assert "documents.content_text ILIKE" in sql
+        assert "ORDER BY similarity(documents.title" in sql
+        assert "word_similarity(" in sql
+        assert "@@" not in sql
+        assert params["title_1"] == "%depl%"
+        assert params["content_text_1"] == "%depl%"
+        assert params["similarity_1"] == "depl"
+        assert results == [(document, None)]
+
+    @pytest.mark.asyncio
+    async def test_no_fallback_past_last_full_text_page(self, db):
+        """Should return an empty page instead of fallback results when paging."""
+        db.execute.return_value.all.return_value = []
+        db.scalar.return_value = "doc-1"
+
+        results = await DocumentService(db).search_documents("ws-1", "deploy", offset=20)
+
+        sql, _ = compile_query(db.scalar.await_args.args[0])
+        assert "documents.search_vector @@" in sql
+        assert results == []
+        assert db.execute.await_count == 1
+
+
+class TestSearchEntities:
+    """Tests for KnowledgeGraphService.search_entities."""
+
+    @pytest.mark.asyncio
+    async def test_combines_full_text_and_trigram_matches(self, db):
+        """Should match full text or trigram similarity and rank by the better score."""
+        await KnowledgeGraphService(db).search_entities(
+            "ws-1", "  React Native ", entity_type="technology", limit=10
+        )
+
+        sql, params = compile_query(db.execute.await_args.args[0])
+        assert "knowledge_entities.search_vector @@ websearch_to_tsquery(" in sql
+        assert "knowledge_entities.normalized_name %% %(normalized_name_1)s" in sql
+        assert "knowledge_entities.normalized_name ILIKE %(normalized_name_2)s" in sql
+        assert "ORDER BY greatest(ts_rank_cd(knowledge_entities.search_vector" in sql
+        assert "similarity(knowledge_entities.normalized_name" in sql
+        assert params["normalized_name_1"] == "react native"
+        assert params["normalized_name_2"] == "%react native%"
+        assert params["entity_type_1"] == "technology"
+
+    @pytest.mark.asyncio
+    async def test_blank_query_orders_by_occurrences(self, db):
+        """Should skip text matching for blank queries."""
+        await KnowledgeGraphService(db).search_entities("ws-1", "   ")
+
+        sql, _ = compile_query(db.execute.await_args.args[0])
+        assert "tsquery" not in sql
+        assert "ORDER BY knowledge_entities.occurrence_count DESC" in sql
@@ -0,0 +1,204 @@
+"""Tests for the document tree cache and its invalidation."""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from aexy.cache.document_tree_cache import DocumentTreeCache
+from aexy.core.database import run_after_commit
+from aexy.services.document_service import DocumentService
+from aexy.services.document_space_service import DocumentSpaceService
+
+
+class FakeRedis:
+    """Minimal async Redis stand-in for get/setex/delete."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+
+@pytest.fixture
+def db():
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=MagicMock())
+    db.commit = AsyncMock()
+    db.flush = AsyncMock()
+    db.refresh = AsyncMock()
+    return db
+
+
+class TestDocumentTreeCache:
+    """Tests for DocumentTreeCache."""
+
+    @pytest.mark.asyncio
+    async def test_set_get_and_invalidate(self):
+        """Should round-trip nodes per workspace and drop them on invalidate."""
+        cache = DocumentTreeCache(FakeRedis())
+        nodes = [{"id": "doc-1", "title": "Intro", "parent_id": None}]
+
+        assert await cache.get("ws-1") is None
+        assert await cache.set("ws-1", nodes)
+        assert await cache.get("ws-1") == nodes
+        assert await cache.get("ws-2") is None
+
+        assert await cache.invalidate("ws-1")
+        assert await cache.get("ws-1") is None
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_are_cache_misses(self):
+        """Should treat Redis failures as misses instead of raising."""
+        redis = MagicMock()
+        redis.get = AsyncMock(side_effect=ConnectionError("down"))
+        redis.setex = AsyncMock(side_effect=ConnectionError("down"))
+        cache = DocumentTreeCache(redis)
+
+        assert await cache.get("ws-1") is None
+        assert not await cache.set("ws-1", [])
+
+
+class TestTreeNodes:
+    """Tests for DocumentService._get_tree_nodes."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_query(self, db):
+        """Should serve cached nodes without querying the database."""
+        cache = DocumentTreeCache(FakeRedis())
+        await cache.set("ws-1", [{"id": "doc-1"}])
+
+        with patch("aexy.services.document_service.get_document_tree_cache", return_value=cache):
+            nodes = await DocumentService(db)._get_tree_nodes("ws-1")
+
+        assert nodes == [{"id": "doc-1"}]
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_queries_tree_columns_and_caches(self, db):
+        """Should load only tree columns with space names and cache the nodes."""
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        db.execute.return_value.all.return_value = [
+            SimpleNamespace(
+                id="doc-1",
+                title="Intro",
+                icon=None,
+                parent_id=None,
+                space_id="space-1",
+                space_name="Engineering",
+                position=0,
+                visibility="workspace",
+                created_by_id="dev-1",
+                is_template=False,
+                created_at=now,
+                updated_at=now,
+            )
+        ]
+        cache = DocumentTreeCache(FakeRedis())
+
+        with patch("aexy.services.document_service.get_document_tree_cache", return_value=cache):
+            nodes = await DocumentService(db)._get_tree_nodes("ws-1")
+
+        sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "LEFT OUTER JOIN document_spaces" in sql
+        assert "documents.content" not in sql
+        assert "ORDER BY documents.position" in sql
+        assert nodes[0]["space_name"] == "Engineering"
+        assert nodes[0]["updated_at"] == now.isoformat()
+        assert await cache.get("ws-1") == nodes
+
+    @pytest.mark.asyncio
+    async def test_content_update_invalidates_tree(self, db):
+        """Should invalidate on content-only edits since updated_at is cached."""
+        service = DocumentService(db)
+        service.get_document = AsyncMock(
+            return_value=SimpleNamespace(id="doc-1", workspace_id="ws-1", content={})
+        )
+        service._invalidate_tree = AsyncMock()
+        service._invalidate_graph = AsyncMock()
+
+        await service.update_document(
+            "doc-1", "dev-1", content={"type": "doc"}, create_version=False
+        )
+
+        service._invalidate_tree.assert_awaited_once_with("ws-1")
+
+
+class TestSpaceInvalidation:
+    """Tests for tree invalidation from DocumentSpaceService."""
+
+    @pytest.mark.asyncio
+    async def test_update_space_invalidates_after_commit(self, db):
+        """Should defer tree invalidation until the caller commits."""
+        service = DocumentSpaceService(db)
+        service.get_space = AsyncMock(
+            return_value=SimpleNamespace(id="space-1", workspace_id="ws-1")
+        )
+        cache = MagicMock()
+        cache.invalidate = AsyncMock()
+        queued = []
+
+        with (
+            patch(
+                "aexy.services.document_space_service.get_document_tree_cache",
+                return_value=cache,
+            ),
+            patch(
+                "aexy.services.document_space_service.run_after_commit",
+                side_effect=lambda session, callback: queued.append(callback),
+            ),
+        ):
+            await service.update_space("space-1", name="Platform")
+
+        cache.invalidate.assert_not_awaited()
+        await queued[0]()
+        cache.invalidate.assert_awaited_once_with("ws-1")
+
+
+class TestRunAfterCommit:
+    """Tests for run_after_commit."""
+
+    @pytest.fixture
+    async def session(self):
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with AsyncSession(engine) as session:
+            yield session
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_runs_only_after_commit(self, session):
+        """Should run the callback once the transaction commits."""
+        callback = AsyncMock()
+        await session.execute(text("SELECT 1"))
+
+        run_after_commit(session, callback)
+        callback.assert_not_called()
+        await session.commit()
+        await session.execute(text("SELECT 1"))
+        await session.commit()
+
+        callback.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rollback_drops_callbacks(self, session):
+        """Should not run callbacks queued in a rolled back transaction."""
+        callback = AsyncMock()
+        await session.execute(text("SELECT 1"))
+
+        run_after_commit(session, callback)
+        await session.rollback()
+        await session.execute(text("SELECT 1"))
+        await session.commit()
+
+        callback.assert_not_called()
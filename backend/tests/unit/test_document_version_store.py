@@ -0,0 +1,82 @@
+"""Tests for delta-compressed document version storage."""
+
+import copy
+import json
+
+from aexy.services.document_version_store import (
+    apply_patch,
+    decode_json,
+    diff_content,
+    encode_json,
+)
+
+
+def paragraph(text: str) -> dict:
+    return {"type": "paragraph", "content": [{"type": "text", "text": text}]}
+
+
+def document(*texts: str) -> dict:
+    return {"type": "doc", "content": [paragraph(t) for t in texts]}
+
+
+def roundtrip(old: dict, new: dict) -> dict:
+    """Diff, serialize the patch like the version store does, and apply it."""
+    patch = decode_json(encode_json(diff_content(old, new)))
+    return apply_patch(copy.deepcopy(old), patch)
+
+
+class TestDocumentVersionStore:
+    """Tests for content diffing and patching."""
+
+    def test_identical_content_has_empty_patch(self):
+        """Should produce no operations for unchanged content."""
+        content = document("a", "b")
+
+        assert diff_content(content, copy.deepcopy(content)) == []
+
+    def test_edit_inside_block(self):
+        """Should patch only the edited text node."""
+        old = document("first", "second", "third")
+        new = document("first", "second edited", "third")
+
+        patch = diff_content(old, new)
+
+        assert patch == [["set", ["content", 1, "content", 0, "text"], "second edited"]]
+        assert roundtrip(old, new) == new
+
+    def test_insert_and_delete_blocks(self):
+        """Should splice inserted and removed list items."""
+        old = document("a", "b", "c", "d")
+
+        assert roundtrip(old, document("a", "b", "new", "c", "d")) == document(
+            "a", "b", "new", "c", "d"
+        )
+        assert roundtrip(old, document("a", "d")) == document("a", "d")
+        assert roundtrip(old, document()) == document()
+
+    def test_key_changes_and_type_changes(self):
+        """Should handle added and removed keys and replaced values."""
+        old = {"type": "doc", "attrs": {"level": 1}, "content": []}
+        new = {"type": "doc", "meta": {"x": [1, 2]}, "content": "text"}
+
+        assert roundtrip(old, new) == new
+        assert roundtrip({"a": 1}, ["b"]) == ["b"]
+
+    def test_bool_int_and_float_changes(self):
+        """Should patch values that are equal in Python but not in JSON."""
+        old = {"attrs": {"checked": True, "level": 1}, "content": [1, False, 2.0]}
+        new = {"attrs": {"checked": 1, "level": 1.0}, "content": [True, 0, 2]}
+
+        result = roundtrip(old, new)
+
+        assert json.dumps(result) == json.dumps(new)
+        assert diff_content({"a": [True]}, {"a": [1]}) == [["set", ["a", 0], 1]]
+
+    def test_patch_is_smaller_than_content(self):
+        """Should store small edits far more compactly than the full content."""
+        old = document(*[f"paragraph number {i} with some text" for i in range(200)])
+        new = copy.deepcopy(old)
+        new["content"][100]["content"][0]["text"] = "changed"
+
+        assert len(encode_json(diff_content(old, new))) < len(encode_json(new)) / 10
+        assert len(encode_json(new)) < len(json.dumps(new))
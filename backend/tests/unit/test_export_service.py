@@ -459,3 +459,85 @@ class TestExportValidation:
 
         is_valid = service._validate_request(request)
         assert is_valid is False
+
+
+class TestStreamingExport:
+    """Tests for row-streamed exports."""
+
+    @staticmethod
+    async def _rows(count):
+        for i in range(count):
+            yield [i, f"task {i}"]
+
+    @pytest.mark.asyncio
+    async def test_process_streaming_export_csv(self, tmp_path):
+        """Test CSV rows are streamed into the file across batches."""
+        service = ExportService(export_dir=tmp_path)
+        job = MagicMock(id="job-1", format="csv")
+
+        with patch.object(service, "get_export_job", AsyncMock(return_value=job)), \
+             patch.object(service, "update_job_status", AsyncMock(return_value=job)) as update:
+            with patch("aexy.services.export_service.EXPORT_BATCH_SIZE", 2):
+                await service.process_streaming_export(
+                    "job-1", MagicMock(), ["ID", "Title"], self._rows(5)
+                )
+
+        file_path = update.call_args.kwargs["file_path"]
+        assert file_path.endswith(".csv")
+        with open(file_path) as f:
+            lines = f.read().splitlines()
+        assert lines[0] == "ID,Title"
+        assert len(lines) == 6
+
+    @pytest.mark.asyncio
+    async def test_process_streaming_export_jsonl(self, tmp_path):
+        """Test JSONL output writes one object per row keyed by header."""
+        service = ExportService(export_dir=tmp_path)
+        job = MagicMock(id="job-2", format="jsonl")
+
+        with patch.object(service, "get_export_job", AsyncMock(return_value=job)), \
+             patch.object(service, "update_job_status", AsyncMock(return_value=job)) as update:
+            await service.process_streaming_export(
+                "job-2", MagicMock(), ["id", "title"], self._rows(3)
+            )
+
+        with open(update.call_args.kwargs["file_path"]) as f:
+            records = [json.loads(line) for line in f]
+        assert records[2] == {"id": 2, "title": "task 2"}
+
+    def test_sprint_task_rows_keep_export_columns(self):
+        """Test streamed sprint task rows keep each format's original columns."""
+        from aexy.api.sprint_tasks import SPRINT_TASK_EXPORT_COLUMNS, _sprint_task_export_row
+        from aexy.schemas.analytics import ExportFormat
+
+        task = MagicMock(
+            id="task-1",
+            title="Fix login",
+            description="Users get logged out",
+            status="in_progress",
+            priority="high",
+            story_points=3,
+            labels=["auth", "bug"],
+            assignee_id="dev-1",
+            epic_id=None,
+            epic=None,
+            created_at=datetime(2026, 1, 1),
+            updated_at=None,
+        )
+        task.assignee.name = "Ada"
+
+        csv_row = _sprint_task_export_row(ExportFormat.CSV, task)
+        jsonl_row = _sprint_task_export_row(ExportFormat.JSONL, task)
+        xlsx_row = _sprint_task_export_row(ExportFormat.XLSX, task)
+
+        assert [h for _, h in SPRINT_TASK_EXPORT_COLUMNS[ExportFormat.CSV]] == [
+            "ID", "Title", "Status", "Priority", "Story Points", "Assignee", "Epic",
+            "Labels", "Created At", "Updated At",
+        ]
+        assert csv_row[:3] == ["task-1", "Fix login", "in_progress"]
+        assert csv_row[7] == "auth, bug"
+        jsonl_fields = [field for field, _ in SPRINT_TASK_EXPORT_COLUMNS[ExportFormat.JSONL]]
+        record = dict(zip(jsonl_fields, jsonl_row))
+        assert record["description"] == "Users get logged out"
+        assert record["labels"] == ["auth", "bug"]
+        assert xlsx_row[:3] == ["Fix login", "In Progress", "High"]
@@ -335,3 +335,218 @@ class TestGetPRReviews:
 
         assert len(result) == 2
         assert result[0]["state"] == "APPROVED"
+
+
+class FakeRedis:
+    """Minimal async Redis stand-in for the response cache."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+
+
+class TestConditionalRequests:
+    """Test ETag-based conditional requests through the response cache."""
+
+    @pytest.mark.asyncio
+    async def test_sends_if_none_match_and_serves_304_from_cache(self):
+        """Should reuse the cached body when GitHub answers 304."""
+        from aexy.cache.github_response_cache import GitHubResponseCache
+
+        request = httpx.Request("GET", "https://api.github.com/repos/o/r/commits")
+        first = httpx.Response(
+            200,
+            json=[{"sha": "abc123"}],
+            headers={"etag": '"v1"'},
+            request=request,
+        )
+        not_modified = httpx.Response(304, headers={"etag": '"v1"'}, request=request)
+
+        rate_limiter = MagicMock()
+        rate_limiter.record_rate_limit = AsyncMock()
+        rate_limiter.record_cache_hit = AsyncMock()
+
+        service = GitHubService(
+            access_token="test_token",
+            response_cache=GitHubResponseCache(FakeRedis()),
+            rate_limiter=rate_limiter,
+        )
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(side_effect=[first, not_modified])
+        service._client = mock_client
+
+        assert await service.get_commits("o", "r") == [{"sha": "abc123"}]
+        assert mock_client.get.call_args_list[0][1]["headers"] is None
+
+        result = await service.get_commits("o", "r")
+
+        assert result == [{"sha": "abc123"}]
+        assert mock_client.get.call_args_list[1][1]["headers"] == {"If-None-Match": '"v1"'}
+        rate_limiter.record_cache_hit.assert_awaited_once_with("test_token")
+
+    @pytest.mark.asyncio
+    async def test_cache_is_scoped_per_token(self):
+        """Should not send another token's validators."""
+        from aexy.cache.github_response_cache import GitHubResponseCache
+
+        cache = GitHubResponseCache(FakeRedis())
+        await cache.set("token_a", "/user/repos", b"[]", etag='"a"')
+
+        assert (await cache.get("token_a", "/user/repos")).etag == '"a"'
+        assert await cache.get("token_b", "/user/repos") is None
+
+
+class TestGraphQLBulkFetch:
+    """Test GraphQL bulk fetching of commits and pull requests."""
+
+    @pytest.mark.asyncio
+    async def test_iter_pull_requests_graphql_embeds_reviews(self):
+        """Should return REST-shaped PRs with reviews from a single query."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.json.return_value = {
+            "data": {
+                "repository": {
+                    "pullRequests": {
+                        "pageInfo": {"hasNextPage": False, "endCursor": None},
+                        "nodes": [
+                            {
+                                "databaseId": 101,
+                                "number": 7,
+                                "title": "Add feature",
+                                "state": "MERGED",
+                                "additions": 10,
+                                "deletions": 2,
+                                "changedFiles": 3,
+                                "createdAt": "2024-01-01T00:00:00Z",
+                                "updatedAt": "2024-01-02T00:00:00Z",
+                                "mergedAt": "2024-01-02T00:00:00Z",
+                                "closedAt": "2024-01-02T00:00:00Z",
+                                "author": {"login": "dev"},
+                                "commits": {"totalCount": 2},
+                                "comments": {"totalCount": 1},
+                                "reviews": {
+                                    "nodes": [
+                                        {
+                                            "databaseId": 501,
+                                            "state": "APPROVED",
+                                            "body": "LGTM",
+                                            "submittedAt": "2024-01-02T00:00:00Z",
+                                            "author": {"login": "reviewer"},
+                                            "comments": {"totalCount": 4},
+                                        }
+                                    ]
+                                },
+                            }
+                        ],
+                    }
+                },
+                "rateLimit": {"cost": 1, "remaining": 4999, "resetAt": "2024-01-01T01:00:00Z"},
+            }
+        }
+
+        service = GitHubService(access_token="test_token")
+        service._client = MagicMock()
+        service._client.post = AsyncMock(return_value=mock_response)
+
+        pages = [page async for page in service.iter_pull_requests_graphql("owner", "repo")]
+
+        assert service._client.post.await_count == 1
+        pr = pages[0][0]
+        assert pr["id"] == 101
+        assert pr["state"] == "closed"
+        assert pr["changed_files"] == 3
+        assert pr["review_comments"] == 4
+        assert pr["reviews"][0]["id"] == 501
+        assert pr["reviews"][0]["user"]["login"] == "reviewer"
+
+    @pytest.mark.asyncio
+    async def test_iter_pull_requests_graphql_paginates_reviews(self):
+        """Should fetch review pages beyond the first with follow-up queries."""
+
+        def review(review_id: int) -> dict:
+            return {
+                "databaseId": review_id,
+                "state": "COMMENTED",
+                "body": "",
+                "submittedAt": "2024-01-02T00:00:00Z",
+                "author": {"login": "reviewer"},
+                "comments": {"totalCount": 1},
+            }
+
+        def response(data: dict) -> MagicMock:
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.headers = {}
+            mock_response.json.return_value = {"data": data}
+            return mock_response
+
+        pr_page = response({
+            "repository": {
+                "pullRequests": {
+                    "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    "nodes": [
+                        {
+                            "databaseId": 101,
+                            "number": 7,
+                            "state": "OPEN",
+                            "createdAt": "2024-01-01T00:00:00Z",
+                            "reviews": {
+                                "pageInfo": {"hasNextPage": True, "endCursor": "r1"},
+                                "nodes": [review(501)],
+                            },
+                        }
+                    ],
+                }
+            }
+        })
+        review_page = response({
+            "repository": {
+                "pullRequest": {
+                    "reviews": {
+                        "pageInfo": {"hasNextPage": False, "endCursor": "r2"},
+                        "nodes": [review(502)],
+                    }
+                }
+            }
+        })
+
+        service = GitHubService(access_token="test_token")
+        service._client = MagicMock()
+        responses = iter([pr_page, review_page])
+        sent = []
+
+        async def post(path, json):
+            sent.append(dict(json["variables"]))
+            return next(responses)
+
+        service._client.post = post
+
+        pages = [page async for page in service.iter_pull_requests_graphql("owner", "repo")]
+
+        assert sent[1]["number"] == 7
+        assert sent[1]["after"] == "r1"
+        pr = pages[0][0]
+        assert [r["id"] for r in pr["reviews"]] == [501, 502]
+        assert pr["review_comments"] == 2
+
+    @pytest.mark.asyncio
+    async def test_graphql_errors_raise(self):
+        """Should raise GitHubAPIError when GraphQL returns errors."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.json.return_value = {"errors": [{"message": "Bad query"}]}
+
+        service = GitHubService(access_token="test_token")
+        service._client = MagicMock()
+        service._client.post = AsyncMock(return_value=mock_response)
+
+        with pytest.raises(GitHubAPIError):
+            await service.graphql("query { viewer { login } }")
@@ -0,0 +1,118 @@
+"""Tests for the knowledge extraction service."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from aexy.services.knowledge_extraction_service import KnowledgeExtractionService
+
+
+@pytest.fixture
+def db():
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=MagicMock())
+    db.commit = AsyncMock()
+    return db
+
+
+@pytest.fixture
+def service(db):
+    with patch("aexy.services.knowledge_extraction_service.get_llm_gateway"):
+        return KnowledgeExtractionService(db)
+
+
+class TestDocumentRelationships:
+    """Tests for building document relationships."""
+
+    @pytest.mark.asyncio
+    async def test_upsert_counts_created_and_updated(self, service, db):
+        """Should upsert on the unique key and split counts by xmax."""
+        db.execute.return_value.scalars.return_value.all.return_value = [True, False, True]
+
+        created, updated = await service._upsert_document_relationships([{"id": "r-1"}])
+
+        sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (workspace_id, source_document_id, target_document_id" in sql
+        assert "RETURNING xmax = 0 AS inserted" in sql
+        assert (created, updated) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_build_reports_created_updated_removed(self, service, db):
+        """Should upsert each co-mentioning pair once and report all counts."""
+        service._load_document_entities = AsyncMock(
+            return_value={"doc-a": {"e1", "e2"}, "doc-b": {"e1"}, "doc-c": {"e3"}}
+        )
+        service._upsert_document_relationships = AsyncMock(return_value=(1, 0))
+        db.execute.return_value.rowcount = 2
+
+        with patch(
+            "aexy.services.knowledge_extraction_service.bump_graph_version", AsyncMock()
+        ):
+            counts = await service.build_document_relationships("ws-1")
+
+        rows = service._upsert_document_relationships.await_args.args[0]
+        assert [(r["source_document_id"], r["target_document_id"]) for r in rows] == [
+            ("doc-a", "doc-b")
+        ]
+        assert rows[0]["strength"] == 0.5
+        assert counts == {"created": 1, "updated": 0, "removed": 2}
+
+
+class TestEntityExtraction:
+    """Tests for document chunking, entity merging and change detection."""
+
+    def test_chunk_text_splits_long_lines_between_words(self, service):
+        """Should keep chunks within the size limit without cutting words."""
+        text = " ".join(f"word{i}" for i in range(20))
+
+        with patch("aexy.services.knowledge_extraction_service.EXTRACTION_CHUNK_CHARS", 30):
+            chunks = service._chunk_text(text + "\nnext line\n")
+
+        assert "".join(chunks) == text + "\nnext line\n"
+        assert all(len(chunk) <= 30 for chunk in chunks)
+        assert all(chunk.endswith((" ", "\n")) for chunk in chunks)
+
+    def test_merge_entity_data_combines_duplicates(self, service):
+        """Should merge entities by normalized name and type."""
+        merged = {}
+
+        service._merge_entity_data(
+            merged, {"name": "React", "type": "technology", "confidence": 0.6}
+        )
+        service._merge_entity_data(
+            merged,
+            {
+                "name": "react ",
+                "type": "technology",
+                "aliases": ["ReactJS", "react"],
+                "description": "UI library",
+                "confidence": 0.9,
+            },
+        )
+        service._merge_entity_data(merged, {"name": "Thing", "type": "unknown"})
+        service._merge_entity_data(merged, {"name": "  "})
+
+        assert set(merged) == {("react", "technology"), ("thing", "concept")}
+        react = merged[("react", "technology")]
+        assert react["name"] == "React"
+        assert react["aliases"] == ["ReactJS"]
+        assert react["confidence"] == 0.9
+        assert react["description"] == "UI library"
+
+    @pytest.mark.asyncio
+    async def test_unchanged_documents_are_skipped(self, service, db):
+        """Should not call the LLM for documents whose content hash is unchanged."""
+        import hashlib
+
+        content = {"type": "doc", "content": [{"type": "text", "text": "x" * 100}]}
+        document = MagicMock(id="doc-1", title="Doc", content=content)
+        text = service._extract_text_from_tiptap(content)
+        content_hash = hashlib.sha256(f"Doc\n{text}".encode()).hexdigest()
+        db.execute.return_value.all.return_value = [("doc-1", content_hash)]
+        service._extract_chunk_entities = AsyncMock()
+
+        result = await service._extract_documents("ws-1", [document], skip_unchanged=True)
+
+        assert result == ({}, {})
+        service._extract_chunk_entities.assert_not_awaited()
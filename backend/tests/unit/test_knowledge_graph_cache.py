@@ -0,0 +1,192 @@
+"""Tests for knowledge graph payload caching and statistics."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from aexy.cache.knowledge_graph_cache import KnowledgeGraphCache
+from aexy.services.knowledge_graph_service import (
+    GraphData,
+    GraphEdge,
+    GraphFilters,
+    GraphNode,
+    GraphStatistics,
+    KnowledgeGraphService,
+)
+
+
+class FakeRedis:
+    """Minimal async Redis stand-in for get/setex/incr."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    async def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+
+def build_graph(title: str = "Design doc") -> GraphData:
+    return GraphData(
+        nodes=[
+            GraphNode("entity-1", "React", "technology", {"occurrence_count": 3}),
+            GraphNode("doc-1", title, "document", {"activity_score": 0.5}),
+        ],
+        edges=[GraphEdge("entity-1", "doc-1", "mentioned_in", 0.9)],
+        statistics=GraphStatistics(total_entities=1, total_documents=1),
+    )
+
+
+@pytest.fixture
+def db():
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=MagicMock())
+    db.commit = AsyncMock()
+    return db
+
+
+class TestKnowledgeGraphCache:
+    """Tests for KnowledgeGraphCache."""
+
+    @pytest.mark.asyncio
+    async def test_key_includes_version_generation_and_filters(self):
+        """Should only hit for the same graph version, generation and filters."""
+        cache = KnowledgeGraphCache(FakeRedis())
+        await cache.set("ws-1", 3, 0, "filters", {"node_ids": []})
+
+        assert await cache.get("ws-1", 3, 0, "filters") == {"node_ids": []}
+        assert await cache.get("ws-1", 4, 0, "filters") is None
+        assert await cache.get("ws-1", 3, 1, "filters") is None
+        assert await cache.get("ws-1", 3, 0, "other") is None
+        assert await cache.get("ws-2", 3, 0, "filters") is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_bumps_generation(self):
+        """Should move the workspace to a new generation on each invalidation."""
+        cache = KnowledgeGraphCache(FakeRedis())
+
+        assert await cache.generation("ws-1") == 0
+        assert await cache.invalidate("ws-1")
+        assert await cache.invalidate("ws-1")
+
+        assert await cache.generation("ws-1") == 2
+        assert await cache.generation("ws-2") == 0
+
+
+class TestGraphDataCaching:
+    """Tests for KnowledgeGraphService.get_graph_data caching."""
+
+    @pytest.mark.asyncio
+    async def test_miss_hit_and_invalidation(self, db):
+        """Should build on a miss, serve hits and rebuild after invalidation."""
+        cache = KnowledgeGraphCache(FakeRedis())
+        service = KnowledgeGraphService(db)
+        service._build_graph_data = AsyncMock(
+            side_effect=[build_graph(), build_graph("Renamed doc")]
+        )
+
+        with (
+            patch(
+                "aexy.services.knowledge_graph_service.get_knowledge_graph_cache",
+                return_value=cache,
+            ),
+            patch(
+                "aexy.services.knowledge_graph_service.get_graph_version",
+                AsyncMock(return_value=7),
+            ),
+        ):
+            first = await service.get_graph_data("ws-1")
+            second = await service.get_graph_data("ws-1")
+            await cache.invalidate("ws-1")
+            third = await service.get_graph_data("ws-1")
+
+        assert service._build_graph_data.await_count == 2
+        assert second.to_dict() == first.to_dict()
+        assert third.nodes[1].label == "Renamed doc"
+
+    @pytest.mark.asyncio
+    async def test_document_update_invalidates_graph(self, db):
+        """Should invalidate cached graph payloads when a document changes."""
+        from aexy.services.document_service import DocumentService
+
+        cache = MagicMock()
+        cache.invalidate = AsyncMock()
+        db.refresh = AsyncMock()
+        service = DocumentService(db)
+        service.get_document = AsyncMock(
+            return_value=SimpleNamespace(id="doc-1", workspace_id="ws-1", content={})
+        )
+        service._invalidate_tree = AsyncMock()
+
+        with patch(
+            "aexy.services.document_service.get_knowledge_graph_cache", return_value=cache
+        ):
+            await service.update_document("doc-1", "dev-1", title="Renamed doc")
+
+        cache.invalidate.assert_awaited_once_with("ws-1")
+
+    def test_compact_dict_round_trip(self):
+        """Should rebuild the same graph from its compact form."""
+        graph = build_graph()
+
+        rebuilt = GraphData.from_compact_dict(graph.to_compact_dict())
+
+        assert rebuilt.to_dict() == graph.to_dict()
+
+    def test_compact_dict_rejects_dangling_edges(self):
+        """Should raise instead of dropping edges whose endpoints are missing."""
+        graph = build_graph()
+        graph.edges.append(GraphEdge("entity-1", "doc-missing", "mentioned_in"))
+
+        with pytest.raises(ValueError, match="doc-missing"):
+            graph.to_compact_dict()
+
+
+class TestGraphStatistics:
+    """Tests for KnowledgeGraphService.get_graph_statistics."""
+
+    @pytest.mark.asyncio
+    async def test_stored_statistics_are_served(self, db):
+        """Should return stored statistics when they match the graph version."""
+        db.execute.return_value.one_or_none.return_value = SimpleNamespace(
+            graph_version=4, statistics={"total_entities": 9}, statistics_version=4
+        )
+        service = KnowledgeGraphService(db)
+        service._compute_graph_statistics = AsyncMock()
+
+        statistics = await service.get_graph_statistics("ws-1")
+
+        assert statistics.total_entities == 9
+        service._compute_graph_statistics.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stale_statistics_are_computed_without_writing(self, db):
+        """Should recompute stale statistics on read without storing or committing."""
+        db.execute.return_value.one_or_none.return_value = SimpleNamespace(
+            graph_version=5, statistics={"total_entities": 9}, statistics_version=4
+        )
+        service = KnowledgeGraphService(db)
+        service._compute_graph_statistics = AsyncMock(
+            return_value=GraphStatistics(total_entities=10)
+        )
+
+        statistics = await service.get_graph_statistics("ws-1")
+
+        assert statistics.total_entities == 10
+        assert db.execute.await_count == 1
+        db.commit.assert_not_awaited()
+
+
+def test_filters_cache_key_is_order_independent():
+    """Should produce the same key for the same filters in any order."""
+    first = GraphFilters(entity_types=["technology", "person"], space_ids=["b", "a"])
+    second = GraphFilters(entity_types=["person", "technology"], space_ids=["a", "b"])
+
+    assert first.cache_key() == second.cache_key()
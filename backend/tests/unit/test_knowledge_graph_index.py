@@ -0,0 +1,69 @@
+"""Tests for knowledge graph adjacency snapshots."""
+
+from aexy.services.knowledge_graph_index import GraphAdjacency
+
+
+def build_graph() -> GraphAdjacency:
+    """a - b - c - d chain with a shortcut a -> e -> d and an isolated pair x - y."""
+    return GraphAdjacency.from_edges(
+        version=1,
+        edges=[
+            ("a", "b", "related_to", 0.5),
+            ("b", "c", "depends_on", 0.7),
+            ("c", "d", "related_to", 0.5),
+            ("a", "e", "mentions", 0.9),
+            ("d", "e", "implements", 0.4),
+            ("x", "y", "related_to", 0.5),
+        ],
+    )
+
+
+class TestGraphAdjacency:
+    """Tests for GraphAdjacency."""
+
+    def test_degree(self):
+        """Should count relationships in both directions."""
+        graph = build_graph()
+
+        assert graph.degree("a") == 2
+        assert graph.degree("e") == 2
+        assert graph.degree("unknown") == 0
+        assert graph.most_connected(limit=1)[0][1] == 2
+
+    def test_shortest_path(self):
+        """Should find the shortest undirected path with relationship types."""
+        graph = build_graph()
+
+        path = graph.shortest_path("a", "d", max_hops=5)
+
+        assert path == [("a", None), ("e", "mentions"), ("d", "implements")]
+
+    def test_shortest_path_respects_max_hops(self):
+        """Should not return paths longer than max_hops."""
+        graph = build_graph()
+
+        assert graph.shortest_path("a", "d", max_hops=1) is None
+        assert graph.shortest_path("b", "d", max_hops=2) is not None
+
+    def test_shortest_path_disconnected(self):
+        """Should return None for nodes in different components."""
+        graph = build_graph()
+
+        assert graph.shortest_path("a", "x", max_hops=10) is None
+        assert graph.shortest_path("a", "a", max_hops=0) == [("a", None)]
+
+    def test_neighborhood(self):
+        """Should return k-hop nodes and distinct directed edges."""
+        graph = build_graph()
+
+        nodes, edges = graph.neighborhood("a", depth=1)
+
+        assert nodes == ["a", "b", "e"]
+        assert sorted(edges) == [
+            ("a", "b", "related_to", 0.5),
+            ("a", "e", "mentions", 0.9),
+        ]
+
+        nodes, edges = graph.neighborhood("a", depth=2)
+        assert set(nodes) == {"a", "b", "c", "d", "e"}
+        assert len(edges) == 4
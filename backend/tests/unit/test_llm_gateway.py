@@ -1,5 +1,6 @@
 """Tests for LLM Gateway."""
 
+import json
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
@@ -197,22 +198,50 @@ class TestLLMGateway:
         assert score.overall_score == 75.0
 
     @pytest.mark.asyncio
-    async def test_rank_developers(self, gateway):
-        """Should rank multiple developers."""
+    async def test_rank_developers(self, gateway_with_cache, mock_provider):
+        """Should rank all developers in one cached LLM call."""
+        mock_provider._call_api = AsyncMock(
+            return_value=(
+                json.dumps({
+                    "rankings": [
+                        {
+                            "developer_id": "dev-1",
+                            "overall_score": 85,
+                            "skill_match": 90,
+                            "experience_match": 80,
+                            "growth_opportunity": 40,
+                            "reasoning": "Strong Python",
+                        }
+                    ]
+                }),
+                100,
+                60,
+                40,
+            )
+        )
+        mock_provider._parse_json_response = json.loads
+        gateway_with_cache._rate_limiter = AsyncMock()
         task_signals = TaskSignals(
             required_skills=["Python"],
             domain="backend",
         )
         developers = [
-            {"developer_id": "dev-1", "languages": [{"name": "Python"}]},
             {"developer_id": "dev-2", "languages": [{"name": "Go"}]},
+            {"developer_id": "dev-1", "languages": [{"name": "Python"}]},
         ]
 
-        scores = await gateway.rank_developers(task_signals, developers)
+        scores = await gateway_with_cache.rank_developers(
+            task_signals, developers, skip_rate_limit=True
+        )
+        cached = await gateway_with_cache.rank_developers(
+            task_signals, developers, skip_rate_limit=True
+        )
 
-        assert len(scores) == 2
-        # Should be sorted by overall_score
-        assert scores[0].overall_score >= scores[-1].overall_score
+        assert mock_provider._call_api.await_count == 1
+        assert [s.developer_id for s in scores] == ["dev-1", "dev-2"]
+        # Developers missing from the response are kept with a zero score
+        assert scores[1].overall_score == 0
+        assert cached == scores
 
     @pytest.mark.asyncio
     async def test_health_check_healthy(self, gateway_with_cache, mock_provider):
@@ -0,0 +1,109 @@
+"""Tests for Slack history import."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from aexy.services.slack_history_sync import SlackHistorySyncService
+
+
+def _response(status_code: int = 200, data: dict | None = None) -> MagicMock:
+    response = MagicMock(status_code=status_code, headers={"Retry-After": "0"})
+    response.json.return_value = data or {}
+    return response
+
+
+def _patch_client(responses: list[MagicMock]):
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=responses)
+    client_cls = MagicMock()
+    client_cls.return_value.__aenter__ = AsyncMock(return_value=client)
+    client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+    return client, patch("aexy.services.slack_history_sync.httpx.AsyncClient", client_cls)
+
+
+class TestFetchChannelHistoryPages:
+    """Tests for SlackHistorySyncService.fetch_channel_history_pages."""
+
+    @pytest.mark.asyncio
+    async def test_follows_cursor_across_pages(self):
+        """Should yield one batch per page until has_more is false."""
+        client, patched = _patch_client([
+            _response(data={
+                "ok": True,
+                "messages": [{"ts": "1"}, {"ts": "2"}],
+                "has_more": True,
+                "response_metadata": {"next_cursor": "page-2"},
+            }),
+            _response(data={"ok": True, "messages": [{"ts": "3"}], "has_more": False}),
+        ])
+        integration = SimpleNamespace(bot_token="token")
+
+        with patched:
+            pages = [
+                page
+                async for page in SlackHistorySyncService().fetch_channel_history_pages(
+                    integration, "C1"
+                )
+            ]
+
+        assert pages == [[{"ts": "1"}, {"ts": "2"}], [{"ts": "3"}]]
+        assert client.get.await_args_list[1].kwargs["params"]["cursor"] == "page-2"
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_retries_are_capped(self):
+        """Should give up after MAX_RATE_LIMIT_RETRIES consecutive 429s."""
+        limit = SlackHistorySyncService.MAX_RATE_LIMIT_RETRIES
+        client, patched = _patch_client([_response(429)] * (limit + 1))
+        integration = SimpleNamespace(bot_token="token")
+
+        with patched, patch("aexy.services.slack_history_sync.asyncio.sleep", AsyncMock()):
+            pages = [
+                page
+                async for page in SlackHistorySyncService().fetch_channel_history_pages(
+                    integration, "C1"
+                )
+            ]
+
+        assert pages == []
+        assert client.get.await_count == limit + 1
+
+
+class TestImportChannelHistory:
+    """Tests for SlackHistorySyncService.import_channel_history."""
+
+    @pytest.mark.asyncio
+    async def test_deduplicates_each_page_with_one_query(self):
+        """Should skip imported and repeated messages using one lookup per page."""
+        service = SlackHistorySyncService()
+        pages = [
+            [
+                {"ts": "1", "user": "U1", "text": "old"},
+                {"ts": "2", "user": "U1", "text": "new"},
+                {"ts": "2", "user": "U1", "text": "repeat"},
+                {"ts": "3", "user": "U2", "text": "unmapped"},
+            ],
+            [{"ts": "4", "user": "U1", "text": "new"}],
+        ]
+
+        async def fetch_pages(*args, **kwargs):
+            for page in pages:
+                yield page
+
+        service.fetch_channel_history_pages = fetch_pages
+        service._imported_message_ts = AsyncMock(side_effect=[{"1"}, set()])
+        service._build_tracking_records = MagicMock(
+            side_effect=lambda msg, **kwargs: [msg["ts"]]
+        )
+        db = MagicMock()
+        db.commit = AsyncMock()
+        integration = SimpleNamespace(user_mappings={"U1": "dev-1"}, organization_id="ws-1")
+
+        stats = await service.import_channel_history(integration, "C1", db)
+
+        assert service._imported_message_ts.await_count == 2
+        assert service._imported_message_ts.await_args_list[0].args[2] == ["1", "2", "2"]
+        assert [c.args[0] for c in db.add_all.call_args_list] == [["2"], ["4"]]
+        assert stats["total_messages"] == 5
+        assert stats["skipped"] == 3
@@ -0,0 +1,131 @@
+"""Tests for the task matcher."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from aexy.llm.base import MatchScore, TaskSignals
+from aexy.services.task_matcher import TaskMatcher, TaskMatchRequest
+
+
+def _developer(dev_id: str, languages: dict[str, int], availability: int = 6) -> dict:
+    return {
+        "id": dev_id,
+        "name": dev_id.title(),
+        "skill_fingerprint": {
+            "languages": [
+                {"name": name, "proficiency_score": score} for name, score in languages.items()
+            ],
+        },
+        "availability": availability,
+    }
+
+
+def _match_score(developer_id: str, overall: float) -> MatchScore:
+    return MatchScore(
+        developer_id=developer_id,
+        overall_score=overall,
+        skill_match=overall,
+        experience_match=overall,
+        growth_opportunity=0,
+    )
+
+
+class TestTaskMatcher:
+    """Tests for TaskMatcher."""
+
+    @pytest.fixture
+    def llm(self):
+        llm = MagicMock()
+        llm.extract_task_signals = AsyncMock(
+            return_value=TaskSignals(required_skills=["Python"], domain="backend")
+        )
+        return llm
+
+    @pytest.fixture
+    def developers(self):
+        return [
+            _developer("go", {"Go": 90}),
+            _developer("busy", {"Python": 90}, availability=0),
+            _developer("python", {"Python": 90}),
+        ] + [_developer(f"js-{i}", {"JavaScript": 80}) for i in range(5)]
+
+    def test_prescore_orders_by_skill_and_capacity(self, llm, developers):
+        """Should rank skill matches first, breaking ties by capacity."""
+        matcher = TaskMatcher(llm)
+        signals = TaskSignals(required_skills=["Python"], domain="backend")
+
+        ranked = [d["id"] for _, d in matcher.prescore(signals, developers)]
+
+        assert ranked[:2] == ["python", "busy"]
+
+    @pytest.mark.asyncio
+    async def test_match_task_ranks_shortlist_in_one_call(self, llm, developers):
+        """Should send only the shortlist to the LLM, in a single call."""
+        llm.rank_developers = AsyncMock(
+            side_effect=lambda signals, skills: [
+                _match_score(s["developer_id"], 90 - i) for i, s in enumerate(skills)
+            ]
+        )
+        matcher = TaskMatcher(llm)
+
+        result = await matcher.match_task(
+            TaskMatchRequest(title="API", description="Build an API"), developers
+        )
+
+        llm.rank_developers.assert_awaited_once()
+        shortlist = llm.rank_developers.await_args.args[1]
+        assert len(shortlist) == TaskMatcher.SHORTLIST_SIZE
+        assert len(result.candidates) == len(developers)
+        assert result.candidates[0].developer_id == "python"
+        assert [c.rank for c in result.candidates] == list(range(1, len(developers) + 1))
+
+    @pytest.mark.asyncio
+    async def test_rank_is_monotonic_in_overall_score(self, llm, developers):
+        """Should keep candidates outside the shortlist below the lowest LLM score."""
+        llm.rank_developers = AsyncMock(
+            side_effect=lambda signals, skills: [
+                _match_score(s["developer_id"], [12, 30, 8, 20, 15][i])
+                for i, s in enumerate(skills)
+            ]
+        )
+        matcher = TaskMatcher(llm)
+
+        result = await matcher.match_task(
+            TaskMatchRequest(title="API", description="Build an API"), developers
+        )
+
+        overall = [c.match_score.overall_score for c in result.candidates]
+        assert overall[: TaskMatcher.SHORTLIST_SIZE] == [30, 20, 15, 12, 8]
+        assert all(score < 8 for score in overall[TaskMatcher.SHORTLIST_SIZE :])
+        assert overall == sorted(overall, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_match_task_falls_back_to_prescores(self, llm, developers):
+        """Should rank by pre-score when the LLM ranking fails."""
+        llm.rank_developers = AsyncMock(side_effect=RuntimeError("rate limited"))
+        matcher = TaskMatcher(llm)
+
+        result = await matcher.match_task(
+            TaskMatchRequest(title="API", description="Build an API"), developers
+        )
+
+        top = result.candidates[0]
+        assert top.developer_id == "python"
+        assert top.match_score.gaps == []
+        assert result.candidates[-1].match_score.gaps == ["Python"]
+
+    @pytest.mark.asyncio
+    async def test_optimize_assignments_respects_workload(self, llm, developers):
+        """Should assign each task once without exceeding the per-developer limit."""
+        llm.rank_developers = AsyncMock(side_effect=RuntimeError("rate limited"))
+        matcher = TaskMatcher(llm)
+        tasks = [TaskMatchRequest(title=f"API {i}", description="Build an API") for i in range(3)]
+
+        assignments = await matcher.optimize_assignments(
+            tasks, developers, {"max_tasks_per_developer": 1}
+        )
+
+        assert set(assignments) == {t.title for t in tasks}
+        assert len(set(assignments.values())) == 3
+        assert "python" in assignments.values()
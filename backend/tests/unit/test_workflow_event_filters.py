@@ -0,0 +1,74 @@
+"""Tests for indexed workflow event subscription filters."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from aexy.services.workflow_event_service import (
+    _build_filter_keys,
+    _event_filter_pairs,
+    _matches_filter,
+)
+
+
+def _indexed_candidate(event_data: dict, event_filter: dict) -> bool:
+    """Mirror the SQL candidate query: every indexed key/value must be in the event."""
+    subscription = SimpleNamespace(
+        id="sub-1", workspace_id="ws-1", event_type="form.submitted", event_filter=event_filter
+    )
+    keys = _build_filter_keys(subscription)
+    pairs = set(_event_filter_pairs(event_data))
+    return sum((k.filter_key, k.filter_value) in pairs for k in keys) == len(keys)
+
+
+class TestEventFilterIndex:
+    """Tests for _build_filter_keys and _event_filter_pairs."""
+
+    def test_build_filter_keys_skips_unindexable_values(self):
+        """Should index scalars only and count the indexed keys."""
+        subscription = SimpleNamespace(
+            id="sub-1",
+            workspace_id="ws-1",
+            event_type="form.submitted",
+            event_filter={"form_id": "f-1", "score": 5.0, "tags": ["a"], "owner": None},
+        )
+
+        keys = _build_filter_keys(subscription)
+
+        assert {(k.filter_key, k.filter_value) for k in keys} == {
+            ("form_id", '"f-1"'),
+            ("score", "5"),
+        }
+        assert subscription.filter_key_count == 2
+
+    def test_event_filter_pairs_flattens_nested_objects(self):
+        """Should expose nested values under dotted paths."""
+        pairs = _event_filter_pairs({"record": {"id": 7, "meta": {"ok": True}}, "x": [1]})
+
+        assert sorted(pairs) == [("record.id", "7"), ("record.meta.ok", "1")]
+
+    @pytest.mark.parametrize(
+        "event_data, event_filter",
+        [
+            ({"form_id": "f-1"}, {"form_id": "f-1"}),
+            ({"form_id": "f-2"}, {"form_id": "f-1"}),
+            ({"score": 5}, {"score": 5.0}),
+            ({"score": 5.0}, {"score": 5}),
+            ({"score": 5.5}, {"score": 5}),
+            ({"flag": True}, {"flag": 1}),
+            ({"form_id": "f-1"}, {"owner": None}),
+            ({"form_id": "f-1", "owner": "u-1"}, {"owner": None}),
+            ({"record": {"id": "r-1"}}, {"record.id": "r-1"}),
+            ({"record": {"id": "r-2"}}, {"record.id": "r-1"}),
+            ({"tags": ["a"]}, {"tags": ["a"]}),
+            ({}, {}),
+        ],
+    )
+    def test_matching_parity_with_python_filter(self, event_data, event_filter):
+        """Should never drop a match and agree with _matches_filter after re-checking."""
+        expected = _matches_filter(event_data, event_filter)
+        candidate = _indexed_candidate(event_data, event_filter)
+
+        if expected:
+            assert candidate
+        assert (candidate and _matches_filter(event_data, event_filter)) == expected
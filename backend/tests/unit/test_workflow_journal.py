@@ -0,0 +1,66 @@
+"""Tests for journaled workflow execution."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from aexy.models.workflow import WorkflowExecution
+from aexy.services.workflow_execution_service import SyncWorkflowExecutor
+
+
+def build_workflow(action_count: int) -> SimpleNamespace:
+    nodes = [{"id": "trigger", "type": "trigger", "data": {}}]
+    edges = []
+    for i in range(action_count):
+        nodes.append({"id": f"a{i}", "type": "action", "data": {"action_type": "update_record"}})
+        edges.append({"source": nodes[-2]["id"], "target": f"a{i}"})
+    return SimpleNamespace(
+        id=f"wf-{action_count}", version=1, nodes=nodes, edges=edges, execution_order=None
+    )
+
+
+def build_execution(is_dry_run: bool) -> WorkflowExecution:
+    return WorkflowExecution(
+        id="exec-1", workspace_id="ws-1", record_id=None, context={}, is_dry_run=is_dry_run
+    )
+
+
+class TestExecutionJournal:
+    """Tests for SyncWorkflowExecutor journaling."""
+
+    def test_buffers_steps_without_side_effects(self):
+        """Should write all steps of a side-effect-free run in one flush."""
+        db = MagicMock()
+        execution = build_execution(is_dry_run=True)
+
+        result = SyncWorkflowExecutor(db, journaled=True, flush_steps=20).execute(
+            execution, build_workflow(5)
+        )
+
+        assert result["status"] == "completed"
+        assert db.commit.call_count == 1
+        assert db.execute.call_count == 1
+        assert [row["node_id"] for row in db.execute.call_args[0][1]] == [
+            "trigger", "a0", "a1", "a2", "a3", "a4",
+        ]
+        assert execution.current_node_id == "a4"
+        assert execution.next_node_id is None
+
+    def test_flushes_every_n_steps(self):
+        """Should flush when the buffer reaches flush_steps."""
+        db = MagicMock()
+
+        SyncWorkflowExecutor(db, journaled=True, flush_steps=2).execute(
+            build_execution(is_dry_run=True), build_workflow(5)
+        )
+
+        assert [len(call[0][1]) for call in db.execute.call_args_list] == [2, 2, 2]
+
+    def test_unjournaled_commits_per_node(self):
+        """Should keep two commits per node when journaling is off."""
+        db = MagicMock()
+
+        SyncWorkflowExecutor(db, journaled=False).execute(
+            build_execution(is_dry_run=True), build_workflow(2)
+        )
+
+        assert db.commit.call_count == 3 * 2 + 1
@@ -0,0 +1,149 @@
+"""Tests for compiled workflow execution plans."""
+
+from types import SimpleNamespace
+
+from aexy.services.workflow_plan import (
+    WorkflowPlan,
+    get_workflow_plan,
+    invalidate_workflow_plans,
+    topological_order,
+)
+
+NODES = [
+    {"id": "trigger", "type": "trigger", "data": {}},
+    {
+        "id": "check",
+        "type": "condition",
+        "data": {
+            "conditions": [{"field": "record.status", "operator": "equals", "value": "won"}],
+        },
+    },
+    {"id": "celebrate", "type": "action", "data": {}},
+    {"id": "follow_up", "type": "action", "data": {}},
+    {"id": "nurture", "type": "action", "data": {}},
+    {
+        "id": "route",
+        "type": "branch",
+        "data": {
+            "branches": [
+                {
+                    "id": "big",
+                    "conditions": [{"field": "record.amount", "operator": "gte", "value": 1000}],
+                },
+                {"id": "small", "conditions": []},
+            ]
+        },
+    },
+    {"id": "big_deal", "type": "action", "data": {}},
+    {"id": "small_deal", "type": "action", "data": {}},
+]
+
+EDGES = [
+    {"source": "trigger", "target": "check"},
+    {"source": "check", "target": "celebrate", "sourceHandle": "true"},
+    {"source": "celebrate", "target": "follow_up"},
+    {"source": "check", "target": "nurture", "sourceHandle": "false"},
+    {"source": "nurture", "target": "route"},
+    {"source": "route", "target": "big_deal", "sourceHandle": "big"},
+    {"source": "route", "target": "small_deal", "sourceHandle": "small"},
+]
+
+
+def build_plan() -> WorkflowPlan:
+    return WorkflowPlan("wf", 1, NODES, EDGES, topological_order(NODES, EDGES))
+
+
+class TestWorkflowPlan:
+    """Tests for WorkflowPlan."""
+
+    def test_condition_skip_masks(self):
+        """Should skip everything downstream of the branch not taken."""
+        plan = build_plan()
+        check = plan.nodes[plan.index_of["check"]]
+
+        assert plan.ids_of(check.skip_mask(condition_result=True)) == [
+            "nurture", "route", "big_deal", "small_deal",
+        ]
+        assert plan.ids_of(check.skip_mask(condition_result=False)) == ["celebrate", "follow_up"]
+
+    def test_branch_selection_and_skips(self):
+        """Should select the first matching branch and skip the others."""
+        plan = build_plan()
+        route = plan.nodes[plan.index_of["route"]]
+
+        assert route.select_branch({"record_data": {"amount": 5000}}) == "big"
+        assert route.select_branch({"record_data": {"amount": 10}}) == "small"
+        assert plan.ids_of(route.skip_mask(selected_branch="big")) == ["small_deal"]
+        assert plan.ids_of(route.skip_mask(selected_branch=None)) == ["big_deal", "small_deal"]
+
+    def test_conditions_are_precompiled(self):
+        """Should evaluate compiled conditions and treat unknown operators as false."""
+        nodes = [
+            {
+                "id": "c",
+                "type": "condition",
+                "data": {
+                    "conjunction": "or",
+                    "conditions": [
+                        {"field": "trigger.count", "operator": "gt", "value": "3"},
+                        {"field": "status", "operator": "bogus", "value": "x"},
+                    ],
+                },
+            }
+        ]
+        plan = WorkflowPlan("wf", 1, nodes, [], ["c"])
+        node = plan.nodes[0]
+
+        assert node.evaluate_conditions({"trigger_data": {"count": 4}}) == (True, [True, False])
+        assert node.evaluate_conditions({"trigger_data": {"count": 1}}) == (False, [False, False])
+
+    def test_steps_resume_from_node(self):
+        """Should iterate execution order from a saved position."""
+        plan = build_plan()
+
+        steps = [
+            (node.id, following.id if following else None)
+            for node, following in plan.steps_from("route")
+        ]
+
+        assert steps[0] == ("route", "big_deal")
+        assert steps[-1][1] is None
+        assert len(list(plan.steps_from(None))) == len(NODES)
+
+    def test_plan_cache(self):
+        """Should reuse plans per version and drop them on invalidation."""
+        workflow = SimpleNamespace(
+            id="wf-cache", version=3, nodes=NODES, edges=EDGES, execution_order=None
+        )
+
+        plan = get_workflow_plan(workflow)
+        assert get_workflow_plan(workflow) is plan
+
+        invalidate_workflow_plans("wf-cache")
+        assert get_workflow_plan(workflow) is not plan
+
+    def test_concurrent_runs(self):
+        """Should group independent notification actions but not record updates."""
+        nodes = [
+            {"id": "trigger", "type": "trigger", "data": {}},
+            {"id": "hook_a", "type": "action", "data": {"action_type": "webhook_call"}},
+            {"id": "hook_b", "type": "action", "data": {"action_type": "send_slack"}},
+            {"id": "update", "type": "action", "data": {"action_type": "update_record"}},
+            {"id": "hook_c", "type": "action", "data": {"action_type": "webhook_call"}},
+        ]
+        edges = [
+            {"source": "trigger", "target": "hook_a"},
+            {"source": "trigger", "target": "hook_b"},
+            {"source": "trigger", "target": "update"},
+            {"source": "hook_a", "target": "hook_c"},
+        ]
+        order = ["trigger", "hook_a", "hook_b", "update", "hook_c"]
+        plan = WorkflowPlan("wf", 1, nodes, edges, order)
+
+        members, following = plan.concurrent_run(plan.nodes[plan.index_of["hook_a"]])
+        assert [m.id for m in members] == ["hook_a", "hook_b"]
+        assert following.id == "update"
+
+        members, following = plan.concurrent_run(plan.nodes[plan.index_of["hook_c"]])
+        assert [m.id for m in members] == ["hook_c"]
+        assert following is None
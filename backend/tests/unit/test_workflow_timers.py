@@ -0,0 +1,99 @@
+"""Tests for the workflow timer queue."""
+
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, call, patch
+
+from aexy.processing.workflow_tasks import resume_due_workflows_task
+from aexy.processing.workflow_timers import RESUME, TIMEOUT, WorkflowTimerQueue
+from aexy.services.workflow_execution_service import SyncWorkflowExecutor
+
+
+class TestWorkflowTimerQueue:
+    """Tests for WorkflowTimerQueue."""
+
+    def test_schedule_scores_by_due_time(self):
+        """Should add the execution to the sorted set scored by its due time."""
+        redis_client = MagicMock()
+        queue = WorkflowTimerQueue(redis_client)
+        due_at = datetime(2026, 1, 1, 12, 0, 5, tzinfo=timezone.utc)
+
+        assert queue.schedule(RESUME, "exec-1", due_at)
+
+        redis_client.zadd.assert_called_once_with(
+            "aexy:workflow:timers", {"resume:exec-1": due_at.timestamp()}
+        )
+
+    def test_pop_due_decodes_members(self):
+        """Should return (kind, execution id) pairs of popped members."""
+        redis_client = MagicMock()
+        redis_client.register_script.return_value = MagicMock(
+            return_value=[b"resume:exec-1", b"timeout:exec-2"]
+        )
+        queue = WorkflowTimerQueue(redis_client)
+
+        due = queue.pop_due(datetime.now(timezone.utc), limit=10)
+
+        assert due == [(RESUME, "exec-1"), (TIMEOUT, "exec-2")]
+
+    def test_failures_are_not_raised(self):
+        """Should degrade to the database sweep when Redis fails."""
+        redis_client = MagicMock()
+        redis_client.zadd.side_effect = ConnectionError("down")
+        redis_client.register_script.return_value = MagicMock(side_effect=ConnectionError("down"))
+        queue = WorkflowTimerQueue(redis_client)
+
+        assert not queue.schedule(TIMEOUT, "exec-1", datetime.now(timezone.utc))
+        assert queue.pop_due(datetime.now(timezone.utc)) == []
+
+
+class TestResumeDueWorkflows:
+    """Tests for resume_due_workflows_task."""
+
+    def test_failed_execution_does_not_strand_the_rest(self):
+        """Should claim each execution right before running it and keep going on errors."""
+        steps = MagicMock()
+        steps.claim.side_effect = [True, False, True]
+        steps.execute.side_effect = [RuntimeError("boom"), {"status": "completed"}]
+
+        @contextmanager
+        def session():
+            yield MagicMock()
+
+        with (
+            patch("aexy.processing.workflow_tasks.get_sync_session", session),
+            patch(
+                "aexy.processing.workflow_tasks._claim_paused_execution",
+                side_effect=lambda db, execution_id, due_before: steps.claim(execution_id),
+            ),
+            patch("aexy.processing.workflow_tasks.execute_workflow_task", steps.execute),
+        ):
+            result = resume_due_workflows_task.run(["exec-1", "exec-2", "exec-3"])
+
+        assert result == {"resumed": 1, "skipped": 1, "failed": 1}
+        assert steps.mock_calls == [
+            call.claim("exec-1"),
+            call.execute("exec-1"),
+            call.claim("exec-2"),
+            call.claim("exec-3"),
+            call.execute("exec-3"),
+        ]
+
+
+class TestWaitNode:
+    """Tests for SyncWorkflowExecutor._execute_wait."""
+
+    def test_naive_wait_until_is_utc(self):
+        """Should treat a datetime wait without an offset as UTC."""
+        executor = SyncWorkflowExecutor(MagicMock(), journaled=False, flush_steps=1)
+
+        result = executor._execute_wait(
+            {"wait_type": "datetime", "wait_until": "2026-01-01T12:00:00"},
+            {},
+            SimpleNamespace(is_dry_run=False),
+        )
+
+        resume_at = result["wait_info"]["resume_at"]
+        assert resume_at == datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+        assert resume_at.timestamp() == 1767268800